@@ -1,9 +1,20 @@
+from dataclasses import asdict
+
 from fastapi import Request, status
 from fastapi.responses import JSONResponse
 
+from app.application import request_timings
+from app.application.exception.analysis_job_not_found_exception import AnalysisJobNotFoundException
+from app.application.exception.analysis_queue_full_exception import AnalysisQueueFullException
+from app.application.exception.analysis_timeout_exception import AnalysisTimeoutException
+from app.application.exception.data_file_not_found_exception import DataFileNotFoundException
+from app.application.exception.dataset_not_found_exception import DatasetNotFoundException
+from app.application.exception.invalid_panel_exception import InvalidPanelException
 from app.application.exception.missing_columns_exception import MissingColumnsException
+from app.application.exception.upload_too_large_exception import UploadTooLargeException
 
 def handle_value_error(request: Request, e: ValueError):
+    request_timings.record_error(ValueError)
     return JSONResponse(
         status_code=status.HTTP_400_BAD_REQUEST,
         content={
@@ -16,6 +27,7 @@ def handle_value_error(request: Request, e: ValueError):
     )
     
 def handle_missing_columns_exception(request: Request, e: MissingColumnsException):
+    request_timings.record_error(MissingColumnsException)
     return JSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
         content={
@@ -27,7 +39,102 @@ def handle_missing_columns_exception(request: Request, e: MissingColumnsExceptio
         },
     )
 
+def handle_invalid_panel_exception(request: Request, e: InvalidPanelException):
+    request_timings.record_error(InvalidPanelException)
+    return JSONResponse(
+        status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+        content={
+            "type": "about:blank",
+            "title": "Unprocessable content",
+            "status": status.HTTP_422_UNPROCESSABLE_CONTENT,
+            "detail": str(e),
+            "instance": str(request.url.path),
+            "issues": [asdict(issue) for issue in e.issues],
+        },
+    )
+
+def handle_dataset_not_found_exception(request: Request, e: DatasetNotFoundException):
+    request_timings.record_error(DatasetNotFoundException)
+    return JSONResponse(
+        status_code=status.HTTP_404_NOT_FOUND,
+        content={
+            "type": "about:blank",
+            "title": "Not found",
+            "status": status.HTTP_404_NOT_FOUND,
+            "detail": str(e),
+            "instance": str(request.url.path),
+        },
+    )
+
+def handle_data_file_not_found_exception(request: Request, e: DataFileNotFoundException):
+    request_timings.record_error(DataFileNotFoundException)
+    return JSONResponse(
+        status_code=status.HTTP_404_NOT_FOUND,
+        content={
+            "type": "about:blank",
+            "title": "Not found",
+            "status": status.HTTP_404_NOT_FOUND,
+            "detail": str(e),
+            "instance": str(request.url.path),
+        },
+    )
+
+def handle_analysis_job_not_found_exception(request: Request, e: AnalysisJobNotFoundException):
+    request_timings.record_error(AnalysisJobNotFoundException)
+    return JSONResponse(
+        status_code=status.HTTP_404_NOT_FOUND,
+        content={
+            "type": "about:blank",
+            "title": "Not found",
+            "status": status.HTTP_404_NOT_FOUND,
+            "detail": str(e),
+            "instance": str(request.url.path),
+        },
+    )
+
+def handle_analysis_queue_full_exception(request: Request, e: AnalysisQueueFullException):
+    request_timings.record_error(AnalysisQueueFullException)
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        headers={"Retry-After": str(e.retry_after_seconds)},
+        content={
+            "type": "about:blank",
+            "title": "Service unavailable",
+            "status": status.HTTP_503_SERVICE_UNAVAILABLE,
+            "detail": str(e),
+            "instance": str(request.url.path),
+        },
+    )
+
+def handle_analysis_timeout_exception(request: Request, e: AnalysisTimeoutException):
+    request_timings.record_error(AnalysisTimeoutException)
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        headers={"Retry-After": str(e.retry_after_seconds)},
+        content={
+            "type": "about:blank",
+            "title": "Service unavailable",
+            "status": status.HTTP_503_SERVICE_UNAVAILABLE,
+            "detail": str(e),
+            "instance": str(request.url.path),
+        },
+    )
+
+def handle_upload_too_large_exception(request: Request, e: UploadTooLargeException):
+    request_timings.record_error(UploadTooLargeException)
+    return JSONResponse(
+        status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+        content={
+            "type": "about:blank",
+            "title": "Content too large",
+            "status": status.HTTP_413_CONTENT_TOO_LARGE,
+            "detail": str(e),
+            "instance": str(request.url.path),
+        },
+    )
+
 def handle_unexpected_exception(request: Request, e: Exception):
+    request_timings.record_error(Exception)
     return JSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
@@ -1,5 +1,9 @@
 from fastapi import APIRouter
 from app.api.routes.analysis import router as analysis
+from app.api.routes.analysis_jobs import router as analysis_jobs
+from app.api.routes.datasets import router as datasets
 
 api_router = APIRouter()
 api_router.include_router(analysis)
+api_router.include_router(analysis_jobs)
+api_router.include_router(datasets)
@@ -0,0 +1,85 @@
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.application import request_timings
+from app.infrastructure.request_metrics import RequestMetrics
+
+class RequestMetricsMiddleware:
+    def __init__(self, app: ASGIApp, metrics: RequestMetrics):
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings, token = request_timings.begin()
+        start = time.perf_counter()
+        received_bytes = 0
+        status = 500
+        elapsed = None
+
+        async def timed_receive() -> Message:
+            nonlocal received_bytes
+            message = await receive()
+            if message["type"] == "http.request":
+                received_bytes += len(message.get("body", b""))
+                if not message.get("more_body", False):
+                    timings.add("upload", time.perf_counter() - start)
+            return message
+
+        async def timed_send(message: Message) -> None:
+            nonlocal status, elapsed
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                elapsed = time.perf_counter() - start
+                message = {
+                    **message,
+                    "headers": [*message.get("headers", []), (b"server-timing", self._server_timing(timings, elapsed))],
+                }
+            await send(message)
+
+        self.metrics.in_flight.inc()
+        try:
+            await self.app(scope, timed_receive, timed_send)
+        except Exception:
+            # Unhandled errors are answered by the outermost server error
+            # handler, after this middleware; record them as it would.
+            timings.error = timings.error or "Exception"
+            raise
+        finally:
+            self.metrics.in_flight.dec()
+            request_timings.end(token)
+            self._observe(scope, timings, status, elapsed if elapsed is not None else time.perf_counter() - start, received_bytes)
+
+    def _server_timing(self, timings: request_timings.RequestTimings, elapsed: float) -> bytes:
+        entries = [f"{stage};dur={seconds * 1000:.3f}" for stage, seconds in dict(timings.stages).items()]
+        entries.append(f"total;dur={elapsed * 1000:.3f}")
+        return ", ".join(entries).encode("latin-1")
+
+    def _observe(
+        self,
+        scope: Scope,
+        timings: request_timings.RequestTimings,
+        status: int,
+        elapsed: float,
+        received_bytes: int,
+    ) -> None:
+        # Route templates keep label cardinality bounded; unmatched paths
+        # (404s, probes) share one label.
+        route = scope.get("route")
+        path = getattr(route, "path", "unmatched")
+        method = scope["method"]
+
+        self.metrics.requests.inc(method=method, path=path, status=str(status))
+        self.metrics.duration.observe(elapsed, method=method, path=path)
+        self.metrics.request_size.observe(received_bytes, path=path)
+        for stage, seconds in dict(timings.stages).items():
+            self.metrics.stage_duration.observe(seconds, path=path, stage=stage)
+        if timings.rows is not None:
+            self.metrics.rows.observe(timings.rows)
+            self.metrics.columns.observe(timings.columns)
+        if timings.error is not None:
+            self.metrics.errors.inc(path=path, error=timings.error)
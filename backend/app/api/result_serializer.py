@@ -0,0 +1,155 @@
+from functools import lru_cache
+import importlib.util
+
+from fastapi import Response
+from pydantic import ConfigDict, TypeAdapter
+
+from app.application import request_timings
+from app.domain.model.analysis_job import AnalysisJob
+from app.domain.model.fixed_effects_result import FixedEffectsResult
+from app.domain.model.subset_search_result import SubsetSearchResult
+from app.domain.model.window_estimate import WindowEstimate
+
+JSON_MEDIA_TYPE = "application/json"
+EVENT_STREAM_MEDIA_TYPE = "text/event-stream"
+ARROW_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+# Results are built by the estimators and need no validation on the way out,
+# so they are dumped by pydantic-core directly. NaN and infinite statistics
+# (e.g. standard errors without residual degrees of freedom) become null.
+# The dataclasses cannot take a config of their own, so a single item is
+# dumped as a one-element list and unwrapped.
+results_adapter = TypeAdapter(list[FixedEffectsResult], config=ConfigDict(ser_json_inf_nan="null"))
+jobs_adapter = TypeAdapter(list[AnalysisJob], config=ConfigDict(ser_json_inf_nan="null"))
+searches_adapter = TypeAdapter(list[SubsetSearchResult], config=ConfigDict(ser_json_inf_nan="null"))
+windows_adapter = TypeAdapter(list[WindowEstimate], config=ConfigDict(ser_json_inf_nan="null"))
+
+# Per-coefficient columns of the Arrow response, in order.
+COEFFICIENT_COLUMNS = ("param", "std_error", "tstat", "pvalue", "bootstrap_pvalue", "bootstrap_conf_low", "bootstrap_conf_high")
+MODEL_COLUMNS = ("nobs", "rsquared_within", "rsquared_between", "rsquared_overall", "permutation_pvalue")
+# Model-level values that are not scalars travel in the schema metadata.
+MODEL_METADATA = ("dropped_vars", "absorption_iterations", "permutation_null")
+
+RESULT_RESPONSES = {200: {"content": {JSON_MEDIA_TYPE: {}, ARROW_MEDIA_TYPE: {}}}}
+
+
+@lru_cache
+def arrow_available() -> bool:
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def negotiate_media_type(accept: str | None) -> str:
+    if not accept:
+        return JSON_MEDIA_TYPE
+
+    preferences = []
+    for position, entry in enumerate(accept.split(",")):
+        media_type, *parameters = (part.strip() for part in entry.split(";"))
+        quality = 1.0
+        for parameter in parameters:
+            name, _, value = parameter.partition("=")
+            if name.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if quality > 0:
+            preferences.append((-quality, position, media_type.lower()))
+
+    for _, _, media_type in sorted(preferences):
+        if media_type == ARROW_MEDIA_TYPE and arrow_available():
+            return ARROW_MEDIA_TYPE
+        if media_type in (JSON_MEDIA_TYPE, "application/*", "*/*"):
+            return JSON_MEDIA_TYPE
+    # Nothing acceptable was offered; answer with JSON rather than 406, as
+    # FastAPI does for every other route.
+    return JSON_MEDIA_TYPE
+
+
+def serialize_results(content: FixedEffectsResult | list[FixedEffectsResult], accept: str | None = None) -> Response:
+    media_type = negotiate_media_type(accept)
+    # Serialized here rather than by FastAPI so that the time shows up as a
+    # stage of its own in Server-Timing and /metrics.
+    with request_timings.stage("serialize"):
+        if media_type == ARROW_MEDIA_TYPE:
+            body = to_arrow_ipc(content if isinstance(content, list) else [content])
+        elif isinstance(content, list):
+            body = results_adapter.dump_json(content)
+        else:
+            body = results_adapter.dump_json([content])[1:-1]
+
+    return Response(body, media_type=media_type, headers={"Vary": "Accept"})
+
+
+def serialize_job(job: AnalysisJob, status_code: int = 200, headers: dict[str, str] | None = None) -> Response:
+    with request_timings.stage("serialize"):
+        body = jobs_adapter.dump_json([job])[1:-1]
+    return Response(body, status_code=status_code, media_type=JSON_MEDIA_TYPE, headers=headers)
+
+
+def serialize_subset_search(search: SubsetSearchResult) -> Response:
+    with request_timings.stage("serialize"):
+        body = searches_adapter.dump_json([search])[1:-1]
+    return Response(body, media_type=JSON_MEDIA_TYPE)
+
+
+def serialize_windows(estimates: list[WindowEstimate]) -> Response:
+    with request_timings.stage("serialize"):
+        body = windows_adapter.dump_json(estimates)
+    return Response(body, media_type=JSON_MEDIA_TYPE)
+
+
+def format_event(event: str, data: bytes) -> bytes:
+    """One Server-Sent Event. `data` is compact JSON, so it has no newlines."""
+    return b"event: " + event.encode() + b"\ndata: " + data + b"\n\n"
+
+
+def result_event(index: int, result: FixedEffectsResult) -> bytes:
+    body = results_adapter.dump_json([result])[1:-1]
+    return format_event("result", b'{"index":' + str(index).encode() + b',"result":' + body + b"}")
+
+
+def to_arrow_ipc(results: list[FixedEffectsResult]) -> bytes:
+    """Write results as an Arrow IPC stream with one row per coefficient.
+
+    Model-level scalars are repeated on each of the model's rows; missing
+    values are null and NaN statistics stay NaN."""
+    import pyarrow as pa
+
+    columns: dict[str, list] = {"model": [], "variable": [], **{name: [] for name in COEFFICIENT_COLUMNS + MODEL_COLUMNS}}
+    for model, result in enumerate(results):
+        bootstrap_pvalues = result.bootstrap_pvalues or {}
+        bootstrap_conf_int = result.bootstrap_conf_int or {}
+        for variable, param in result.params.items():
+            low, high = bootstrap_conf_int.get(variable, (None, None))
+            row = {
+                "model": model,
+                "variable": variable,
+                "param": param,
+                "std_error": result.std_errors[variable],
+                "tstat": result.tstats[variable],
+                "pvalue": result.pvalues[variable],
+                "bootstrap_pvalue": bootstrap_pvalues.get(variable),
+                "bootstrap_conf_low": low,
+                "bootstrap_conf_high": high,
+                **{name: getattr(result, name) for name in MODEL_COLUMNS},
+            }
+            for name, value in row.items():
+                columns[name].append(value)
+
+    schema = pa.schema(
+        [
+            pa.field("model", pa.int32()),
+            pa.field("variable", pa.string()),
+            *(pa.field(name, pa.int64() if name == "nobs" else pa.float64()) for name in COEFFICIENT_COLUMNS + MODEL_COLUMNS),
+        ],
+        metadata={
+            "models": results_adapter.dump_json(results, include={"__all__": set(MODEL_METADATA)}),
+        },
+    )
+    table = pa.Table.from_pydict({field.name: columns[field.name] for field in schema}, schema=schema)
+
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
@@ -0,0 +1,82 @@
+import asyncio
+from collections.abc import AsyncIterator, Callable
+import json
+import time
+
+from fastapi import Request
+
+from app.api.result_serializer import format_event, result_event
+from app.application import job_progress
+from app.application.fertility_analysis_application_service import ResultCallback
+from app.domain.model.fixed_effects_result import FixedEffectsResult
+from app.infrastructure.analysis_executor import AnalysisExecutor
+
+
+async def stream_results(
+        request: Request,
+        analysis_executor: AnalysisExecutor,
+        analyze: Callable[[ResultCallback], list[FixedEffectsResult]],
+        total: int,
+        heartbeat_seconds: float
+) -> AsyncIterator[bytes]:
+    """Server-Sent Events for a batch: a `result` event per specification as
+    soon as it is ready, `progress` events at the start and whenever no
+    result arrived for `heartbeat_seconds`, and a closing `summary` or
+    `error` event. If the client disconnects, the analysis stops at its next
+    checkpoint instead of finishing the batch."""
+    loop = asyncio.get_running_loop()
+    ready: asyncio.Queue[tuple[int, FixedEffectsResult] | None] = asyncio.Queue()
+    progress = job_progress.JobProgress()
+    start = time.perf_counter()
+
+    def run() -> list[FixedEffectsResult]:
+        token = job_progress.begin(progress)
+        try:
+            # Results are queued before the task completes, so the loop sees
+            # every result before the end-of-stream marker.
+            return analyze(lambda index, result: loop.call_soon_threadsafe(ready.put_nowait, (index, result)))
+        finally:
+            job_progress.end(token)
+
+    task = asyncio.ensure_future(analysis_executor.run(run))
+    task.add_done_callback(lambda _: ready.put_nowait(None))
+
+    completed = 0
+    try:
+        yield format_event("progress", _counts(completed, total))
+        while True:
+            try:
+                item = await asyncio.wait_for(ready.get(), timeout=heartbeat_seconds)
+            except TimeoutError:
+                yield format_event("progress", _counts(completed, total))
+                continue
+            if item is None:
+                break
+            completed += 1
+            yield result_event(*item)
+
+        error = task.exception()
+        if error is not None:
+            yield format_event("error", _problem(request, error))
+        else:
+            summary = {"completed": completed, "total": total, "elapsed_seconds": time.perf_counter() - start}
+            yield format_event("summary", json.dumps(summary, separators=(",", ":")).encode())
+    finally:
+        if not task.done():
+            progress.cancel()
+            # The cancellation surfaces as an exception nobody awaits.
+            task.add_done_callback(lambda finished: finished.exception())
+
+
+def _counts(completed: int, total: int) -> bytes:
+    return json.dumps({"completed": completed, "total": total}, separators=(",", ":")).encode()
+
+
+def _problem(request: Request, error: BaseException) -> bytes:
+    # The stream has already answered 200, so errors are reported as the
+    # problem body that the app's exception handler would have returned.
+    for error_class in type(error).__mro__:
+        handler = request.app.exception_handlers.get(error_class)
+        if handler is not None:
+            return handler(request, error).body
+    raise error
@@ -1,22 +1,276 @@
-from fastapi import APIRouter, UploadFile, File, Form, Depends
+import functools
 
+from fastapi import APIRouter, UploadFile, File, Form, Depends, Header, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+
+from app.api.result_serializer import (
+    EVENT_STREAM_MEDIA_TYPE,
+    RESULT_RESPONSES,
+    serialize_results,
+    serialize_subset_search,
+    serialize_windows,
+)
+from app.api.result_stream import stream_results
 from app.application.fertility_analysis_application_service import FertilityAnalysisApplicationService
+from app.config.web_config import web_config
+from app.domain.model.absorption_specification import AbsorptionSpecification
+from app.domain.model.analysis_specification import AnalysisSpecification
+from app.domain.model.bootstrap_specification import BootstrapSpecification, BootstrapWeights
 from app.domain.model.fixed_effects_result import FixedEffectsResult
-from app.dependencies import get_fertility_analysis_application_service
+from app.domain.model.panel_validation_options import PanelValidationOptions
+from app.domain.model.permutation_specification import PermutationScheme, PermutationSpecification
+from app.domain.model.subset_search_result import SubsetSearchResult
+from app.domain.model.subset_search_specification import SubsetCriterion, SubsetSearchSpecification
+from app.domain.model.window_estimate import WindowEstimate
+from app.domain.model.window_specification import WindowMode, WindowSpecification
+from app.dependencies import get_analysis_executor, get_fertility_analysis_application_service
+from app.infrastructure.analysis_executor import AnalysisExecutor
 
 router = APIRouter(prefix="/analysis", tags=["analysis"])
 
-@router.post("", response_model=FixedEffectsResult)
+specifications_adapter = TypeAdapter(list[AnalysisSpecification])
+
+def check_bootstrap_draws(bootstrap: BootstrapSpecification | None) -> None:
+    if bootstrap is not None and bootstrap.draws > web_config.ANALYSIS_BOOTSTRAP_MAX_DRAWS:
+        raise ValueError(f"At most {web_config.ANALYSIS_BOOTSTRAP_MAX_DRAWS} bootstrap draws can be requested")
+
+def check_permutation_draws(permutation: PermutationSpecification | None) -> None:
+    if permutation is not None and permutation.draws > web_config.ANALYSIS_PERMUTATION_MAX_DRAWS:
+        raise ValueError(f"At most {web_config.ANALYSIS_PERMUTATION_MAX_DRAWS} permutation draws can be requested")
+
+def parse_specifications(specifications: str) -> list[AnalysisSpecification]:
+    parsed_specifications = specifications_adapter.validate_json(specifications)
+    if not parsed_specifications:
+        raise ValueError("At least one specification must be provided")
+    if len(parsed_specifications) > web_config.ANALYSIS_BATCH_MAX_SPECIFICATIONS:
+        raise ValueError(
+            f"At most {web_config.ANALYSIS_BATCH_MAX_SPECIFICATIONS} specifications can be analyzed in one batch"
+        )
+    for specification in parsed_specifications:
+        check_bootstrap_draws(specification.bootstrap)
+        check_permutation_draws(specification.permutation)
+    return parsed_specifications
+
+def parse_absorption(
+        absorb: list[str] | None,
+        tolerance: float,
+        max_iterations: int
+) -> AbsorptionSpecification | None:
+    if not absorb:
+        return None
+    # Interactions are written as "region:year".
+    effects = tuple(tuple(column.strip() for column in effect.split(":")) for effect in absorb)
+    return AbsorptionSpecification(effects, tolerance, max_iterations)
+
+def parse_validation(
+        drop_missing: bool = Form(False),
+        drop_singletons: bool = Form(False)
+) -> PanelValidationOptions:
+    return PanelValidationOptions(drop_missing, drop_singletons)
+
+@router.post("", response_model=FixedEffectsResult, responses=RESULT_RESPONSES)
 async def analyze(
-        csv_file: UploadFile = File(...),
+        csv_file: UploadFile | None = File(None),
+        dataset_id: str | None = Form(None),
         dependent_var: str = Form(...),
         independent_vars: list[str] = Form(...),
-        fertility_analysis_application_service: FertilityAnalysisApplicationService = Depends(get_fertility_analysis_application_service)
-) -> FixedEffectsResult:
-    csv_bytes = await csv_file.read()
-
-    return fertility_analysis_application_service.analyze(
-        csv_bytes,
-        dependent_var,
-        independent_vars
+        bootstrap_draws: int | None = Form(None),
+        bootstrap_weights: BootstrapWeights = Form("rademacher"),
+        bootstrap_seed: int = Form(0),
+        bootstrap_confidence_level: float = Form(0.95),
+        absorb: list[str] | None = Form(None),
+        absorption_tolerance: float = Form(1e-8),
+        absorption_max_iterations: int = Form(1000),
+        permute_var: str | None = Form(None),
+        permutation_draws: int = Form(999),
+        permutation_scheme: PermutationScheme = Form("within_entity"),
+        permutation_block_length: int = Form(1),
+        permutation_seed: int = Form(0),
+        validation: PanelValidationOptions = Depends(parse_validation),
+        accept: str | None = Header(None),
+        fertility_analysis_application_service: FertilityAnalysisApplicationService = Depends(get_fertility_analysis_application_service),
+        analysis_executor: AnalysisExecutor = Depends(get_analysis_executor)
+) -> Response:
+    if (csv_file is None) == (dataset_id is None):
+        raise ValueError("Exactly one of csv_file or dataset_id must be provided")
+
+    bootstrap = None
+    if bootstrap_draws is not None:
+        bootstrap = BootstrapSpecification(bootstrap_draws, bootstrap_weights, bootstrap_seed, bootstrap_confidence_level)
+        check_bootstrap_draws(bootstrap)
+    absorption = parse_absorption(absorb, absorption_tolerance, absorption_max_iterations)
+
+    permutation = None
+    if permute_var is not None:
+        permutation = PermutationSpecification(
+            permute_var, permutation_draws, permutation_scheme, permutation_block_length, permutation_seed
+        )
+        check_permutation_draws(permutation)
+
+    if dataset_id is not None:
+        result = await analysis_executor.run(
+            fertility_analysis_application_service.analyze_dataset,
+            dataset_id,
+            dependent_var,
+            independent_vars,
+            bootstrap=bootstrap,
+            absorption=absorption,
+            permutation=permutation,
+            validation=validation
+        )
+    else:
+        result = await analysis_executor.run(
+            fertility_analysis_application_service.analyze,
+            csv_file.file,
+            dependent_var,
+            independent_vars,
+            bootstrap=bootstrap,
+            absorption=absorption,
+            permutation=permutation,
+            validation=validation
+        )
+
+    return serialize_results(result, accept)
+
+@router.post("/batch", response_model=list[FixedEffectsResult], responses=RESULT_RESPONSES)
+async def analyze_batch(
+        csv_file: UploadFile | None = File(None),
+        dataset_id: str | None = Form(None),
+        specifications: str = Form(...),
+        accept: str | None = Header(None),
+        fertility_analysis_application_service: FertilityAnalysisApplicationService = Depends(get_fertility_analysis_application_service),
+        analysis_executor: AnalysisExecutor = Depends(get_analysis_executor)
+) -> Response:
+    if (csv_file is None) == (dataset_id is None):
+        raise ValueError("Exactly one of csv_file or dataset_id must be provided")
+
+    parsed_specifications = parse_specifications(specifications)
+
+    if dataset_id is not None:
+        results = await analysis_executor.run(
+            fertility_analysis_application_service.analyze_dataset_batch,
+            dataset_id,
+            parsed_specifications
+        )
+    else:
+        results = await analysis_executor.run(
+            fertility_analysis_application_service.analyze_batch,
+            csv_file.file,
+            parsed_specifications
+        )
+
+    return serialize_results(results, accept)
+
+@router.post("/batch/stream", responses={200: {"content": {EVENT_STREAM_MEDIA_TYPE: {}}}})
+async def stream_analysis_batch(
+        request: Request,
+        csv_file: UploadFile | None = File(None),
+        dataset_id: str | None = Form(None),
+        specifications: str = Form(...),
+        fertility_analysis_application_service: FertilityAnalysisApplicationService = Depends(get_fertility_analysis_application_service),
+        analysis_executor: AnalysisExecutor = Depends(get_analysis_executor)
+) -> StreamingResponse:
+    if (csv_file is None) == (dataset_id is None):
+        raise ValueError("Exactly one of csv_file or dataset_id must be provided")
+
+    parsed_specifications = parse_specifications(specifications)
+
+    if dataset_id is not None:
+        analyze = functools.partial(
+            fertility_analysis_application_service.analyze_dataset_batch, dataset_id, parsed_specifications
+        )
+    else:
+        # The body is streamed after this handler returns, by which time the
+        # upload's temporary file may be closed.
+        analyze = functools.partial(
+            fertility_analysis_application_service.analyze_batch, await csv_file.read(), parsed_specifications
+        )
+
+    return StreamingResponse(
+        stream_results(
+            request,
+            analysis_executor,
+            lambda on_result: analyze(on_result=on_result),
+            len(parsed_specifications),
+            web_config.ANALYSIS_STREAM_HEARTBEAT_SECONDS
+        ),
+        media_type=EVENT_STREAM_MEDIA_TYPE,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
+
+@router.post("/subsets", response_model=SubsetSearchResult)
+async def search_subsets(
+        csv_file: UploadFile | None = File(None),
+        dataset_id: str | None = Form(None),
+        dependent_var: str = Form(...),
+        candidate_vars: list[str] = Form(...),
+        criterion: SubsetCriterion = Form("bic"),
+        top: int = Form(10),
+        max_vars: int | None = Form(None),
+        validation: PanelValidationOptions = Depends(parse_validation),
+        fertility_analysis_application_service: FertilityAnalysisApplicationService = Depends(get_fertility_analysis_application_service),
+        analysis_executor: AnalysisExecutor = Depends(get_analysis_executor)
+) -> Response:
+    if (csv_file is None) == (dataset_id is None):
+        raise ValueError("Exactly one of csv_file or dataset_id must be provided")
+    if len(candidate_vars) > web_config.ANALYSIS_SUBSET_MAX_CANDIDATES:
+        raise ValueError(f"At most {web_config.ANALYSIS_SUBSET_MAX_CANDIDATES} candidate variables can be searched")
+
+    specification = SubsetSearchSpecification(dependent_var, tuple(candidate_vars), criterion, top, max_vars)
+
+    if dataset_id is not None:
+        result = await analysis_executor.run(
+            fertility_analysis_application_service.search_dataset_subsets,
+            dataset_id,
+            specification,
+            validation
+        )
+    else:
+        result = await analysis_executor.run(
+            fertility_analysis_application_service.search_subsets,
+            csv_file.file,
+            specification,
+            validation
+        )
+
+    return serialize_subset_search(result)
+
+@router.post("/windows", response_model=list[WindowEstimate])
+async def analyze_windows(
+        csv_file: UploadFile | None = File(None),
+        dataset_id: str | None = Form(None),
+        dependent_var: str = Form(...),
+        independent_vars: list[str] = Form(...),
+        window_length: int = Form(...),
+        window_mode: WindowMode = Form("rolling"),
+        window_step: int = Form(1),
+        validation: PanelValidationOptions = Depends(parse_validation),
+        fertility_analysis_application_service: FertilityAnalysisApplicationService = Depends(get_fertility_analysis_application_service),
+        analysis_executor: AnalysisExecutor = Depends(get_analysis_executor)
+) -> Response:
+    if (csv_file is None) == (dataset_id is None):
+        raise ValueError("Exactly one of csv_file or dataset_id must be provided")
+
+    window = WindowSpecification(window_length, window_mode, window_step)
+
+    if dataset_id is not None:
+        estimates = await analysis_executor.run(
+            fertility_analysis_application_service.analyze_dataset_windows,
+            dataset_id,
+            dependent_var,
+            independent_vars,
+            window,
+            validation=validation
+        )
+    else:
+        estimates = await analysis_executor.run(
+            fertility_analysis_application_service.analyze_windows,
+            csv_file.file,
+            dependent_var,
+            independent_vars,
+            window,
+            validation=validation
+        )
+
+    return serialize_windows(estimates)
@@ -0,0 +1,53 @@
+import functools
+
+from fastapi import APIRouter, UploadFile, File, Form, Depends, Response, status
+
+from app.api.result_serializer import serialize_job
+from app.api.routes.analysis import parse_specifications
+from app.application.analysis_job_service import AnalysisJobService
+from app.application.fertility_analysis_application_service import FertilityAnalysisApplicationService
+from app.domain.model.analysis_job import AnalysisJob
+from app.dependencies import get_analysis_job_service, get_fertility_analysis_application_service
+
+router = APIRouter(prefix="/analysis/jobs", tags=["analysis"])
+
+@router.post("", response_model=AnalysisJob, status_code=status.HTTP_202_ACCEPTED)
+async def submit_analysis_job(
+        csv_file: UploadFile | None = File(None),
+        dataset_id: str | None = Form(None),
+        specifications: str = Form(...),
+        fertility_analysis_application_service: FertilityAnalysisApplicationService = Depends(get_fertility_analysis_application_service),
+        analysis_job_service: AnalysisJobService = Depends(get_analysis_job_service)
+) -> Response:
+    if (csv_file is None) == (dataset_id is None):
+        raise ValueError("Exactly one of csv_file or dataset_id must be provided")
+
+    parsed_specifications = parse_specifications(specifications)
+
+    if dataset_id is not None:
+        analyze = functools.partial(
+            fertility_analysis_application_service.analyze_dataset_batch, dataset_id, parsed_specifications
+        )
+    else:
+        # The upload's temporary file is closed when this request ends, so
+        # the job keeps its own copy of the bytes.
+        analyze = functools.partial(
+            fertility_analysis_application_service.analyze_batch, await csv_file.read(), parsed_specifications
+        )
+
+    job = analysis_job_service.submit(analyze)
+    return serialize_job(job, status.HTTP_202_ACCEPTED, headers={"Location": f"{router.prefix}/{job.job_id}"})
+
+@router.get("/{job_id}", response_model=AnalysisJob)
+def get_analysis_job(
+        job_id: str,
+        analysis_job_service: AnalysisJobService = Depends(get_analysis_job_service)
+) -> Response:
+    return serialize_job(analysis_job_service.get(job_id))
+
+@router.delete("/{job_id}", response_model=AnalysisJob)
+def cancel_analysis_job(
+        job_id: str,
+        analysis_job_service: AnalysisJobService = Depends(get_analysis_job_service)
+) -> Response:
+    return serialize_job(analysis_job_service.cancel(job_id))
@@ -0,0 +1,34 @@
+from fastapi import APIRouter, UploadFile, File, Form, Depends
+
+from app.application.dataset_application_service import DatasetApplicationService
+from app.domain.model.registered_dataset import RegisteredDataset
+from app.dependencies import get_analysis_executor, get_dataset_application_service
+from app.infrastructure.analysis_executor import AnalysisExecutor
+
+router = APIRouter(prefix="/datasets", tags=["datasets"])
+
+@router.post("", response_model=RegisteredDataset)
+async def register_dataset(
+        csv_file: UploadFile = File(...),
+        dataset_application_service: DatasetApplicationService = Depends(get_dataset_application_service),
+        analysis_executor: AnalysisExecutor = Depends(get_analysis_executor)
+) -> RegisteredDataset:
+    return await analysis_executor.run(dataset_application_service.register, csv_file.file)
+
+@router.post("/files", response_model=RegisteredDataset)
+async def register_dataset_file(
+        path: str = Form(...),
+        dataset_application_service: DatasetApplicationService = Depends(get_dataset_application_service),
+        analysis_executor: AnalysisExecutor = Depends(get_analysis_executor)
+) -> RegisteredDataset:
+    return await analysis_executor.run(dataset_application_service.register_file, path)
+
+@router.post("/{dataset_id}/append", response_model=RegisteredDataset)
+async def append_dataset(
+        dataset_id: str,
+        csv_file: UploadFile = File(...),
+        time_var: str = Form("year"),
+        dataset_application_service: DatasetApplicationService = Depends(get_dataset_application_service),
+        analysis_executor: AnalysisExecutor = Depends(get_analysis_executor)
+) -> RegisteredDataset:
+    return await analysis_executor.run(dataset_application_service.append, dataset_id, csv_file.file, time_var)
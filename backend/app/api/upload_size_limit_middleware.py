@@ -0,0 +1,55 @@
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.api.global_exception_handler import handle_upload_too_large_exception
+from app.application.exception.upload_too_large_exception import UploadTooLargeException
+
+class UploadSizeLimitMiddleware:
+    def __init__(self, app: ASGIApp, max_bytes: int):
+        self.app = app
+        self.max_bytes = max_bytes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        content_length = dict(scope["headers"]).get(b"content-length")
+        if content_length is not None and content_length.isdigit() and int(content_length) > self.max_bytes:
+            await self._reject(scope, receive, send)
+            return
+
+        received_bytes = 0
+        rejected = False
+
+        async def limited_receive() -> Message:
+            nonlocal received_bytes, rejected
+            if rejected:
+                return {"type": "http.disconnect"}
+
+            message = await receive()
+            if message["type"] == "http.request":
+                received_bytes += len(message.get("body", b""))
+                if received_bytes > self.max_bytes:
+                    # Stop reading before the rest of the body is buffered and
+                    # answer 413 ourselves; the app only sees a disconnect.
+                    rejected = True
+                    await self._reject(scope, receive, send)
+                    return {"type": "http.disconnect"}
+            return message
+
+        async def guarded_send(message: Message) -> None:
+            if not rejected:
+                await send(message)
+
+        try:
+            await self.app(scope, limited_receive, guarded_send)
+        except Exception:
+            # Whatever the app raises after the body was cut off is a
+            # consequence of the rejection, which has already been answered.
+            if not rejected:
+                raise
+
+    async def _reject(self, scope: Scope, receive: Receive, send: Send) -> None:
+        response = handle_upload_too_large_exception(Request(scope), UploadTooLargeException(self.max_bytes))
+        await response(scope, receive, send)
@@ -0,0 +1,164 @@
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+import threading
+import uuid
+
+from app.application import job_progress
+from app.application.exception.analysis_job_cancelled_exception import AnalysisJobCancelledException
+from app.application.exception.analysis_job_not_found_exception import AnalysisJobNotFoundException
+from app.application.exception.analysis_queue_full_exception import AnalysisQueueFullException
+from app.application.exception.data_file_not_found_exception import DataFileNotFoundException
+from app.application.exception.dataset_not_found_exception import DatasetNotFoundException
+from app.application.exception.invalid_panel_exception import InvalidPanelException
+from app.application.exception.missing_columns_exception import MissingColumnsException
+from app.domain.analysis_job_store import AnalysisJobStore
+from app.domain.model.analysis_job import AnalysisJob
+from app.domain.model.fixed_effects_result import FixedEffectsResult
+
+# Failures whose message is meant for the client; anything else is reported
+# without detail, as the synchronous endpoints do.
+REPORTED_ERRORS = (
+    ValueError,
+    MissingColumnsException,
+    DatasetNotFoundException,
+    DataFileNotFoundException,
+    InvalidPanelException,
+)
+
+
+class AnalysisJobService:
+    """Runs analyses in the background on a worker pool of its own, so long
+    jobs do not hold HTTP connections or slots of the synchronous executor.
+    At most `max_workers + max_queue_depth` jobs are queued or running."""
+
+    def __init__(
+        self,
+        job_store: AnalysisJobStore,
+        max_workers: int,
+        max_queue_depth: int,
+        result_ttl_seconds: float,
+        retry_after_seconds: int,
+        clock: Callable[[], datetime] = lambda: datetime.now(UTC),
+    ):
+        self.job_store = job_store
+        self.max_workers = max_workers
+        self.max_queue_depth = max_queue_depth
+        self.result_ttl_seconds = result_ttl_seconds
+        self.retry_after_seconds = retry_after_seconds
+        self._clock = clock
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="analysis-job")
+        self._active: dict[str, tuple[job_progress.JobProgress, Future]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._active)
+
+    def submit(self, analyze: Callable[[], list[FixedEffectsResult]]) -> AnalysisJob:
+        job = AnalysisJob(job_id=uuid.uuid4().hex, status="queued", created_at=self._clock())
+        progress = job_progress.JobProgress()
+
+        with self._lock:
+            if len(self._active) >= self.max_workers + self.max_queue_depth:
+                raise AnalysisQueueFullException(self.retry_after_seconds)
+            self.job_store.put(job)
+            future = self._executor.submit(self._run, job.job_id, progress, analyze)
+            self._active[job.job_id] = (progress, future)
+        # Also called for jobs cancelled before they start.
+        future.add_done_callback(lambda _: self._release(job.job_id))
+
+        return job
+
+    def get(self, job_id: str) -> AnalysisJob:
+        job = self.job_store.get(job_id)
+        if job is None:
+            raise AnalysisJobNotFoundException(job_id)
+
+        with self._lock:
+            active = self._active.get(job_id)
+        if active is not None and job.status == "running":
+            job = replace(job, progress=active[0].fraction)
+        return job
+
+    def cancel(self, job_id: str) -> AnalysisJob:
+        with self._lock:
+            active = self._active.get(job_id)
+        if active is not None:
+            progress, future = active
+            # A queued job never starts; a running one stops at its next
+            # checkpoint, and its result is discarded either way.
+            progress.cancel()
+            future.cancel()
+
+        job = self.job_store.update(job_id, self._cancelled)
+        if job is None:
+            raise AnalysisJobNotFoundException(job_id)
+        return job
+
+    def shutdown(self) -> None:
+        with self._lock:
+            active = list(self._active)
+        for job_id in active:
+            self.cancel(job_id)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self, job_id: str, progress: job_progress.JobProgress, analyze: Callable[[], list[FixedEffectsResult]]) -> None:
+        try:
+            job = self.job_store.update(job_id, self._started)
+            if job is None or job.status != "running":
+                return
+
+            token = job_progress.begin(progress)
+            try:
+                result = analyze()
+            finally:
+                job_progress.end(token)
+        except AnalysisJobCancelledException:
+            pass
+        except REPORTED_ERRORS as e:
+            self.job_store.update(job_id, lambda job: self._finished(job, "failed", error=e, detail=str(e)))
+        except Exception as e:
+            self.job_store.update(job_id, lambda job: self._finished(job, "failed", error=e, detail="Unexpected error"))
+        else:
+            self.job_store.update(job_id, lambda job: self._finished(job, "succeeded", result=result))
+
+    def _release(self, job_id: str) -> None:
+        with self._lock:
+            self._active.pop(job_id, None)
+
+    def _started(self, job: AnalysisJob) -> AnalysisJob:
+        if job.status != "queued":
+            return job
+        return replace(job, status="running", started_at=self._clock())
+
+    def _cancelled(self, job: AnalysisJob) -> AnalysisJob:
+        if job.finished:
+            return job
+        return self._finished(job, "cancelled")
+
+    def _finished(
+        self,
+        job: AnalysisJob,
+        status: str,
+        result: list[FixedEffectsResult] | None = None,
+        error: Exception | None = None,
+        detail: str | None = None,
+    ) -> AnalysisJob:
+        # A job cancelled while running keeps its cancelled state.
+        if job.finished:
+            return job
+        finished_at = self._clock()
+        return replace(
+            job,
+            status=status,
+            progress=1.0 if status == "succeeded" else job.progress,
+            finished_at=finished_at,
+            expires_at=finished_at + timedelta(seconds=self.result_ttl_seconds),
+            result=result,
+            error=type(error).__name__ if error is not None else None,
+            error_detail=detail,
+            error_issues=error.issues if isinstance(error, InvalidPanelException) else None,
+        )
@@ -0,0 +1,189 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+from app.application.dataset_id import compute_dataset_id
+from app.application.exception.data_file_not_found_exception import DataFileNotFoundException
+from app.application.exception.dataset_not_found_exception import DatasetNotFoundException
+from app.application.exception.missing_columns_exception import MissingColumnsException
+from app.application.panel_validation import validate_panel
+from app.domain.dataframe_loader import DatasetSource, DataFrameLoader
+from app.domain.dataset_repository import DatasetRepository
+from app.domain.model.panel import Panel
+from app.domain.model.panel_validation_options import PanelValidationOptions
+from app.domain.model.panel_validation_outcome import PanelValidationOutcome
+from app.domain.model.registered_dataset import RegisteredDataset
+from app.domain.service.panel_sufficient_statistics import PanelSufficientStatistics
+from app.domain.sufficient_statistics_repository import SufficientStatisticsRepository
+
+
+class DatasetApplicationService:
+    def __init__(
+        self,
+        csv_loader: DataFrameLoader,
+        dataset_repository: DatasetRepository,
+        data_directory: Path | None = None,
+        statistics_repository: SufficientStatisticsRepository | None = None
+    ):
+        self.csv_loader = csv_loader
+        self.dataset_repository = dataset_repository
+        self.data_directory = data_directory
+        self.statistics_repository = statistics_repository
+
+    def register(self, csv_bytes: DatasetSource) -> RegisteredDataset:
+        dataset_id = compute_dataset_id(csv_bytes)
+
+        dataframe = self.dataset_repository.get(dataset_id)
+        if dataframe is None:
+            dataframe = self._compact(self.csv_loader.load(csv_bytes))
+            self.dataset_repository.put(dataset_id, dataframe)
+
+        return self._to_registered_dataset(dataset_id, dataframe)
+
+    def register_file(self, path: str) -> RegisteredDataset:
+        file_path = self._resolve_data_file(path)
+        with file_path.open("rb") as data_file:
+            dataset_id = compute_dataset_id(data_file)
+
+        dataframe = self.dataset_repository.get(dataset_id)
+        if dataframe is None:
+            dataframe = self._compact(self.csv_loader.load_file(file_path))
+            self.dataset_repository.put(dataset_id, dataframe)
+
+        return self._to_registered_dataset(dataset_id, dataframe)
+
+    def append(self, dataset_id: str, csv_bytes: DatasetSource, time_var: str = "year") -> RegisteredDataset:
+        dataframe = self.dataset_repository.get(dataset_id)
+        if dataframe is None:
+            raise DatasetNotFoundException(dataset_id)
+
+        appended_id = compute_dataset_id(f"{dataset_id}:{compute_dataset_id(csv_bytes)}".encode())
+        appended = self.dataset_repository.get(appended_id)
+        if appended is not None:
+            return self._to_registered_dataset(appended_id, appended)
+
+        time_slice = self.csv_loader.load(csv_bytes)
+        missing_columns = set(dataframe.columns) - set(time_slice.columns)
+        if time_var not in dataframe.columns:
+            missing_columns.add(time_var)
+        if missing_columns:
+            raise MissingColumnsException(list(missing_columns))
+
+        time_slice = time_slice[dataframe.columns]
+        if dataframe[time_var].isin(time_slice[time_var].unique()).any():
+            raise ValueError(f"Appended rows must only contain {time_var} values that are not in the dataset yet")
+
+        # Only the new slice is scanned; earlier rows enter through the
+        # statistics accumulated for the parent dataset. Everything is checked
+        # before the appended dataset is stored.
+        merged = {}
+        outcomes = []
+        if self.statistics_repository is not None:
+            for statistics in self.statistics_repository.list(dataset_id):
+                panel, kept_all = self._slice_panel(
+                    time_slice, statistics.entity_var, time_var, statistics.columns, row_offset=len(dataframe)
+                )
+                merged[(statistics.entity_var, statistics.columns)] = (
+                    statistics.merge(PanelSufficientStatistics.from_panel(panel, statistics.columns)),
+                    panel,
+                    kept_all,
+                )
+            outcomes = [
+                outcome
+                for outcome in self.statistics_repository.list_validations(dataset_id)
+                if self._slice_passes(outcome, time_var, merged.get((outcome.entity_var, outcome.columns)))
+            ]
+
+        appended = self._concat(dataframe, time_slice)
+        self.dataset_repository.put(appended_id, appended)
+        for statistics, _, _ in merged.values():
+            self.statistics_repository.put(appended_id, statistics)
+        for outcome in outcomes:
+            self.statistics_repository.put_validation(appended_id, outcome)
+
+        return self._to_registered_dataset(appended_id, appended)
+
+    def _slice_panel(
+        self,
+        time_slice: pd.DataFrame,
+        entity_var: str,
+        time_var: str,
+        columns: tuple[str, ...],
+        row_offset: int,
+    ) -> tuple[Panel, bool]:
+        # Values must be numbers and keys unique within the slice; rows
+        # missing a key are left out, as the dataset's analyses leave them out
+        # or reject them. Missing values are left to each model.
+        validated = validate_panel(
+            time_slice[[*columns, entity_var, time_var]],
+            list(columns),
+            entity_var,
+            time_var,
+            options=PanelValidationOptions(drop_missing=True),
+            row_offset=row_offset,
+            check_singletons=False,
+        )
+        panel = Panel.from_dataframe(validated, entity_var, time_var, columns)
+        return panel, len(validated) == len(time_slice)
+
+    def _slice_passes(
+        self,
+        outcome: PanelValidationOutcome,
+        time_var: str,
+        merged: tuple[PanelSufficientStatistics, Panel, bool] | None,
+    ) -> bool:
+        # A parent that passed whole still passes with the slice when the
+        # slice drops no rows, has no missing values the options would reject
+        # and leaves no entity with a single complete row. Its keys are already
+        # known to be new, since its time periods are.
+        if outcome.issues or outcome.time_var != time_var or merged is None:
+            return False
+        statistics, panel, kept_all = merged
+        if not kept_all:
+            return False
+        if not outcome.options.drop_missing and np.isnan(panel.values).any():
+            return False
+        return not (statistics.counts == 1).any()
+
+    def _concat(self, dataframe: pd.DataFrame, time_slice: pd.DataFrame) -> pd.DataFrame:
+        # Categorical columns keep the parent's codes and add the slice's new
+        # labels, instead of concatenating as text and being coded again.
+        columns = {}
+        for column, series in dataframe.items():
+            addition = time_slice[column]
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                columns[column] = union_categoricals([series, addition.astype("category")], ignore_order=True)
+            else:
+                columns[column] = pd.concat([series, addition], ignore_index=True)
+        return self._compact(pd.DataFrame(columns))
+
+    def _compact(self, dataframe: pd.DataFrame) -> pd.DataFrame:
+        # Registered datasets stay resident, and text columns such as
+        # prefecture names repeat a few labels over every row. As categoricals
+        # each row holds an integer code, which the panel also reuses as is.
+        text_columns = dataframe.select_dtypes(include="object").columns
+        if text_columns.empty:
+            return dataframe
+        return dataframe.astype({column: "category" for column in text_columns}, copy=False)
+
+    def _resolve_data_file(self, path: str) -> Path:
+        if self.data_directory is None:
+            raise ValueError("Server-side data directory is not configured")
+
+        data_directory = self.data_directory.resolve()
+        file_path = (data_directory / path).resolve()
+        if not file_path.is_relative_to(data_directory):
+            raise ValueError("Data file path must stay inside the data directory")
+        if not file_path.is_file():
+            raise DataFileNotFoundException(path)
+
+        return file_path
+
+    def _to_registered_dataset(self, dataset_id: str, dataframe: pd.DataFrame) -> RegisteredDataset:
+        return RegisteredDataset(
+            dataset_id=dataset_id,
+            nobs=len(dataframe),
+            columns=[str(column) for column in dataframe.columns]
+        )
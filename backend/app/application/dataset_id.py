@@ -0,0 +1,17 @@
+import hashlib
+
+from app.domain.dataframe_loader import DatasetSource
+
+CHUNK_SIZE = 1024 * 1024
+
+
+def compute_dataset_id(csv_bytes: DatasetSource) -> str:
+    if isinstance(csv_bytes, bytes):
+        return hashlib.sha256(csv_bytes).hexdigest()
+
+    digest = hashlib.sha256()
+    start = csv_bytes.tell()
+    while chunk := csv_bytes.read(CHUNK_SIZE):
+        digest.update(chunk)
+    csv_bytes.seek(start)
+    return digest.hexdigest()
@@ -0,0 +1,3 @@
+class AnalysisJobCancelledException(Exception):
+    def __init__(self):
+        super().__init__("Analysis job was cancelled")
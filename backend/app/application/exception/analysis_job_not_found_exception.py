@@ -0,0 +1,4 @@
+class AnalysisJobNotFoundException(Exception):
+    def __init__(self, job_id: str):
+        self.job_id = job_id
+        super().__init__(f"Analysis job not found: {job_id}")
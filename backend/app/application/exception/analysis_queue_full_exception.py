@@ -0,0 +1,4 @@
+class AnalysisQueueFullException(Exception):
+    def __init__(self, retry_after_seconds: int):
+        self.retry_after_seconds = retry_after_seconds
+        super().__init__(f"Analysis queue is full. Retry after {retry_after_seconds} seconds")
@@ -0,0 +1,5 @@
+class AnalysisTimeoutException(Exception):
+    def __init__(self, timeout_seconds: float, retry_after_seconds: int):
+        self.timeout_seconds = timeout_seconds
+        self.retry_after_seconds = retry_after_seconds
+        super().__init__(f"Analysis did not finish within {timeout_seconds} seconds")
@@ -0,0 +1,4 @@
+class DataFileNotFoundException(Exception):
+    def __init__(self, path: str):
+        self.path = path
+        super().__init__(f"Data file does not exist in the data directory: {path}")
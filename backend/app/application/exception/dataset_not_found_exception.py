@@ -0,0 +1,4 @@
+class DatasetNotFoundException(Exception):
+    def __init__(self, dataset_id: str):
+        self.dataset_id = dataset_id
+        super().__init__(f"Dataset is not registered or has been evicted: {dataset_id}")
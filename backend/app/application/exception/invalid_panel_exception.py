@@ -0,0 +1,8 @@
+from app.domain.model.panel_issue import PanelIssue
+
+
+class InvalidPanelException(Exception):
+    def __init__(self, issues: list[PanelIssue]):
+        self.issues = issues
+        summary = ", ".join(f"{issue.kind} in {issue.columns} ({issue.count} rows)" for issue in issues)
+        super().__init__(f"The panel cannot be estimated: {summary}")
@@ -0,0 +1,4 @@
+class UploadTooLargeException(Exception):
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        super().__init__(f"Request body exceeds the maximum upload size of {max_bytes} bytes")
@@ -1,55 +1,720 @@
+from collections.abc import Callable, Iterable, Iterator
+
 import pandas as pd
 
+from app.application import job_progress, request_timings
+from app.application.dataset_id import compute_dataset_id
+from app.application.panel_validation import validate_panel
+from app.application.exception.dataset_not_found_exception import DatasetNotFoundException
+from app.application.exception.invalid_panel_exception import InvalidPanelException
 from app.application.exception.missing_columns_exception import MissingColumnsException
+from app.domain.analysis_result_cache import AnalysisResultCache
+from app.domain.model.absorption_specification import AbsorptionSpecification
+from app.domain.model.analysis_specification import AnalysisSpecification
+from app.domain.model.bootstrap_specification import BootstrapSpecification
+from app.domain.model.dataset_schema import DatasetSchema
 from app.domain.model.fixed_effects_result import FixedEffectsResult
+from app.domain.model.panel import Panel
+from app.domain.model.panel_validation_options import PanelValidationOptions
+from app.domain.model.panel_validation_outcome import PanelValidationOutcome
+from app.domain.model.permutation_specification import PermutationSpecification
+from app.domain.model.subset_search_result import SubsetSearchResult
+from app.domain.model.subset_search_specification import SubsetSearchSpecification
+from app.domain.model.window_estimate import WindowEstimate
+from app.domain.model.window_specification import WindowSpecification
 from app.domain.service.fixed_effects_analysis_service import FixedEffectsAnalysisService
-from app.domain.dataframe_loader import DataFrameLoader
+from app.domain.service.numpy_fixed_effects_estimator import NumpyFixedEffectsEstimator
+from app.domain.service.permutation_inference import PermutationInference
+from app.domain.service.panel_sufficient_statistics import PanelSufficientStatistics
+from app.domain.service.subset_search import SubsetSearch
+from app.domain.service.sufficient_statistics_estimator import SufficientStatisticsEstimator
+from app.domain.service.wild_cluster_bootstrap import WildClusterBootstrap
+from app.domain.service.windowed_estimation import WindowedEstimation
+from app.domain.dataframe_loader import DatasetSource, DataFrameLoader
+from app.domain.dataset_repository import DatasetRepository
+from app.domain.fixed_effects_estimator import FixedEffectsEstimator
+from app.domain.parsed_dataset_cache import ParsedDatasetCache
+from app.domain.sufficient_statistics_repository import SufficientStatisticsRepository
+
+# Called with the specification's position in the batch as soon as its
+# result, including any bootstrap or permutation inference, is ready.
+ResultCallback = Callable[[int, FixedEffectsResult], None]
 
 
 class FertilityAnalysisApplicationService:
-    def __init__(self, csv_loader: DataFrameLoader):
+    def __init__(
+        self,
+        csv_loader: DataFrameLoader,
+        estimator: FixedEffectsEstimator | None = None,
+        dataset_repository: DatasetRepository | None = None,
+        result_cache: AnalysisResultCache | None = None,
+        statistics_repository: SufficientStatisticsRepository | None = None,
+        parsed_cache: ParsedDatasetCache | None = None,
+        chunked_min_bytes: int | None = None,
+        chunk_rows: int = 100_000,
+        bootstrap_workers: int = 1,
+        permutation_workers: int = 1
+    ):
         self.csv_loader = csv_loader
+        self.estimator = estimator or NumpyFixedEffectsEstimator()
+        self.dataset_repository = dataset_repository
+        self.result_cache = result_cache
+        self.statistics_repository = statistics_repository
+        self.parsed_cache = parsed_cache
+        self.chunked_min_bytes = chunked_min_bytes
+        self.chunk_rows = chunk_rows
+        self.bootstrap_workers = bootstrap_workers
+        self.permutation_workers = permutation_workers
 
     def analyze(
         self,
-        csv_bytes: bytes,
+        csv_bytes: DatasetSource,
         dependent_var: str,
         independent_vars: list[str],
         entity_var: str = "prefecture",
-        time_var: str = "year"
+        time_var: str = "year",
+        bootstrap: BootstrapSpecification | None = None,
+        absorption: AbsorptionSpecification | None = None,
+        permutation: PermutationSpecification | None = None,
+        validation: PanelValidationOptions = PanelValidationOptions()
     ) -> FixedEffectsResult:
 
-        dataframe = self.csv_loader.load(csv_bytes)
-        dataframe = self._normalize_dataframe(
+        specification = AnalysisSpecification(
+            dependent_var, tuple(independent_vars), entity_var, time_var, bootstrap, absorption, permutation, validation
+        )
+        dataset_id = compute_dataset_id(csv_bytes) if self.result_cache is not None else None
+
+        if self.chunked_min_bytes is not None and self._source_size(csv_bytes) >= self.chunked_min_bytes:
+            if bootstrap is not None:
+                raise ValueError("Bootstrap inference is not available for uploads estimated in row blocks")
+            if absorption is not None:
+                raise ValueError("Additional absorbed effects are not available for uploads estimated in row blocks")
+            if permutation is not None:
+                raise ValueError("Permutation inference is not available for uploads estimated in row blocks")
+            if validation.drop_singletons:
+                raise ValueError("Singleton entities cannot be dropped from uploads estimated in row blocks")
+            return self._analyze_with_cache(
+                dataset_id,
+                specification,
+                lambda: self._analyze_chunks(csv_bytes, specification)
+            )
+
+        return self._analyze_with_cache(
+            dataset_id,
+            specification,
+            lambda: self._analyze_dataframe(
+                self._load(csv_bytes, DatasetSchema.from_specifications([specification]), dataset_id),
+                specification
+            )
+        )
+
+    def analyze_dataset(
+        self,
+        dataset_id: str,
+        dependent_var: str,
+        independent_vars: list[str],
+        entity_var: str = "prefecture",
+        time_var: str = "year",
+        bootstrap: BootstrapSpecification | None = None,
+        absorption: AbsorptionSpecification | None = None,
+        permutation: PermutationSpecification | None = None,
+        validation: PanelValidationOptions = PanelValidationOptions()
+    ) -> FixedEffectsResult:
+
+        specification = AnalysisSpecification(
+            dependent_var, tuple(independent_vars), entity_var, time_var, bootstrap, absorption, permutation, validation
+        )
+
+        if (
+            self.statistics_repository is not None
+            and bootstrap is None
+            and absorption is None
+            and permutation is None
+            and not validation.drop_singletons
+        ):
+            return self._analyze_with_cache(
+                dataset_id,
+                specification,
+                lambda: self._analyze_statistics(dataset_id, specification)
+            )
+
+        return self._analyze_with_cache(
+            dataset_id,
+            specification,
+            lambda: self._analyze_dataframe(self._get_dataset(dataset_id), specification)
+        )
+
+    def _analyze_with_cache(
+        self,
+        dataset_id: str | None,
+        specification: AnalysisSpecification,
+        analyze: Callable[[], FixedEffectsResult]
+    ) -> FixedEffectsResult:
+
+        if self.result_cache is None or dataset_id is None:
+            return analyze()
+
+        result = self.result_cache.get(dataset_id, specification)
+        if result is None:
+            result = analyze()
+            self.result_cache.put(dataset_id, specification, result)
+
+        return result
+
+    def analyze_batch(
+        self,
+        csv_bytes: DatasetSource,
+        specifications: list[AnalysisSpecification],
+        on_result: ResultCallback | None = None
+    ) -> list[FixedEffectsResult]:
+
+        dataset_id = compute_dataset_id(csv_bytes) if self.result_cache is not None else None
+
+        return self._analyze_batch_with_cache(
+            dataset_id,
+            specifications,
+            lambda: self._load(csv_bytes, DatasetSchema.from_specifications(specifications), dataset_id),
+            on_result
+        )
+
+    def analyze_dataset_batch(
+        self,
+        dataset_id: str,
+        specifications: list[AnalysisSpecification],
+        on_result: ResultCallback | None = None
+    ) -> list[FixedEffectsResult]:
+
+        return self._analyze_batch_with_cache(
+            dataset_id,
+            specifications,
+            lambda: self._get_dataset(dataset_id),
+            on_result
+        )
+
+    def search_subsets(
+        self,
+        csv_bytes: DatasetSource,
+        specification: SubsetSearchSpecification,
+        validation: PanelValidationOptions = PanelValidationOptions()
+    ) -> SubsetSearchResult:
+
+        # Every subset is estimated on the rows where all candidates are
+        # observed, so that their criteria are comparable.
+        columns = (specification.dependent_var, *specification.candidate_vars)
+        panel = self._normalize_panel(
+            self._load(
+                csv_bytes,
+                DatasetSchema.from_specifications([AnalysisSpecification(
+                    specification.dependent_var,
+                    specification.candidate_vars,
+                    specification.entity_var,
+                    specification.time_var
+                )])
+            ),
+            specification.dependent_var,
+            list(specification.candidate_vars),
+            specification.entity_var,
+            specification.time_var,
+            validation=validation
+        )
+        with request_timings.stage("fit"):
+            statistics = PanelSufficientStatistics.from_panel(panel, columns)
+
+        with request_timings.stage("search"):
+            return SubsetSearch().run(statistics, specification)
+
+    def search_dataset_subsets(
+        self,
+        dataset_id: str,
+        specification: SubsetSearchSpecification,
+        validation: PanelValidationOptions = PanelValidationOptions()
+    ) -> SubsetSearchResult:
+
+        statistics = self._dataset_statistics(
+            dataset_id,
+            specification.dependent_var,
+            list(specification.candidate_vars),
+            specification.entity_var,
+            specification.time_var,
+            validation
+        )
+
+        with request_timings.stage("search"):
+            return SubsetSearch().run(statistics, specification)
+
+    def analyze_windows(
+        self,
+        csv_bytes: DatasetSource,
+        dependent_var: str,
+        independent_vars: list[str],
+        window: WindowSpecification,
+        entity_var: str = "prefecture",
+        time_var: str = "year",
+        validation: PanelValidationOptions = PanelValidationOptions()
+    ) -> list[WindowEstimate]:
+
+        specification = AnalysisSpecification(
+            dependent_var, tuple(independent_vars), entity_var, time_var, validation=validation
+        )
+        return self._analyze_windows(
+            self._load(csv_bytes, DatasetSchema.from_specifications([specification])),
+            specification,
+            window
+        )
+
+    def analyze_dataset_windows(
+        self,
+        dataset_id: str,
+        dependent_var: str,
+        independent_vars: list[str],
+        window: WindowSpecification,
+        entity_var: str = "prefecture",
+        time_var: str = "year",
+        validation: PanelValidationOptions = PanelValidationOptions()
+    ) -> list[WindowEstimate]:
+
+        specification = AnalysisSpecification(
+            dependent_var, tuple(independent_vars), entity_var, time_var, validation=validation
+        )
+        return self._analyze_windows(self._get_dataset(dataset_id), specification, window)
+
+    def _analyze_windows(
+        self,
+        dataframe: pd.DataFrame,
+        specification: AnalysisSpecification,
+        window: WindowSpecification
+    ) -> list[WindowEstimate]:
+
+        panel = self._normalize_panel(
             dataframe,
-            dependent_var,
+            specification.dependent_var,
+            list(specification.independent_vars),
+            specification.entity_var,
+            specification.time_var,
+            validation=specification.validation
+        )
+
+        with request_timings.stage("fit"):
+            return WindowedEstimation().run(
+                panel,
+                specification.dependent_var,
+                list(specification.independent_vars),
+                specification.entity_var,
+                specification.time_var,
+                window
+            )
+
+    def _analyze_chunks(
+        self,
+        csv_bytes: DatasetSource,
+        specification: AnalysisSpecification
+    ) -> FixedEffectsResult:
+
+        # Only one row block is parsed at a time; the panel is carried
+        # between blocks as per-entity means and a k x k cross-product.
+        columns = tuple(sorted({specification.dependent_var, *specification.independent_vars}))
+        with request_timings.stage("parse"):
+            statistics = PanelSufficientStatistics.accumulate(
+                self._validate_chunks(
+                    self.csv_loader.load_chunks(
+                        csv_bytes,
+                        DatasetSchema.from_specifications([specification]),
+                        self.chunk_rows
+                    ),
+                    specification
+                ),
+                specification.entity_var,
+                columns
+            )
+        request_timings.record_shape(statistics.nobs, len(columns))
+
+        with request_timings.stage("fit"):
+            return SufficientStatisticsEstimator().fit(
+                statistics,
+                specification.dependent_var,
+                list(specification.independent_vars)
+            )
+
+    def _validate_chunks(
+        self,
+        chunks: Iterable[pd.DataFrame],
+        specification: AnalysisSpecification
+    ) -> Iterator[pd.DataFrame]:
+
+        # Repeated keys and singletons only show across blocks, so row blocks
+        # are checked for values alone.
+        offset = 0
+        for chunk in chunks:
+            yield validate_panel(
+                chunk,
+                list(dict.fromkeys([specification.dependent_var, *specification.independent_vars])),
+                specification.entity_var,
+                specification.time_var,
+                options=specification.validation,
+                row_offset=offset,
+                check_keys=False
+            )
+            offset += len(chunk)
+
+    def _source_size(self, csv_bytes: DatasetSource) -> int:
+        if isinstance(csv_bytes, bytes):
+            return len(csv_bytes)
+
+        start = csv_bytes.tell()
+        size = csv_bytes.seek(0, 2)
+        csv_bytes.seek(start)
+        return size - start
+
+    def _analyze_statistics(
+        self,
+        dataset_id: str,
+        specification: AnalysisSpecification
+    ) -> FixedEffectsResult:
+
+        statistics = self._dataset_statistics(
+            dataset_id,
+            specification.dependent_var,
+            list(specification.independent_vars),
+            specification.entity_var,
+            specification.time_var,
+            specification.validation
+        )
+
+        with request_timings.stage("fit"):
+            return SufficientStatisticsEstimator().fit(
+                statistics,
+                specification.dependent_var,
+                list(specification.independent_vars)
+            )
+
+    def _dataset_statistics(
+        self,
+        dataset_id: str,
+        dependent_var: str,
+        independent_vars: list[str],
+        entity_var: str,
+        time_var: str,
+        validation: PanelValidationOptions
+    ) -> PanelSufficientStatistics:
+
+        # Statistics are kept per column set so that appended time slices can
+        # update them without revisiting earlier rows. They cover every row,
+        # so they are shared only by requests whose validation dropped none.
+        # That outcome is recorded per set of options, so stored statistics
+        # never stand in for a check that the options ask for.
+        variables = tuple(dict.fromkeys([dependent_var, *independent_vars]))
+        columns = tuple(sorted(variables))
+        statistics = None
+        if self.statistics_repository is not None:
+            outcome = self.statistics_repository.get_validation(dataset_id, entity_var, time_var, columns, validation)
+            if outcome is not None and outcome.issues:
+                raise InvalidPanelException(list(outcome.issues))
+            if outcome is not None:
+                statistics = self.statistics_repository.get(dataset_id, entity_var, columns)
+
+        if statistics is None:
+            dataframe = self._get_dataset(dataset_id)
+            try:
+                validated = self._validate(
+                    dataframe, dependent_var, independent_vars, entity_var, time_var, validation=validation
+                )
+            except InvalidPanelException as e:
+                if self.statistics_repository is not None:
+                    self.statistics_repository.put_validation(
+                        dataset_id, PanelValidationOutcome(entity_var, time_var, columns, validation, tuple(e.issues))
+                    )
+                raise
+
+            shared = self.statistics_repository is not None and len(validated) == len(dataframe)
+            with request_timings.stage("normalize"):
+                panel = Panel.from_dataframe(validated, entity_var, time_var, list(variables))
+            with request_timings.stage("fit"):
+                statistics = PanelSufficientStatistics.from_panel(panel, columns)
+            if shared:
+                self.statistics_repository.put(dataset_id, statistics)
+                self.statistics_repository.put_validation(
+                    dataset_id, PanelValidationOutcome(entity_var, time_var, columns, validation)
+                )
+
+        return statistics
+
+    def _get_dataset(self, dataset_id: str) -> pd.DataFrame:
+        dataframe = None
+        if self.dataset_repository is not None:
+            dataframe = self.dataset_repository.get(dataset_id)
+
+        if dataframe is None:
+            raise DatasetNotFoundException(dataset_id)
+
+        request_timings.record_shape(*dataframe.shape)
+        return dataframe
+
+    def _load(self, csv_bytes: DatasetSource, schema: DatasetSchema, dataset_id: str | None = None) -> pd.DataFrame:
+        if self.parsed_cache is None:
+            with request_timings.stage("parse"):
+                dataframe = self.csv_loader.load(csv_bytes, schema)
+        else:
+            # The cache holds every column of the file, so a file is parsed
+            # once whatever the specifications ask of it.
+            dataset_id = dataset_id or compute_dataset_id(csv_bytes)
+            dataframe = self.parsed_cache.get(dataset_id)
+            if dataframe is None:
+                with request_timings.stage("parse"):
+                    dataframe = self.csv_loader.load(csv_bytes)
+                self.parsed_cache.put(dataset_id, dataframe)
+            dataframe = self._project(dataframe, schema)
+
+        request_timings.record_shape(*dataframe.shape)
+        return dataframe
+
+    def _project(self, dataframe: pd.DataFrame, schema: DatasetSchema) -> pd.DataFrame:
+        # The columns and types that reading with ``schema`` would give.
+        missing_columns = [column for column in schema.columns if column not in dataframe.columns]
+        if missing_columns:
+            raise MissingColumnsException(missing_columns)
+
+        projected = dataframe[schema.columns]
+        try:
+            return projected.astype(schema.dtypes, copy=False)
+        except (TypeError, ValueError):
+            return projected.astype(schema.text_dtypes, copy=False)
+
+    def _analyze_batch_with_cache(
+        self,
+        dataset_id: str | None,
+        specifications: list[AnalysisSpecification],
+        load_dataframe: Callable[[], pd.DataFrame],
+        on_result: ResultCallback | None = None
+    ) -> list[FixedEffectsResult]:
+
+        results: list[FixedEffectsResult | None] = [None] * len(specifications)
+        if self.result_cache is not None and dataset_id is not None:
+            results = [self.result_cache.get(dataset_id, specification) for specification in specifications]
+
+        pending = [index for index, result in enumerate(results) if result is None]
+        if on_result is not None:
+            for index, result in enumerate(results):
+                if result is not None:
+                    on_result(index, result)
+
+        def finish(position: int, result: FixedEffectsResult) -> None:
+            index = pending[position]
+            results[index] = result
+            if self.result_cache is not None and dataset_id is not None:
+                self.result_cache.put(dataset_id, specifications[index], result)
+            if on_result is not None:
+                on_result(index, result)
+
+        if pending:
+            self._analyze_dataframe_batch(
+                load_dataframe(),
+                [specifications[index] for index in pending],
+                finish
+            )
+
+        return results
+
+    def _analyze_dataframe_batch(
+        self,
+        dataframe: pd.DataFrame,
+        specifications: list[AnalysisSpecification],
+        on_result: ResultCallback | None = None
+    ) -> list[FixedEffectsResult]:
+
+        required_columns = list(dict.fromkeys(
+            column
+            for specification in specifications
+            for column in (
+                specification.dependent_var,
+                *specification.independent_vars,
+                specification.entity_var,
+                specification.time_var,
+                *(specification.absorption.columns if specification.absorption is not None else ())
+            )
+        ))
+        missing_columns = set(required_columns) - set(dataframe.columns)
+
+        if missing_columns:
+            raise MissingColumnsException(list(missing_columns))
+
+        # Specifications sharing keys and validation options are validated,
+        # and fitted, on one frame; every group is checked before any fit.
+        groups: dict[tuple[str, str, PanelValidationOptions], list[int]] = {}
+        for index, specification in enumerate(specifications):
+            key = (specification.entity_var, specification.time_var, specification.validation)
+            groups.setdefault(key, []).append(index)
+
+        validated = {}
+        with request_timings.stage("validate"):
+            for (entity_var, time_var, validation), indices in groups.items():
+                variables = list(dict.fromkeys(
+                    column
+                    for index in indices
+                    for column in (specifications[index].dependent_var, *specifications[index].independent_vars)
+                ))
+                effect_vars = tuple(dict.fromkeys(
+                    column
+                    for index in indices
+                    if specifications[index].absorption is not None
+                    for column in specifications[index].absorption.columns
+                ))
+                validated[entity_var, time_var, validation] = (
+                    validate_panel(dataframe[required_columns], variables, entity_var, time_var, effect_vars, validation),
+                    variables,
+                    effect_vars
+                )
+
+        panels = {}
+        with request_timings.stage("normalize"):
+            for (entity_var, time_var, validation), (frame, variables, effect_vars) in validated.items():
+                panels[entity_var, time_var, validation] = Panel.from_dataframe(
+                    frame, entity_var, time_var, variables, effect_vars
+                )
+
+        # Background jobs report progress and honour cancellation between
+        # the joint fit and each specification's inference.
+        steps = len(specifications) + 1
+        job_progress.checkpoint(0, steps)
+        results: list[FixedEffectsResult | None] = [None] * len(specifications)
+        with request_timings.stage("fit"):
+            for key, indices in groups.items():
+                fitted = self.estimator.fit_many(panels[key], [specifications[index] for index in indices])
+                for index, result in zip(indices, fitted):
+                    results[index] = result
+        job_progress.checkpoint(1, steps)
+
+        inferred = []
+        for step, (specification, result) in enumerate(zip(specifications, results), start=2):
+            panel = panels[specification.entity_var, specification.time_var, specification.validation]
+            inferred.append(self._permute(panel, specification, self._bootstrap(panel, specification, result)))
+            if on_result is not None:
+                on_result(step - 2, inferred[-1])
+            job_progress.checkpoint(step, steps)
+        return inferred
+
+    def _analyze_dataframe(
+        self,
+        dataframe: pd.DataFrame,
+        specification: AnalysisSpecification
+    ) -> FixedEffectsResult:
+
+        independent_vars = list(specification.independent_vars)
+        panel = self._normalize_panel(
+            dataframe,
+            specification.dependent_var,
             independent_vars,
-            entity_var,
-            time_var
+            specification.entity_var,
+            specification.time_var,
+            specification.absorption.columns if specification.absorption is not None else (),
+            specification.validation
         )
 
         analysis_service = FixedEffectsAnalysisService(
-            dependent_var=dependent_var,
+            dependent_var=specification.dependent_var,
             independent_vars=independent_vars,
-            entity_var=entity_var,
-            time_var=time_var
+            entity_var=specification.entity_var,
+            time_var=specification.time_var,
+            estimator=self.estimator,
+            absorption=specification.absorption
+        )
+
+        with request_timings.stage("fit"):
+            result = analysis_service.analyze(panel)
+        result = self._bootstrap(panel, specification, result)
+        return self._permute(panel, specification, result)
+
+    def _bootstrap(
+        self,
+        panel: Panel,
+        specification: AnalysisSpecification,
+        result: FixedEffectsResult
+    ) -> FixedEffectsResult:
+
+        if specification.bootstrap is None:
+            return result
+
+        with request_timings.stage("bootstrap"):
+            return WildClusterBootstrap(workers=self.bootstrap_workers).run(
+                panel,
+                result,
+                specification.dependent_var,
+                specification.entity_var,
+                specification.bootstrap,
+                specification.absorption,
+                self.estimator.sample(
+                    panel,
+                    specification.dependent_var,
+                    list(specification.independent_vars),
+                    specification.entity_var,
+                    specification.absorption
+                )
+            )
+
+    def _permute(
+        self,
+        panel: Panel,
+        specification: AnalysisSpecification,
+        result: FixedEffectsResult
+    ) -> FixedEffectsResult:
+
+        if specification.permutation is None:
+            return result
+
+        with request_timings.stage("permutation"):
+            return PermutationInference(workers=self.permutation_workers).run(
+                panel,
+                result,
+                specification.dependent_var,
+                specification.entity_var,
+                specification.time_var,
+                specification.permutation,
+                specification.absorption
+            )
+
+    def _normalize_panel(
+        self,
+        dataframe: pd.DataFrame,
+        dependent_var: str,
+        independent_vars: list[str],
+        entity_var: str,
+        time_var: str,
+        effect_vars: tuple[str, ...] = (),
+        validation: PanelValidationOptions = PanelValidationOptions()
+    ) -> Panel:
+
+        dataframe = self._validate(
+            dataframe, dependent_var, independent_vars, entity_var, time_var, effect_vars, validation
         )
+        variables = list(dict.fromkeys([dependent_var] + independent_vars))
 
-        return analysis_service.analyze(dataframe)
+        # Everything past validation works on the compact panel.
+        with request_timings.stage("normalize"):
+            return Panel.from_dataframe(dataframe, entity_var, time_var, variables, effect_vars)
 
-    def _normalize_dataframe(
+    def _validate(
         self,
         dataframe: pd.DataFrame,
         dependent_var: str,
         independent_vars: list[str],
         entity_var: str,
-        time_var: str
+        time_var: str,
+        effect_vars: tuple[str, ...] = (),
+        validation: PanelValidationOptions = PanelValidationOptions()
     ) -> pd.DataFrame:
-        
-        required_columns = [dependent_var] + independent_vars + [entity_var, time_var]
+
+        required_columns = list(dict.fromkeys([dependent_var] + independent_vars + [entity_var, time_var, *effect_vars]))
         missing_columns = set(required_columns) - set(dataframe.columns)
-        
+
         if missing_columns:
             raise MissingColumnsException(list(missing_columns))
-                
-        return dataframe[required_columns]
+
+        variables = list(dict.fromkeys([dependent_var] + independent_vars))
+        with request_timings.stage("validate"):
+            return validate_panel(
+                dataframe[required_columns],
+                variables,
+                entity_var,
+                time_var,
+                effect_vars,
+                validation
+            )
@@ -0,0 +1,41 @@
+from contextvars import ContextVar, Token
+import threading
+
+from app.application.exception.analysis_job_cancelled_exception import AnalysisJobCancelledException
+
+
+class JobProgress:
+    """Progress and cancellation flag of one running job. The analysis code
+    reports through `checkpoint`, which is a no-op outside a job, and stops
+    at the next checkpoint once the job is cancelled."""
+
+    def __init__(self):
+        self.fraction = 0.0
+        self._cancelled = threading.Event()
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+
+_current: ContextVar[JobProgress | None] = ContextVar("job_progress", default=None)
+
+
+def begin(progress: JobProgress) -> Token:
+    return _current.set(progress)
+
+
+def end(token: Token) -> None:
+    _current.reset(token)
+
+
+def checkpoint(completed: int, total: int) -> None:
+    progress = _current.get()
+    if progress is None:
+        return
+    if progress.cancelled:
+        raise AnalysisJobCancelledException()
+    progress.fraction = completed / total if total else 1.0
@@ -0,0 +1,134 @@
+import numpy as np
+import pandas as pd
+
+from app.application.exception.invalid_panel_exception import InvalidPanelException
+from app.domain.model.panel_issue import PanelIssue, PanelIssueKind
+from app.domain.model.panel_validation_options import PanelValidationOptions
+
+# Offending rows listed per issue; the count covers all of them.
+MAX_REPORTED_ROWS = 20
+
+
+def validate_panel(
+    dataframe: pd.DataFrame,
+    variables: list[str],
+    entity_var: str,
+    time_var: str,
+    effect_vars: tuple[str, ...] = (),
+    options: PanelValidationOptions = PanelValidationOptions(),
+    row_offset: int = 0,
+    check_keys: bool = True,
+    check_singletons: bool = True,
+) -> pd.DataFrame:
+    """Check the projected columns before anything is fitted and raise
+    ``InvalidPanelException`` listing every problem found: values that are not
+    numbers, infinite values, missing values, repeated (entity, time) keys
+    and entities observed only once.
+
+    With ``drop_missing``, rows missing a key are dropped and missing
+    variable values are left to each model's complete-case sample. With
+    ``drop_singletons``, entities with a single complete row are dropped.
+    Variables read as text are returned as numbers.
+
+    Row blocks of a larger upload are checked with ``check_keys`` off, since
+    repeated keys and singletons only show across blocks, and ``row_offset``
+    set to the block's first row. Time slices appended to a dataset are
+    checked with ``check_singletons`` off, since their entities usually have
+    rows in the earlier periods."""
+    issues: list[PanelIssue] = []
+    dataframe, non_numeric = _to_numeric(dataframe, variables, issues, row_offset)
+
+    # One pass over the variables as a single float matrix.
+    values = dataframe[variables].to_numpy(dtype=np.float64)
+    infinite = np.isinf(values)
+    missing_values = np.isnan(values)
+    key_vars = list(dict.fromkeys([entity_var, time_var, *effect_vars]))
+    missing_keys = dataframe[key_vars].isna().to_numpy()
+
+    _report_columns(issues, "infinite", variables, infinite, row_offset)
+    if not options.drop_missing:
+        _report_columns(issues, "missing", variables, missing_values & ~non_numeric, row_offset)
+        _report_columns(issues, "missing", key_vars, missing_keys, row_offset)
+
+    dropped = missing_keys.any(axis=1) if options.drop_missing else np.zeros(len(dataframe), dtype=bool)
+    if check_keys:
+        dropped |= _check_keys(
+            dataframe, entity_var, time_var, missing_values, missing_keys, options, issues, row_offset, check_singletons
+        )
+
+    if issues:
+        raise InvalidPanelException(issues)
+    return dataframe[~dropped] if dropped.any() else dataframe
+
+
+def _check_keys(
+    dataframe: pd.DataFrame,
+    entity_var: str,
+    time_var: str,
+    missing_values: np.ndarray,
+    missing_keys: np.ndarray,
+    options: PanelValidationOptions,
+    issues: list[PanelIssue],
+    row_offset: int,
+    check_singletons: bool,
+) -> np.ndarray:
+    keyed = ~missing_keys[:, :2].any(axis=1)
+    duplicated = np.zeros(len(dataframe), dtype=bool)
+    duplicated[keyed] = dataframe.loc[keyed, [entity_var, time_var]].duplicated(keep=False).to_numpy()
+    _report(issues, "duplicate_key", [entity_var, time_var], duplicated, row_offset)
+    if not check_singletons:
+        return np.zeros(len(dataframe), dtype=bool)
+
+    # Singletons are judged on rows that every requested column observes;
+    # dropping them leaves the other entities' counts unchanged.
+    complete = ~(missing_values.any(axis=1) | missing_keys.any(axis=1))
+    codes, entities = pd.factorize(dataframe[entity_var])
+    # Rows without an entity (code -1) look up the extra, empty last slot.
+    counts = np.bincount(codes[complete & (codes >= 0)], minlength=len(entities) + 1)
+    singleton = counts[codes] == 1
+    if options.drop_singletons:
+        return singleton
+    _report(issues, "singleton_entity", [entity_var], singleton & complete, row_offset)
+    return np.zeros(len(dataframe), dtype=bool)
+
+
+def _to_numeric(
+    dataframe: pd.DataFrame,
+    variables: list[str],
+    issues: list[PanelIssue],
+    row_offset: int,
+) -> tuple[pd.DataFrame, np.ndarray]:
+    converted = {}
+    non_numeric = np.zeros((len(dataframe), len(variables)), dtype=bool)
+    for position, column in enumerate(variables):
+        series = dataframe[column]
+        if pd.api.types.is_numeric_dtype(series):
+            continue
+        numbers = pd.to_numeric(series, errors="coerce")
+        non_numeric[:, position] = (numbers.isna() & series.notna()).to_numpy()
+        _report(issues, "non_numeric", [column], non_numeric[:, position], row_offset)
+        converted[column] = numbers.astype(np.float64)
+    return (dataframe.assign(**converted) if converted else dataframe), non_numeric
+
+
+def _report_columns(
+    issues: list[PanelIssue],
+    kind: PanelIssueKind,
+    columns: list[str],
+    flags: np.ndarray,
+    row_offset: int,
+) -> None:
+    for column, column_flags in zip(columns, flags.T):
+        _report(issues, kind, [column], column_flags, row_offset)
+
+
+def _report(
+    issues: list[PanelIssue],
+    kind: PanelIssueKind,
+    columns: list[str],
+    flags: np.ndarray,
+    row_offset: int = 0,
+) -> None:
+    rows = np.flatnonzero(flags)
+    if rows.size:
+        issues.append(PanelIssue(kind, columns, int(rows.size), (rows[:MAX_REPORTED_ROWS] + row_offset).tolist()))
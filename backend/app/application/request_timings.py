@@ -0,0 +1,62 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+import threading
+import time
+
+
+class RequestTimings:
+    """Per-request record of stage durations, dataset shape and error class.
+    It travels in a context variable, which the analysis executor copies into
+    its worker threads, so stages timed there land on the request's record."""
+
+    def __init__(self):
+        self.stages: dict[str, float] = {}
+        self.rows: int | None = None
+        self.columns: int | None = None
+        self.error: str | None = None
+        self._lock = threading.Lock()
+
+    def add(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+
+
+_current: ContextVar[RequestTimings | None] = ContextVar("request_timings", default=None)
+
+
+def begin() -> tuple[RequestTimings, Token]:
+    timings = RequestTimings()
+    return timings, _current.set(timings)
+
+
+def end(token: Token) -> None:
+    _current.reset(token)
+
+
+def current() -> RequestTimings | None:
+    return _current.get()
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings = _current.get()
+        if timings is not None:
+            timings.add(name, time.perf_counter() - start)
+
+
+def record_shape(rows: int, columns: int) -> None:
+    timings = _current.get()
+    if timings is not None:
+        timings.rows = rows
+        timings.columns = columns
+
+
+def record_error(error_class: type[Exception]) -> None:
+    timings = _current.get()
+    if timings is not None:
+        timings.error = error_class.__name__
@@ -0,0 +1,19 @@
+from pathlib import Path
+
+from app.application.fertility_analysis_application_service import FertilityAnalysisApplicationService
+from app.domain.dataframe_loader import DataFrameLoader
+from app.domain.fixed_effects_estimator import FixedEffectsEstimator
+from app.domain.model.fixed_effects_result import FixedEffectsResult
+
+# Six prefectures from sample_panel_data.csv, small enough to fit in a few
+# milliseconds once the code paths are warm.
+WARM_UP_PANEL = Path(__file__).with_name("warm_up_panel.csv")
+
+
+def warm_up(csv_loader: DataFrameLoader, estimator: FixedEffectsEstimator) -> FixedEffectsResult:
+    """Run the bundled panel through the same loader and estimator as the
+    app, so that lazy imports and first-call set-up (CSV parser, LAPACK)
+    happen before the first request rather than during it. The service is
+    built without a cache or repositories so that nothing is retained."""
+    service = FertilityAnalysisApplicationService(csv_loader=csv_loader, estimator=estimator)
+    return service.analyze(WARM_UP_PANEL.read_bytes(), "TFR", ["unmarried", "employment_rate"])
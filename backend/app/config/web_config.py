@@ -1,4 +1,5 @@
-from typing import Annotated, Any
+from pathlib import Path
+from typing import Annotated, Any, Literal
 
 from pydantic import BeforeValidator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -20,4 +21,44 @@ class WebConfig(BaseSettings):
         list[str], BeforeValidator(parse_cors)
     ] = []
 
+    FIXED_EFFECTS_ESTIMATOR: Literal["numpy", "linearmodels"] = "numpy"
+
+    MAX_UPLOAD_BYTES: int = 100 * 1024 * 1024
+    CSV_ENGINE: Literal["c", "pyarrow"] = "c"
+    DATA_DIRECTORY: Path | None = None
+
+    ANALYSIS_BATCH_MAX_SPECIFICATIONS: int = 500
+    ANALYSIS_CHUNKED_MIN_BYTES: int | None = 64 * 1024 * 1024
+    ANALYSIS_CHUNK_ROWS: int = 100_000
+    ANALYSIS_BOOTSTRAP_MAX_DRAWS: int = 99_999
+    ANALYSIS_BOOTSTRAP_WORKERS: int = 4
+    ANALYSIS_PERMUTATION_MAX_DRAWS: int = 99_999
+    ANALYSIS_PERMUTATION_WORKERS: int = 4
+    ANALYSIS_SUBSET_MAX_CANDIDATES: int = 30
+
+    ANALYSIS_WORKERS: int = 4
+    ANALYSIS_QUEUE_DEPTH: int = 16
+    ANALYSIS_TIMEOUT_SECONDS: float = 60.0
+    ANALYSIS_RETRY_AFTER_SECONDS: int = 5
+
+    ANALYSIS_STREAM_HEARTBEAT_SECONDS: float = 5.0
+
+    ANALYSIS_JOB_WORKERS: int = 2
+    ANALYSIS_JOB_QUEUE_DEPTH: int = 64
+    ANALYSIS_JOB_MAX_RETAINED: int = 1000
+    ANALYSIS_JOB_RESULT_TTL_SECONDS: float = 3600.0
+
+    DATASET_REGISTRY_MAX_BYTES: int = 512 * 1024 * 1024
+    DATASET_STORE_DIRECTORY: Path | None = None
+    PARSED_DATASET_CACHE_DIRECTORY: Path | None = None
+    PARSED_DATASET_CACHE_MAX_BYTES: int = 4 * 1024 * 1024 * 1024
+    SUFFICIENT_STATISTICS_MAX_DATASETS: int = 256
+
+    METRICS_ENABLED: bool = True
+    WARM_UP_ENABLED: bool = True
+
+    ANALYSIS_RESULT_CACHE_ENABLED: bool = True
+    ANALYSIS_RESULT_CACHE_MAX_ENTRIES: int = 1024
+    ANALYSIS_RESULT_CACHE_TTL_SECONDS: float = 3600.0
+
 web_config = WebConfig()
@@ -1,14 +1,159 @@
+from functools import lru_cache
 
-from fastapi import Depends
-
+from app.config.web_config import web_config
+from app.infrastructure.analysis_executor import AnalysisExecutor
+from app.infrastructure.in_memory_analysis_job_store import InMemoryAnalysisJobStore
+from app.infrastructure.arrow_dataframe_loader import ArrowDataFrameLoader
 from app.infrastructure.csv_dataframe_loader import CsvDataFrameLoader
+from app.infrastructure.disk_backed_dataset_repository import DiskBackedDatasetRepository
+from app.infrastructure.disk_parsed_dataset_cache import DiskParsedDatasetCache
+from app.infrastructure.format_detecting_dataframe_loader import FormatDetectingDataFrameLoader
+from app.infrastructure.in_memory_analysis_result_cache import InMemoryAnalysisResultCache
+from app.infrastructure.in_memory_dataset_repository import InMemoryDatasetRepository
+from app.infrastructure.in_memory_sufficient_statistics_repository import InMemorySufficientStatisticsRepository
+from app.infrastructure.memory_mapped_dataset_repository import MemoryMappedDatasetRepository
+from app.infrastructure.metrics_registry import MetricsRegistry
+from app.infrastructure.request_metrics import RequestMetrics
+from app.domain.analysis_job_store import AnalysisJobStore
+from app.domain.analysis_result_cache import AnalysisResultCache
 from app.domain.dataframe_loader import DataFrameLoader
+from app.domain.dataset_repository import DatasetRepository
+from app.domain.fixed_effects_estimator import FixedEffectsEstimator
+from app.domain.parsed_dataset_cache import ParsedDatasetCache
+from app.domain.sufficient_statistics_repository import SufficientStatisticsRepository
+from app.domain.service.numpy_fixed_effects_estimator import NumpyFixedEffectsEstimator
+from app.application.analysis_job_service import AnalysisJobService
+from app.application.dataset_application_service import DatasetApplicationService
 from app.application.fertility_analysis_application_service import FertilityAnalysisApplicationService
 
+@lru_cache
 def get_dataframe_loader() -> DataFrameLoader:
-    return CsvDataFrameLoader()
+    return FormatDetectingDataFrameLoader(
+        csv_loader=CsvDataFrameLoader(engine=web_config.CSV_ENGINE),
+        arrow_loader=ArrowDataFrameLoader(),
+    )
+
+@lru_cache
+def get_parsed_dataset_cache() -> ParsedDatasetCache | None:
+    if web_config.PARSED_DATASET_CACHE_DIRECTORY is None:
+        return None
+    return DiskParsedDatasetCache(
+        directory=web_config.PARSED_DATASET_CACHE_DIRECTORY,
+        max_bytes=web_config.PARSED_DATASET_CACHE_MAX_BYTES,
+    )
+
+@lru_cache
+def get_dataset_repository() -> DatasetRepository:
+    # With several workers, a shared directory keeps one copy of each
+    # registered dataset instead of one per worker.
+    if web_config.DATASET_STORE_DIRECTORY is not None:
+        repository = MemoryMappedDatasetRepository(
+            directory=web_config.DATASET_STORE_DIRECTORY,
+            max_bytes=web_config.DATASET_REGISTRY_MAX_BYTES,
+        )
+    else:
+        repository = InMemoryDatasetRepository(max_bytes=web_config.DATASET_REGISTRY_MAX_BYTES)
+
+    parsed_cache = get_parsed_dataset_cache()
+    if parsed_cache is None:
+        return repository
+    return DiskBackedDatasetRepository(repository, parsed_cache)
+
+@lru_cache
+def get_sufficient_statistics_repository() -> SufficientStatisticsRepository | None:
+    # PanelOLS is the reference implementation, so it always refits raw rows.
+    if web_config.FIXED_EFFECTS_ESTIMATOR != "numpy":
+        return None
+    return InMemorySufficientStatisticsRepository(max_datasets=web_config.SUFFICIENT_STATISTICS_MAX_DATASETS)
+
+@lru_cache
+def get_analysis_result_cache() -> AnalysisResultCache | None:
+    if not web_config.ANALYSIS_RESULT_CACHE_ENABLED:
+        return None
+    return InMemoryAnalysisResultCache(
+        max_entries=web_config.ANALYSIS_RESULT_CACHE_MAX_ENTRIES,
+        ttl_seconds=web_config.ANALYSIS_RESULT_CACHE_TTL_SECONDS,
+    )
+
+@lru_cache
+def get_analysis_executor() -> AnalysisExecutor:
+    return AnalysisExecutor(
+        max_workers=web_config.ANALYSIS_WORKERS,
+        max_queue_depth=web_config.ANALYSIS_QUEUE_DEPTH,
+        timeout_seconds=web_config.ANALYSIS_TIMEOUT_SECONDS,
+        retry_after_seconds=web_config.ANALYSIS_RETRY_AFTER_SECONDS,
+    )
+
+@lru_cache
+def get_analysis_job_store() -> AnalysisJobStore:
+    return InMemoryAnalysisJobStore(max_jobs=web_config.ANALYSIS_JOB_MAX_RETAINED)
+
+@lru_cache
+def get_analysis_job_service() -> AnalysisJobService:
+    return AnalysisJobService(
+        job_store=get_analysis_job_store(),
+        max_workers=web_config.ANALYSIS_JOB_WORKERS,
+        max_queue_depth=web_config.ANALYSIS_JOB_QUEUE_DEPTH,
+        result_ttl_seconds=web_config.ANALYSIS_JOB_RESULT_TTL_SECONDS,
+        retry_after_seconds=web_config.ANALYSIS_RETRY_AFTER_SECONDS,
+    )
+
+@lru_cache
+def get_metrics_registry() -> MetricsRegistry:
+    registry = MetricsRegistry()
+    registry.gauge(
+        "analysis_executor_in_flight",
+        "Analyses running or queued on the executor.",
+        function=lambda: get_analysis_executor().in_flight,
+    )
+    registry.gauge(
+        "analysis_executor_capacity",
+        "Analyses the executor accepts before answering 503.",
+        function=lambda: web_config.ANALYSIS_WORKERS + web_config.ANALYSIS_QUEUE_DEPTH,
+    )
+    registry.gauge(
+        "analysis_jobs_in_flight",
+        "Background analysis jobs queued or running.",
+        function=lambda: get_analysis_job_service().in_flight,
+    )
+    return registry
+
+@lru_cache
+def get_request_metrics() -> RequestMetrics:
+    return RequestMetrics(get_metrics_registry())
+
+@lru_cache
+def get_fixed_effects_estimator() -> FixedEffectsEstimator:
+    if web_config.FIXED_EFFECTS_ESTIMATOR == "linearmodels":
+        # linearmodels pulls in statsmodels and scipy.stats, which take
+        # longer to import than the rest of the app combined.
+        from app.domain.service.linearmodels_fixed_effects_estimator import LinearmodelsFixedEffectsEstimator
+
+        return LinearmodelsFixedEffectsEstimator()
+    return NumpyFixedEffectsEstimator()
+
+@lru_cache
+def get_fertility_analysis_application_service() -> FertilityAnalysisApplicationService:
+    return FertilityAnalysisApplicationService(
+        csv_loader=get_dataframe_loader(),
+        estimator=get_fixed_effects_estimator(),
+        dataset_repository=get_dataset_repository(),
+        result_cache=get_analysis_result_cache(),
+        statistics_repository=get_sufficient_statistics_repository(),
+        parsed_cache=get_parsed_dataset_cache(),
+        chunked_min_bytes=(
+            web_config.ANALYSIS_CHUNKED_MIN_BYTES if web_config.FIXED_EFFECTS_ESTIMATOR == "numpy" else None
+        ),
+        chunk_rows=web_config.ANALYSIS_CHUNK_ROWS,
+        bootstrap_workers=web_config.ANALYSIS_BOOTSTRAP_WORKERS,
+        permutation_workers=web_config.ANALYSIS_PERMUTATION_WORKERS,
+    )
 
-def get_fertility_analysis_application_service(
-    csv_loader: CsvDataFrameLoader = Depends(get_dataframe_loader),
-) -> FertilityAnalysisApplicationService:
-    return FertilityAnalysisApplicationService(csv_loader=csv_loader)
+@lru_cache
+def get_dataset_application_service() -> DatasetApplicationService:
+    return DatasetApplicationService(
+        csv_loader=get_dataframe_loader(),
+        dataset_repository=get_dataset_repository(),
+        data_directory=web_config.DATA_DIRECTORY,
+        statistics_repository=get_sufficient_statistics_repository(),
+    )
@@ -0,0 +1,18 @@
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+
+from app.domain.model.analysis_job import AnalysisJob
+
+class AnalysisJobStore(ABC):
+    @abstractmethod
+    def get(self, job_id: str) -> AnalysisJob | None:
+        pass
+
+    @abstractmethod
+    def put(self, job: AnalysisJob) -> None:
+        pass
+
+    @abstractmethod
+    def update(self, job_id: str, change: Callable[[AnalysisJob], AnalysisJob]) -> AnalysisJob | None:
+        """Apply `change` atomically to the stored job, if it still exists."""
+        pass
@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+
+from app.domain.model.analysis_specification import AnalysisSpecification
+from app.domain.model.fixed_effects_result import FixedEffectsResult
+
+class AnalysisResultCache(ABC):
+    @abstractmethod
+    def get(self, dataset_id: str, specification: AnalysisSpecification) -> FixedEffectsResult | None:
+        pass
+
+    @abstractmethod
+    def put(self, dataset_id: str, specification: AnalysisSpecification, result: FixedEffectsResult) -> None:
+        pass
@@ -1,7 +1,22 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from pathlib import Path
+from typing import BinaryIO
+
 import pandas as pd
 
+from app.domain.model.dataset_schema import DatasetSchema
+
+DatasetSource = bytes | BinaryIO
+
 class DataFrameLoader(ABC):
     @abstractmethod
-    def load(self, csv_bytes: bytes) -> pd.DataFrame:
+    def load(self, csv_bytes: DatasetSource, schema: DatasetSchema | None = None) -> pd.DataFrame:
         pass
+
+    def load_file(self, path: Path, schema: DatasetSchema | None = None) -> pd.DataFrame:
+        with path.open("rb") as source:
+            return self.load(source, schema)
+
+    def load_chunks(self, csv_bytes: DatasetSource, schema: DatasetSchema, chunk_rows: int) -> Iterator[pd.DataFrame]:
+        yield self.load(csv_bytes, schema)
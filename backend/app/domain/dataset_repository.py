@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+import pandas as pd
+
+class DatasetRepository(ABC):
+    @abstractmethod
+    def get(self, dataset_id: str) -> pd.DataFrame | None:
+        pass
+
+    @abstractmethod
+    def put(self, dataset_id: str, dataframe: pd.DataFrame) -> None:
+        pass
@@ -0,0 +1,53 @@
+from abc import ABC, abstractmethod
+import numpy as np
+import pandas as pd
+
+from app.domain.model.absorption_specification import AbsorptionSpecification
+from app.domain.model.analysis_specification import AnalysisSpecification
+from app.domain.model.fixed_effects_result import FixedEffectsResult
+from app.domain.model.panel import Panel
+
+class FixedEffectsEstimator(ABC):
+    @abstractmethod
+    def fit(
+        self,
+        dataframe: pd.DataFrame | Panel,
+        dependent_var: str,
+        independent_vars: list[str],
+        entity_var: str,
+        time_var: str,
+        absorption: AbsorptionSpecification | None = None,
+    ) -> FixedEffectsResult:
+        pass
+
+    def fit_many(
+        self,
+        dataframe: pd.DataFrame | Panel,
+        specifications: list[AnalysisSpecification],
+    ) -> list[FixedEffectsResult]:
+        return [
+            self.fit(
+                dataframe,
+                specification.dependent_var,
+                list(specification.independent_vars),
+                specification.entity_var,
+                specification.time_var,
+                specification.absorption,
+            )
+            for specification in specifications
+        ]
+
+    def sample(
+        self,
+        panel: Panel,
+        dependent_var: str,
+        independent_vars: list[str],
+        entity_var: str,
+        absorption: AbsorptionSpecification | None = None,
+    ) -> np.ndarray:
+        """The rows ``fit`` estimates on: those observing every requested
+        variable, dropped ones included, the entity and the absorbed effects."""
+        return panel.complete(
+            [dependent_var, *independent_vars],
+            [entity_var, *(absorption.columns if absorption is not None else ())],
+        )
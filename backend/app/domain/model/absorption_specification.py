@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+
+@dataclass(frozen=True)
+class AbsorptionSpecification:
+    """Effects absorbed in addition to the entity effect. Each effect is a
+    single column or, with several columns, their interaction."""
+
+    effects: tuple[tuple[str, ...], ...]
+    tolerance: float = 1e-8
+    max_iterations: int = 1000
+
+    def __post_init__(self):
+        if not self.effects or not all(self.effects):
+            raise ValueError("Each absorbed effect must name at least one column")
+        if not self.tolerance > 0.0:
+            raise ValueError("Absorption tolerance must be positive")
+        if self.max_iterations < 1:
+            raise ValueError("Absorption max iterations must be a positive integer")
+
+    @property
+    def columns(self) -> tuple[str, ...]:
+        return tuple(dict.fromkeys(column for effect in self.effects for column in effect))
@@ -0,0 +1,29 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Literal
+
+from app.domain.model.fixed_effects_result import FixedEffectsResult
+from app.domain.model.panel_issue import PanelIssue
+
+AnalysisJobStatus = Literal["queued", "running", "succeeded", "failed", "cancelled"]
+
+FINISHED_STATUSES = ("succeeded", "failed", "cancelled")
+
+@dataclass(frozen=True)
+class AnalysisJob:
+    job_id: str
+    status: AnalysisJobStatus
+    created_at: datetime
+    progress: float = 0.0
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    expires_at: datetime | None = None
+    result: list[FixedEffectsResult] | None = None
+    error: str | None = None
+    error_detail: str | None = None
+    # Problems found in the panel when the job failed validation.
+    error_issues: list[PanelIssue] | None = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATUSES
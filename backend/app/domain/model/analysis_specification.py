@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+
+from app.domain.model.absorption_specification import AbsorptionSpecification
+from app.domain.model.bootstrap_specification import BootstrapSpecification
+from app.domain.model.panel_validation_options import PanelValidationOptions
+from app.domain.model.permutation_specification import PermutationSpecification
+
+@dataclass(frozen=True)
+class AnalysisSpecification:
+    dependent_var: str
+    independent_vars: tuple[str, ...]
+    entity_var: str = "prefecture"
+    time_var: str = "year"
+    bootstrap: BootstrapSpecification | None = None
+    absorption: AbsorptionSpecification | None = None
+    permutation: PermutationSpecification | None = None
+    validation: PanelValidationOptions = PanelValidationOptions()
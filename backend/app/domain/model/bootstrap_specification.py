@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+from typing import Literal
+
+BootstrapWeights = Literal["rademacher", "webb"]
+
+@dataclass(frozen=True)
+class BootstrapSpecification:
+    draws: int
+    weights: BootstrapWeights = "rademacher"
+    seed: int = 0
+    confidence_level: float = 0.95
+
+    def __post_init__(self):
+        if self.draws < 1:
+            raise ValueError("Bootstrap draws must be a positive integer")
+        if not 0.0 < self.confidence_level < 1.0:
+            raise ValueError("Bootstrap confidence level must be between 0 and 1")
@@ -0,0 +1,54 @@
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from app.domain.model.analysis_specification import AnalysisSpecification
+
+
+@dataclass(frozen=True)
+class DatasetSchema:
+    variables: tuple[str, ...]
+    entity_vars: tuple[str, ...] = ("prefecture",)
+    time_vars: tuple[str, ...] = ("year",)
+    effect_vars: tuple[str, ...] = ()
+
+    @classmethod
+    def from_specifications(cls, specifications: Iterable[AnalysisSpecification]) -> "DatasetSchema":
+        specifications = list(specifications)
+        return cls(
+            variables=tuple(dict.fromkeys(
+                column
+                for specification in specifications
+                for column in (specification.dependent_var, *specification.independent_vars)
+            )),
+            entity_vars=tuple(dict.fromkeys(specification.entity_var for specification in specifications)),
+            time_vars=tuple(dict.fromkeys(specification.time_var for specification in specifications)),
+            effect_vars=tuple(dict.fromkeys(
+                column
+                for specification in specifications
+                if specification.absorption is not None
+                for column in specification.absorption.columns
+            )),
+        )
+
+    @property
+    def columns(self) -> list[str]:
+        return list(self.dtypes)
+
+    @property
+    def dtypes(self) -> dict[str, str]:
+        dtypes = {variable: "float64" for variable in self.variables}
+        dtypes.update({time_var: "int64" for time_var in self.time_vars})
+        dtypes.update({entity_var: "category" for entity_var in self.entity_vars})
+        for effect_var in self.effect_vars:
+            dtypes.setdefault(effect_var, "category")
+        return dtypes
+
+    @property
+    def text_dtypes(self) -> dict[str, str]:
+        """``dtypes`` with the variables as text and time as a nullable
+        integer, for data in which some value does not parse as its type;
+        panel validation then reports the rows."""
+        dtypes = self.dtypes
+        dtypes.update({time_var: "Int64" for time_var in self.time_vars})
+        dtypes.update({variable: "object" for variable in self.variables})
+        return dtypes
@@ -11,3 +11,8 @@ class FixedEffectsResult:
     rsquared_between: float
     rsquared_overall: float
     dropped_vars: list[str]
+    bootstrap_pvalues: dict[str, float] | None = None
+    bootstrap_conf_int: dict[str, tuple[float, float]] | None = None
+    absorption_iterations: dict[str, int] | None = None
+    permutation_pvalue: float | None = None
+    permutation_null: dict[str, float] | None = None
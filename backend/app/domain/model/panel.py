@@ -0,0 +1,155 @@
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(frozen=True, eq=False)
+class Panel:
+    """Columns of a panel as compact arrays, for the estimators.
+
+    Key columns (the entity, the time period where one is needed and any
+    absorbed effect) are held as int32 codes into a table of their labels,
+    with -1 for missing keys; periods are coded in sorted order, so code order
+    is time order. Variables share one column-major value block, so each
+    variable is a contiguous column and ``slot`` resolves a name to its
+    position."""
+
+    entity_var: str
+    time_var: str | None
+    keys: tuple[str, ...]
+    codes: np.ndarray
+    labels: tuple[np.ndarray, ...]
+    columns: tuple[str, ...]
+    values: np.ndarray
+
+    @classmethod
+    def from_dataframe(
+        cls,
+        dataframe: pd.DataFrame,
+        entity_var: str,
+        time_var: str | None,
+        variables: Iterable[str],
+        effect_vars: Iterable[str] = (),
+        dtype: type = np.float64,
+    ) -> "Panel":
+        keys = tuple(dict.fromkeys([entity_var, *([time_var] if time_var is not None else []), *effect_vars]))
+        columns = tuple(dict.fromkeys(variables))
+
+        codes = np.empty((len(dataframe), len(keys)), dtype=np.int32, order="F")
+        labels = []
+        for position, key in enumerate(keys):
+            codes[:, position], key_labels = _encode(dataframe[key], sort=key == time_var)
+            labels.append(key_labels)
+
+        values = np.empty((len(dataframe), len(columns)), dtype=dtype, order="F")
+        for position, column in enumerate(columns):
+            values[:, position] = dataframe[column].to_numpy(dtype=dtype, na_value=np.nan)
+
+        return cls(
+            entity_var=entity_var,
+            time_var=time_var,
+            keys=keys,
+            codes=codes,
+            labels=tuple(labels),
+            columns=columns,
+            values=values,
+        )
+
+    @classmethod
+    def of(
+        cls,
+        data: "pd.DataFrame | Panel",
+        entity_var: str,
+        time_var: str | None,
+        variables: Iterable[str],
+        effect_vars: Iterable[str] = (),
+    ) -> "Panel":
+        """``data`` itself when it is already a panel, else its columns."""
+        if isinstance(data, Panel):
+            return data
+        return cls.from_dataframe(data, entity_var, time_var, variables, effect_vars)
+
+    @property
+    def nobs(self) -> int:
+        return self.values.shape[0]
+
+    @property
+    def nbytes(self) -> int:
+        return self.codes.nbytes + self.values.nbytes + sum(_label_bytes(labels) for labels in self.labels)
+
+    def slot(self, column: str) -> int:
+        try:
+            return self.columns.index(column)
+        except ValueError:
+            raise KeyError(column) from None
+
+    def variable(self, column: str) -> np.ndarray:
+        return self.values[:, self.slot(column)]
+
+    def matrix(self, columns: Iterable[str]) -> np.ndarray:
+        """The named variables as a float64 matrix, one column each."""
+        return self.values[:, [self.slot(column) for column in columns]].astype(np.float64, copy=False)
+
+    def key_codes(self, key: str) -> np.ndarray:
+        try:
+            return self.codes[:, self.keys.index(key)]
+        except ValueError:
+            raise KeyError(key) from None
+
+    def key_labels(self, key: str) -> np.ndarray:
+        try:
+            return self.labels[self.keys.index(key)]
+        except ValueError:
+            raise KeyError(key) from None
+
+    def missing_keys(self, keys: Iterable[str]) -> np.ndarray:
+        positions = [self.keys.index(key) for key in keys]
+        return (self.codes[:, positions] < 0).any(axis=1)
+
+    def complete(self, columns: Iterable[str], keys: Iterable[str]) -> np.ndarray:
+        """Rows observing every one of ``columns`` and ``keys``."""
+        return ~(np.isnan(self.matrix(columns)).any(axis=1) | self.missing_keys(keys))
+
+    def take(self, rows: np.ndarray) -> "Panel":
+        """The panel restricted to ``rows``, a boolean mask or positions.
+        Label tables are shared, so codes keep their meaning."""
+        return Panel(
+            entity_var=self.entity_var,
+            time_var=self.time_var,
+            keys=self.keys,
+            codes=np.asfortranarray(self.codes[rows]),
+            labels=self.labels,
+            columns=self.columns,
+            values=np.asfortranarray(self.values[rows]),
+        )
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Decoded columns, for estimators that work on data frames. The time
+        period keeps its labels' type; other keys become categoricals."""
+        columns = {}
+        for key, codes, labels in zip(self.keys, self.codes.T, self.labels):
+            if key == self.time_var:
+                missing = codes < 0
+                columns[key] = pd.array(labels).take(codes, allow_fill=True) if missing.any() else labels[codes]
+            else:
+                columns[key] = pd.Categorical.from_codes(codes, categories=pd.Index(labels))
+        for column, values in zip(self.columns, self.values.T):
+            columns.setdefault(column, values)
+        return pd.DataFrame(columns)
+
+
+def _encode(series: pd.Series, sort: bool) -> tuple[np.ndarray, np.ndarray]:
+    if isinstance(series.dtype, pd.CategoricalDtype) and not sort:
+        # Categorical columns are already coded; unused categories are kept
+        # so the codes need no remapping.
+        return series.cat.codes.to_numpy(), np.asarray(series.cat.categories, dtype=object)
+    codes, uniques = pd.factorize(series, sort=sort)
+    return codes, np.asarray(uniques)
+
+
+def _label_bytes(labels: np.ndarray) -> int:
+    if labels.dtype != object:
+        return labels.nbytes
+    return labels.nbytes + sum(len(str(label)) for label in labels)
@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+from typing import Literal
+
+PanelIssueKind = Literal["non_numeric", "infinite", "missing", "duplicate_key", "singleton_entity"]
+
+@dataclass(frozen=True)
+class PanelIssue:
+    kind: PanelIssueKind
+    columns: list[str]
+    count: int
+    # Zero-based positions of the first offending data rows.
+    rows: list[int]
@@ -0,0 +1,6 @@
+from dataclasses import dataclass
+
+@dataclass(frozen=True)
+class PanelValidationOptions:
+    drop_missing: bool = False
+    drop_singletons: bool = False
@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+
+from app.domain.model.panel_issue import PanelIssue
+from app.domain.model.panel_validation_options import PanelValidationOptions
+
+@dataclass(frozen=True)
+class PanelValidationOutcome:
+    """How the variables ``columns`` (sorted) of a registered dataset fared
+    under ``options``: the issues found, or none when every row passed and
+    none was dropped. Dataset IDs name immutable content, so an outcome
+    never goes stale."""
+
+    entity_var: str
+    time_var: str
+    columns: tuple[str, ...]
+    options: PanelValidationOptions
+    issues: tuple[PanelIssue, ...] = ()
@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+from typing import Literal
+
+PermutationScheme = Literal["within_entity", "across_entity", "time_block"]
+
+@dataclass(frozen=True)
+class PermutationSpecification:
+    variable: str
+    draws: int
+    scheme: PermutationScheme = "within_entity"
+    block_length: int = 1
+    seed: int = 0
+
+    def __post_init__(self):
+        if self.draws < 1:
+            raise ValueError("Permutation draws must be a positive integer")
+        if self.block_length < 1:
+            raise ValueError("Permutation block length must be a positive integer")
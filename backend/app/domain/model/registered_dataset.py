@@ -0,0 +1,7 @@
+from dataclasses import dataclass
+
+@dataclass(frozen=True)
+class RegisteredDataset:
+    dataset_id: str
+    nobs: int
+    columns: list[str]
@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+
+from app.domain.model.fixed_effects_result import FixedEffectsResult
+from app.domain.model.subset_search_specification import SubsetCriterion
+
+@dataclass(frozen=True)
+class SubsetSearchModel:
+    independent_vars: tuple[str, ...]
+    criterion_value: float
+    result: FixedEffectsResult
+
+@dataclass(frozen=True)
+class SubsetSearchResult:
+    criterion: SubsetCriterion
+    nobs: int
+    models: list[SubsetSearchModel]
+    evaluated_subsets: int
+    total_subsets: int
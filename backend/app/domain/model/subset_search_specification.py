@@ -0,0 +1,26 @@
+from dataclasses import dataclass
+from typing import Literal
+
+SubsetCriterion = Literal["rsquared_within", "aic", "bic"]
+
+@dataclass(frozen=True)
+class SubsetSearchSpecification:
+    dependent_var: str
+    candidate_vars: tuple[str, ...]
+    criterion: SubsetCriterion = "bic"
+    top: int = 10
+    max_vars: int | None = None
+    entity_var: str = "prefecture"
+    time_var: str = "year"
+
+    def __post_init__(self):
+        if not self.candidate_vars:
+            raise ValueError("At least one candidate variable must be provided")
+        if len(set(self.candidate_vars)) != len(self.candidate_vars):
+            raise ValueError("Candidate variables must be distinct")
+        if self.dependent_var in self.candidate_vars:
+            raise ValueError("The dependent variable cannot be a candidate regressor")
+        if self.top < 1:
+            raise ValueError("The number of returned subsets must be a positive integer")
+        if self.max_vars is not None and self.max_vars < 1:
+            raise ValueError("The maximum subset size must be a positive integer")
@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+
+from app.domain.model.fixed_effects_result import FixedEffectsResult
+
+@dataclass(frozen=True)
+class WindowEstimate:
+    start: int
+    end: int
+    result: FixedEffectsResult
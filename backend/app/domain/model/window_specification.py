@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+from typing import Literal
+
+WindowMode = Literal["rolling", "expanding"]
+
+@dataclass(frozen=True)
+class WindowSpecification:
+    length: int
+    mode: WindowMode = "rolling"
+    step: int = 1
+
+    def __post_init__(self):
+        if self.length < 1:
+            raise ValueError("Window length must be a positive integer")
+        if self.step < 1:
+            raise ValueError("Window step must be a positive integer")
@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+import pandas as pd
+
+class ParsedDatasetCache(ABC):
+    """Parsed datasets by content hash, with every column of the file, so
+    that any specification can be projected from one parse."""
+
+    @abstractmethod
+    def get(self, dataset_id: str) -> pd.DataFrame | None:
+        pass
+
+    @abstractmethod
+    def put(self, dataset_id: str, dataframe: pd.DataFrame) -> None:
+        pass
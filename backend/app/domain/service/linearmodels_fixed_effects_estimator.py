@@ -0,0 +1,72 @@
+from linearmodels.panel import PanelOLS
+from linearmodels.panel.results import PanelEffectsResults
+import pandas as pd
+
+from app.domain.fixed_effects_estimator import FixedEffectsEstimator
+from app.domain.model.absorption_specification import AbsorptionSpecification
+from app.domain.model.fixed_effects_result import FixedEffectsResult
+from app.domain.model.panel import Panel
+
+
+class LinearmodelsFixedEffectsEstimator(FixedEffectsEstimator):
+    def fit(
+        self,
+        dataframe: pd.DataFrame | Panel,
+        dependent_var: str,
+        independent_vars: list[str],
+        entity_var: str,
+        time_var: str,
+        absorption: AbsorptionSpecification | None = None,
+    ) -> FixedEffectsResult:
+        if isinstance(dataframe, Panel):
+            dataframe = dataframe.to_dataframe()
+        if isinstance(dataframe[entity_var].dtype, pd.CategoricalDtype):
+            # PanelOLS groups on the index with observed=False, which would
+            # create empty groups for categories absent from the sample.
+            dataframe = dataframe.assign(**{entity_var: dataframe[entity_var].astype(object)})
+
+        df = dataframe.set_index([entity_var, time_var])
+
+        y = df[dependent_var]
+        x = df[independent_vars]
+
+        fixed_effects_model = PanelOLS(
+            y,
+            x,
+            entity_effects=True,
+            drop_absorbed=True,
+            **self._effects(df, absorption, time_var)
+        )
+
+        result = fixed_effects_model.fit()
+
+        return FixedEffectsResult(
+            nobs=int(result.nobs),
+            params=result.params.to_dict(),
+            std_errors=result.std_errors.to_dict(),
+            tstats=result.tstats.to_dict(),
+            pvalues=result.pvalues.to_dict(),
+            rsquared_within=result.rsquared_within,
+            rsquared_between=result.rsquared_between,
+            rsquared_overall=result.rsquared_overall,
+            dropped_vars=self._get_dropped_variables(result, independent_vars)
+        )
+
+    def _effects(self, df: pd.DataFrame, absorption: AbsorptionSpecification | None, time_var: str) -> dict:
+        if absorption is None:
+            return {}
+        if len(absorption.effects) > 1:
+            raise ValueError("PanelOLS can absorb at most one effect in addition to the entity effect")
+
+        effect = absorption.effects[0]
+        if effect == (time_var,):
+            return {"time_effects": True}
+
+        columns = [df[column] if column in df else df.index.get_level_values(column) for column in effect]
+        codes = pd.MultiIndex.from_arrays(columns).factorize()[0]
+        return {"other_effects": pd.DataFrame({"effect": codes}, index=df.index)}
+
+    def _get_dropped_variables(self, result: PanelEffectsResults, independent_vars: list[str]) -> list[str]:
+        estimated_vars = set(result.params.index)
+        original_vars = set(independent_vars)
+        return sorted(original_vars - estimated_vars)
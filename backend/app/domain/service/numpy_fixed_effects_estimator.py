@@ -0,0 +1,269 @@
+from dataclasses import replace
+
+import numpy as np
+import pandas as pd
+from scipy import linalg, special
+
+from app.domain.fixed_effects_estimator import FixedEffectsEstimator
+from app.domain.model.absorption_specification import AbsorptionSpecification
+from app.domain.model.analysis_specification import AnalysisSpecification
+from app.domain.model.fixed_effects_result import FixedEffectsResult
+from app.domain.model.panel import Panel
+from app.domain.service.within_transformation import (
+    count_absorbed_levels,
+    demean,
+    demean_alternating,
+    encode_groups,
+    encode_interaction,
+)
+
+# Columns whose within variation, relative to their raw norm, falls below this
+# threshold are treated as absorbed by the entity effects (or collinear).
+ABSORPTION_TOLERANCE = float(np.sqrt(np.finfo(np.float64).eps))
+
+
+class NumpyFixedEffectsEstimator(FixedEffectsEstimator):
+    def fit(
+        self,
+        dataframe: pd.DataFrame | Panel,
+        dependent_var: str,
+        independent_vars: list[str],
+        entity_var: str,
+        time_var: str,
+        absorption: AbsorptionSpecification | None = None,
+    ) -> FixedEffectsResult:
+        panel = Panel.of(
+            dataframe,
+            entity_var,
+            time_var,
+            [dependent_var, *independent_vars],
+            absorption.columns if absorption is not None else (),
+        )
+        complete = self.sample(panel, dependent_var, independent_vars, entity_var, absorption)
+        y = panel.variable(dependent_var).astype(np.float64, copy=False)[complete]
+        x = panel.matrix(independent_vars)[complete]
+        codes, nentity = encode_groups(panel.key_codes(entity_var)[complete])
+
+        y_within, y_means = demean(codes, y[:, None], nentity)
+        x_within, x_means = demean(codes, x, nentity)
+
+        if absorption is None:
+            return self._solve(
+                y,
+                x,
+                y_within[:, 0],
+                x_within,
+                y_means[:, 0],
+                x_means,
+                independent_vars,
+            )
+
+        within, absorbed, iterations = self._absorb(
+            panel, complete, np.column_stack([y_within, x_within]), codes, nentity, absorption
+        )
+        result = self._solve(
+            y,
+            x,
+            within[:, 0],
+            within[:, 1:],
+            y_means[:, 0],
+            x_means,
+            independent_vars,
+            absorbed,
+            y_within[:, 0],
+            x_within,
+        )
+        return replace(
+            result,
+            absorption_iterations=self._to_counts([dependent_var, *independent_vars], iterations),
+        )
+
+    def fit_many(
+        self,
+        dataframe: pd.DataFrame | Panel,
+        specifications: list[AnalysisSpecification],
+    ) -> list[FixedEffectsResult]:
+        results: list[FixedEffectsResult | None] = [None] * len(specifications)
+
+        groups: dict[tuple[str, str, AbsorptionSpecification | None], list[int]] = {}
+        for index, specification in enumerate(specifications):
+            key = (specification.entity_var, specification.time_var, specification.absorption)
+            groups.setdefault(key, []).append(index)
+
+        for (entity_var, time_var, absorption), indices in groups.items():
+            columns = list(dict.fromkeys(
+                column
+                for index in indices
+                for column in (specifications[index].dependent_var, *specifications[index].independent_vars)
+            ))
+            slots = {column: slot for slot, column in enumerate(columns)}
+            panel = Panel.of(
+                dataframe,
+                entity_var,
+                time_var,
+                columns,
+                absorption.columns if absorption is not None else (),
+            )
+
+            values = panel.matrix(columns)
+            missing = np.isnan(values)
+            missing_keys = self._missing_keys(panel, entity_var, absorption)
+            incomplete = missing.any(axis=1) | missing_keys
+            values = values[~incomplete]
+            codes, nentity = encode_groups(panel.key_codes(entity_var)[~incomplete])
+
+            # Demean the union of referenced columns once; each specification
+            # is then solved on a column subset of the shared within matrix.
+            entity_within, means = demean(codes, values, nentity)
+            within, absorbed, iterations = entity_within, None, None
+            if absorption is not None:
+                within, absorbed, iterations = self._absorb(
+                    panel, ~incomplete, entity_within, codes, nentity, absorption
+                )
+
+            for index in indices:
+                specification = specifications[index]
+                independent_vars = list(specification.independent_vars)
+                y_slot = slots[specification.dependent_var]
+                x_slots = [slots[var] for var in independent_vars]
+
+                if not np.array_equal(missing[:, [y_slot, *x_slots]].any(axis=1) | missing_keys, incomplete):
+                    # Missing values in other columns would change this
+                    # specification's sample, so it cannot share the transform.
+                    results[index] = self.fit(
+                        panel,
+                        specification.dependent_var,
+                        independent_vars,
+                        entity_var,
+                        specification.time_var,
+                        absorption,
+                    )
+                    continue
+
+                result = self._solve(
+                    values[:, y_slot],
+                    values[:, x_slots],
+                    within[:, y_slot],
+                    within[:, x_slots],
+                    means[:, y_slot],
+                    means[:, x_slots],
+                    independent_vars,
+                    absorbed,
+                    entity_within[:, y_slot],
+                    entity_within[:, x_slots],
+                )
+                if iterations is not None:
+                    result = replace(
+                        result,
+                        absorption_iterations=self._to_counts(
+                            [specification.dependent_var, *independent_vars], iterations[[y_slot, *x_slots]]
+                        ),
+                    )
+                results[index] = result
+
+        return results
+
+    def _missing_keys(
+        self,
+        panel: Panel,
+        entity_var: str,
+        absorption: AbsorptionSpecification | None,
+    ) -> np.ndarray:
+        # Rows without an entity (code -1) would otherwise form a group of
+        # their own.
+        return panel.missing_keys([entity_var, *(absorption.columns if absorption is not None else ())])
+
+    def _absorb(
+        self,
+        panel: Panel,
+        rows: np.ndarray,
+        entity_within: np.ndarray,
+        codes: np.ndarray,
+        nentity: int,
+        absorption: AbsorptionSpecification,
+    ) -> tuple[np.ndarray, int, np.ndarray]:
+        groupings = [(codes, nentity)] + [
+            encode_interaction([panel.key_codes(column)[rows] for column in effect])
+            for effect in absorption.effects
+        ]
+        within, iterations = demean_alternating(
+            groupings, entity_within, absorption.tolerance, absorption.max_iterations
+        )
+        return within, count_absorbed_levels(groupings), iterations
+
+    def _solve(
+        self,
+        y: np.ndarray,
+        x: np.ndarray,
+        y_within: np.ndarray,
+        x_within: np.ndarray,
+        y_means: np.ndarray,
+        x_means: np.ndarray,
+        independent_vars: list[str],
+        absorbed: int | None = None,
+        y_entity_within: np.ndarray | None = None,
+        x_entity_within: np.ndarray | None = None,
+    ) -> FixedEffectsResult:
+        nobs = y.shape[0]
+        absorbed = y_means.shape[0] if absorbed is None else absorbed
+        if nobs == 0:
+            raise ValueError("No complete observations are available for estimation")
+
+        scale = np.linalg.norm(x, axis=0)
+        scale[scale == 0.0] = 1.0
+        q, r, pivots = linalg.qr(x_within / scale, mode="economic", pivoting=True)
+        rank = int(np.count_nonzero(np.abs(np.diag(r)) > ABSORPTION_TOLERANCE))
+        if rank == 0:
+            raise ValueError(
+                "All columns in exog have been fully absorbed by the included effects. "
+                "This model cannot be estimated."
+            )
+
+        # Solve in pivot order, then restore the caller's column order.
+        r_inverse = linalg.solve_triangular(r[:rank, :rank], np.eye(rank))
+        order = np.argsort(pivots[:rank])
+        retained = pivots[:rank][order]
+        params = (r_inverse @ (q[:, :rank].T @ y_within))[order] / scale[retained]
+        normalized_cov = (r_inverse @ r_inverse.T)[np.ix_(order, order)] / np.outer(
+            scale[retained], scale[retained]
+        )
+
+        residuals = y_within - x_within[:, retained] @ params
+        residual_ss = float(residuals @ residuals)
+        df_resid = nobs - absorbed - rank
+        sigma2 = residual_ss / df_resid if df_resid > 0 else np.nan
+
+        std_errors = np.sqrt(sigma2 * np.diag(normalized_cov))
+        tstats = params / std_errors
+        pvalues = 2 * special.stdtr(df_resid, -np.abs(tstats))
+
+        names = [independent_vars[i] for i in retained]
+        return FixedEffectsResult(
+            nobs=int(nobs),
+            params=self._to_dict(names, params),
+            std_errors=self._to_dict(names, std_errors),
+            tstats=self._to_dict(names, tstats),
+            pvalues=self._to_dict(names, pvalues),
+            rsquared_within=(
+                self._rsquared(residual_ss, y_within)
+                if y_entity_within is None
+                else self._rsquared_from_fit(y_entity_within, x_entity_within[:, retained], params)
+            ),
+            rsquared_between=self._rsquared_from_fit(y_means, x_means[:, retained], params),
+            rsquared_overall=self._rsquared_from_fit(y, x[:, retained], params),
+            dropped_vars=sorted(set(independent_vars) - set(names)),
+        )
+
+    def _rsquared_from_fit(self, y: np.ndarray, x: np.ndarray, params: np.ndarray) -> float:
+        residuals = y - x @ params
+        return self._rsquared(float(residuals @ residuals), y)
+
+    def _rsquared(self, residual_ss: float, y: np.ndarray) -> float:
+        total_ss = float(y @ y)
+        return 1.0 - residual_ss / total_ss if total_ss > 0.0 else 0.0
+
+    def _to_dict(self, names: list[str], values: np.ndarray) -> dict[str, float]:
+        return {name: float(value) for name, value in zip(names, values)}
+
+    def _to_counts(self, names: list[str], values: np.ndarray) -> dict[str, int]:
+        return {name: int(value) for name, value in zip(names, values)}
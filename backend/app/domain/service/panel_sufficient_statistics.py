@@ -0,0 +1,169 @@
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from app.domain.model.panel import Panel
+from app.domain.service.within_transformation import demean
+
+
+@dataclass(frozen=True, eq=False)
+class PanelSufficientStatistics:
+    """Per-entity counts and means plus the pooled within cross-product
+    matrix of ``columns``, over rows where all of them are observed."""
+
+    entity_var: str
+    columns: tuple[str, ...]
+    entities: np.ndarray
+    counts: np.ndarray
+    means: np.ndarray
+    within_cross_products: np.ndarray
+
+    @classmethod
+    def from_dataframe(
+        cls,
+        dataframe: pd.DataFrame,
+        entity_var: str,
+        columns: tuple[str, ...],
+    ) -> "PanelSufficientStatistics":
+        values = dataframe[list(columns)].to_numpy(dtype=np.float64)
+        complete = ~np.isnan(values).any(axis=1)
+        values = values[complete]
+        codes, entities = pd.factorize(dataframe[entity_var][complete])
+        codes = codes.astype(np.intp, copy=False)
+        nentity = len(entities)
+
+        within, means = demean(codes, values, nentity)
+        return cls(
+            entity_var=entity_var,
+            columns=tuple(columns),
+            entities=np.asarray(entities, dtype=object),
+            counts=np.bincount(codes, minlength=nentity).astype(np.float64),
+            means=means,
+            within_cross_products=within.T @ within,
+        )
+
+    @classmethod
+    def from_panel(cls, panel: Panel, columns: tuple[str, ...]) -> "PanelSufficientStatistics":
+        values = panel.matrix(columns)
+        complete = ~np.isnan(values).any(axis=1)
+        values = values[complete]
+        # Entity codes index the panel's label table; the statistics keep the
+        # labels of the entities they observe, in order of appearance.
+        codes, observed = pd.factorize(panel.key_codes(panel.entity_var)[complete])
+        codes = codes.astype(np.intp, copy=False)
+        nentity = len(observed)
+
+        within, means = demean(codes, values, nentity)
+        return cls(
+            entity_var=panel.entity_var,
+            columns=tuple(columns),
+            entities=np.asarray(panel.key_labels(panel.entity_var), dtype=object)[observed],
+            counts=np.bincount(codes, minlength=nentity).astype(np.float64),
+            means=means,
+            within_cross_products=within.T @ within,
+        )
+
+    @classmethod
+    def accumulate(
+        cls,
+        chunks: Iterable[pd.DataFrame],
+        entity_var: str,
+        columns: tuple[str, ...],
+    ) -> "PanelSufficientStatistics":
+        statistics = None
+        for chunk in chunks:
+            chunk_statistics = cls.from_dataframe(chunk, entity_var, columns)
+            statistics = chunk_statistics if statistics is None else statistics.merge(chunk_statistics)
+
+        if statistics is None:
+            raise ValueError("No complete observations are available for estimation")
+        return statistics
+
+    @property
+    def nobs(self) -> int:
+        return int(self.counts.sum())
+
+    def merge(self, other: "PanelSufficientStatistics") -> "PanelSufficientStatistics":
+        if (other.entity_var, other.columns) != (self.entity_var, self.columns):
+            raise ValueError("Sufficient statistics can only be merged over the same entity and columns")
+
+        entities = pd.Index(self.entities).append(pd.Index(other.entities)).drop_duplicates()
+        counts_a, means_a = self._align(entities)
+        counts_b, means_b = other._align(entities)
+
+        counts = counts_a + counts_b
+        observed = counts > 0
+        weights_a = np.divide(counts_a, counts, out=np.zeros_like(counts), where=observed)
+        means = weights_a[:, None] * means_a + (1.0 - weights_a)[:, None] * means_b
+        means[~observed] = 0.0
+
+        # Pairwise update (Chan et al.): the within scatter of the union is
+        # the two within scatters plus the shift between per-entity means.
+        shift = means_b - means_a
+        shift_weights = np.divide(counts_a * counts_b, counts, out=np.zeros_like(counts), where=observed)
+        within_cross_products = (
+            self.within_cross_products
+            + other.within_cross_products
+            + (shift * shift_weights[:, None]).T @ shift
+        )
+
+        return PanelSufficientStatistics(
+            entity_var=self.entity_var,
+            columns=self.columns,
+            entities=entities.to_numpy(dtype=object),
+            counts=counts,
+            means=means,
+            within_cross_products=within_cross_products,
+        )
+
+    def subtract(self, other: "PanelSufficientStatistics") -> "PanelSufficientStatistics":
+        """Inverse of ``merge``: the statistics of these rows without the rows
+        summarized by ``other``, which must be among them."""
+        if (other.entity_var, other.columns) != (self.entity_var, self.columns):
+            raise ValueError("Sufficient statistics can only be subtracted over the same entity and columns")
+
+        entities = pd.Index(self.entities)
+        if entities.get_indexer(pd.Index(other.entities)).min(initial=0) < 0:
+            raise ValueError("Subtracted statistics include entities that are not present")
+        counts_b, means_b = other._align(entities)
+
+        counts = self.counts - counts_b
+        if (counts < 0).any():
+            raise ValueError("Subtracted statistics include more observations than are present")
+        observed = counts > 0
+        # Solving the merge's weighted mean for the remaining part.
+        means = np.divide(
+            self.counts[:, None] * self.means - counts_b[:, None] * means_b,
+            counts[:, None],
+            out=np.zeros_like(self.means),
+            where=observed[:, None],
+        )
+
+        shift = means_b - means
+        shift_weights = np.divide(counts * counts_b, self.counts, out=np.zeros_like(counts), where=observed)
+        within_cross_products = (
+            self.within_cross_products
+            - other.within_cross_products
+            - (shift * shift_weights[:, None]).T @ shift
+        )
+
+        # Entities left without observations are dropped, so that a window
+        # moving through the panel does not carry every entity it has seen.
+        return PanelSufficientStatistics(
+            entity_var=self.entity_var,
+            columns=self.columns,
+            entities=self.entities[observed],
+            counts=counts[observed],
+            means=means[observed],
+            within_cross_products=within_cross_products,
+        )
+
+    def _align(self, entities: pd.Index) -> tuple[np.ndarray, np.ndarray]:
+        positions = entities.get_indexer(pd.Index(self.entities))
+        counts = np.zeros(len(entities))
+        means = np.zeros((len(entities), len(self.columns)))
+        counts[positions] = self.counts
+        means[positions] = self.means
+        return counts, means
@@ -0,0 +1,208 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+
+import numpy as np
+import pandas as pd
+from scipy import linalg
+
+from app.domain.model.absorption_specification import AbsorptionSpecification
+from app.domain.model.fixed_effects_result import FixedEffectsResult
+from app.domain.model.panel import Panel
+from app.domain.model.permutation_specification import PermutationSpecification
+from app.domain.service.within_transformation import (
+    demean,
+    demean_alternating,
+    encode_groups,
+    encode_interaction,
+)
+
+# Draws are refitted in blocks holding at most this many permuted values, so
+# memory stays bounded on long panels. Each block is seeded from its own
+# child of the request seed, so results do not depend on worker count.
+BLOCK_VALUES = 1 << 22
+MAX_BLOCK_DRAWS = 512
+
+NULL_QUANTILES = {"q025": 0.025, "q50": 0.5, "q975": 0.975}
+
+
+class PermutationInference:
+    """Randomization inference for one coefficient. The variable is permuted
+    under the requested scheme and only its coefficient is refitted, by
+    Frisch-Waugh-Lovell against the other regressors, which are demeaned and
+    factored once."""
+
+    def __init__(self, workers: int = 1):
+        self.workers = workers
+
+    def run(
+        self,
+        dataframe: pd.DataFrame | Panel,
+        result: FixedEffectsResult,
+        dependent_var: str,
+        entity_var: str,
+        time_var: str,
+        specification: PermutationSpecification,
+        absorption: AbsorptionSpecification | None = None,
+    ) -> FixedEffectsResult:
+        names = list(result.params)
+        if specification.variable not in names:
+            raise ValueError(
+                f"Permuted variable '{specification.variable}' is not among the estimated coefficients"
+            )
+
+        panel = Panel.of(
+            dataframe,
+            entity_var,
+            time_var,
+            [dependent_var, *names],
+            absorption.columns if absorption is not None else (),
+        )
+        y = panel.variable(dependent_var).astype(np.float64, copy=False)
+        x = panel.matrix(names)
+        complete = ~(np.isnan(y) | np.isnan(x).any(axis=1))
+        if absorption is not None:
+            complete &= ~panel.missing_keys(absorption.columns)
+        codes, nentity = encode_groups(panel.key_codes(entity_var)[complete])
+
+        groupings = [(codes, nentity)]
+        if absorption is not None:
+            groupings += [
+                encode_interaction([panel.key_codes(column)[complete] for column in effect])
+                for effect in absorption.effects
+            ]
+        within = self._demean(groupings, np.column_stack([y[complete], x[complete]]), absorption)
+
+        j = names.index(specification.variable)
+        treatment = x[complete][:, j]
+        treatment_within = within[:, 1 + j]
+        others = np.delete(within[:, 1:], j, axis=1)
+        basis = linalg.qr(others, mode="economic")[0] if others.shape[1] else None
+        y_residuals = self._residualize(within[:, :1], basis)[:, 0]
+
+        indices = self._index_sampler(specification, codes, nentity, panel.key_codes(time_var)[complete])
+        observed = self._coefficients(treatment_within[:, None], y_residuals, basis)[0]
+
+        block_draws = int(np.clip(BLOCK_VALUES // max(len(treatment), 1), 1, MAX_BLOCK_DRAWS))
+        seeds = np.random.SeedSequence(specification.seed).spawn(-(-specification.draws // block_draws))
+        sizes = [min(block_draws, specification.draws - i * block_draws) for i in range(len(seeds))]
+
+        def run_block(seed: np.random.SeedSequence, size: int) -> np.ndarray:
+            index = indices(np.random.default_rng(seed), size)
+            if absorption is None:
+                # Every scheme moves whole entity paths or stays inside an
+                # entity, so entity means are preserved and permuting the
+                # demeaned values equals demeaning the permuted ones.
+                permuted = treatment_within[index].T
+            else:
+                permuted = self._demean(groupings, treatment[index].T, absorption)
+            return self._coefficients(permuted, y_residuals, basis)
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            null = np.concatenate(list(executor.map(run_block, seeds, sizes)))
+
+        # Draws that reproduce the observed assignment may differ from it only
+        # by summation order, so ties are compared with a relative margin.
+        exceedances = np.count_nonzero(np.abs(null) >= np.abs(observed) * (1.0 - 1e-12))
+        return replace(
+            result,
+            permutation_pvalue=float((1 + exceedances) / (1 + specification.draws)),
+            permutation_null={
+                "mean": float(np.nanmean(null)),
+                "std": float(np.nanstd(null)),
+                "min": float(np.nanmin(null)),
+                "max": float(np.nanmax(null)),
+                **{key: float(value) for key, value in zip(
+                    NULL_QUANTILES, np.nanquantile(null, list(NULL_QUANTILES.values()))
+                )},
+            },
+        )
+
+    def _demean(
+        self,
+        groupings: list[tuple[np.ndarray, int]],
+        values: np.ndarray,
+        absorption: AbsorptionSpecification | None,
+    ) -> np.ndarray:
+        codes, nentity = groupings[0]
+        within = demean(codes, values, nentity)[0]
+        if absorption is None:
+            return within
+        return demean_alternating(groupings, within, absorption.tolerance, absorption.max_iterations)[0]
+
+    def _residualize(self, values: np.ndarray, basis: np.ndarray | None) -> np.ndarray:
+        if basis is None:
+            return values
+        return values - basis @ (basis.T @ values)
+
+    def _coefficients(self, permuted: np.ndarray, y_residuals: np.ndarray, basis: np.ndarray | None) -> np.ndarray:
+        # y_residuals is already orthogonal to the basis, so only the
+        # permuted column's squared norm needs the projection removed, and
+        # that takes a (k - 1) x draws product rather than a rows x draws one.
+        squares = np.einsum("ij,ij->j", permuted, permuted)
+        if basis is not None:
+            projected = basis.T @ permuted
+            squares -= np.einsum("ij,ij->j", projected, projected)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return (permuted.T @ y_residuals) / squares
+
+    def _index_sampler(
+        self,
+        specification: PermutationSpecification,
+        codes: np.ndarray,
+        nentity: int,
+        periods: np.ndarray,
+    ):
+        # Each sampler returns (draws x rows) source rows: row i of draw b
+        # takes the permuted variable's value from row index[b, i].
+        nobs = len(codes)
+        if specification.scheme == "within_entity":
+            by_entity = np.argsort(codes, kind="stable")
+
+            def within_entity(rng: np.random.Generator, size: int) -> np.ndarray:
+                # Sorting on entity code plus a uniform key in [0, 1)
+                # shuffles rows within each entity and keeps entities in order.
+                index = np.empty((size, nobs), dtype=np.intp)
+                index[:, by_entity] = np.argsort(codes + rng.random((size, nobs)), axis=1)
+                return index
+
+            return within_entity
+
+        grid = self._balanced_grid(codes, nentity, periods, specification.scheme)
+        cells = grid.ravel()
+        if specification.scheme == "across_entity":
+            def across_entity(rng: np.random.Generator, size: int) -> np.ndarray:
+                index = np.empty((size, nobs), dtype=np.intp)
+                entities = rng.permuted(np.broadcast_to(np.arange(nentity), (size, nentity)), axis=1)
+                index[:, cells] = grid[entities].reshape(size, -1)
+                return index
+
+            return across_entity
+
+        # Whole blocks of consecutive periods trade places; the last block
+        # may be shorter, so periods are ordered by (block rank, offset).
+        blocks = np.arange(grid.shape[1]) // specification.block_length
+        nblock = int(blocks[-1]) + 1
+
+        def time_block(rng: np.random.Generator, size: int) -> np.ndarray:
+            index = np.empty((size, nobs), dtype=np.intp)
+            ranks = rng.permuted(np.broadcast_to(np.arange(nblock), (size, nblock)), axis=1)
+            periods = np.argsort(ranks[:, blocks] * grid.shape[1] + np.arange(grid.shape[1]), axis=1)
+            index[:, cells] = grid[:, periods].transpose(1, 0, 2).reshape(size, -1)
+            return index
+
+        return time_block
+
+    def _balanced_grid(
+        self,
+        codes: np.ndarray,
+        nentity: int,
+        periods: np.ndarray,
+        scheme: str,
+    ) -> np.ndarray:
+        # Period codes are in time order, so this keeps periods sorted.
+        period_codes, uniques = pd.factorize(periods, sort=True)
+        grid = np.full((nentity, len(uniques)), -1, dtype=np.intp)
+        grid[codes, period_codes] = np.arange(len(codes))
+        if len(codes) != grid.size or (grid < 0).any():
+            raise ValueError(f"The {scheme} permutation scheme requires a balanced panel")
+        return grid
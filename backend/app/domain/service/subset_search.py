@@ -0,0 +1,209 @@
+from dataclasses import dataclass
+import heapq
+from math import comb
+
+import numpy as np
+
+from app.domain.model.subset_search_result import SubsetSearchModel, SubsetSearchResult
+from app.domain.model.subset_search_specification import SubsetSearchSpecification
+from app.domain.service.panel_sufficient_statistics import PanelSufficientStatistics
+from app.domain.service.sufficient_statistics_estimator import SufficientStatisticsEstimator, collinearity_threshold
+
+# Bounds come from a different sequence of sweeps than the subsets they
+# bound, so they are loosened by a few ulps before pruning.
+BOUND_SLACK = 1e-10
+
+
+@dataclass
+class _Bound:
+    """Sweep state of the largest model reachable below a search node: the
+    node's subset plus every candidate not yet decided."""
+
+    matrix: np.ndarray
+    # Candidates in the model that were left unswept because they were
+    # collinear with those already swept in.
+    collinear: tuple[int, ...]
+
+
+class SubsetSearch:
+    """Best-subset selection over a candidate pool for the entity
+    fixed-effects model, by leaps and bounds (Furnival and Wilson, 1974).
+
+    The within cross-product matrix of the dependent variable and every
+    candidate is formed once. Subsets are reached by sweeping candidates into
+    that matrix one at a time, which is the Schur-complement step of its
+    Cholesky factorization, so each step costs O(k^2) rather than a refit.
+    Every node also carries the fit of its largest reachable model, from which
+    undecided candidates are swept back out; its residual sum of squares
+    bounds every subset below the node, and branches that cannot enter the
+    current top list are skipped. Only the returned subsets are refitted."""
+
+    def run(
+        self,
+        statistics: PanelSufficientStatistics,
+        specification: SubsetSearchSpecification,
+    ) -> SubsetSearchResult:
+        counts = statistics.counts[statistics.counts > 0]
+        nobs = int(counts.sum())
+        if nobs == 0:
+            raise ValueError("No complete observations are available for estimation")
+
+        slots = [statistics.columns.index(var) for var in (*specification.candidate_vars, specification.dependent_var)]
+        means = statistics.means[statistics.counts > 0][:, slots]
+        gram = statistics.within_cross_products[np.ix_(slots, slots)]
+
+        # Scaled by raw norms, as in SufficientStatisticsEstimator, so that the
+        # collinearity tolerance means the same thing in both.
+        raw_norms = np.sqrt(np.diag(gram) + counts @ means ** 2)
+        raw_norms[raw_norms == 0.0] = 1.0
+        gram = gram / np.outer(raw_norms, raw_norms)
+
+        usable = [j for j in range(len(specification.candidate_vars)) if gram[j, j] > collinearity_threshold(gram, j)]
+        if not usable:
+            raise ValueError(
+                "All columns in exog have been fully absorbed by the included effects. "
+                "This model cannot be estimated."
+            )
+        gram = gram[np.ix_(usable + [-1], usable + [-1])]
+        names = [specification.candidate_vars[j] for j in usable]
+        ncandidate = len(names)
+        max_vars = min(specification.max_vars or ncandidate, ncandidate)
+
+        search = _Search(gram, nobs, raw_norms[-1] ** 2, specification, max_vars)
+        search.run()
+
+        models = []
+        for key, subset, residual_ss in sorted(search.ranked()):
+            independent_vars = [names[j] for j in subset]
+            models.append(SubsetSearchModel(
+                independent_vars=tuple(independent_vars),
+                criterion_value=search.criterion_value(residual_ss, len(subset)),
+                result=SufficientStatisticsEstimator().fit(
+                    statistics, specification.dependent_var, independent_vars
+                ),
+            ))
+
+        return SubsetSearchResult(
+            criterion=specification.criterion,
+            nobs=nobs,
+            models=models,
+            evaluated_subsets=search.evaluated,
+            total_subsets=sum(comb(ncandidate, size) for size in range(1, max_vars + 1)),
+        )
+
+
+class _Search:
+    def __init__(
+        self,
+        gram: np.ndarray,
+        nobs: int,
+        y_scale: float,
+        specification: SubsetSearchSpecification,
+        max_vars: int,
+    ):
+        self.gram = gram
+        self.nobs = nobs
+        self.y_scale = y_scale
+        self.total_ss = float(gram[-1, -1]) * y_scale
+        self.criterion = specification.criterion
+        self.top = specification.top
+        self.max_vars = max_vars
+        self.evaluated = 0
+        # Max-heap, through negated keys, of the best subsets found so far.
+        self._heap: list[tuple[float, int, tuple[int, ...], float]] = []
+
+    def run(self) -> None:
+        bound = _Bound(self.gram, ())
+        for j in range(self.gram.shape[0] - 1):
+            if self._pivot_ok(bound.matrix, j):
+                bound.matrix = _sweep(bound.matrix, j)
+            else:
+                bound.collinear += (j,)
+        self._visit((), 0, self.gram, bound)
+
+    def ranked(self) -> list[tuple[float, tuple[int, ...], float]]:
+        return [(-key, subset, residual_ss) for key, _, subset, residual_ss in self._heap]
+
+    def criterion_value(self, residual_ss: float, size: int) -> float:
+        if self.criterion == "rsquared_within":
+            return float(1.0 - residual_ss / self.total_ss) if self.total_ss > 0.0 else 0.0
+        return self._key(residual_ss, size)
+
+    def _visit(self, subset: tuple[int, ...], start: int, matrix: np.ndarray, bound: _Bound) -> None:
+        size = len(subset) + 1
+        for j in range(start, self.gram.shape[0] - 1):
+            # Children further right reach fewer candidates, so once one
+            # cannot enter the top list neither can the rest.
+            if len(self._heap) == self.top:
+                lower = self._key(self._residual_ss(bound.matrix) * (1.0 - BOUND_SLACK), size)
+                if lower >= -self._heap[0][0]:
+                    return
+
+            # A candidate collinear with the subset only duplicates subsets
+            # reached without it.
+            if self._pivot_ok(matrix, j):
+                child = _sweep(matrix, j)
+                self._consider(subset + (j,), self._residual_ss(child))
+                if size < self.max_vars:
+                    self._visit(subset + (j,), j + 1, child, bound)
+
+            bound = self._exclude(bound, j)
+
+    def _exclude(self, bound: _Bound, j: int) -> _Bound:
+        if j in bound.collinear:
+            return _Bound(bound.matrix, tuple(k for k in bound.collinear if k != j))
+
+        matrix = _unsweep(bound.matrix, j)
+        collinear = ()
+        for k in bound.collinear:
+            if self._pivot_ok(matrix, k):
+                matrix = _sweep(matrix, k)
+            else:
+                collinear += (k,)
+        return _Bound(matrix, collinear)
+
+    def _consider(self, subset: tuple[int, ...], residual_ss: float) -> None:
+        self.evaluated += 1
+        entry = (-self._key(residual_ss, len(subset)), -self.evaluated, subset, residual_ss)
+        if len(self._heap) < self.top:
+            heapq.heappush(self._heap, entry)
+        elif entry > self._heap[0]:
+            heapq.heapreplace(self._heap, entry)
+
+    def _key(self, residual_ss: float, size: int) -> float:
+        # Lower is better for every criterion. Entity effects are common to
+        # all subsets, so only the candidates count as parameters.
+        fit_term = self.nobs * np.log(max(residual_ss, np.finfo(np.float64).tiny) / self.nobs)
+        if self.criterion == "aic":
+            return float(fit_term + 2.0 * size)
+        if self.criterion == "bic":
+            return float(fit_term + np.log(self.nobs) * size)
+        return float(fit_term)
+
+    def _residual_ss(self, matrix: np.ndarray) -> float:
+        return max(float(matrix[-1, -1]), 0.0) * self.y_scale
+
+    def _pivot_ok(self, matrix: np.ndarray, j: int) -> bool:
+        return matrix[j, j] > collinearity_threshold(self.gram, j)
+
+
+def _sweep(matrix: np.ndarray, j: int) -> np.ndarray:
+    """Sweep column ``j`` into the model: the swept block holds the negated
+    inverse Gram matrix, the cross block the coefficients and the remaining
+    block the residual cross-products."""
+    pivot = matrix[j, j]
+    row = matrix[j].copy()
+    swept = matrix - np.outer(row, row) / pivot
+    swept[j] = swept[:, j] = row / pivot
+    swept[j, j] = -1.0 / pivot
+    return swept
+
+
+def _unsweep(matrix: np.ndarray, j: int) -> np.ndarray:
+    """Inverse of ``_sweep``: take column ``j`` back out of the model."""
+    pivot = matrix[j, j]
+    row = matrix[j].copy()
+    swept = matrix - np.outer(row, row) / pivot
+    swept[j] = swept[:, j] = -row / pivot
+    swept[j, j] = -1.0 / pivot
+    return swept
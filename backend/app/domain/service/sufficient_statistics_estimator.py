@@ -0,0 +1,117 @@
+import numpy as np
+from scipy import linalg, special
+
+from app.domain.model.fixed_effects_result import FixedEffectsResult
+from app.domain.service.numpy_fixed_effects_estimator import ABSORPTION_TOLERANCE
+from app.domain.service.panel_sufficient_statistics import PanelSufficientStatistics
+
+
+# Within cross-products carry rounding of up to a few hundred eps relative to
+# their diagonal, which would let exactly collinear columns pass the squared
+# QR tolerance (eps itself) alone.
+GRAM_ROUNDING = 1024 * np.finfo(np.float64).eps
+
+
+def collinearity_threshold(gram: np.ndarray, j: int) -> float:
+    """The Schur complement of column ``j`` of a Gram matrix scaled by raw
+    column norms must exceed this for the column to be kept: the square of
+    the QR path's tolerance on R, or the rounding of ``gram[j, j]`` if that is
+    larger."""
+    return max(ABSORPTION_TOLERANCE ** 2, GRAM_ROUNDING * gram[j, j])
+
+
+class SufficientStatisticsEstimator:
+    """Solves the entity fixed-effects model from accumulated
+    ``PanelSufficientStatistics`` instead of raw rows."""
+
+    def fit(
+        self,
+        statistics: PanelSufficientStatistics,
+        dependent_var: str,
+        independent_vars: list[str],
+    ) -> FixedEffectsResult:
+        observed = statistics.counts > 0
+        counts = statistics.counts[observed]
+        means = statistics.means[observed]
+        nobs = int(counts.sum())
+        nentity = int(counts.shape[0])
+        if nobs == 0:
+            raise ValueError("No complete observations are available for estimation")
+
+        y_slot = statistics.columns.index(dependent_var)
+        x_slots = [statistics.columns.index(var) for var in independent_vars]
+        within = statistics.within_cross_products
+        within_xx = within[np.ix_(x_slots, x_slots)]
+        within_xy = within[x_slots, y_slot]
+        within_yy = float(within[y_slot, y_slot])
+
+        raw_norms = np.sqrt(np.diag(within_xx) + counts @ means[:, x_slots] ** 2)
+        raw_norms[raw_norms == 0.0] = 1.0
+        gram = within_xx / np.outer(raw_norms, raw_norms)
+        retained = self._select_columns(gram)
+        if not retained:
+            raise ValueError(
+                "All columns in exog have been fully absorbed by the included effects. "
+                "This model cannot be estimated."
+            )
+
+        factor = linalg.cho_factor(gram[np.ix_(retained, retained)])
+        scale = raw_norms[retained]
+        params = linalg.cho_solve(factor, within_xy[retained] / scale) / scale
+        normalized_cov = linalg.cho_solve(factor, np.eye(len(retained))) / np.outer(scale, scale)
+
+        residual_ss = max(within_yy - float(params @ within_xy[retained]), 0.0)
+        rank = len(retained)
+        df_resid = nobs - nentity - rank
+        sigma2 = residual_ss / df_resid if df_resid > 0 else np.nan
+
+        std_errors = np.sqrt(sigma2 * np.diag(normalized_cov))
+        tstats = params / std_errors
+        pvalues = 2 * special.stdtr(df_resid, -np.abs(tstats))
+
+        # The overall residual splits into the within residual and the
+        # count-weighted between residual of the entity means.
+        y_means = means[:, y_slot]
+        between_residuals = y_means - means[:, [x_slots[i] for i in retained]] @ params
+        between_residual_ss = float(between_residuals @ between_residuals)
+        weighted_between_residual_ss = float(counts @ between_residuals ** 2)
+
+        names = [independent_vars[i] for i in retained]
+        return FixedEffectsResult(
+            nobs=nobs,
+            params=self._to_dict(names, params),
+            std_errors=self._to_dict(names, std_errors),
+            tstats=self._to_dict(names, tstats),
+            pvalues=self._to_dict(names, pvalues),
+            rsquared_within=self._rsquared(residual_ss, within_yy),
+            rsquared_between=self._rsquared(between_residual_ss, float(y_means @ y_means)),
+            rsquared_overall=self._rsquared(
+                residual_ss + weighted_between_residual_ss,
+                within_yy + float(counts @ y_means ** 2),
+            ),
+            dropped_vars=sorted(set(independent_vars) - set(names)),
+        )
+
+    def _select_columns(self, gram: np.ndarray) -> list[int]:
+        # Greedy pivoting on the largest remaining Schur complement mirrors the
+        # column pivoting of the QR path, whose diagonal of R is the square
+        # root of that complement.
+        residual = gram.copy()
+        candidates = list(range(gram.shape[0]))
+        retained: list[int] = []
+        while candidates:
+            candidates = [j for j in candidates if residual[j, j] > collinearity_threshold(gram, j)]
+            if not candidates:
+                break
+            pivot = max(candidates, key=lambda j: residual[j, j])
+            column = residual[:, pivot] / np.sqrt(residual[pivot, pivot])
+            residual -= np.outer(column, column)
+            retained.append(pivot)
+            candidates.remove(pivot)
+        return sorted(retained)
+
+    def _rsquared(self, residual_ss: float, total_ss: float) -> float:
+        return 1.0 - residual_ss / total_ss if total_ss > 0.0 else 0.0
+
+    def _to_dict(self, names: list[str], values: np.ndarray) -> dict[str, float]:
+        return {name: float(value) for name, value in zip(names, values)}
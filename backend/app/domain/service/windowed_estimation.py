@@ -0,0 +1,82 @@
+import numpy as np
+import pandas as pd
+
+from app.domain.model.panel import Panel
+from app.domain.model.window_estimate import WindowEstimate
+from app.domain.model.window_specification import WindowSpecification
+from app.domain.service.panel_sufficient_statistics import PanelSufficientStatistics
+from app.domain.service.sufficient_statistics_estimator import SufficientStatisticsEstimator
+
+
+class WindowedEstimation:
+    """Fits the entity fixed-effects model on rolling or expanding windows of
+    consecutive ``time_var`` values. Each time slice is summarized once; a
+    window is reached from the previous one by merging the incoming slices
+    into its sufficient statistics and subtracting the outgoing ones, so
+    moving a window costs the rows of the slices that change hands."""
+
+    def run(
+        self,
+        dataframe: pd.DataFrame | Panel,
+        dependent_var: str,
+        independent_vars: list[str],
+        entity_var: str,
+        time_var: str,
+        window: WindowSpecification,
+    ) -> list[WindowEstimate]:
+        columns = tuple(dict.fromkeys([dependent_var, *independent_vars]))
+        panel = Panel.of(dataframe, entity_var, time_var, columns)
+        # Period codes are already in time order; periods without rows left
+        # after validation are not windowed over.
+        period_codes, observed = pd.factorize(panel.key_codes(time_var), sort=True)
+        periods = panel.key_labels(time_var)[observed]
+        if len(periods) < window.length:
+            raise ValueError(
+                f"A window of {window.length} {time_var} values needs at least that many, "
+                f"but the data has {len(periods)}"
+            )
+
+        # Row positions of each slice, from one stable sort of the codes.
+        order = np.argsort(period_codes, kind="stable")
+        bounds = np.searchsorted(period_codes[order], np.arange(len(periods) + 1))
+
+        slices: dict[int, PanelSufficientStatistics] = {}
+
+        def slice_statistics(index: int) -> PanelSufficientStatistics:
+            if index not in slices:
+                rows = order[bounds[index]:bounds[index + 1]]
+                slices[index] = PanelSufficientStatistics.from_panel(panel.take(rows), columns)
+            return slices.pop(index) if window.mode == "expanding" else slices[index]
+
+        estimates = []
+        statistics, current_start, current_end = None, 0, 0
+        for start, end in self._windows(len(periods), window):
+            if statistics is None or start >= current_end:
+                statistics = slice_statistics(start)
+                for index in range(start + 1, end):
+                    statistics = statistics.merge(slice_statistics(index))
+            else:
+                for index in range(current_end, end):
+                    statistics = statistics.merge(slice_statistics(index))
+                for index in range(current_start, start):
+                    statistics = statistics.subtract(slices.pop(index))
+            for index in [index for index in slices if index < start]:
+                del slices[index]
+            current_start, current_end = start, end
+
+            estimates.append(WindowEstimate(
+                start=self._to_value(periods[start]),
+                end=self._to_value(periods[end - 1]),
+                result=SufficientStatisticsEstimator().fit(statistics, dependent_var, independent_vars),
+            ))
+
+        return estimates
+
+    def _windows(self, nperiod: int, window: WindowSpecification) -> list[tuple[int, int]]:
+        ends = range(window.length, nperiod + 1, window.step)
+        if window.mode == "expanding":
+            return [(0, end) for end in ends]
+        return [(end - window.length, end) for end in ends]
+
+    def _to_value(self, period):
+        return period.item() if isinstance(period, np.generic) else period
@@ -0,0 +1,92 @@
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from scipy.sparse import csgraph
+
+
+def encode_groups(labels: np.ndarray | pd.Series) -> tuple[np.ndarray, int]:
+    codes, uniques = pd.factorize(labels)
+    return codes.astype(np.intp, copy=False), len(uniques)
+
+
+def group_sums(codes: np.ndarray, values: np.ndarray, ngroups: int) -> np.ndarray:
+    sums = np.empty((ngroups, values.shape[1]), dtype=np.float64)
+    for column in range(values.shape[1]):
+        sums[:, column] = np.bincount(codes, weights=values[:, column], minlength=ngroups)
+    return sums
+
+
+def group_means(codes: np.ndarray, values: np.ndarray, ngroups: int) -> np.ndarray:
+    counts = np.bincount(codes, minlength=ngroups)
+    return group_sums(codes, values, ngroups) / counts[:, None]
+
+
+def demean(codes: np.ndarray, values: np.ndarray, ngroups: int) -> tuple[np.ndarray, np.ndarray]:
+    means = group_means(codes, values, ngroups)
+    return values - means[codes], means
+
+
+def encode_interaction(columns: list[np.ndarray | pd.Series]) -> tuple[np.ndarray, int]:
+    codes, ngroups = encode_groups(columns[0])
+    for column in columns[1:]:
+        other, nother = encode_groups(column)
+        codes, ngroups = encode_groups(codes * nother + other)
+    return codes, ngroups
+
+
+def demean_alternating(
+    groupings: list[tuple[np.ndarray, int]],
+    values: np.ndarray,
+    tolerance: float,
+    max_iterations: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Sweep out each grouping's means in turn until a sweep moves no value by
+    more than ``tolerance`` relative to the column's largest magnitude. Each
+    sweep costs one pass over the rows per grouping; columns drop out of the
+    sweep once they converge. Returns the residuals and sweeps per column."""
+    counts = [np.bincount(codes, minlength=ngroups)[:, None] for codes, ngroups in groupings]
+    within = values.copy()
+    iterations = np.zeros(values.shape[1], dtype=np.int64)
+    if values.shape[0] == 0:
+        return within, iterations
+
+    scale = np.abs(values).max(axis=0)
+    scale[scale == 0.0] = 1.0
+    active = np.arange(values.shape[1])
+    for _ in range(max_iterations):
+        block = within[:, active]
+        change = np.zeros_like(block)
+        for (codes, ngroups), count in zip(groupings, counts):
+            means = (group_sums(codes, block, ngroups) / count)[codes]
+            block -= means
+            change += means
+        within[:, active] = block
+        iterations[active] += 1
+        active = active[np.abs(change).max(axis=0) / scale[active] > tolerance]
+        if active.size == 0:
+            return within, iterations
+
+    raise ValueError(f"Alternating projections did not converge within {max_iterations} iterations")
+
+
+def count_absorbed_levels(groupings: list[tuple[np.ndarray, int]]) -> int:
+    """Levels spanned by the group dummies, net of those redundant with an
+    earlier grouping. Two groupings share one redundant level per connected
+    component of their bipartite graph; beyond two, only the largest pairwise
+    redundancy is subtracted, which errs towards fewer degrees of freedom."""
+    absorbed = groupings[0][1]
+    for k in range(1, len(groupings)):
+        codes, ngroups = groupings[k]
+        absorbed += ngroups - max(
+            _connected_components(groupings[j], (codes, ngroups)) for j in range(k)
+        )
+    return absorbed
+
+
+def _connected_components(first: tuple[np.ndarray, int], second: tuple[np.ndarray, int]) -> int:
+    (first_codes, nfirst), (second_codes, nsecond) = first, second
+    edges = sparse.coo_matrix(
+        (np.ones(first_codes.size, dtype=np.int8), (first_codes, nfirst + second_codes)),
+        shape=(nfirst + nsecond, nfirst + nsecond),
+    )
+    return int(csgraph.connected_components(edges, directed=False)[0])
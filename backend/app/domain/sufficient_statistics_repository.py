@@ -0,0 +1,37 @@
+from abc import ABC, abstractmethod
+
+from app.domain.model.panel_validation_options import PanelValidationOptions
+from app.domain.model.panel_validation_outcome import PanelValidationOutcome
+from app.domain.service.panel_sufficient_statistics import PanelSufficientStatistics
+
+class SufficientStatisticsRepository(ABC):
+    @abstractmethod
+    def get(self, dataset_id: str, entity_var: str, columns: tuple[str, ...]) -> PanelSufficientStatistics | None:
+        pass
+
+    @abstractmethod
+    def put(self, dataset_id: str, statistics: PanelSufficientStatistics) -> None:
+        pass
+
+    @abstractmethod
+    def get_validation(
+        self,
+        dataset_id: str,
+        entity_var: str,
+        time_var: str,
+        columns: tuple[str, ...],
+        options: PanelValidationOptions,
+    ) -> PanelValidationOutcome | None:
+        pass
+
+    @abstractmethod
+    def put_validation(self, dataset_id: str, outcome: PanelValidationOutcome) -> None:
+        pass
+
+    @abstractmethod
+    def list_validations(self, dataset_id: str) -> list[PanelValidationOutcome]:
+        pass
+
+    @abstractmethod
+    def list(self, dataset_id: str) -> list[PanelSufficientStatistics]:
+        pass
@@ -0,0 +1,56 @@
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+import contextvars
+import functools
+import threading
+from typing import Any, TypeVar
+
+from app.application.exception.analysis_queue_full_exception import AnalysisQueueFullException
+from app.application.exception.analysis_timeout_exception import AnalysisTimeoutException
+
+T = TypeVar("T")
+
+class AnalysisExecutor:
+    def __init__(self, max_workers: int, max_queue_depth: int, timeout_seconds: float, retry_after_seconds: int):
+        self.max_workers = max_workers
+        self.max_queue_depth = max_queue_depth
+        self.timeout_seconds = timeout_seconds
+        self.retry_after_seconds = retry_after_seconds
+        self.in_flight = 0
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="analysis")
+        self._lock = threading.Lock()
+
+    async def run(self, function: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        self._acquire()
+        try:
+            context = contextvars.copy_context()
+            future = self._executor.submit(context.run, functools.partial(function, *args, **kwargs))
+        except BaseException:
+            self._release()
+            raise
+        future.add_done_callback(self._release_on_done)
+
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout=self.timeout_seconds)
+        except TimeoutError as e:
+            # A running fit cannot be interrupted; its slot is only released
+            # once it finishes, so the queue bound stays honest.
+            future.cancel()
+            raise AnalysisTimeoutException(self.timeout_seconds, self.retry_after_seconds) from e
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _acquire(self) -> None:
+        with self._lock:
+            if self.in_flight >= self.max_workers + self.max_queue_depth:
+                raise AnalysisQueueFullException(self.retry_after_seconds)
+            self.in_flight += 1
+
+    def _release_on_done(self, future: Future) -> None:
+        self._release()
+
+    def _release(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
@@ -0,0 +1,116 @@
+import io
+from collections.abc import Iterator
+from pathlib import Path
+from typing import BinaryIO, Literal
+
+import pandas as pd
+
+from app.application.exception.missing_columns_exception import MissingColumnsException
+from app.domain.dataframe_loader import DatasetSource, DataFrameLoader
+from app.domain.model.dataset_schema import DatasetSchema
+
+ArrowFormat = Literal["parquet", "arrow_file", "arrow_stream"]
+
+PARQUET_MAGIC = b"PAR1"
+ARROW_FILE_MAGIC = b"ARROW1"
+ARROW_STREAM_MAGIC = b"\xff\xff\xff\xff"
+
+
+def detect_arrow_format(header: bytes) -> ArrowFormat | None:
+    if header.startswith(PARQUET_MAGIC):
+        return "parquet"
+    if header.startswith(ARROW_FILE_MAGIC):
+        # Feather v2 is the Arrow IPC file format.
+        return "arrow_file"
+    if header.startswith(ARROW_STREAM_MAGIC):
+        return "arrow_stream"
+    return None
+
+
+class ArrowDataFrameLoader(DataFrameLoader):
+    def load(self, csv_bytes: DatasetSource, schema: DatasetSchema | None = None) -> pd.DataFrame:
+        source = io.BytesIO(csv_bytes) if isinstance(csv_bytes, bytes) else csv_bytes
+        return self._load(source, schema)
+
+    def load_file(self, path: Path, schema: DatasetSchema | None = None) -> pd.DataFrame:
+        import pyarrow as pa
+
+        # Uncompressed Arrow buffers are used in place from the mapping, so
+        # numeric columns reach pandas without being copied onto the heap.
+        with pa.memory_map(str(path), "r") as source:
+            return self._load(source, schema)
+
+    def load_chunks(self, csv_bytes: DatasetSource, schema: DatasetSchema, chunk_rows: int) -> Iterator[pd.DataFrame]:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        source = io.BytesIO(csv_bytes) if isinstance(csv_bytes, bytes) else csv_bytes
+        arrow_format = self._detect_format(source)
+
+        try:
+            if arrow_format == "parquet":
+                parquet_file = pq.ParquetFile(source)
+                self._check_columns(parquet_file.schema_arrow.names, schema)
+                batches = parquet_file.iter_batches(batch_size=chunk_rows, columns=schema.columns)
+            elif arrow_format == "arrow_file":
+                reader = pa.ipc.open_file(source)
+                self._check_columns(reader.schema.names, schema)
+                batches = (reader.get_batch(index) for index in range(reader.num_record_batches))
+            else:
+                reader = pa.ipc.open_stream(source)
+                self._check_columns(reader.schema.names, schema)
+                batches = reader
+
+            for batch in batches:
+                # Record batches are sized by the writer; re-slice them so a
+                # single oversized batch does not defeat the row bound.
+                for offset in range(0, batch.num_rows, chunk_rows):
+                    table = pa.Table.from_batches([batch.slice(offset, chunk_rows)]).select(schema.columns)
+                    yield table.to_pandas(split_blocks=True).astype(schema.dtypes, copy=False)
+        except (ImportError, MissingColumnsException):
+            raise
+        except Exception as e:
+            raise ValueError("Invalid Arrow format") from e
+
+    def _detect_format(self, source: BinaryIO) -> ArrowFormat:
+        start = source.tell()
+        arrow_format = detect_arrow_format(source.read(len(ARROW_FILE_MAGIC)))
+        source.seek(start)
+        if arrow_format is None:
+            raise ValueError("Invalid Arrow format")
+        return arrow_format
+
+    def _load(self, source: BinaryIO, schema: DatasetSchema | None) -> pd.DataFrame:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        arrow_format = self._detect_format(source)
+
+        try:
+            if arrow_format == "parquet":
+                parquet_file = pq.ParquetFile(source)
+                self._check_columns(parquet_file.schema_arrow.names, schema)
+                table = parquet_file.read(columns=schema.columns if schema is not None else None)
+            else:
+                reader = pa.ipc.open_file(source) if arrow_format == "arrow_file" else pa.ipc.open_stream(source)
+                self._check_columns(reader.schema.names, schema)
+                table = reader.read_all()
+                if schema is not None:
+                    table = table.select(schema.columns)
+
+            dataframe = table.to_pandas(split_blocks=True)
+            if schema is not None:
+                dataframe = dataframe.astype(schema.dtypes, copy=False)
+            return dataframe
+        except (ImportError, MissingColumnsException):
+            raise
+        except Exception as e:
+            raise ValueError("Invalid Arrow format") from e
+
+    def _check_columns(self, names: list[str], schema: DatasetSchema | None) -> None:
+        if schema is None:
+            return
+
+        missing_columns = [column for column in schema.columns if column not in names]
+        if missing_columns:
+            raise MissingColumnsException(missing_columns)
@@ -0,0 +1,65 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+METADATA_FILE = "columns.json"
+
+
+def write_columns(path: Path, dataframe: pd.DataFrame) -> int:
+    """Write ``dataframe`` into the new directory ``path`` as one ``.npy``
+    file per column. Categorical and text columns are stored as codes with
+    their labels in the metadata. Returns the bytes of column data."""
+    path.mkdir()
+    columns = []
+    nbytes = 0
+    for position, (name, series) in enumerate(dataframe.items()):
+        if not isinstance(series.dtype, (pd.CategoricalDtype, np.dtype)) or series.dtype == object:
+            series = series.astype("category")
+
+        file_name = f"{position}.npy"
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            values = series.cat.codes.to_numpy()
+            columns.append({
+                "name": name,
+                "file": file_name,
+                "categories": series.cat.categories.tolist(),
+                "ordered": bool(series.cat.ordered),
+            })
+        else:
+            values = series.to_numpy()
+            columns.append({"name": name, "file": file_name})
+
+        np.save(path / file_name, values, allow_pickle=False)
+        nbytes += values.nbytes
+
+    (path / METADATA_FILE).write_text(json.dumps({"nrows": len(dataframe), "columns": columns}))
+    return nbytes
+
+
+def read_columns(path: Path) -> pd.DataFrame:
+    """Map the columns written by ``write_columns`` read-only. Raises
+    ``FileNotFoundError`` when ``path`` is gone and ``ValueError`` when its
+    files are not a complete set of columns."""
+    try:
+        metadata = json.loads((path / METADATA_FILE).read_text())
+        nrows = metadata["nrows"]
+        columns = {}
+        for column in metadata["columns"]:
+            # A plain array view, since pandas does not expect np.memmap.
+            values = np.asarray(np.load(path / column["file"], mmap_mode="r", allow_pickle=False))
+            if values.shape != (nrows,):
+                raise ValueError(f"Column {column['name']!r} has {values.shape} values, expected {nrows}")
+            if "categories" in column:
+                values = pd.Categorical.from_codes(
+                    values, categories=column["categories"], ordered=column["ordered"]
+                )
+            columns[column["name"]] = values
+    except FileNotFoundError:
+        raise
+    except (OSError, KeyError, TypeError, ValueError) as e:
+        raise ValueError(f"Stored columns under {path} are unreadable") from e
+
+    # copy=False keeps one block per column, each a view of its mapping.
+    return pd.DataFrame(columns, copy=False)
@@ -1,11 +1,84 @@
+from collections.abc import Iterator
+from typing import BinaryIO, Literal
+
 import pandas as pd
 import io
 
-from app.domain.dataframe_loader import DataFrameLoader
+from app.application.exception.missing_columns_exception import MissingColumnsException
+from app.domain.dataframe_loader import DatasetSource, DataFrameLoader
+from app.domain.model.dataset_schema import DatasetSchema
+
+CsvEngine = Literal["c", "pyarrow"]
 
 class CsvDataFrameLoader(DataFrameLoader):
-    def load(self, csv_bytes: bytes) -> pd.DataFrame:
+    def __init__(self, engine: CsvEngine = "c"):
+        self.engine = engine
+
+    def load(self, csv_bytes: DatasetSource, schema: DatasetSchema | None = None) -> pd.DataFrame:
+        source = io.BytesIO(csv_bytes) if isinstance(csv_bytes, bytes) else csv_bytes
+        if schema is None:
+            return self._read_csv(source)
+
+        self._check_header(source, schema)
+        start = source.tell()
+        try:
+            return self._read_csv(source, usecols=schema.columns, dtype=schema.dtypes)
+        except ValueError:
+            # A value that does not parse as its column's type fails the
+            # whole read.
+            source.seek(start)
+            return self._read_csv(source, usecols=schema.columns, dtype=schema.text_dtypes)
+
+    def load_chunks(self, csv_bytes: DatasetSource, schema: DatasetSchema, chunk_rows: int) -> Iterator[pd.DataFrame]:
+        source = io.BytesIO(csv_bytes) if isinstance(csv_bytes, bytes) else csv_bytes
+        self._check_header(source, schema)
+
+        # The pyarrow engine has no chunked reader, so row blocks always go
+        # through the C parser.
+        start = source.tell()
+        rows = 0
+        try:
+            for chunk in self._read_chunks(source, schema.dtypes, chunk_rows):
+                rows += len(chunk)
+                yield chunk
+        except ValueError:
+            # As in ``load``, a value that does not parse as its column's type
+            # fails the read; the remaining rows are read again as text.
+            source.seek(start)
+            yield from self._read_chunks(source, schema.text_dtypes, chunk_rows, skiprows=range(1, rows + 1))
+
+    def _read_chunks(
+        self,
+        source: BinaryIO,
+        dtypes: dict[str, str],
+        chunk_rows: int,
+        skiprows: range | None = None,
+    ) -> Iterator[pd.DataFrame]:
+        try:
+            with pd.read_csv(source, usecols=list(dtypes), dtype=dtypes, chunksize=chunk_rows, skiprows=skiprows) as reader:
+                yield from reader
+        except Exception as e:
+            raise ValueError("Invalid CSV format") from e
+
+    def _check_header(self, source: BinaryIO, schema: DatasetSchema) -> None:
+        header = self._read_header(source)
+        missing_columns = [column for column in schema.columns if column not in header]
+        if missing_columns:
+            raise MissingColumnsException(missing_columns)
+
+    def _read_header(self, source: BinaryIO) -> set[str]:
+        start = source.tell()
+        try:
+            return set(pd.read_csv(source, nrows=0).columns)
+        except Exception as e:
+            raise ValueError("Invalid CSV format") from e
+        finally:
+            source.seek(start)
+
+    def _read_csv(self, source: BinaryIO, **kwargs) -> pd.DataFrame:
         try:
-            return pd.read_csv(io.BytesIO(csv_bytes))
+            return pd.read_csv(source, engine=self.engine, **kwargs)
+        except ImportError:
+            raise
         except Exception as e:
             raise ValueError("Invalid CSV format") from e
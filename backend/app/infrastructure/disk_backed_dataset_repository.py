@@ -0,0 +1,26 @@
+import pandas as pd
+
+from app.domain.dataset_repository import DatasetRepository
+from app.domain.parsed_dataset_cache import ParsedDatasetCache
+
+
+class DiskBackedDatasetRepository(DatasetRepository):
+    """Registered datasets written through to the parsed dataset cache, so
+    that after a restart they are reloaded on first use instead of being
+    lost or parsed again."""
+
+    def __init__(self, repository: DatasetRepository, parsed_cache: ParsedDatasetCache):
+        self.repository = repository
+        self.parsed_cache = parsed_cache
+
+    def get(self, dataset_id: str) -> pd.DataFrame | None:
+        dataframe = self.repository.get(dataset_id)
+        if dataframe is None:
+            dataframe = self.parsed_cache.get(dataset_id)
+            if dataframe is not None:
+                self.repository.put(dataset_id, dataframe)
+        return dataframe
+
+    def put(self, dataset_id: str, dataframe: pd.DataFrame) -> None:
+        self.repository.put(dataset_id, dataframe)
+        self.parsed_cache.put(dataset_id, dataframe)
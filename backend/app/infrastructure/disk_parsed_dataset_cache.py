@@ -0,0 +1,109 @@
+import os
+from pathlib import Path
+import re
+import shutil
+import uuid
+
+import pandas as pd
+
+from app.domain.parsed_dataset_cache import ParsedDatasetCache
+from app.infrastructure.columnar_files import read_columns, write_columns
+
+# Bumped whenever parsing or the stored layout changes, so entries written
+# by an older release are never read back.
+FORMAT_VERSION = 1
+
+DATASET_ID_PATTERN = re.compile(r"[0-9a-f]{64}")
+
+
+class DiskParsedDatasetCache(ParsedDatasetCache):
+    """Parsed datasets kept under ``directory`` across restarts, one
+    directory of column files per content hash.
+
+    Entries are read lazily when looked up and mapped rather than parsed.
+    Writes are staged and renamed into place, so a crash leaves either a
+    complete entry or none. Entries that cannot be read back are deleted and
+    reported as misses. Once the entries exceed ``max_bytes``, the least
+    recently used are deleted; use is tracked by the entry's modification
+    time."""
+
+    def __init__(self, directory: Path, max_bytes: int):
+        self.directory = directory / f"v{FORMAT_VERSION}"
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def get(self, dataset_id: str) -> pd.DataFrame | None:
+        path = self._entry(dataset_id)
+        if path is None:
+            return None
+
+        try:
+            dataframe = read_columns(path)
+        except FileNotFoundError:
+            return None
+        except ValueError:
+            # Truncated or foreign files; the caller parses again.
+            shutil.rmtree(path, ignore_errors=True)
+            return None
+
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            # Evicted since it was mapped; the mapping stays readable.
+            pass
+        return dataframe
+
+    def put(self, dataset_id: str, dataframe: pd.DataFrame) -> None:
+        path = self._entry(dataset_id)
+        if path is None or path.exists():
+            return
+
+        staging = self.directory / f".staging-{uuid.uuid4().hex}"
+        try:
+            if write_columns(staging, dataframe) > self.max_bytes:
+                return
+            try:
+                os.rename(staging, path)
+            except OSError:
+                # Another process stored the same entry first.
+                return
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+        self._evict(keep=path)
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(size for _, _, size in self._entries())
+
+    def _entry(self, dataset_id: str) -> Path | None:
+        # Dataset IDs come from requests, so only content hashes name paths.
+        if not DATASET_ID_PATTERN.fullmatch(dataset_id):
+            return None
+        return self.directory / dataset_id
+
+    def _entries(self) -> list[tuple[float, Path, int]]:
+        entries = []
+        for path in self.directory.iterdir():
+            if path.name.startswith("."):
+                continue
+            try:
+                entries.append((
+                    path.stat().st_mtime,
+                    path,
+                    sum(file.stat().st_size for file in path.iterdir()),
+                ))
+            except FileNotFoundError:
+                continue
+        return entries
+
+    def _evict(self, keep: Path) -> None:
+        entries = sorted(self._entries())
+        total_bytes = sum(size for _, _, size in entries)
+        for _, path, size in entries:
+            if total_bytes <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            shutil.rmtree(path, ignore_errors=True)
+            total_bytes -= size
@@ -0,0 +1,34 @@
+import io
+from collections.abc import Iterator
+from pathlib import Path
+from typing import BinaryIO
+
+import pandas as pd
+
+from app.domain.dataframe_loader import DatasetSource, DataFrameLoader
+from app.domain.model.dataset_schema import DatasetSchema
+from app.infrastructure.arrow_dataframe_loader import ARROW_FILE_MAGIC, detect_arrow_format
+
+class FormatDetectingDataFrameLoader(DataFrameLoader):
+    def __init__(self, csv_loader: DataFrameLoader, arrow_loader: DataFrameLoader):
+        self.csv_loader = csv_loader
+        self.arrow_loader = arrow_loader
+
+    def load(self, csv_bytes: DatasetSource, schema: DatasetSchema | None = None) -> pd.DataFrame:
+        source = io.BytesIO(csv_bytes) if isinstance(csv_bytes, bytes) else csv_bytes
+        return self._select_loader(source).load(source, schema)
+
+    def load_file(self, path: Path, schema: DatasetSchema | None = None) -> pd.DataFrame:
+        with path.open("rb") as source:
+            loader = self._select_loader(source)
+        return loader.load_file(path, schema)
+
+    def load_chunks(self, csv_bytes: DatasetSource, schema: DatasetSchema, chunk_rows: int) -> Iterator[pd.DataFrame]:
+        source = io.BytesIO(csv_bytes) if isinstance(csv_bytes, bytes) else csv_bytes
+        return self._select_loader(source).load_chunks(source, schema, chunk_rows)
+
+    def _select_loader(self, source: BinaryIO) -> DataFrameLoader:
+        start = source.tell()
+        header = source.read(len(ARROW_FILE_MAGIC))
+        source.seek(start)
+        return self.csv_loader if detect_arrow_format(header) is None else self.arrow_loader
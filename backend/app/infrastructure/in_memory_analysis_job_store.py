@@ -0,0 +1,58 @@
+from collections import OrderedDict
+from collections.abc import Callable
+from datetime import UTC, datetime
+import threading
+
+from app.domain.analysis_job_store import AnalysisJobStore
+from app.domain.model.analysis_job import AnalysisJob
+
+class InMemoryAnalysisJobStore(AnalysisJobStore):
+    """Jobs in submission order. Finished jobs are dropped once they expire,
+    and the oldest finished jobs make room when more than `max_jobs` are
+    held; queued and running jobs are never evicted."""
+
+    def __init__(self, max_jobs: int, clock: Callable[[], datetime] = lambda: datetime.now(UTC)):
+        self.max_jobs = max_jobs
+        self._clock = clock
+        self._jobs: OrderedDict[str, AnalysisJob] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, job_id: str) -> AnalysisJob | None:
+        with self._lock:
+            self._expire()
+            return self._jobs.get(job_id)
+
+    def put(self, job: AnalysisJob) -> None:
+        with self._lock:
+            self._jobs[job.job_id] = job
+            self._expire()
+            self._evict()
+
+    def update(self, job_id: str, change: Callable[[AnalysisJob], AnalysisJob]) -> AnalysisJob | None:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            self._jobs[job_id] = job = change(job)
+            return job
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._jobs)
+
+    def _expire(self) -> None:
+        now = self._clock()
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job.expires_at is not None and job.expires_at <= now
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+    def _evict(self) -> None:
+        excess = len(self._jobs) - self.max_jobs
+        if excess <= 0:
+            return
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished][:excess]
+        for job_id in finished:
+            del self._jobs[job_id]
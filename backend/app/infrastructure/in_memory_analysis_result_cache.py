@@ -0,0 +1,63 @@
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+import threading
+import time
+
+from app.domain.analysis_result_cache import AnalysisResultCache
+from app.domain.model.analysis_specification import AnalysisSpecification
+from app.domain.model.fixed_effects_result import FixedEffectsResult
+
+class InMemoryAnalysisResultCache(AnalysisResultCache):
+    def __init__(self, max_entries: int, ttl_seconds: float, clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[float, FixedEffectsResult]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, dataset_id: str, specification: AnalysisSpecification) -> FixedEffectsResult | None:
+        key = self._key(dataset_id, specification)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= self._clock():
+                del self._entries[key]
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, dataset_id: str, specification: AnalysisSpecification, result: FixedEffectsResult) -> None:
+        key = self._key(dataset_id, specification)
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl_seconds, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _key(self, dataset_id: str, specification: AnalysisSpecification) -> Hashable:
+        return (
+            dataset_id,
+            specification.dependent_var,
+            tuple(sorted(specification.independent_vars)),
+            specification.entity_var,
+            specification.time_var,
+            specification.bootstrap,
+            specification.absorption,
+            specification.permutation,
+            specification.validation,
+        )
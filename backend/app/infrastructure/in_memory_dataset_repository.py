@@ -0,0 +1,46 @@
+from collections import OrderedDict
+import threading
+
+import pandas as pd
+
+from app.domain.dataset_repository import DatasetRepository
+
+class InMemoryDatasetRepository(DatasetRepository):
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._entries: OrderedDict[str, tuple[pd.DataFrame, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, dataset_id: str) -> pd.DataFrame | None:
+        with self._lock:
+            entry = self._entries.get(dataset_id)
+            if entry is None:
+                return None
+            self._entries.move_to_end(dataset_id)
+            return entry[0]
+
+    def put(self, dataset_id: str, dataframe: pd.DataFrame) -> None:
+        nbytes = int(dataframe.memory_usage(index=True, deep=True).sum())
+        if nbytes > self.max_bytes:
+            raise ValueError(
+                f"Dataset requires {nbytes} bytes, which exceeds the registry budget of {self.max_bytes} bytes"
+            )
+
+        with self._lock:
+            previous = self._entries.pop(dataset_id, None)
+            if previous is not None:
+                self.total_bytes -= previous[1]
+            while self._entries and self.total_bytes + nbytes > self.max_bytes:
+                _, (_, evicted_bytes) = self._entries.popitem(last=False)
+                self.total_bytes -= evicted_bytes
+            self._entries[dataset_id] = (dataframe, nbytes)
+            self.total_bytes += nbytes
+
+    def __contains__(self, dataset_id: str) -> bool:
+        with self._lock:
+            return dataset_id in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
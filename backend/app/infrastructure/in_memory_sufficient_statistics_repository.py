@@ -0,0 +1,69 @@
+from collections import OrderedDict
+from collections.abc import Hashable
+import threading
+
+from app.domain.model.panel_validation_options import PanelValidationOptions
+from app.domain.model.panel_validation_outcome import PanelValidationOutcome
+from app.domain.service.panel_sufficient_statistics import PanelSufficientStatistics
+from app.domain.sufficient_statistics_repository import SufficientStatisticsRepository
+
+StatisticsKey = tuple[str, tuple[str, ...]]
+
+class InMemorySufficientStatisticsRepository(SufficientStatisticsRepository):
+    def __init__(self, max_datasets: int):
+        self.max_datasets = max_datasets
+        self._entries: OrderedDict[str, dict[StatisticsKey, PanelSufficientStatistics]] = OrderedDict()
+        # Evicted together with the dataset's statistics.
+        self._validations: dict[str, dict[Hashable, PanelValidationOutcome]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, dataset_id: str, entity_var: str, columns: tuple[str, ...]) -> PanelSufficientStatistics | None:
+        with self._lock:
+            statistics = self._entries.get(dataset_id)
+            if statistics is None:
+                return None
+            self._entries.move_to_end(dataset_id)
+            return statistics.get((entity_var, columns))
+
+    def put(self, dataset_id: str, statistics: PanelSufficientStatistics) -> None:
+        with self._lock:
+            self._touch(dataset_id)[(statistics.entity_var, statistics.columns)] = statistics
+
+    def get_validation(
+        self,
+        dataset_id: str,
+        entity_var: str,
+        time_var: str,
+        columns: tuple[str, ...],
+        options: PanelValidationOptions,
+    ) -> PanelValidationOutcome | None:
+        with self._lock:
+            if dataset_id in self._entries:
+                self._entries.move_to_end(dataset_id)
+            return self._validations.get(dataset_id, {}).get((entity_var, time_var, columns, options))
+
+    def put_validation(self, dataset_id: str, outcome: PanelValidationOutcome) -> None:
+        with self._lock:
+            self._touch(dataset_id)
+            key = (outcome.entity_var, outcome.time_var, outcome.columns, outcome.options)
+            self._validations.setdefault(dataset_id, {})[key] = outcome
+
+    def list_validations(self, dataset_id: str) -> list[PanelValidationOutcome]:
+        with self._lock:
+            return list(self._validations.get(dataset_id, {}).values())
+
+    def list(self, dataset_id: str) -> list[PanelSufficientStatistics]:
+        with self._lock:
+            return list(self._entries.get(dataset_id, {}).values())
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _touch(self, dataset_id: str) -> dict[StatisticsKey, PanelSufficientStatistics]:
+        entries = self._entries.setdefault(dataset_id, {})
+        self._entries.move_to_end(dataset_id)
+        while len(self._entries) > self.max_datasets:
+            evicted, _ = self._entries.popitem(last=False)
+            self._validations.pop(evicted, None)
+        return entries
@@ -0,0 +1,145 @@
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+import fcntl
+import json
+import os
+from pathlib import Path
+import shutil
+import threading
+import time
+import uuid
+
+import pandas as pd
+
+from app.domain.dataset_repository import DatasetRepository
+from app.infrastructure.columnar_files import read_columns, write_columns
+
+INDEX_FILE = "index.json"
+LOCK_FILE = "index.lock"
+
+# Reads move a dataset's last use forward only once it is this old, so
+# most reads share the lock and leave the index untouched.
+RECENCY_RESOLUTION_SECONDS = 1.0
+
+
+class MemoryMappedDatasetRepository(DatasetRepository):
+    """Datasets kept as one ``.npy`` file per column under ``directory``,
+    shared by every worker process that uses the directory.
+
+    A dataset parsed by one worker is written once. Other workers map its
+    files read-only, so they all read the same pages from the page cache
+    instead of holding a parsed copy each. Text columns are stored as
+    categorical codes plus their labels.
+
+    The workers share an index of dataset sizes and last uses, which is
+    used for the byte budget and LRU eviction. Lookups read it under a shared
+    file lock; it is rewritten under an exclusive lock by puts and by reads
+    whose recorded last use is older than ``RECENCY_RESOLUTION_SECONDS``.
+    An evicted dataset's files are unlinked. The kernel reference-counts
+    mapped files, so workers that still have an evicted dataset attached can
+    keep reading it; its pages are freed when the last mapping is dropped.
+    Each worker drops its own mappings of evicted datasets the next time it
+    reads the index."""
+
+    def __init__(self, directory: Path, max_bytes: int, clock: Callable[[], float] = time.time):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._clock = clock
+        self._attached: dict[str, pd.DataFrame] = {}
+        self._lock = threading.Lock()
+
+    def get(self, dataset_id: str) -> pd.DataFrame | None:
+        now = self._clock()
+        with self._index(shared=True) as index:
+            entry = index["datasets"].get(dataset_id)
+            attached = self._attached.get(dataset_id)
+
+        if entry is not None and now - entry["last_used"] >= RECENCY_RESOLUTION_SECONDS:
+            with self._index() as index:
+                entry = index["datasets"].get(dataset_id)
+                attached = self._attached.get(dataset_id)
+                if entry is not None:
+                    entry["last_used"] = max(entry["last_used"], now)
+
+        if entry is None or attached is not None:
+            return attached
+
+        try:
+            dataframe = read_columns(self.directory / dataset_id)
+        except FileNotFoundError:
+            # Evicted by another worker after the index was read.
+            return None
+
+        with self._lock:
+            return self._attached.setdefault(dataset_id, dataframe)
+
+    def put(self, dataset_id: str, dataframe: pd.DataFrame) -> None:
+        staging = self.directory / f".staging-{uuid.uuid4().hex}"
+        try:
+            nbytes = write_columns(staging, dataframe)
+            if nbytes > self.max_bytes:
+                raise ValueError(
+                    f"Dataset requires {nbytes} bytes, which exceeds the registry budget of {self.max_bytes} bytes"
+                )
+
+            now = self._clock()
+            with self._index() as index:
+                datasets = index["datasets"]
+                if dataset_id in datasets:
+                    # Another worker stored the same content first.
+                    datasets[dataset_id]["last_used"] = max(datasets[dataset_id]["last_used"], now)
+                    return
+
+                total_bytes = sum(entry["nbytes"] for entry in datasets.values())
+                for evicted in sorted(datasets, key=lambda key: datasets[key]["last_used"]):
+                    if total_bytes + nbytes <= self.max_bytes:
+                        break
+                    total_bytes -= datasets.pop(evicted)["nbytes"]
+                    shutil.rmtree(self.directory / evicted, ignore_errors=True)
+                    self._attached.pop(evicted, None)
+
+                os.rename(staging, self.directory / dataset_id)
+                datasets[dataset_id] = {"nbytes": nbytes, "last_used": now}
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+    @property
+    def total_bytes(self) -> int:
+        with self._index(shared=True) as index:
+            return sum(entry["nbytes"] for entry in index["datasets"].values())
+
+    def __contains__(self, dataset_id: str) -> bool:
+        with self._index(shared=True) as index:
+            return dataset_id in index["datasets"]
+
+    def __len__(self) -> int:
+        with self._index(shared=True) as index:
+            return len(index["datasets"])
+
+    @contextmanager
+    def _index(self, shared: bool = False) -> Iterator[dict]:
+        # The thread lock orders this worker's threads; the file lock orders
+        # the workers. Under the exclusive lock the index is rewritten when it
+        # changed; under the shared lock it is only read.
+        with self._lock, open(self.directory / LOCK_FILE, "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+            try:
+                index_path = self.directory / INDEX_FILE
+                try:
+                    index = json.loads(index_path.read_text())
+                except FileNotFoundError:
+                    index = {"datasets": {}}
+                before = json.dumps(index)
+
+                for dataset_id in [key for key in self._attached if key not in index["datasets"]]:
+                    del self._attached[dataset_id]
+
+                yield index
+
+                if not shared and json.dumps(index) != before:
+                    staged = index_path.with_suffix(f".{os.getpid()}.tmp")
+                    staged.write_text(json.dumps(index))
+                    os.replace(staged, index_path)
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
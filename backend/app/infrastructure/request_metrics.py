@@ -0,0 +1,29 @@
+from app.infrastructure.metrics_registry import MetricsRegistry
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+SIZE_BUCKETS = tuple(float(1 << exponent) for exponent in range(10, 31, 2))
+ROW_BUCKETS = (100.0, 1_000.0, 10_000.0, 100_000.0, 1_000_000.0, 10_000_000.0)
+COLUMN_BUCKETS = (2.0, 4.0, 8.0, 16.0, 32.0, 64.0, 128.0)
+
+
+class RequestMetrics:
+    def __init__(self, registry: MetricsRegistry):
+        self.registry = registry
+        self.requests = registry.counter(
+            "http_requests_total", "HTTP requests by route, method and status.", ("method", "path", "status")
+        )
+        self.errors = registry.counter(
+            "http_request_errors_total", "Requests answered by an exception handler, by error class.", ("path", "error")
+        )
+        self.in_flight = registry.gauge("http_requests_in_flight", "HTTP requests currently being served.")
+        self.duration = registry.histogram(
+            "http_request_duration_seconds", "Time until the response starts.", DURATION_BUCKETS, ("method", "path")
+        )
+        self.stage_duration = registry.histogram(
+            "analysis_stage_duration_seconds", "Time spent in each request stage.", DURATION_BUCKETS, ("path", "stage")
+        )
+        self.request_size = registry.histogram(
+            "http_request_size_bytes", "Request body size.", SIZE_BUCKETS, ("path",)
+        )
+        self.rows = registry.histogram("analysis_dataset_rows", "Rows in the analyzed dataset.", ROW_BUCKETS)
+        self.columns = registry.histogram("analysis_dataset_columns", "Columns in the analyzed dataset.", COLUMN_BUCKETS)
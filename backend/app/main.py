@@ -1,16 +1,71 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 
 from app.config.web_config import web_config
 
-from app.api.global_exception_handler import handle_missing_columns_exception, handle_value_error, handle_unexpected_exception
+from app.api.global_exception_handler import (
+    handle_analysis_job_not_found_exception,
+    handle_analysis_queue_full_exception,
+    handle_analysis_timeout_exception,
+    handle_data_file_not_found_exception,
+    handle_dataset_not_found_exception,
+    handle_invalid_panel_exception,
+    handle_missing_columns_exception,
+    handle_value_error,
+    handle_unexpected_exception,
+)
 from app.api.main import api_router
+from app.api.request_metrics_middleware import RequestMetricsMiddleware
+from app.api.result_serializer import serialize_results
+from app.api.upload_size_limit_middleware import UploadSizeLimitMiddleware
+from app.application.exception.analysis_job_not_found_exception import AnalysisJobNotFoundException
+from app.application.exception.analysis_queue_full_exception import AnalysisQueueFullException
+from app.application.exception.analysis_timeout_exception import AnalysisTimeoutException
+from app.application.exception.data_file_not_found_exception import DataFileNotFoundException
+from app.application.exception.dataset_not_found_exception import DatasetNotFoundException
+from app.application.exception.invalid_panel_exception import InvalidPanelException
 from app.application.exception.missing_columns_exception import MissingColumnsException
+from app.application.warm_up import warm_up
+from app.dependencies import (
+    get_analysis_executor,
+    get_analysis_job_service,
+    get_dataframe_loader,
+    get_dataset_application_service,
+    get_fertility_analysis_application_service,
+    get_fixed_effects_estimator,
+    get_metrics_registry,
+    get_request_metrics,
+)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Build the app-scoped services before accepting traffic, and fit the
+    # bundled panel once so that the first request does not pay for
+    # imports and first-call set-up.
+    get_fertility_analysis_application_service()
+    get_dataset_application_service()
+    analysis_job_service = get_analysis_job_service()
+    analysis_executor = get_analysis_executor()
+    if web_config.WARM_UP_ENABLED:
+        serialize_results(
+            await analysis_executor.run(warm_up, get_dataframe_loader(), get_fixed_effects_estimator())
+        )
+    yield
+    analysis_job_service.shutdown()
+    get_analysis_job_service.cache_clear()
+    analysis_executor.shutdown()
+    get_analysis_executor.cache_clear()
 
 app = FastAPI(
     title="Japan Fertility Workstyle Analysis API",
+    lifespan=lifespan,
 )
 
+app.add_middleware(UploadSizeLimitMiddleware, max_bytes=web_config.MAX_UPLOAD_BYTES)
+
 if web_config.BACKEND_CORS_ORIGINS:
     app.add_middleware(
         CORSMiddleware,
@@ -18,13 +73,29 @@ if web_config.BACKEND_CORS_ORIGINS:
         allow_credentials=True,
         allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
         allow_headers=["*"],
+        expose_headers=["Server-Timing"],
     )
 
+if web_config.METRICS_ENABLED:
+    # Added last so that it is outermost and also times rejected uploads.
+    app.add_middleware(RequestMetricsMiddleware, metrics=get_request_metrics())
+
 app.include_router(api_router)
 app.add_exception_handler(ValueError, handle_value_error)
 app.add_exception_handler(MissingColumnsException, handle_missing_columns_exception)
+app.add_exception_handler(InvalidPanelException, handle_invalid_panel_exception)
+app.add_exception_handler(DatasetNotFoundException, handle_dataset_not_found_exception)
+app.add_exception_handler(DataFileNotFoundException, handle_data_file_not_found_exception)
+app.add_exception_handler(AnalysisJobNotFoundException, handle_analysis_job_not_found_exception)
+app.add_exception_handler(AnalysisQueueFullException, handle_analysis_queue_full_exception)
+app.add_exception_handler(AnalysisTimeoutException, handle_analysis_timeout_exception)
 app.add_exception_handler(Exception, handle_unexpected_exception)
 
 @app.get("/health")
 def health_check():
     return {"status": "ok"}
+
+if web_config.METRICS_ENABLED:
+    @app.get("/metrics", include_in_schema=False)
+    def metrics():
+        return PlainTextResponse(get_metrics_registry().render(), media_type="text/plain; version=0.0.4")
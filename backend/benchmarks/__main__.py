@@ -0,0 +1,50 @@
+import argparse
+import sys
+
+from benchmarks.runner import compare, load, run, save
+from benchmarks.synthetic_panel import SCENARIOS
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="time each pipeline stage on synthetic panels")
+    run_parser.add_argument("--output", "-o", default="benchmark-results.json")
+    run_parser.add_argument("--scenario", action="append", choices=list(SCENARIOS))
+    run_parser.add_argument("--repeat", type=int, default=5)
+    run_parser.add_argument("--seed", type=int, default=0)
+    run_parser.add_argument(
+        "--skip-cold-start", action="store_true", help="do not time import, start-up and first response"
+    )
+
+    compare_parser = commands.add_parser("compare", help="flag stages slower than a stored baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("--threshold", type=float, default=0.25)
+    compare_parser.add_argument("--min-seconds", type=float, default=0.001)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        scenarios = [SCENARIOS[name] for name in args.scenario or SCENARIOS]
+        results = run(scenarios, args.repeat, args.seed, cold_start=not args.skip_cold_start)
+        save(results, args.output)
+        for name, entry in results["scenarios"].items():
+            for stage, timing in entry["stages"].items():
+                print(f"{name:<16} {stage:<18} {timing['median'] * 1000:>10.2f} ms")
+        return 0
+
+    rows = compare(load(args.current), load(args.baseline), args.threshold, args.min_seconds)
+    for row in rows:
+        flag = "REGRESSION" if row["regressed"] else ""
+        print(
+            f"{row['scenario']:<16} {row['stage']:<18} "
+            f"{row['baseline'] * 1000:>10.2f} ms -> {row['current'] * 1000:>10.2f} ms "
+            f"({row['ratio']:.2f}x) {flag}"
+        )
+    return 1 if any(row["regressed"] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
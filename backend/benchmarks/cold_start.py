@@ -0,0 +1,66 @@
+import json
+from pathlib import Path
+import subprocess
+import sys
+import time
+
+# Modules that should only be imported once an estimator needs them.
+LAZY_MODULES = ("linearmodels", "statsmodels", "scipy.stats")
+
+BACKEND_DIRECTORY = Path(__file__).resolve().parents[1]
+
+
+def measure() -> dict:
+    """Time a cold start in the current process: importing the app, running
+    its lifespan (service construction and warm-up) and answering the first
+    analysis request. Only meaningful in a fresh interpreter, so nothing
+    else is imported before the app."""
+    start = time.perf_counter()
+    from app.main import app
+    imported = time.perf_counter()
+    loaded_at_import = [name for name in LAZY_MODULES if name in sys.modules]
+
+    from fastapi.testclient import TestClient
+
+    from benchmarks.synthetic_panel import SCENARIOS, make_panel, to_csv_bytes
+
+    scenario = SCENARIOS["prefectures"]
+    csv_bytes = to_csv_bytes(make_panel(scenario.nentity, scenario.nperiod, scenario.nvar))
+    client = TestClient(app)
+    lifespan_start = time.perf_counter()
+
+    with client:
+        started = time.perf_counter()
+        response = client.post(
+            "/analysis",
+            files={"csv_file": ("panel.csv", csv_bytes, "text/csv")},
+            data={"dependent_var": "TFR", "independent_vars": scenario.independent_vars},
+        )
+        responded = time.perf_counter()
+    response.raise_for_status()
+
+    return {
+        "stages": {
+            "import": imported - start,
+            "startup": started - lifespan_start,
+            "first_response": responded - started,
+            # Excludes building the synthetic upload, which a client would do.
+            "time_to_first_response": (imported - start) + (responded - lifespan_start),
+        },
+        "loaded_at_import": loaded_at_import,
+    }
+
+
+def measure_in_subprocess() -> dict:
+    completed = subprocess.run(
+        [sys.executable, "-m", "benchmarks.cold_start"],
+        cwd=BACKEND_DIRECTORY,
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return json.loads(completed.stdout)
+
+
+if __name__ == "__main__":
+    print(json.dumps(measure()))
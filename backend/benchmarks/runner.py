@@ -0,0 +1,168 @@
+from collections.abc import Callable
+import copy
+import json
+import platform
+import statistics
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+from fastapi.testclient import TestClient
+
+from app.api.result_serializer import serialize_results
+from app.application.fertility_analysis_application_service import FertilityAnalysisApplicationService
+from app.dependencies import get_fertility_analysis_application_service
+from app.domain.model.dataset_schema import DatasetSchema
+from app.domain.model.analysis_specification import AnalysisSpecification
+from app.domain.service.linearmodels_fixed_effects_estimator import LinearmodelsFixedEffectsEstimator
+from app.domain.service.numpy_fixed_effects_estimator import NumpyFixedEffectsEstimator
+from app.infrastructure.csv_dataframe_loader import CsvDataFrameLoader
+from app.main import app
+from benchmarks.cold_start import measure_in_subprocess
+from benchmarks.synthetic_panel import Scenario, make_panel, to_csv_bytes
+
+def time_stage(function: Callable[[], object], repeat: int) -> dict:
+    function()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return summarize(timings)
+
+
+def summarize(timings: list[float]) -> dict:
+    return {"min": min(timings), "median": statistics.median(timings), "timings": timings}
+
+
+def run_cold_start(repeat: int) -> dict:
+    """Each repetition starts a fresh interpreter, so there is no warm-up run."""
+    measurements = [measure_in_subprocess() for _ in range(repeat)]
+    return {
+        "loaded_at_import": measurements[-1]["loaded_at_import"],
+        "stages": {
+            stage: summarize([measurement["stages"][stage] for measurement in measurements])
+            for stage in measurements[0]["stages"]
+        },
+    }
+
+
+def run_scenario(scenario: Scenario, repeat: int, seed: int = 0) -> dict:
+    dataframe = make_panel(scenario.nentity, scenario.nperiod, scenario.nvar, seed)
+    csv_bytes = to_csv_bytes(dataframe)
+    specification = AnalysisSpecification("TFR", tuple(scenario.independent_vars))
+    schema = DatasetSchema.from_specifications([specification])
+
+    loader = CsvDataFrameLoader()
+    service = FertilityAnalysisApplicationService(csv_loader=loader)
+    loaded = loader.load(csv_bytes, schema)
+    normalized = service._normalize_panel(loaded, "TFR", scenario.independent_vars, "prefecture", "year")
+    numpy_estimator = NumpyFixedEffectsEstimator()
+    linearmodels_estimator = LinearmodelsFixedEffectsEstimator()
+    result = numpy_estimator.fit(normalized, "TFR", scenario.independent_vars, "prefecture", "year")
+
+    def fit_linearmodels():
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            linearmodels_estimator.fit(normalized, "TFR", scenario.independent_vars, "prefecture", "year")
+
+    stages = {
+        "csv_load": lambda: loader.load(csv_bytes, schema),
+        "normalize": lambda: service._normalize_panel(
+            loaded, "TFR", scenario.independent_vars, "prefecture", "year"
+        ),
+        "fit_numpy": lambda: numpy_estimator.fit(
+            normalized, "TFR", scenario.independent_vars, "prefecture", "year"
+        ),
+        "fit_linearmodels": fit_linearmodels,
+        "serialize": lambda: serialize_results(result),
+        "round_trip": _round_trip(csv_bytes, scenario.independent_vars),
+    }
+
+    return {
+        "nentity": scenario.nentity,
+        "nperiod": scenario.nperiod,
+        "nvar": scenario.nvar,
+        "rows": len(dataframe),
+        "csv_bytes": len(csv_bytes),
+        "stages": {name: time_stage(function, repeat) for name, function in stages.items()},
+    }
+
+
+def _round_trip(csv_bytes: bytes, independent_vars: list[str]) -> Callable[[], object]:
+    client = TestClient(app)
+    data = {"dependent_var": "TFR", "independent_vars": independent_vars}
+    # Cached results would time a dictionary lookup, not the pipeline.
+    uncached_service = copy.copy(get_fertility_analysis_application_service())
+    uncached_service.result_cache = None
+
+    def post():
+        app.dependency_overrides[get_fertility_analysis_application_service] = lambda: uncached_service
+        try:
+            response = client.post(
+                "/analysis", files={"csv_file": ("panel.csv", csv_bytes, "text/csv")}, data=data
+            )
+        finally:
+            app.dependency_overrides.pop(get_fertility_analysis_application_service, None)
+        response.raise_for_status()
+
+    return post
+
+
+def run(scenarios: list[Scenario], repeat: int, seed: int = 0, cold_start: bool = False) -> dict:
+    results = {
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+        },
+        "repeat": repeat,
+        "seed": seed,
+        "scenarios": {scenario.name: run_scenario(scenario, repeat, seed) for scenario in scenarios},
+    }
+    if cold_start:
+        # Stored like a scenario so that `compare` flags start-up regressions.
+        results["scenarios"]["cold_start"] = run_cold_start(repeat)
+    return results
+
+
+def compare(current: dict, baseline: dict, threshold: float, min_seconds: float) -> list[dict]:
+    """One row per stage present in both runs. A stage regresses when its
+    median is more than `threshold` (relative) and `min_seconds` (absolute)
+    slower than the baseline, so sub-millisecond noise is not flagged."""
+    rows = []
+    for scenario, entry in current["scenarios"].items():
+        baseline_entry = baseline["scenarios"].get(scenario)
+        if baseline_entry is None:
+            continue
+        for stage, timing in entry["stages"].items():
+            baseline_timing = baseline_entry["stages"].get(stage)
+            if baseline_timing is None:
+                continue
+            median = timing["median"]
+            baseline_median = baseline_timing["median"]
+            rows.append({
+                "scenario": scenario,
+                "stage": stage,
+                "baseline": baseline_median,
+                "current": median,
+                "ratio": median / baseline_median if baseline_median > 0 else float("inf"),
+                "regressed": (
+                    median > baseline_median * (1.0 + threshold)
+                    and median - baseline_median > min_seconds
+                ),
+            })
+    return rows
+
+
+def load(path) -> dict:
+    with open(path) as file:
+        return json.load(file)
+
+
+def save(results: dict, path) -> None:
+    with open(path, "w") as file:
+        json.dump(results, file, indent=2)
+        file.write("\n")
@@ -0,0 +1,52 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    nentity: int
+    nperiod: int
+    nvar: int
+
+    @property
+    def independent_vars(self) -> list[str]:
+        return [f"x{j}" for j in range(self.nvar)]
+
+
+SCENARIOS = {
+    scenario.name: scenario
+    for scenario in [
+        Scenario("prefectures", nentity=47, nperiod=20, nvar=3),
+        Scenario("municipalities", nentity=1_700, nperiod=20, nvar=5),
+        Scenario("grid", nentity=20_000, nperiod=20, nvar=8),
+    ]
+}
+
+
+def make_panel(nentity: int, nperiod: int, nvar: int, seed: int = 0) -> pd.DataFrame:
+    """Balanced panel with the API's default column names: `prefecture`,
+    `year`, the outcome `TFR` and regressors `x0`, `x1`, ... Each regressor
+    mixes an entity-level and an idiosyncratic component, so none is
+    absorbed, and the same arguments always give the same frame."""
+    rng = np.random.default_rng(seed)
+    entity = np.repeat(np.arange(nentity), nperiod)
+    year = np.tile(np.arange(2000, 2000 + nperiod), nentity)
+
+    columns: dict[str, np.ndarray] = {
+        "prefecture": np.array([f"P{i:05d}" for i in range(nentity)], dtype=object)[entity],
+        "year": year,
+    }
+    tfr = 1.4 + rng.normal(scale=0.2, size=nentity)[entity] + rng.normal(scale=0.05, size=entity.size)
+    for j in range(nvar):
+        x = rng.normal(size=nentity)[entity] + rng.normal(size=entity.size)
+        columns[f"x{j}"] = x
+        tfr += 0.02 * (j + 1) * x
+    columns["TFR"] = tfr
+    return pd.DataFrame(columns)
+
+
+def to_csv_bytes(dataframe: pd.DataFrame) -> bytes:
+    return dataframe.to_csv(index=False).encode()
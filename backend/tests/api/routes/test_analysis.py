@@ -1,14 +1,93 @@
+import json
 import pytest
 from fastapi.testclient import TestClient
 from unittest.mock import Mock, AsyncMock
 from io import BytesIO
 
+from app.config.web_config import web_config
 from app.main import app
+from app.dependencies import get_analysis_executor
+from app.application.exception.analysis_queue_full_exception import AnalysisQueueFullException
 from app.application.fertility_analysis_application_service import FertilityAnalysisApplicationService
 from app.domain.model.fixed_effects_result import FixedEffectsResult
 
 
+def make_bootstrap_csv_content() -> str:
+    csv_content = "prefecture,year,fertility_rate,work_hours\n"
+    for index, prefecture in enumerate(["Tokyo", "Osaka", "Kyoto", "Aichi", "Fukuoka", "Hokkaido"]):
+        for year in range(2015, 2023):
+            work_hours = 40 + index - 0.3 * (year - 2015) + ((year * 7 + index * 3) % 5) * 0.2
+            fertility_rate = 1.2 + 0.05 * index - 0.02 * work_hours + ((year * 3 + index) % 4) * 0.01
+            csv_content += f"{prefecture},{year},{fertility_rate},{work_hours}\n"
+    return csv_content
+
+
 class TestAnalysisRoute:
+    def test_analyze_endpoint_returns_null_for_undefined_statistics(self):
+        # Given
+        client = TestClient(app)
+        # Two observations per prefecture and two regressors leave no
+        # residual degrees of freedom, so standard errors are NaN.
+        csv_content = "prefecture,year,fertility_rate,work_hours,income\n"
+        csv_content += "Tokyo,2021,1.2,40,500\nTokyo,2022,1.3,38,520\n"
+        csv_content += "Osaka,2021,1.5,42,480\nOsaka,2022,1.45,41,470\n"
+        files = {"csv_file": ("test.csv", csv_content, "text/csv")}
+        data = {"dependent_var": "fertility_rate", "independent_vars": ["work_hours", "income"]}
+
+        # When
+        response = client.post("/analysis", files=files, data=data)
+
+        # Then
+        assert response.status_code == 200
+        assert response.json()["std_errors"]["work_hours"] is None
+
+    def test_stream_batch_endpoint_emits_results_as_server_sent_events(self):
+        # Given
+        client = TestClient(app)
+        files = {"csv_file": ("test.csv", make_bootstrap_csv_content(), "text/csv")}
+        specifications = json.dumps([
+            {"dependent_var": "fertility_rate", "independent_vars": ["work_hours"]},
+            {"dependent_var": "work_hours", "independent_vars": ["fertility_rate"]},
+        ])
+        expected = client.post("/analysis/batch", files=files, data={"specifications": specifications}).json()
+
+        # When
+        response = client.post("/analysis/batch/stream", files=files, data={"specifications": specifications})
+
+        # Then
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = [
+            (block.split("\n")[0].removeprefix("event: "), json.loads(block.split("\n")[1].removeprefix("data: ")))
+            for block in response.text.strip().split("\n\n")
+        ]
+        assert [name for name, _ in events] == ["progress", "result", "result", "summary"]
+        assert sorted((data["index"], data["result"]) for name, data in events if name == "result") == list(enumerate(expected))
+
+    def test_analyze_batch_endpoint_returns_arrow_stream_when_accepted(self):
+        # Given
+        pa = pytest.importorskip("pyarrow")
+
+        client = TestClient(app)
+        files = {"csv_file": ("test.csv", make_bootstrap_csv_content(), "text/csv")}
+        data = {
+            "specifications": json.dumps([
+                {"dependent_var": "fertility_rate", "independent_vars": ["work_hours"]},
+                {"dependent_var": "work_hours", "independent_vars": ["fertility_rate"]},
+            ])
+        }
+
+        # When
+        response = client.post(
+            "/analysis/batch", files=files, data=data, headers={"Accept": "application/vnd.apache.arrow.stream"}
+        )
+
+        # Then
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/vnd.apache.arrow.stream"
+        table = pa.ipc.open_stream(response.content).read_all()
+        assert table.column("variable").to_pylist() == ["work_hours", "fertility_rate"]
+
     def test_analyze_endpoint_returns_200_on_success(self):
         # Given
         client = TestClient(app)
@@ -43,8 +122,10 @@ class TestAnalysisRoute:
         csv_content = "prefecture,year,fertility_rate,work_hours,income\n"
         csv_content += "Tokyo,2020,1.2,40,500\n"
         csv_content += "Tokyo,2021,1.3,38,520\n"
+        csv_content += "Tokyo,2022,1.25,39,545\n"
         csv_content += "Osaka,2020,1.5,42,480\n"
         csv_content += "Osaka,2021,1.6,40,500\n"
+        csv_content += "Osaka,2022,1.55,37,505\n"
         
         files = {"csv_file": ("test.csv", csv_content, "text/csv")}
         data = {
@@ -100,3 +181,355 @@ class TestAnalysisRoute:
         
         # Then
         assert response.status_code == 400
+
+    def test_analyze_endpoint_returns_404_on_unknown_dataset_id(self):
+        # Given
+        client = TestClient(app)
+        data = {
+            "dataset_id": "0" * 64,
+            "dependent_var": "fertility_rate",
+            "independent_vars": ["work_hours"]
+        }
+
+        # When
+        response = client.post("/analysis", data=data)
+
+        # Then
+        assert response.status_code == 404
+
+    def test_analyze_endpoint_returns_400_without_csv_file_or_dataset_id(self):
+        # Given
+        client = TestClient(app)
+        data = {
+            "dependent_var": "fertility_rate",
+            "independent_vars": ["work_hours"]
+        }
+
+        # When
+        response = client.post("/analysis", data=data)
+
+        # Then
+        assert response.status_code == 400
+
+    def test_analyze_batch_endpoint_returns_result_per_specification(self):
+        # Given
+        client = TestClient(app)
+        
+        csv_content = "prefecture,year,fertility_rate,work_hours,income\n"
+        for year in [2018, 2019, 2020, 2021, 2022]:
+            csv_content += f"Tokyo,{year},{1.2 + (year-2018)*0.05},{40 - (year-2018)},{500 + (year-2018)**2}\n"
+            csv_content += f"Osaka,{year},{1.5 + (year-2018)*0.05},{42 - (year-2018)*0.5},{480 + (year-2018)*3}\n"
+            csv_content += f"Kyoto,{year},{1.3 + (year-2018)*0.02},{41 - (year-2018)*0.5},{450 - (year-2018)}\n"
+        
+        files = {"csv_file": ("test.csv", csv_content, "text/csv")}
+        data = {
+            "specifications": json.dumps([
+                {"dependent_var": "fertility_rate", "independent_vars": ["work_hours"]},
+                {"dependent_var": "fertility_rate", "independent_vars": ["work_hours", "income"]},
+            ])
+        }
+        
+        # When
+        response = client.post("/analysis/batch", files=files, data=data)
+        
+        # Then
+        assert response.status_code == 200
+        results = response.json()
+        assert len(results) == 2
+        assert list(results[0]["params"]) == ["work_hours"]
+        assert list(results[1]["params"]) == ["work_hours", "income"]
+        
+    def test_analyze_endpoint_returns_bootstrap_inference_when_requested(self):
+        # Given
+        client = TestClient(app)
+        files = {"csv_file": ("test.csv", make_bootstrap_csv_content(), "text/csv")}
+        data = {
+            "dependent_var": "fertility_rate",
+            "independent_vars": ["work_hours"],
+            "bootstrap_draws": "499",
+            "bootstrap_weights": "webb",
+            "bootstrap_seed": "7",
+        }
+
+        # When
+        response = client.post("/analysis", files=files, data=data)
+
+        # Then
+        assert response.status_code == 200
+        result = response.json()
+        assert 0.0 <= result["bootstrap_pvalues"]["work_hours"] <= 1.0
+        lower, upper = result["bootstrap_conf_int"]["work_hours"]
+        assert lower < result["params"]["work_hours"] < upper
+
+    def test_analyze_endpoint_returns_400_when_bootstrap_draws_exceed_limit(self):
+        # Given
+        client = TestClient(app)
+        files = {"csv_file": ("test.csv", make_bootstrap_csv_content(), "text/csv")}
+        data = {
+            "dependent_var": "fertility_rate",
+            "independent_vars": ["work_hours"],
+            "bootstrap_draws": str(web_config.ANALYSIS_BOOTSTRAP_MAX_DRAWS + 1),
+        }
+
+        # When
+        response = client.post("/analysis", files=files, data=data)
+
+        # Then
+        assert response.status_code == 400
+
+    def test_analyze_batch_endpoint_applies_bootstrap_per_specification(self):
+        # Given
+        client = TestClient(app)
+        files = {"csv_file": ("test.csv", make_bootstrap_csv_content(), "text/csv")}
+        data = {
+            "specifications": json.dumps([
+                {"dependent_var": "fertility_rate", "independent_vars": ["work_hours"]},
+                {"dependent_var": "fertility_rate", "independent_vars": ["work_hours"], "bootstrap": {"draws": 199}},
+            ])
+        }
+
+        # When
+        response = client.post("/analysis/batch", files=files, data=data)
+
+        # Then
+        assert response.status_code == 200
+        results = response.json()
+        assert results[0]["bootstrap_pvalues"] is None
+        assert "work_hours" in results[1]["bootstrap_pvalues"]
+
+    def test_analyze_endpoint_absorbs_requested_effects(self):
+        # Given
+        client = TestClient(app)
+        files = {"csv_file": ("test.csv", make_bootstrap_csv_content(), "text/csv")}
+        data = {
+            "dependent_var": "fertility_rate",
+            "independent_vars": ["work_hours"],
+            "absorb": ["year"],
+            "absorption_tolerance": "1e-10",
+        }
+
+        # When
+        response = client.post("/analysis", files=files, data=data)
+
+        # Then
+        assert response.status_code == 200
+        result = response.json()
+        assert "work_hours" in result["params"]
+        assert set(result["absorption_iterations"]) == {"fertility_rate", "work_hours"}
+
+    def test_analyze_batch_endpoint_accepts_absorption_per_specification(self):
+        # Given
+        client = TestClient(app)
+        files = {"csv_file": ("test.csv", make_bootstrap_csv_content(), "text/csv")}
+        data = {
+            "specifications": json.dumps([
+                {"dependent_var": "fertility_rate", "independent_vars": ["work_hours"]},
+                {
+                    "dependent_var": "fertility_rate",
+                    "independent_vars": ["work_hours"],
+                    "absorption": {"effects": [["year"]]},
+                },
+            ])
+        }
+
+        # When
+        response = client.post("/analysis/batch", files=files, data=data)
+
+        # Then
+        assert response.status_code == 200
+        results = response.json()
+        assert results[0]["absorption_iterations"] is None
+        assert results[1]["absorption_iterations"]["work_hours"] >= 1
+        assert results[1]["params"]["work_hours"] != results[0]["params"]["work_hours"]
+
+    def test_analyze_endpoint_returns_permutation_inference_when_requested(self):
+        # Given
+        client = TestClient(app)
+        files = {"csv_file": ("test.csv", make_bootstrap_csv_content(), "text/csv")}
+        data = {
+            "dependent_var": "fertility_rate",
+            "independent_vars": ["work_hours"],
+            "permute_var": "work_hours",
+            "permutation_draws": "199",
+            "permutation_scheme": "across_entity",
+        }
+
+        # When
+        response = client.post("/analysis", files=files, data=data)
+
+        # Then
+        assert response.status_code == 200
+        result = response.json()
+        assert 1 / 200 <= result["permutation_pvalue"] <= 1.0
+        assert set(result["permutation_null"]) == {"mean", "std", "min", "max", "q025", "q50", "q975"}
+
+    def test_analyze_endpoint_returns_400_when_permutation_draws_exceed_limit(self):
+        # Given
+        client = TestClient(app)
+        files = {"csv_file": ("test.csv", make_bootstrap_csv_content(), "text/csv")}
+        data = {
+            "dependent_var": "fertility_rate",
+            "independent_vars": ["work_hours"],
+            "permute_var": "work_hours",
+            "permutation_draws": str(web_config.ANALYSIS_PERMUTATION_MAX_DRAWS + 1),
+        }
+
+        # When
+        response = client.post("/analysis", files=files, data=data)
+
+        # Then
+        assert response.status_code == 400
+
+    def test_analyze_batch_endpoint_returns_400_on_invalid_specifications(self):
+        # Given
+        client = TestClient(app)
+        
+        files = {"csv_file": ("test.csv", "prefecture,year,fertility_rate\nTokyo,2020,1.2\n", "text/csv")}
+        data = {"specifications": json.dumps([{"independent_vars": ["work_hours"]}])}
+        
+        # When
+        response = client.post("/analysis/batch", files=files, data=data)
+        
+        # Then
+        assert response.status_code == 400
+        
+    def test_analyze_batch_endpoint_returns_422_on_missing_columns(self):
+        # Given
+        client = TestClient(app)
+        
+        files = {"csv_file": ("test.csv", "prefecture,year,fertility_rate\nTokyo,2020,1.2\n", "text/csv")}
+        data = {
+            "specifications": json.dumps([
+                {"dependent_var": "fertility_rate", "independent_vars": ["work_hours"]}
+            ])
+        }
+        
+        # When
+        response = client.post("/analysis/batch", files=files, data=data)
+        
+        # Then
+        assert response.status_code == 422
+
+    def test_search_subsets_endpoint_returns_top_specifications(self):
+        # Given
+        client = TestClient(app)
+        csv_content = make_bootstrap_csv_content().replace("work_hours\n", "work_hours,noise\n", 1)
+        lines = csv_content.splitlines()
+        csv_content = "\n".join([lines[0]] + [f"{line},{(index * 37) % 11 / 10}" for index, line in enumerate(lines[1:])])
+        files = {"csv_file": ("test.csv", csv_content, "text/csv")}
+        data = {"dependent_var": "fertility_rate", "candidate_vars": ["work_hours", "noise"], "criterion": "bic", "top": 2}
+
+        # When
+        response = client.post("/analysis/subsets", files=files, data=data)
+
+        # Then
+        assert response.status_code == 200
+        body = response.json()
+        assert body["criterion"] == "bic"
+        assert body["total_subsets"] == 3
+        assert len(body["models"]) == 2
+        assert body["models"][0]["independent_vars"] == ["work_hours"]
+        assert list(body["models"][0]["result"]["params"]) == ["work_hours"]
+
+    def test_search_subsets_endpoint_returns_400_when_candidates_exceed_limit(self):
+        # Given
+        client = TestClient(app)
+        files = {"csv_file": ("test.csv", make_bootstrap_csv_content(), "text/csv")}
+        data = {
+            "dependent_var": "fertility_rate",
+            "candidate_vars": [f"x{j}" for j in range(web_config.ANALYSIS_SUBSET_MAX_CANDIDATES + 1)],
+        }
+
+        # When
+        response = client.post("/analysis/subsets", files=files, data=data)
+
+        # Then
+        assert response.status_code == 400
+
+    def test_analyze_windows_endpoint_returns_result_per_window(self):
+        # Given
+        client = TestClient(app)
+        files = {"csv_file": ("test.csv", make_bootstrap_csv_content(), "text/csv")}
+        data = {
+            "dependent_var": "fertility_rate",
+            "independent_vars": ["work_hours"],
+            "window_length": "5",
+            "window_mode": "expanding",
+            "window_step": "2",
+        }
+
+        # When
+        response = client.post("/analysis/windows", files=files, data=data)
+
+        # Then
+        assert response.status_code == 200
+        estimates = response.json()
+        assert [(estimate["start"], estimate["end"]) for estimate in estimates] == [(2015, 2019), (2015, 2021)]
+        assert estimates[1]["result"]["nobs"] == 42
+        assert list(estimates[0]["result"]["params"]) == ["work_hours"]
+
+    def test_analyze_endpoint_returns_422_listing_invalid_rows(self):
+        # Given
+        client = TestClient(app)
+        csv_content = make_bootstrap_csv_content() + "Tokyo,2016,1.3,40\nNara,2015,1.3,abc\n"
+        files = {"csv_file": ("test.csv", csv_content, "text/csv")}
+        data = {"dependent_var": "fertility_rate", "independent_vars": ["work_hours"]}
+
+        # When
+        response = client.post("/analysis", files=files, data=data)
+
+        # Then
+        assert response.status_code == 422
+        issues = {issue["kind"]: issue for issue in response.json()["issues"]}
+        assert issues["non_numeric"]["rows"] == [49]
+        assert issues["duplicate_key"]["rows"] == [1, 48]
+
+    def test_analyze_batch_endpoint_drops_singletons_when_requested(self):
+        # Given
+        client = TestClient(app)
+        csv_content = make_bootstrap_csv_content() + "Nara,2015,1.3,40\n"
+        files = {"csv_file": ("test.csv", csv_content, "text/csv")}
+        data = {
+            "specifications": json.dumps([
+                {"dependent_var": "fertility_rate", "independent_vars": ["work_hours"]},
+                {
+                    "dependent_var": "fertility_rate",
+                    "independent_vars": ["work_hours"],
+                    "validation": {"drop_singletons": True},
+                },
+            ])
+        }
+
+        # When
+        rejected = client.post("/analysis/batch", files=files, data=data)
+        data["specifications"] = json.dumps(json.loads(data["specifications"])[1:])
+        response = client.post("/analysis/batch", files=files, data=data)
+
+        # Then
+        assert rejected.status_code == 422
+        assert rejected.json()["issues"][0]["kind"] == "singleton_entity"
+        assert response.status_code == 200
+        assert response.json()[0]["nobs"] == 48
+
+    def test_analyze_endpoint_returns_503_with_retry_after_when_queue_is_full(self):
+        # Given
+        mock_executor = Mock()
+        mock_executor.run = AsyncMock(side_effect=AnalysisQueueFullException(retry_after_seconds=5))
+        app.dependency_overrides[get_analysis_executor] = lambda: mock_executor
+        client = TestClient(app)
+        
+        files = {"csv_file": ("test.csv", "prefecture,year,fertility_rate,work_hours\n", "text/csv")}
+        data = {
+            "dependent_var": "fertility_rate",
+            "independent_vars": ["work_hours"]
+        }
+        
+        # When
+        try:
+            response = client.post("/analysis", files=files, data=data)
+        finally:
+            app.dependency_overrides.clear()
+        
+        # Then
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "5"
@@ -0,0 +1,111 @@
+import json
+import time
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from tests.api.routes.test_analysis import make_bootstrap_csv_content
+
+SPECIFICATIONS = json.dumps([
+    {"dependent_var": "fertility_rate", "independent_vars": ["work_hours"]},
+    {"dependent_var": "work_hours", "independent_vars": ["fertility_rate"]},
+])
+
+
+def wait_for_job(client: TestClient, location: str) -> dict:
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        job = client.get(location).json()
+        if job["status"] in ("succeeded", "failed", "cancelled"):
+            return job
+        time.sleep(0.02)
+    raise AssertionError("job did not finish")
+
+
+class TestAnalysisJobsRoute:
+    def test_submitted_job_returns_same_results_as_batch_endpoint(self):
+        # Given
+        client = TestClient(app)
+        files = {"csv_file": ("test.csv", make_bootstrap_csv_content(), "text/csv")}
+
+        # When
+        response = client.post("/analysis/jobs", files=files, data={"specifications": SPECIFICATIONS})
+        job = wait_for_job(client, response.headers["location"])
+
+        # Then
+        assert response.status_code == 202
+        assert response.json()["status"] in ("queued", "running", "succeeded")
+        assert response.headers["location"] == f"/analysis/jobs/{response.json()['job_id']}"
+        assert job["status"] == "succeeded"
+        assert job["progress"] == 1.0
+        expected = client.post("/analysis/batch", files=files, data={"specifications": SPECIFICATIONS}).json()
+        assert job["result"] == expected
+
+    def test_failed_job_reports_error(self):
+        # Given
+        client = TestClient(app)
+        files = {"csv_file": ("test.csv", make_bootstrap_csv_content(), "text/csv")}
+        specifications = json.dumps([{"dependent_var": "fertility_rate", "independent_vars": ["income"]}])
+
+        # When
+        response = client.post("/analysis/jobs", files=files, data={"specifications": specifications})
+        job = wait_for_job(client, response.headers["location"])
+
+        # Then
+        assert job["status"] == "failed"
+        assert job["error"] == "MissingColumnsException"
+        assert job["result"] is None
+
+    def test_failed_job_keeps_issues_of_invalid_panel(self):
+        # Given
+        client = TestClient(app)
+        csv_content = make_bootstrap_csv_content() + "Tokyo,2016,1.3,40\n"
+        files = {"csv_file": ("test.csv", csv_content, "text/csv")}
+
+        # When
+        response = client.post("/analysis/jobs", files=files, data={"specifications": SPECIFICATIONS})
+        job = wait_for_job(client, response.headers["location"])
+
+        # Then
+        assert job["status"] == "failed"
+        assert job["error"] == "InvalidPanelException"
+        expected = client.post("/analysis/batch", files=files, data={"specifications": SPECIFICATIONS})
+        assert expected.status_code == 422
+        assert job["error_issues"] == expected.json()["issues"]
+
+    def test_submit_validates_specifications_before_enqueueing(self):
+        # Given
+        client = TestClient(app)
+
+        # When
+        response = client.post("/analysis/jobs", data={"dataset_id": "unknown", "specifications": "[]"})
+
+        # Then
+        assert response.status_code == 400
+
+    def test_get_and_delete_return_404_for_unknown_job(self):
+        # Given
+        client = TestClient(app)
+
+        # When
+        get_response = client.get("/analysis/jobs/unknown")
+        delete_response = client.delete("/analysis/jobs/unknown")
+
+        # Then
+        assert get_response.status_code == 404
+        assert get_response.json()["title"] == "Not found"
+        assert delete_response.status_code == 404
+
+    def test_delete_leaves_finished_job_unchanged(self):
+        # Given
+        client = TestClient(app)
+        files = {"csv_file": ("test.csv", make_bootstrap_csv_content(), "text/csv")}
+        location = client.post("/analysis/jobs", files=files, data={"specifications": SPECIFICATIONS}).headers["location"]
+        finished = wait_for_job(client, location)
+
+        # When
+        response = client.delete(location)
+
+        # Then
+        assert response.status_code == 200
+        assert response.json() == finished
@@ -0,0 +1,143 @@
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.config.web_config import web_config
+from app.dependencies import get_dataset_application_service
+from app.main import app
+
+
+def make_csv_content() -> str:
+    csv_content = "prefecture,year,fertility_rate,work_hours\n"
+    for year in [2018, 2019, 2020, 2021, 2022]:
+        csv_content += f"Tokyo,{year},{1.2 + (year-2018)*0.05},{40 - (year-2018)}\n"
+        csv_content += f"Osaka,{year},{1.5 + (year-2018)*0.05},{42 - (year-2018)*0.5}\n"
+        csv_content += f"Kyoto,{year},{1.3 + (year-2018)*0.02},{41 - (year-2018)*0.5}\n"
+    return csv_content
+
+
+@pytest.fixture
+def data_directory(tmp_path):
+    # The application service is an app-scoped singleton that reads the
+    # directory when it is built, so it is rebuilt around the patch.
+    get_dataset_application_service.cache_clear()
+    with patch.object(web_config, "DATA_DIRECTORY", tmp_path):
+        yield tmp_path
+    get_dataset_application_service.cache_clear()
+
+
+class TestDatasetsRoute:
+    def test_register_dataset_returns_content_addressed_id(self):
+        # Given
+        client = TestClient(app)
+        files = {"csv_file": ("test.csv", make_csv_content(), "text/csv")}
+
+        # When
+        first = client.post("/datasets", files=files)
+        second = client.post("/datasets", files=files)
+
+        # Then
+        assert first.status_code == 200
+        result = first.json()
+        assert len(result["dataset_id"]) == 64
+        assert result["nobs"] == 15
+        assert result["columns"] == ["prefecture", "year", "fertility_rate", "work_hours"]
+        assert second.json()["dataset_id"] == result["dataset_id"]
+
+    def test_registered_dataset_can_be_analyzed_by_id(self):
+        # Given
+        client = TestClient(app)
+        files = {"csv_file": ("test.csv", make_csv_content(), "text/csv")}
+        dataset_id = client.post("/datasets", files=files).json()["dataset_id"]
+        data = {
+            "dataset_id": dataset_id,
+            "dependent_var": "fertility_rate",
+            "independent_vars": ["work_hours"]
+        }
+
+        # When
+        response = client.post("/analysis", data=data)
+
+        # Then
+        assert response.status_code == 200
+        assert "work_hours" in response.json()["params"]
+
+    def test_register_dataset_returns_400_on_invalid_csv(self):
+        # Given
+        client = TestClient(app)
+        files = {"csv_file": ("test.csv", b"\x80\x81\x82", "text/csv")}
+
+        # When
+        response = client.post("/datasets", files=files)
+
+        # Then
+        assert response.status_code == 400
+
+    def test_register_dataset_rejects_uploads_over_the_size_limit(self):
+        # Given
+        client = TestClient(app)
+        files = {"csv_file": ("test.csv", "x" * (web_config.MAX_UPLOAD_BYTES + 1), "text/csv")}
+
+        # When
+        response = client.post("/datasets", files=files)
+
+        # Then
+        assert response.status_code == 413
+
+    def test_register_dataset_file_returns_404_for_unknown_file(self, data_directory):
+        # Given
+        client = TestClient(app)
+
+        # When
+        response = client.post("/datasets/files", data={"path": "missing.parquet"})
+
+        # Then
+        assert response.status_code == 404
+
+    def test_register_dataset_file_reads_from_data_directory(self, data_directory):
+        # Given
+        client = TestClient(app)
+        (data_directory / "panel.csv").write_text(make_csv_content())
+
+        # When
+        response = client.post("/datasets/files", data={"path": "panel.csv"})
+
+        # Then
+        assert response.status_code == 200
+        assert response.json()["nobs"] == 15
+
+    def test_appended_dataset_matches_analysis_of_full_upload(self):
+        # Given
+        client = TestClient(app)
+        lines = make_csv_content().splitlines(keepends=True)
+        header, rows = lines[0], lines[1:]
+        history = header + "".join(row for row in rows if ",2022," not in row)
+        new_year = header + "".join(row for row in rows if ",2022," in row)
+        data = {"dependent_var": "fertility_rate", "independent_vars": ["work_hours"]}
+        dataset_id = client.post("/datasets", files={"csv_file": ("history.csv", history, "text/csv")}).json()["dataset_id"]
+        client.post("/analysis", data={"dataset_id": dataset_id, **data})
+
+        # When
+        response = client.post(
+            f"/datasets/{dataset_id}/append",
+            files={"csv_file": ("2022.csv", new_year, "text/csv")}
+        )
+
+        # Then
+        assert response.status_code == 200
+        assert response.json()["nobs"] == 15
+        appended = client.post("/analysis", data={"dataset_id": response.json()["dataset_id"], **data}).json()
+        full = client.post("/analysis", data=data, files={"csv_file": ("test.csv", make_csv_content(), "text/csv")}).json()
+        assert appended["params"]["work_hours"] == pytest.approx(full["params"]["work_hours"], rel=1e-12)
+        assert appended["std_errors"]["work_hours"] == pytest.approx(full["std_errors"]["work_hours"], rel=1e-12)
+
+    def test_append_returns_404_for_unknown_dataset(self):
+        # Given
+        client = TestClient(app)
+
+        # When
+        response = client.post("/datasets/unknown/append", files={"csv_file": ("2022.csv", make_csv_content(), "text/csv")})
+
+        # Then
+        assert response.status_code == 404
@@ -1,3 +1,4 @@
+import json
 import pytest
 from fastapi import Request, status
 from unittest.mock import Mock
@@ -5,9 +6,22 @@ from unittest.mock import Mock
 from app.api.global_exception_handler import (
     handle_value_error,
     handle_missing_columns_exception,
+    handle_invalid_panel_exception,
+    handle_data_file_not_found_exception,
+    handle_dataset_not_found_exception,
+    handle_analysis_queue_full_exception,
+    handle_analysis_timeout_exception,
+    handle_upload_too_large_exception,
     handle_unexpected_exception
 )
+from app.application.exception.analysis_queue_full_exception import AnalysisQueueFullException
+from app.application.exception.analysis_timeout_exception import AnalysisTimeoutException
+from app.application.exception.data_file_not_found_exception import DataFileNotFoundException
+from app.application.exception.dataset_not_found_exception import DatasetNotFoundException
+from app.application.exception.invalid_panel_exception import InvalidPanelException
 from app.application.exception.missing_columns_exception import MissingColumnsException
+from app.application.exception.upload_too_large_exception import UploadTooLargeException
+from app.domain.model.panel_issue import PanelIssue
 
 
 class TestHandleValueError:
@@ -70,6 +84,74 @@ class TestHandleMissingColumnsException:
         assert "422" in content
 
 
+class TestHandleInvalidPanelException:
+    def test_returns_422_response_listing_issues(self):
+        # Given
+        mock_request = Mock(spec=Request)
+        mock_request.url.path = "/test/path"
+        error = InvalidPanelException([PanelIssue("duplicate_key", ["prefecture", "year"], 2, [3, 4])])
+
+        # When
+        response = handle_invalid_panel_exception(mock_request, error)
+
+        # Then
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+        assert json.loads(response.body)["issues"] == [
+            {"kind": "duplicate_key", "columns": ["prefecture", "year"], "count": 2, "rows": [3, 4]}
+        ]
+
+
+class TestHandleDatasetNotFoundException:
+    def test_returns_404_response(self):
+        # Given
+        mock_request = Mock(spec=Request)
+        mock_request.url.path = "/test/path"
+        error = DatasetNotFoundException("abc123")
+        
+        # When
+        response = handle_dataset_not_found_exception(mock_request, error)
+        content = response.body.decode('utf-8')
+        
+        # Then
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert "abc123" in content
+        assert "404" in content
+
+
+class TestHandleAnalysisQueueFullException:
+    def test_returns_503_response_with_retry_after(self):
+        # Given
+        mock_request = Mock(spec=Request)
+        mock_request.url.path = "/test/path"
+        error = AnalysisQueueFullException(retry_after_seconds=5)
+        
+        # When
+        response = handle_analysis_queue_full_exception(mock_request, error)
+        content = response.body.decode('utf-8')
+        
+        # Then
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert response.headers["Retry-After"] == "5"
+        assert "503" in content
+
+
+class TestHandleAnalysisTimeoutException:
+    def test_returns_503_response_with_retry_after(self):
+        # Given
+        mock_request = Mock(spec=Request)
+        mock_request.url.path = "/test/path"
+        error = AnalysisTimeoutException(timeout_seconds=60, retry_after_seconds=5)
+        
+        # When
+        response = handle_analysis_timeout_exception(mock_request, error)
+        content = response.body.decode('utf-8')
+        
+        # Then
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert response.headers["Retry-After"] == "5"
+        assert "60 seconds" in content
+
+
 class TestHandleUnexpectedException:
     def test_returns_500_response(self):
         # Given
@@ -98,3 +180,32 @@ class TestHandleUnexpectedException:
         assert "Secret internal error" not in content
         assert "Unexpected error" in content
         assert "500" in content
+
+
+class TestHandleUploadTooLargeException:
+    def test_returns_413_response(self):
+        # Given
+        mock_request = Mock(spec=Request)
+        mock_request.url.path = "/analysis"
+        error = UploadTooLargeException(1024)
+
+        # When
+        response = handle_upload_too_large_exception(mock_request, error)
+
+        # Then
+        assert response.status_code == status.HTTP_413_CONTENT_TOO_LARGE
+        assert b"1024 bytes" in response.body
+
+
+class TestHandleDataFileNotFoundException:
+    def test_returns_404_response(self):
+        # Given
+        mock_request = Mock(spec=Request)
+        mock_request.url.path = "/datasets/files"
+        error = DataFileNotFoundException("panel.parquet")
+
+        # When
+        response = handle_data_file_not_found_exception(mock_request, error)
+
+        # Then
+        assert response.status_code == status.HTTP_404_NOT_FOUND
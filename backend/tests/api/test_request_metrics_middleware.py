@@ -0,0 +1,68 @@
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+import pytest
+
+from app.api.request_metrics_middleware import RequestMetricsMiddleware
+from app.application import request_timings
+from app.infrastructure.metrics_registry import MetricsRegistry
+from app.infrastructure.request_metrics import RequestMetrics
+
+
+def make_client() -> tuple[TestClient, MetricsRegistry]:
+    registry = MetricsRegistry()
+    app = FastAPI()
+    app.add_middleware(RequestMetricsMiddleware, metrics=RequestMetrics(registry))
+
+    @app.post("/echo")
+    async def echo(request: Request):
+        body = await request.body()
+        with request_timings.stage("fit"):
+            request_timings.record_shape(len(body), 1)
+        return {"size": len(body)}
+
+    @app.get("/boom")
+    def boom():
+        raise RuntimeError("boom")
+
+    return TestClient(app, raise_server_exceptions=False), registry
+
+
+class TestRequestMetricsMiddleware:
+    def test_adds_server_timing_header_with_stages_and_total(self):
+        # Given
+        client, _ = make_client()
+
+        # When
+        response = client.post("/echo", content=b"x" * 10)
+
+        # Then
+        assert response.status_code == 200
+        entries = [entry.split(";")[0] for entry in response.headers["server-timing"].split(", ")]
+        assert entries == ["upload", "fit", "total"]
+
+    def test_records_request_stage_and_shape_metrics_by_route(self):
+        # Given
+        client, registry = make_client()
+
+        # When
+        client.post("/echo", content=b"x" * 10)
+        text = registry.render()
+
+        # Then
+        assert 'http_requests_total{method="POST",path="/echo",status="200"} 1.0' in text
+        assert 'analysis_stage_duration_seconds_count{path="/echo",stage="fit"} 1' in text
+        assert 'http_request_size_bytes_sum{path="/echo"} 10.0' in text
+        assert 'analysis_dataset_rows_sum 10.0' in text
+
+    def test_counts_unhandled_exceptions_as_errors(self):
+        # Given
+        client, registry = make_client()
+
+        # When
+        response = client.get("/boom")
+
+        # Then
+        assert response.status_code == 500
+        text = registry.render()
+        assert 'http_request_errors_total{path="/boom",error="Exception"} 1.0' in text
+        assert 'http_requests_in_flight 0.0' in text
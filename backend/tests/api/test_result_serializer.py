@@ -0,0 +1,103 @@
+import json
+import math
+
+import pytest
+
+from app.api.result_serializer import (
+    ARROW_MEDIA_TYPE,
+    JSON_MEDIA_TYPE,
+    negotiate_media_type,
+    serialize_results,
+    to_arrow_ipc,
+)
+from app.domain.model.fixed_effects_result import FixedEffectsResult
+
+pa = pytest.importorskip("pyarrow")
+
+
+def make_result(std_error: float = 0.1) -> FixedEffectsResult:
+    return FixedEffectsResult(
+        nobs=4,
+        params={"work_hours": -0.02, "income": 0.001},
+        std_errors={"work_hours": std_error, "income": 0.0005},
+        tstats={"work_hours": -0.02 / std_error, "income": 2.0},
+        pvalues={"work_hours": 0.5, "income": 0.05},
+        rsquared_within=0.4,
+        rsquared_between=float("nan"),
+        rsquared_overall=0.2,
+        dropped_vars=["region"],
+        bootstrap_pvalues={"work_hours": 0.4, "income": 0.1},
+        bootstrap_conf_int={"work_hours": (-0.1, 0.05), "income": (-0.001, 0.003)},
+    )
+
+
+class TestNegotiateMediaType:
+    @pytest.mark.parametrize(
+        ("accept", "expected"),
+        [
+            (None, JSON_MEDIA_TYPE),
+            ("*/*", JSON_MEDIA_TYPE),
+            (ARROW_MEDIA_TYPE, ARROW_MEDIA_TYPE),
+            (f"application/json;q=0.5, {ARROW_MEDIA_TYPE}", ARROW_MEDIA_TYPE),
+            (f"{ARROW_MEDIA_TYPE};q=0.2, application/json", JSON_MEDIA_TYPE),
+            (f"{ARROW_MEDIA_TYPE};q=0, */*", JSON_MEDIA_TYPE),
+            ("text/csv", JSON_MEDIA_TYPE),
+        ],
+    )
+    def test_picks_the_most_preferred_supported_type(self, accept, expected):
+        # When / Then
+        assert negotiate_media_type(accept) == expected
+
+
+class TestSerializeResults:
+    def test_json_writes_non_finite_statistics_as_null(self):
+        # Given
+        result = make_result(std_error=float("nan"))
+
+        # When
+        response = serialize_results(result)
+
+        # Then
+        assert response.media_type == JSON_MEDIA_TYPE
+        body = json.loads(response.body)
+        assert body["std_errors"]["work_hours"] is None
+        assert body["rsquared_between"] is None
+        assert body["bootstrap_conf_int"]["income"] == [-0.001, 0.003]
+
+    def test_json_batch_matches_single_results(self):
+        # Given
+        results = [make_result(), make_result(0.2)]
+
+        # When
+        body = json.loads(serialize_results(results).body)
+
+        # Then
+        assert body == [json.loads(serialize_results(result).body) for result in results]
+
+    def test_arrow_stream_has_one_row_per_coefficient(self):
+        # Given
+        results = [make_result(), make_result(float("nan"))]
+
+        # When
+        table = pa.ipc.open_stream(to_arrow_ipc(results)).read_all()
+
+        # Then
+        assert table.column("model").to_pylist() == [0, 0, 1, 1]
+        assert table.column("variable").to_pylist() == ["work_hours", "income"] * 2
+        assert table.column("bootstrap_conf_low").to_pylist()[0] == -0.1
+        assert math.isnan(table.column("std_error").to_pylist()[2])
+        assert table.column("nobs").to_pylist() == [4] * 4
+        models = json.loads(table.schema.metadata[b"models"])
+        assert models[0] == {"dropped_vars": ["region"], "absorption_iterations": None, "permutation_null": None}
+
+    def test_arrow_stream_leaves_absent_bootstrap_columns_null(self):
+        # Given
+        result = FixedEffectsResult(4, {"x": 1.0}, {"x": 0.1}, {"x": 10.0}, {"x": 0.0}, 0.5, 0.5, 0.5, [])
+
+        # When
+        response = serialize_results(result, ARROW_MEDIA_TYPE)
+
+        # Then
+        assert response.media_type == ARROW_MEDIA_TYPE
+        table = pa.ipc.open_stream(response.body).read_all()
+        assert table.column("bootstrap_pvalue").to_pylist() == [None]
@@ -0,0 +1,117 @@
+import asyncio
+import json
+import threading
+import time
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+from app.api.result_stream import stream_results
+from app.application import job_progress
+from app.domain.model.fixed_effects_result import FixedEffectsResult
+from app.infrastructure.analysis_executor import AnalysisExecutor
+
+
+def make_result(nobs: int) -> FixedEffectsResult:
+    return FixedEffectsResult(nobs, {"x": 1.0}, {"x": 0.1}, {"x": 10.0}, {"x": 0.0}, 0.5, 0.4, 0.3, [])
+
+
+def make_request() -> Request:
+    app = FastAPI()
+
+    @app.exception_handler(ValueError)
+    def handle(request, e):
+        return JSONResponse(status_code=400, content={"status": 400, "detail": str(e)})
+
+    return Request({"type": "http", "app": app, "method": "POST", "path": "/analysis/batch/stream", "headers": []})
+
+
+def parse(event: bytes) -> tuple[str, dict]:
+    name, data = event.decode().strip().split("\n")
+    return name.removeprefix("event: "), json.loads(data.removeprefix("data: "))
+
+
+def make_executor() -> AnalysisExecutor:
+    return AnalysisExecutor(max_workers=1, max_queue_depth=0, timeout_seconds=5, retry_after_seconds=1)
+
+
+class TestStreamResults:
+    async def test_emits_each_result_then_a_summary(self):
+        # Given
+        executor = make_executor()
+
+        def analyze(on_result):
+            results = [make_result(index) for index in range(3)]
+            for index, result in enumerate(results):
+                on_result(index, result)
+            return results
+
+        # When
+        events = [parse(event) async for event in stream_results(make_request(), executor, analyze, 3, 5.0)]
+
+        # Then
+        assert [name for name, _ in events] == ["progress", "result", "result", "result", "summary"]
+        assert [data["result"]["nobs"] for name, data in events if name == "result"] == [0, 1, 2]
+        assert events[-1][1]["completed"] == 3
+        executor.shutdown()
+
+    async def test_sends_progress_heartbeats_while_waiting(self):
+        # Given
+        executor = make_executor()
+
+        def analyze(on_result):
+            time.sleep(0.2)
+            on_result(0, make_result(1))
+            return [make_result(1)]
+
+        # When
+        events = [parse(event) async for event in stream_results(make_request(), executor, analyze, 1, 0.05)]
+
+        # Then
+        names = [name for name, _ in events]
+        assert names.count("progress") >= 3
+        assert names[-2:] == ["result", "summary"]
+        executor.shutdown()
+
+    async def test_reports_failure_as_problem_event(self):
+        # Given
+        executor = make_executor()
+
+        def analyze(on_result):
+            raise ValueError("At least one specification must be provided")
+
+        # When
+        events = [parse(event) async for event in stream_results(make_request(), executor, analyze, 1, 5.0)]
+
+        # Then
+        assert events[-1] == ("error", {"status": 400, "detail": "At least one specification must be provided"})
+        executor.shutdown()
+
+    async def test_stops_remaining_work_when_client_disconnects(self):
+        # Given
+        executor = make_executor()
+        steps = []
+        stopped = threading.Event()
+
+        def analyze(on_result):
+            try:
+                for step in range(100):
+                    job_progress.checkpoint(step, 100)
+                    steps.append(step)
+                    on_result(step, make_result(step))
+                    time.sleep(0.01)
+            finally:
+                stopped.set()
+            return []
+
+        stream = stream_results(make_request(), executor, analyze, 100, 5.0)
+
+        # When
+        await anext(stream)
+        await anext(stream)
+        await stream.aclose()
+
+        # Then
+        assert await asyncio.to_thread(stopped.wait, 5)
+        assert len(steps) < 100
+        executor.shutdown()
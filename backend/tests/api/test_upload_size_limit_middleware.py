@@ -0,0 +1,55 @@
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from app.api.upload_size_limit_middleware import UploadSizeLimitMiddleware
+
+
+def make_client(max_bytes: int) -> TestClient:
+    app = FastAPI()
+    app.add_middleware(UploadSizeLimitMiddleware, max_bytes=max_bytes)
+
+    @app.post("/echo")
+    async def echo(request: Request):
+        return {"size": len(await request.body())}
+
+    return TestClient(app)
+
+
+class TestUploadSizeLimitMiddleware:
+    def test_passes_requests_within_limit(self):
+        # Given
+        client = make_client(max_bytes=10)
+
+        # When
+        response = client.post("/echo", content=b"x" * 10)
+
+        # Then
+        assert response.status_code == 200
+        assert response.json() == {"size": 10}
+
+    def test_rejects_declared_content_length_over_limit(self):
+        # Given
+        client = make_client(max_bytes=10)
+
+        # When
+        response = client.post("/echo", content=b"x" * 11)
+
+        # Then
+        assert response.status_code == 413
+        assert response.json()["title"] == "Content too large"
+        assert response.json()["instance"] == "/echo"
+
+    def test_rejects_streamed_body_once_it_exceeds_limit(self):
+        # Given
+        client = make_client(max_bytes=10)
+
+        def body():
+            for _ in range(100):
+                yield b"x" * 4
+
+        # When
+        response = client.post("/echo", content=body())
+
+        # Then
+        assert response.status_code == 413
+        assert "10 bytes" in response.json()["detail"]
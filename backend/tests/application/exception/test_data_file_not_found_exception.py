@@ -0,0 +1,14 @@
+from app.application.exception.data_file_not_found_exception import DataFileNotFoundException
+
+
+class TestDataFileNotFoundException:
+    def test_exception_contains_path(self):
+        # Given
+        path = "panel.parquet"
+
+        # When
+        exception = DataFileNotFoundException(path)
+
+        # Then
+        assert exception.path == path
+        assert "panel.parquet" in str(exception)
@@ -0,0 +1,14 @@
+from app.application.exception.dataset_not_found_exception import DatasetNotFoundException
+
+
+class TestDatasetNotFoundException:
+    def test_exception_contains_dataset_id(self):
+        # Given
+        dataset_id = "abc123"
+
+        # When
+        exception = DatasetNotFoundException(dataset_id)
+
+        # Then
+        assert exception.dataset_id == dataset_id
+        assert "abc123" in str(exception)
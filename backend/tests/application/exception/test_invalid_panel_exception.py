@@ -0,0 +1,19 @@
+from app.application.exception.invalid_panel_exception import InvalidPanelException
+from app.domain.model.panel_issue import PanelIssue
+
+
+class TestInvalidPanelException:
+    def test_exception_summarizes_issues(self):
+        # Given
+        issues = [
+            PanelIssue("missing", ["work_hours"], 3, [0, 4, 9]),
+            PanelIssue("duplicate_key", ["prefecture", "year"], 2, [1, 2]),
+        ]
+
+        # When
+        exception = InvalidPanelException(issues)
+
+        # Then
+        assert exception.issues == issues
+        assert "missing in ['work_hours'] (3 rows)" in str(exception)
+        assert "duplicate_key in ['prefecture', 'year'] (2 rows)" in str(exception)
@@ -0,0 +1,14 @@
+from app.application.exception.upload_too_large_exception import UploadTooLargeException
+
+
+class TestUploadTooLargeException:
+    def test_exception_contains_max_bytes(self):
+        # Given
+        max_bytes = 1024
+
+        # When
+        exception = UploadTooLargeException(max_bytes)
+
+        # Then
+        assert exception.max_bytes == max_bytes
+        assert "1024 bytes" in str(exception)
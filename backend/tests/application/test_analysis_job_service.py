@@ -0,0 +1,201 @@
+import threading
+import time
+
+import pytest
+
+from app.application import job_progress
+from app.application.analysis_job_service import AnalysisJobService
+from app.application.exception.analysis_job_not_found_exception import AnalysisJobNotFoundException
+from app.application.exception.analysis_queue_full_exception import AnalysisQueueFullException
+from app.application.exception.invalid_panel_exception import InvalidPanelException
+from app.application.exception.missing_columns_exception import MissingColumnsException
+from app.domain.model.fixed_effects_result import FixedEffectsResult
+from app.domain.model.panel_issue import PanelIssue
+from app.infrastructure.in_memory_analysis_job_store import InMemoryAnalysisJobStore
+
+
+def make_service(max_workers: int = 1, max_queue_depth: int = 4) -> AnalysisJobService:
+    return AnalysisJobService(
+        job_store=InMemoryAnalysisJobStore(max_jobs=100),
+        max_workers=max_workers,
+        max_queue_depth=max_queue_depth,
+        result_ttl_seconds=60,
+        retry_after_seconds=3,
+    )
+
+
+def make_result() -> FixedEffectsResult:
+    return FixedEffectsResult(10, {"x": 1.0}, {"x": 0.1}, {"x": 10.0}, {"x": 0.0}, 0.5, 0.4, 0.3, [])
+
+
+def wait_until_finished(service: AnalysisJobService, job_id: str):
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        job = service.get(job_id)
+        if job.finished:
+            return job
+        time.sleep(0.01)
+    raise AssertionError("job did not finish")
+
+
+class TestAnalysisJobService:
+    def test_submitted_job_runs_in_background_and_keeps_result(self):
+        # Given
+        service = make_service()
+        result = make_result()
+
+        # When
+        job = service.submit(lambda: [result])
+        finished = wait_until_finished(service, job.job_id)
+
+        # Then
+        assert job.status == "queued"
+        assert finished.status == "succeeded"
+        assert finished.progress == 1.0
+        assert finished.result == [result]
+        assert (finished.expires_at - finished.finished_at).total_seconds() == 60
+        assert service.in_flight == 0
+        service.shutdown()
+
+    def test_failed_job_reports_error_class_and_message(self):
+        # Given
+        service = make_service()
+
+        def fail():
+            raise MissingColumnsException(["unmarried"])
+
+        # When
+        finished = wait_until_finished(service, service.submit(fail).job_id)
+
+        # Then
+        assert finished.status == "failed"
+        assert finished.error == "MissingColumnsException"
+        assert "unmarried" in finished.error_detail
+        service.shutdown()
+
+    def test_failed_job_keeps_issues_of_invalid_panel(self):
+        # Given
+        service = make_service()
+        issues = [PanelIssue("duplicate_key", ["prefecture", "year"], 2, [3, 48])]
+
+        def fail():
+            raise InvalidPanelException(issues)
+
+        # When
+        finished = wait_until_finished(service, service.submit(fail).job_id)
+
+        # Then
+        assert finished.status == "failed"
+        assert finished.error == "InvalidPanelException"
+        assert "duplicate_key" in finished.error_detail
+        assert finished.error_issues == issues
+        service.shutdown()
+
+    def test_unexpected_errors_are_reported_without_detail(self):
+        # Given
+        service = make_service()
+
+        def fail():
+            raise RuntimeError("internal state")
+
+        # When
+        finished = wait_until_finished(service, service.submit(fail).job_id)
+
+        # Then
+        assert finished.error == "RuntimeError"
+        assert finished.error_detail == "Unexpected error"
+        service.shutdown()
+
+    def test_submit_raises_when_workers_and_queue_are_full(self):
+        # Given
+        service = make_service(max_workers=1, max_queue_depth=1)
+        release = threading.Event()
+        service.submit(release.wait)
+        service.submit(release.wait)
+
+        # When / Then
+        with pytest.raises(AnalysisQueueFullException):
+            service.submit(release.wait)
+        release.set()
+        service.shutdown()
+
+    def test_cancel_stops_running_job_at_next_checkpoint(self):
+        # Given
+        service = make_service()
+        started = threading.Event()
+
+        def analyze():
+            for step in range(1000):
+                job_progress.checkpoint(step, 1000)
+                started.set()
+                time.sleep(0.01)
+            return [make_result()]
+
+        job = service.submit(analyze)
+        started.wait(timeout=5)
+
+        # When
+        cancelled = service.cancel(job.job_id)
+
+        # Then
+        assert cancelled.status == "cancelled"
+        deadline = time.monotonic() + 5
+        while service.in_flight and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert service.in_flight == 0
+        assert service.get(job.job_id).result is None
+        service.shutdown()
+
+    def test_cancel_prevents_queued_job_from_starting(self):
+        # Given
+        service = make_service(max_workers=1)
+        release = threading.Event()
+        calls = []
+        service.submit(release.wait)
+        queued = service.submit(lambda: calls.append("ran") or [])
+
+        # When
+        cancelled = service.cancel(queued.job_id)
+        release.set()
+
+        # Then
+        assert cancelled.status == "cancelled"
+        assert cancelled.started_at is None
+        time.sleep(0.05)
+        assert calls == []
+        service.shutdown()
+
+    def test_get_reports_progress_of_running_job(self):
+        # Given
+        service = make_service()
+        reached = threading.Event()
+        release = threading.Event()
+
+        def analyze():
+            job_progress.checkpoint(1, 4)
+            reached.set()
+            release.wait()
+            return []
+
+        job = service.submit(analyze)
+        reached.wait(timeout=5)
+
+        # When
+        running = service.get(job.job_id)
+        release.set()
+
+        # Then
+        assert running.status == "running"
+        assert running.progress == 0.25
+        service.shutdown()
+
+    def test_get_and_cancel_raise_for_unknown_job(self):
+        # Given
+        service = make_service()
+
+        # When / Then
+        with pytest.raises(AnalysisJobNotFoundException):
+            service.get("missing")
+        with pytest.raises(AnalysisJobNotFoundException):
+            service.cancel("missing")
+        service.shutdown()
@@ -0,0 +1,290 @@
+from contextlib import nullcontext
+import hashlib
+from unittest.mock import Mock, patch
+
+import pandas as pd
+import pytest
+
+from app.application.dataset_application_service import DatasetApplicationService
+from app.application.fertility_analysis_application_service import FertilityAnalysisApplicationService
+from app.application.exception.data_file_not_found_exception import DataFileNotFoundException
+from app.application.exception.dataset_not_found_exception import DatasetNotFoundException
+from app.application.exception.invalid_panel_exception import InvalidPanelException
+from app.application.panel_validation import validate_panel
+from app.domain.model.panel_validation_options import PanelValidationOptions
+from app.domain.model.registered_dataset import RegisteredDataset
+from app.domain.service.numpy_fixed_effects_estimator import NumpyFixedEffectsEstimator
+from app.domain.service.panel_sufficient_statistics import PanelSufficientStatistics
+from app.domain.service.sufficient_statistics_estimator import SufficientStatisticsEstimator
+from app.infrastructure.in_memory_dataset_repository import InMemoryDatasetRepository
+from app.infrastructure.in_memory_sufficient_statistics_repository import InMemorySufficientStatisticsRepository
+from app.infrastructure.memory_mapped_dataset_repository import MemoryMappedDatasetRepository
+from tests.domain.service.test_numpy_fixed_effects_estimator import make_dataframe
+
+
+class TestDatasetApplicationService:
+    def test_register_parses_and_stores_dataset_by_content_hash(self):
+        # Given
+        mock_csv_loader = Mock()
+        mock_csv_loader.load.return_value = pd.DataFrame({"prefecture": ["Tokyo"], "year": [2020]})
+        repository = InMemoryDatasetRepository(max_bytes=1024 * 1024)
+        service = DatasetApplicationService(csv_loader=mock_csv_loader, dataset_repository=repository)
+        csv_bytes = b"prefecture,year\nTokyo,2020\n"
+
+        # When
+        result = service.register(csv_bytes)
+
+        # Then
+        assert isinstance(result, RegisteredDataset)
+        assert result.dataset_id == hashlib.sha256(csv_bytes).hexdigest()
+        assert result.nobs == 1
+        assert result.columns == ["prefecture", "year"]
+        stored = repository.get(result.dataset_id)
+        assert isinstance(stored["prefecture"].dtype, pd.CategoricalDtype)
+        pd.testing.assert_frame_equal(stored, mock_csv_loader.load.return_value, check_dtype=False, check_categorical=False)
+
+    def test_register_same_content_twice_parses_once(self):
+        # Given
+        mock_csv_loader = Mock()
+        mock_csv_loader.load.return_value = pd.DataFrame({"prefecture": ["Tokyo"], "year": [2020]})
+        repository = InMemoryDatasetRepository(max_bytes=1024 * 1024)
+        service = DatasetApplicationService(csv_loader=mock_csv_loader, dataset_repository=repository)
+        csv_bytes = b"prefecture,year\nTokyo,2020\n"
+
+        # When
+        first = service.register(csv_bytes)
+        second = service.register(csv_bytes)
+
+        # Then
+        assert first == second
+        mock_csv_loader.load.assert_called_once_with(csv_bytes)
+
+    def test_register_file_loads_file_from_data_directory(self, tmp_path):
+        # Given
+        mock_csv_loader = Mock()
+        mock_csv_loader.load_file.return_value = pd.DataFrame({"prefecture": ["Tokyo"], "year": [2020]})
+        repository = InMemoryDatasetRepository(max_bytes=1024 * 1024)
+        service = DatasetApplicationService(
+            csv_loader=mock_csv_loader,
+            dataset_repository=repository,
+            data_directory=tmp_path
+        )
+        content = b"PAR1 panel"
+        (tmp_path / "panel.parquet").write_bytes(content)
+
+        # When
+        result = service.register_file("panel.parquet")
+
+        # Then
+        assert result.dataset_id == hashlib.sha256(content).hexdigest()
+        mock_csv_loader.load_file.assert_called_once_with((tmp_path / "panel.parquet").resolve())
+
+    def test_register_file_rejects_paths_outside_data_directory(self, tmp_path):
+        # Given
+        data_directory = tmp_path / "data"
+        data_directory.mkdir()
+        (tmp_path / "secret.csv").write_bytes(b"a,b\n1,2\n")
+        service = DatasetApplicationService(
+            csv_loader=Mock(),
+            dataset_repository=InMemoryDatasetRepository(max_bytes=1024 * 1024),
+            data_directory=data_directory
+        )
+
+        # When / Then
+        with pytest.raises(ValueError, match="inside the data directory"):
+            service.register_file("../secret.csv")
+
+    def test_register_file_raises_when_file_does_not_exist(self, tmp_path):
+        # Given
+        service = DatasetApplicationService(
+            csv_loader=Mock(),
+            dataset_repository=InMemoryDatasetRepository(max_bytes=1024 * 1024),
+            data_directory=tmp_path
+        )
+
+        # When / Then
+        with pytest.raises(DataFileNotFoundException):
+            service.register_file("missing.parquet")
+
+    def test_register_file_requires_configured_data_directory(self):
+        # Given
+        service = DatasetApplicationService(
+            csv_loader=Mock(),
+            dataset_repository=InMemoryDatasetRepository(max_bytes=1024 * 1024)
+        )
+
+        # When / Then
+        with pytest.raises(ValueError, match="not configured"):
+            service.register_file("panel.parquet")
+
+    def test_append_adds_new_time_slice_and_updates_statistics(self):
+        # Given
+        dataframe = make_dataframe()
+        repository = InMemoryDatasetRepository(max_bytes=1024 * 1024)
+        statistics_repository = InMemorySufficientStatisticsRepository(max_datasets=8)
+        repository.put("base", dataframe[dataframe["year"] < 2022].reset_index(drop=True))
+        columns = ("fertility_rate", "work_hours")
+        statistics_repository.put(
+            "base",
+            PanelSufficientStatistics.from_dataframe(repository.get("base"), "prefecture", columns)
+        )
+        mock_csv_loader = Mock()
+        mock_csv_loader.load.return_value = dataframe[dataframe["year"] == 2022].reset_index(drop=True)
+        service = DatasetApplicationService(
+            csv_loader=mock_csv_loader,
+            dataset_repository=repository,
+            statistics_repository=statistics_repository
+        )
+
+        # When
+        result = service.append("base", b"2022 slice")
+
+        # Then
+        assert result.nobs == 15
+        assert result.dataset_id != "base"
+        statistics = statistics_repository.get(result.dataset_id, "prefecture", columns)
+        assert statistics.nobs == 15
+        expected = NumpyFixedEffectsEstimator().fit(dataframe, "fertility_rate", ["work_hours"], "prefecture", "year")
+        actual = SufficientStatisticsEstimator().fit(statistics, "fertility_rate", ["work_hours"])
+        assert actual.params == pytest.approx(expected.params, rel=1e-12)
+
+    def test_datasets_registered_by_one_worker_are_analyzed_and_appended_by_another(self, tmp_path):
+        # Given
+        dataframe = make_dataframe()
+        mock_csv_loader = Mock()
+        mock_csv_loader.load.side_effect = [
+            dataframe[dataframe["year"] < 2022].reset_index(drop=True),
+            dataframe[dataframe["year"] == 2022].reset_index(drop=True),
+        ]
+        registering = DatasetApplicationService(
+            csv_loader=mock_csv_loader,
+            dataset_repository=MemoryMappedDatasetRepository(tmp_path, max_bytes=1024 * 1024)
+        )
+        other_repository = MemoryMappedDatasetRepository(tmp_path, max_bytes=1024 * 1024)
+        appending = DatasetApplicationService(csv_loader=mock_csv_loader, dataset_repository=other_repository)
+
+        # When
+        registered = registering.register(b"base")
+        appended = appending.append(registered.dataset_id, b"2022 slice")
+        result = FertilityAnalysisApplicationService(
+            csv_loader=Mock(),
+            dataset_repository=other_repository
+        ).analyze_dataset(appended.dataset_id, "fertility_rate", ["work_hours"])
+
+        # Then
+        assert appended.nobs == 15
+        expected = NumpyFixedEffectsEstimator().fit(dataframe, "fertility_rate", ["work_hours"], "prefecture", "year")
+        assert result.params == pytest.approx(expected.params, rel=1e-12)
+
+    @pytest.mark.parametrize("column, value, kind", [("work_hours", "abc", "non_numeric"), ("prefecture", "Tokyo", "duplicate_key")])
+    def test_append_rejects_invalid_slice_before_storing_anything(self, column, value, kind):
+        # Given
+        dataframe = make_dataframe()
+        repository = InMemoryDatasetRepository(max_bytes=1024 * 1024)
+        statistics_repository = InMemorySufficientStatisticsRepository(max_datasets=8)
+        base = dataframe[dataframe["year"] < 2022].reset_index(drop=True)
+        repository.put("base", base)
+        statistics_repository.put(
+            "base", PanelSufficientStatistics.from_dataframe(base, "prefecture", ("fertility_rate", "work_hours"))
+        )
+        time_slice = dataframe[dataframe["year"] == 2022].reset_index(drop=True).astype({column: object})
+        time_slice.loc[1, column] = value
+        mock_csv_loader = Mock()
+        mock_csv_loader.load.return_value = time_slice
+        service = DatasetApplicationService(
+            csv_loader=mock_csv_loader,
+            dataset_repository=repository,
+            statistics_repository=statistics_repository
+        )
+
+        # When
+        with pytest.raises(InvalidPanelException) as raised:
+            service.append("base", b"2022 slice")
+
+        # Then
+        assert [issue.kind for issue in raised.value.issues] == [kind]
+        assert min(raised.value.issues[0].rows) >= len(base)
+        assert len(repository) == 1
+        assert len(statistics_repository) == 1
+
+    @pytest.mark.parametrize("new_prefecture, carried", [(None, True), ("Nara", False)])
+    def test_append_carries_parent_validation_when_slice_passes(self, new_prefecture, carried):
+        # Given
+        dataframe = make_dataframe()
+        repository = InMemoryDatasetRepository(max_bytes=1024 * 1024)
+        statistics_repository = InMemorySufficientStatisticsRepository(max_datasets=8)
+        repository.put("base", dataframe[dataframe["year"] < 2022].reset_index(drop=True))
+        analysis = FertilityAnalysisApplicationService(
+            csv_loader=Mock(),
+            dataset_repository=repository,
+            statistics_repository=statistics_repository
+        )
+        analysis.analyze_dataset("base", "fertility_rate", ["work_hours"])
+        time_slice = dataframe[dataframe["year"] == 2022].reset_index(drop=True)
+        if new_prefecture is not None:
+            time_slice.loc[0, "prefecture"] = new_prefecture
+        mock_csv_loader = Mock()
+        mock_csv_loader.load.return_value = time_slice
+        service = DatasetApplicationService(
+            csv_loader=mock_csv_loader,
+            dataset_repository=repository,
+            statistics_repository=statistics_repository
+        )
+
+        # When
+        result = service.append("base", b"2022 slice")
+
+        # Then
+        outcome = statistics_repository.get_validation(
+            result.dataset_id, "prefecture", "year", ("fertility_rate", "work_hours"), PanelValidationOptions()
+        )
+        assert (outcome is not None) == carried
+        with patch(
+            "app.application.fertility_analysis_application_service.validate_panel", wraps=validate_panel
+        ) as validate, nullcontext() if carried else pytest.raises(InvalidPanelException, match="singleton"):
+            analysis.analyze_dataset(result.dataset_id, "fertility_rate", ["work_hours"])
+        assert validate.called != carried
+
+    def test_append_keeps_parent_category_codes(self):
+        # Given
+        dataframe = make_dataframe().astype({"prefecture": "category"})
+        repository = InMemoryDatasetRepository(max_bytes=1024 * 1024)
+        repository.put("base", dataframe[dataframe["year"] < 2022].reset_index(drop=True))
+        time_slice = dataframe[dataframe["year"] == 2022].reset_index(drop=True).astype({"prefecture": object})
+        time_slice.loc[0, "prefecture"] = "Nara"
+        mock_csv_loader = Mock()
+        mock_csv_loader.load.return_value = time_slice
+        service = DatasetApplicationService(csv_loader=mock_csv_loader, dataset_repository=repository)
+
+        # When
+        result = service.append("base", b"2022 slice")
+
+        # Then
+        appended = repository.get(result.dataset_id)
+        parent = repository.get("base")
+        assert list(appended["prefecture"].cat.categories) == [*parent["prefecture"].cat.categories, "Nara"]
+        assert appended["prefecture"].astype(object).tolist() == [*parent["prefecture"], *time_slice["prefecture"]]
+
+    def test_append_rejects_time_periods_already_in_dataset(self):
+        # Given
+        dataframe = make_dataframe()
+        repository = InMemoryDatasetRepository(max_bytes=1024 * 1024)
+        repository.put("base", dataframe)
+        mock_csv_loader = Mock()
+        mock_csv_loader.load.return_value = dataframe[dataframe["year"] == 2022]
+        service = DatasetApplicationService(csv_loader=mock_csv_loader, dataset_repository=repository)
+
+        # When / Then
+        with pytest.raises(ValueError, match="not in the dataset yet"):
+            service.append("base", b"2022 slice")
+
+    def test_append_to_unknown_dataset_raises_exception(self):
+        # Given
+        service = DatasetApplicationService(
+            csv_loader=Mock(),
+            dataset_repository=InMemoryDatasetRepository(max_bytes=1024 * 1024)
+        )
+
+        # When / Then
+        with pytest.raises(DatasetNotFoundException):
+            service.append("unknown", b"2022 slice")
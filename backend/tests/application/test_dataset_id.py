@@ -0,0 +1,18 @@
+import hashlib
+import io
+
+from app.application.dataset_id import compute_dataset_id
+
+
+class TestComputeDatasetId:
+    def test_file_object_hashes_like_bytes_and_is_rewound(self):
+        # Given
+        csv_bytes = b"prefecture,year\nTokyo,2018\n" * 1000
+        csv_file = io.BytesIO(csv_bytes)
+
+        # When
+        dataset_id = compute_dataset_id(csv_file)
+
+        # Then
+        assert dataset_id == compute_dataset_id(csv_bytes) == hashlib.sha256(csv_bytes).hexdigest()
+        assert csv_file.tell() == 0
@@ -1,17 +1,36 @@
-from unittest.mock import Mock
-
-from app.dependencies import get_fertility_analysis_application_service
+from app.dependencies import (
+    get_dataframe_loader,
+    get_dataset_application_service,
+    get_dataset_repository,
+    get_fertility_analysis_application_service,
+    get_fixed_effects_estimator,
+)
+from app.application.dataset_application_service import DatasetApplicationService
 from app.application.fertility_analysis_application_service import FertilityAnalysisApplicationService
 
 
 class TestGetFertilityAnalysisApplicationService:
-    def test_returns_fertility_analysis_application_service_instance(self):
-        # Given
-        mock_csv_loader = Mock()
-        
-        # When
-        result = get_fertility_analysis_application_service(csv_loader=mock_csv_loader)
-        
+    def test_returns_shared_fertility_analysis_application_service(self):
+        # Given / When
+        first = get_fertility_analysis_application_service()
+        second = get_fertility_analysis_application_service()
+
+        # Then
+        assert isinstance(first, FertilityAnalysisApplicationService)
+        assert first is second
+        assert first.csv_loader is get_dataframe_loader()
+        assert first.estimator is get_fixed_effects_estimator()
+        assert first.dataset_repository is get_dataset_repository()
+
+
+class TestGetDatasetApplicationService:
+    def test_returns_shared_dataset_application_service(self):
+        # Given / When
+        first = get_dataset_application_service()
+        second = get_dataset_application_service()
+
         # Then
-        assert isinstance(result, FertilityAnalysisApplicationService)
-        assert result.csv_loader == mock_csv_loader
+        assert isinstance(first, DatasetApplicationService)
+        assert first is second
+        assert first.csv_loader is get_dataframe_loader()
+        assert first.dataset_repository is get_dataset_repository()
@@ -1,10 +1,31 @@
+from contextlib import nullcontext
+import io
+
+import numpy as np
 import pytest
 import pandas as pd
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from app.application.fertility_analysis_application_service import FertilityAnalysisApplicationService
+from app.application.exception.dataset_not_found_exception import DatasetNotFoundException
+from app.application.exception.invalid_panel_exception import InvalidPanelException
 from app.application.exception.missing_columns_exception import MissingColumnsException
+from app.application.panel_validation import validate_panel
+from app.domain.model.absorption_specification import AbsorptionSpecification
+from app.domain.model.analysis_specification import AnalysisSpecification
+from app.domain.model.bootstrap_specification import BootstrapSpecification
+from app.domain.model.dataset_schema import DatasetSchema
 from app.domain.model.fixed_effects_result import FixedEffectsResult
+from app.domain.model.panel_validation_options import PanelValidationOptions
+from app.domain.model.subset_search_specification import SubsetSearchSpecification
+from app.domain.model.window_specification import WindowSpecification
+from app.domain.service.numpy_fixed_effects_estimator import NumpyFixedEffectsEstimator
+from app.domain.service.panel_sufficient_statistics import PanelSufficientStatistics
+from app.infrastructure.csv_dataframe_loader import CsvDataFrameLoader
+from app.infrastructure.disk_parsed_dataset_cache import DiskParsedDatasetCache
+from app.infrastructure.in_memory_analysis_result_cache import InMemoryAnalysisResultCache
+from app.infrastructure.in_memory_sufficient_statistics_repository import InMemorySufficientStatisticsRepository
+from tests.domain.service.test_fixed_effects_estimator_parity import assert_results_agree, make_synthetic_panel
 
 
 class TestFertilityAnalysisApplicationService:
@@ -32,7 +53,10 @@ class TestFertilityAnalysisApplicationService:
         
         # Then
         assert isinstance(result, FixedEffectsResult)
-        mock_csv_loader.load.assert_called_once_with(csv_bytes)
+        mock_csv_loader.load.assert_called_once_with(
+            csv_bytes,
+            DatasetSchema(variables=("fertility_rate", "work_hours"))
+        )
         
     def test_analyze_with_missing_columns_raises_exception(self):
         # Given
@@ -109,3 +133,527 @@ class TestFertilityAnalysisApplicationService:
         
         # Then
         assert isinstance(result, FixedEffectsResult)
+
+    def test_analyze_reuses_parsed_dataset_cached_on_disk_after_restart(self, tmp_path):
+        # Given
+        dataframe = make_synthetic_panel(nentity=10, nperiod=5, nvar=1, seed=3, balanced=True, missing=0)
+        csv_bytes = dataframe.to_csv(index=False).encode("utf-8")
+        loader = CsvDataFrameLoader()
+        before_restart = FertilityAnalysisApplicationService(
+            csv_loader=loader,
+            parsed_cache=DiskParsedDatasetCache(tmp_path, max_bytes=1024 * 1024),
+        )
+        after_restart = FertilityAnalysisApplicationService(
+            csv_loader=loader,
+            parsed_cache=DiskParsedDatasetCache(tmp_path, max_bytes=1024 * 1024),
+        )
+
+        # When
+        with patch.object(loader, "load", wraps=loader.load) as load:
+            expected = before_restart.analyze(csv_bytes, "y", ["x0"], "entity", "period")
+            result = after_restart.analyze(csv_bytes, "y", ["x0"], "entity", "period")
+
+        # Then
+        load.assert_called_once()
+        assert_results_agree(result, expected)
+
+    def test_analyze_dataset_uses_registered_dataframe(self):
+        # Given
+        mock_csv_loader = Mock()
+        mock_dataset_repository = Mock()
+        data = {
+            "prefecture": ["Tokyo"] * 5 + ["Osaka"] * 5 + ["Kyoto"] * 5,
+            "year": [2018, 2019, 2020, 2021, 2022] * 3,
+            "fertility_rate": [1.2, 1.25, 1.3, 1.35, 1.4, 1.5, 1.55, 1.6, 1.65, 1.7, 1.3, 1.32, 1.35, 1.38, 1.4],
+            "work_hours": [40, 39, 38, 37, 36, 42, 41.5, 41, 40.5, 40, 41, 40.5, 40, 39.5, 39]
+        }
+        mock_dataset_repository.get.return_value = pd.DataFrame(data)
+        
+        service = FertilityAnalysisApplicationService(
+            csv_loader=mock_csv_loader,
+            dataset_repository=mock_dataset_repository
+        )
+        
+        # When
+        result = service.analyze_dataset(
+            dataset_id="abc123",
+            dependent_var="fertility_rate",
+            independent_vars=["work_hours"]
+        )
+        
+        # Then
+        assert isinstance(result, FixedEffectsResult)
+        mock_dataset_repository.get.assert_called_once_with("abc123")
+        mock_csv_loader.load.assert_not_called()
+        
+    def test_analyze_dataset_solves_from_stored_sufficient_statistics(self):
+        # Given
+        mock_dataset_repository = Mock()
+        data = {
+            "prefecture": ["Tokyo"] * 5 + ["Osaka"] * 5 + ["Kyoto"] * 5,
+            "year": [2018, 2019, 2020, 2021, 2022] * 3,
+            "fertility_rate": [1.2, 1.25, 1.3, 1.35, 1.4, 1.5, 1.55, 1.6, 1.65, 1.7, 1.3, 1.32, 1.35, 1.38, 1.4],
+            "work_hours": [40, 39, 38, 37, 36, 42, 41.5, 41, 40.5, 40, 41, 40.5, 40, 39.5, 39]
+        }
+        mock_dataset_repository.get.return_value = pd.DataFrame(data)
+        statistics_repository = InMemorySufficientStatisticsRepository(max_datasets=8)
+
+        service = FertilityAnalysisApplicationService(
+            csv_loader=Mock(),
+            dataset_repository=mock_dataset_repository,
+            statistics_repository=statistics_repository
+        )
+
+        # When
+        with patch.object(PanelSufficientStatistics, "from_panel", wraps=PanelSufficientStatistics.from_panel) as from_panel:
+            first = service.analyze_dataset("abc123", "fertility_rate", ["work_hours"])
+            second = service.analyze_dataset("abc123", "work_hours", ["fertility_rate"])
+
+        # Then
+        expected = NumpyFixedEffectsEstimator().fit(
+            pd.DataFrame(data), "fertility_rate", ["work_hours"], "prefecture", "year"
+        )
+        assert first.params == pytest.approx(expected.params, rel=1e-12)
+        assert list(second.params) == ["fertility_rate"]
+        from_panel.assert_called_once()
+        assert statistics_repository.get("abc123", "prefecture", ("fertility_rate", "work_hours")) is not None
+
+    def test_analyze_dataset_keeps_nearly_collinear_variables_like_uploads(self):
+        # Given
+        dataframe = make_synthetic_panel(nentity=30, nperiod=8, nvar=1, seed=11, balanced=True, missing=0)
+        dataframe["x1"] = dataframe["x0"] + 1e-6 * np.random.default_rng(11).normal(size=len(dataframe))
+        mock_dataset_repository = Mock()
+        mock_dataset_repository.get.return_value = dataframe
+        service = FertilityAnalysisApplicationService(
+            csv_loader=CsvDataFrameLoader(),
+            dataset_repository=mock_dataset_repository,
+            statistics_repository=InMemorySufficientStatisticsRepository(max_datasets=8)
+        )
+
+        # When
+        uploaded = service.analyze(dataframe.to_csv(index=False).encode("utf-8"), "y", ["x0", "x1"], "entity", "period")
+        registered = service.analyze_dataset("abc123", "y", ["x0", "x1"], "entity", "period")
+
+        # Then
+        assert uploaded.dropped_vars == registered.dropped_vars == []
+        # The two columns are collinear to one part in a million, so the
+        # estimates themselves are only determined to a few digits.
+        assert registered.params == pytest.approx(uploaded.params, rel=1e-2)
+
+    @pytest.mark.parametrize("valid", [True, False])
+    def test_analyze_dataset_validates_each_dataset_and_options_once(self, valid):
+        # Given
+        dataframe = make_synthetic_panel(nentity=12, nperiod=5, nvar=1, seed=12, missing=0 if valid else 2)
+        mock_dataset_repository = Mock()
+        mock_dataset_repository.get.return_value = dataframe
+        service = FertilityAnalysisApplicationService(
+            csv_loader=Mock(),
+            dataset_repository=mock_dataset_repository,
+            statistics_repository=InMemorySufficientStatisticsRepository(max_datasets=8)
+        )
+
+        # When
+        with patch(
+            "app.application.fertility_analysis_application_service.validate_panel",
+            wraps=validate_panel
+        ) as validate:
+            for _ in range(2):
+                with nullcontext() if valid else pytest.raises(InvalidPanelException, match="missing"):
+                    service.analyze_dataset("abc123", "y", ["x0"], "entity", "period")
+            service.analyze_dataset(
+                "abc123", "x0", ["y"], "entity", "period", validation=PanelValidationOptions(drop_missing=True)
+            )
+
+        # Then
+        assert validate.call_count == 2
+
+    def test_analyze_dataset_does_not_reuse_statistics_built_after_dropping_rows(self):
+        # Given
+        mock_dataset_repository = Mock()
+        data = {
+            "prefecture": ["Tokyo"] * 5 + ["Osaka"] * 5 + ["Kyoto"] * 5 + ["Nara"],
+            "year": [2018, 2019, 2020, 2021, 2022] * 3 + [2018],
+            "fertility_rate": [1.2, 1.25, 1.3, 1.35, 1.4, 1.5, 1.55, 1.6, 1.65, 1.7, 1.3, 1.32, 1.35, 1.38, 1.4, 1.4],
+            "work_hours": [40, 39, 38, 37, 36, 42, 41.5, 41, 40.5, 40, 41, 40.5, 40, 39.5, 39, 38]
+        }
+        mock_dataset_repository.get.return_value = pd.DataFrame(data)
+        statistics_repository = InMemorySufficientStatisticsRepository(max_datasets=8)
+        service = FertilityAnalysisApplicationService(
+            csv_loader=Mock(),
+            dataset_repository=mock_dataset_repository,
+            statistics_repository=statistics_repository
+        )
+        specification = SubsetSearchSpecification("fertility_rate", ("work_hours",))
+
+        # When
+        service.search_dataset_subsets("abc123", specification, PanelValidationOptions(drop_singletons=True))
+
+        # Then
+        assert statistics_repository.list("abc123") == []
+        with pytest.raises(InvalidPanelException):
+            service.analyze_dataset("abc123", "fertility_rate", ["work_hours"])
+
+    def test_search_subsets_estimates_every_subset_on_the_common_sample(self):
+        # Given
+        dataframe = make_synthetic_panel(nentity=12, nperiod=5, nvar=3, seed=8, missing=4)
+        service = FertilityAnalysisApplicationService(csv_loader=CsvDataFrameLoader())
+        specification = SubsetSearchSpecification("y", ("x0", "x1", "x2"), "rsquared_within", top=3, max_vars=1, entity_var="entity", time_var="period")
+
+        # When
+        result = service.search_subsets(
+            dataframe.to_csv(index=False).encode("utf-8"), specification, PanelValidationOptions(drop_missing=True)
+        )
+
+        # Then
+        assert result.nobs == len(dataframe) - 4
+        assert {model.independent_vars for model in result.models} == {("x0",), ("x1",), ("x2",)}
+        assert all(model.result.nobs == len(dataframe) - 4 for model in result.models)
+
+    def test_search_dataset_subsets_reuses_stored_sufficient_statistics(self):
+        # Given
+        mock_dataset_repository = Mock()
+        mock_dataset_repository.get.return_value = make_synthetic_panel(nentity=12, nperiod=5, nvar=3, seed=9)
+        statistics_repository = InMemorySufficientStatisticsRepository(max_datasets=8)
+        service = FertilityAnalysisApplicationService(
+            csv_loader=Mock(),
+            dataset_repository=mock_dataset_repository,
+            statistics_repository=statistics_repository
+        )
+        specification = SubsetSearchSpecification("y", ("x0", "x1", "x2"), entity_var="entity", time_var="period")
+
+        # When
+        with patch.object(PanelSufficientStatistics, "from_panel", wraps=PanelSufficientStatistics.from_panel) as from_panel:
+            first = service.search_dataset_subsets("abc123", specification)
+            second = service.search_dataset_subsets("abc123", specification)
+
+        # Then
+        assert first == second
+        from_panel.assert_called_once()
+        assert statistics_repository.get("abc123", "entity", ("x0", "x1", "x2", "y")) is not None
+
+    def test_analyze_dataset_windows_returns_result_per_window(self):
+        # Given
+        mock_dataset_repository = Mock()
+        dataframe = make_synthetic_panel(nentity=12, nperiod=6, nvar=2, seed=10)
+        mock_dataset_repository.get.return_value = dataframe
+        service = FertilityAnalysisApplicationService(csv_loader=Mock(), dataset_repository=mock_dataset_repository)
+
+        # When
+        estimates = service.analyze_dataset_windows(
+            "abc123", "y", ["x0", "x1"], WindowSpecification(4), "entity", "period"
+        )
+
+        # Then
+        assert [(estimate.start, estimate.end) for estimate in estimates] == [(2000, 2003), (2001, 2004), (2002, 2005)]
+        expected = NumpyFixedEffectsEstimator().fit(
+            dataframe[dataframe["period"] >= 2002], "y", ["x0", "x1"], "entity", "period"
+        )
+        assert_results_agree(estimates[-1].result, expected)
+
+    def test_analyze_large_upload_streams_row_blocks(self):
+        # Given
+        dataframe = make_synthetic_panel(nentity=30, nperiod=8, nvar=2, seed=7, balanced=False, missing=5)
+        csv_bytes = dataframe.to_csv(index=False).encode("utf-8")
+        loader = CsvDataFrameLoader()
+        in_memory = FertilityAnalysisApplicationService(csv_loader=loader)
+        chunked = FertilityAnalysisApplicationService(csv_loader=loader, chunked_min_bytes=1, chunk_rows=25)
+        validation = PanelValidationOptions(drop_missing=True)
+
+        # When
+        with patch.object(loader, "load_chunks", wraps=loader.load_chunks) as load_chunks:
+            result = chunked.analyze(io.BytesIO(csv_bytes), "y", ["x0", "x1"], "entity", "period", validation=validation)
+
+        # Then
+        load_chunks.assert_called_once()
+        expected = in_memory.analyze(csv_bytes, "y", ["x0", "x1"], "entity", "period", validation=validation)
+        assert_results_agree(result, expected)
+
+    def test_analyze_dataset_with_bootstrap_refits_raw_rows(self):
+        # Given
+        dataframe = make_synthetic_panel(nentity=15, nperiod=6, nvar=2, seed=12)
+        mock_dataset_repository = Mock()
+        mock_dataset_repository.get.return_value = dataframe
+        statistics_repository = InMemorySufficientStatisticsRepository(max_datasets=8)
+        service = FertilityAnalysisApplicationService(
+            csv_loader=Mock(),
+            dataset_repository=mock_dataset_repository,
+            statistics_repository=statistics_repository
+        )
+
+        # When
+        result = service.analyze_dataset(
+            "abc123", "y", ["x0", "x1"], "entity", "period", BootstrapSpecification(draws=199)
+        )
+
+        # Then
+        assert set(result.bootstrap_pvalues) == {"x0", "x1"}
+        assert statistics_repository.list("abc123") == []
+
+    def test_analyze_dataset_with_absorption_skips_sufficient_statistics(self):
+        # Given
+        dataframe = make_synthetic_panel(15, 6, 2, seed=13)
+        mock_dataset_repository = Mock()
+        mock_dataset_repository.get.return_value = dataframe
+        statistics_repository = InMemorySufficientStatisticsRepository(max_datasets=8)
+        service = FertilityAnalysisApplicationService(
+            csv_loader=Mock(),
+            dataset_repository=mock_dataset_repository,
+            statistics_repository=statistics_repository
+        )
+        absorption = AbsorptionSpecification(effects=(("period",),))
+
+        # When
+        result = service.analyze_dataset("abc123", "y", ["x0", "x1"], "entity", "period", absorption=absorption)
+
+        # Then
+        assert set(result.absorption_iterations) == {"y", "x0", "x1"}
+        assert statistics_repository.list("abc123") == []
+
+    def test_analyze_large_upload_reports_non_numeric_values_like_small_uploads(self):
+        # Given
+        dataframe = make_synthetic_panel(nentity=10, nperiod=5, nvar=1, seed=13).astype({"x0": object})
+        dataframe.loc[37, "x0"] = "abc"
+        csv_bytes = dataframe.to_csv(index=False).encode("utf-8")
+        chunked = FertilityAnalysisApplicationService(csv_loader=CsvDataFrameLoader(), chunked_min_bytes=1, chunk_rows=10)
+        whole = FertilityAnalysisApplicationService(csv_loader=CsvDataFrameLoader())
+
+        # When
+        with pytest.raises(InvalidPanelException) as chunked_raised:
+            chunked.analyze(csv_bytes, "y", ["x0"], "entity", "period")
+        with pytest.raises(InvalidPanelException) as whole_raised:
+            whole.analyze(csv_bytes, "y", ["x0"], "entity", "period")
+
+        # Then
+        assert chunked_raised.value.issues == whole_raised.value.issues
+        assert [(issue.kind, issue.rows) for issue in chunked_raised.value.issues] == [("non_numeric", [37])]
+
+    def test_analyze_large_upload_rejects_bootstrap(self):
+        # Given
+        service = FertilityAnalysisApplicationService(csv_loader=CsvDataFrameLoader(), chunked_min_bytes=1)
+
+        # When / Then
+        with pytest.raises(ValueError, match="Bootstrap inference is not available"):
+            service.analyze(b"entity,period,y,x0\n", "y", ["x0"], "entity", "period", BootstrapSpecification(draws=99))
+
+    def test_analyze_dataset_with_unknown_id_raises_exception(self):
+        # Given
+        mock_dataset_repository = Mock()
+        mock_dataset_repository.get.return_value = None
+        
+        service = FertilityAnalysisApplicationService(
+            csv_loader=Mock(),
+            dataset_repository=mock_dataset_repository
+        )
+        
+        # When / Then
+        with pytest.raises(DatasetNotFoundException):
+            service.analyze_dataset(
+                dataset_id="unknown",
+                dependent_var="fertility_rate",
+                independent_vars=["work_hours"]
+            )
+
+    def test_analyze_returns_cached_result_without_loading_csv_again(self):
+        # Given
+        mock_csv_loader = Mock()
+        data = {
+            "prefecture": ["Tokyo"] * 5 + ["Osaka"] * 5 + ["Kyoto"] * 5,
+            "year": [2018, 2019, 2020, 2021, 2022] * 3,
+            "fertility_rate": [1.2, 1.25, 1.3, 1.35, 1.4, 1.5, 1.55, 1.6, 1.65, 1.7, 1.3, 1.32, 1.35, 1.38, 1.4],
+            "work_hours": [40, 39, 38, 37, 36, 42, 41.5, 41, 40.5, 40, 41, 40.5, 40, 39.5, 39]
+        }
+        mock_csv_loader.load.return_value = pd.DataFrame(data)
+        result_cache = InMemoryAnalysisResultCache(max_entries=10, ttl_seconds=60)
+        
+        service = FertilityAnalysisApplicationService(csv_loader=mock_csv_loader, result_cache=result_cache)
+        csv_bytes = b"some,csv,data"
+        
+        # When
+        first = service.analyze(csv_bytes=csv_bytes, dependent_var="fertility_rate", independent_vars=["work_hours"])
+        second = service.analyze(csv_bytes=csv_bytes, dependent_var="fertility_rate", independent_vars=["work_hours"])
+        
+        # Then
+        assert second is first
+        mock_csv_loader.load.assert_called_once_with(
+            csv_bytes,
+            DatasetSchema(variables=("fertility_rate", "work_hours"))
+        )
+        assert result_cache.hits == 1
+        assert result_cache.misses == 1
+        
+    def test_analyze_dataset_returns_cached_result_without_fetching_dataset_again(self):
+        # Given
+        mock_dataset_repository = Mock()
+        data = {
+            "prefecture": ["Tokyo"] * 5 + ["Osaka"] * 5 + ["Kyoto"] * 5,
+            "year": [2018, 2019, 2020, 2021, 2022] * 3,
+            "fertility_rate": [1.2, 1.25, 1.3, 1.35, 1.4, 1.5, 1.55, 1.6, 1.65, 1.7, 1.3, 1.32, 1.35, 1.38, 1.4],
+            "work_hours": [40, 39, 38, 37, 36, 42, 41.5, 41, 40.5, 40, 41, 40.5, 40, 39.5, 39]
+        }
+        mock_dataset_repository.get.return_value = pd.DataFrame(data)
+        result_cache = InMemoryAnalysisResultCache(max_entries=10, ttl_seconds=60)
+        
+        service = FertilityAnalysisApplicationService(
+            csv_loader=Mock(),
+            dataset_repository=mock_dataset_repository,
+            result_cache=result_cache
+        )
+        
+        # When
+        first = service.analyze_dataset(dataset_id="abc123", dependent_var="fertility_rate", independent_vars=["work_hours"])
+        second = service.analyze_dataset(dataset_id="abc123", dependent_var="fertility_rate", independent_vars=["work_hours"])
+        
+        # Then
+        assert second is first
+        mock_dataset_repository.get.assert_called_once_with("abc123")
+
+    def test_analyze_parses_file_once_for_different_specifications(self, tmp_path):
+        # Given
+        dataframe = make_synthetic_panel(nentity=10, nperiod=5, nvar=2, seed=3, balanced=True, missing=0)
+        csv_bytes = dataframe.to_csv(index=False).encode("utf-8")
+        loader = CsvDataFrameLoader()
+        service = FertilityAnalysisApplicationService(
+            csv_loader=loader,
+            parsed_cache=DiskParsedDatasetCache(tmp_path, max_bytes=1024 * 1024),
+        )
+        uncached = FertilityAnalysisApplicationService(csv_loader=CsvDataFrameLoader())
+
+        # When
+        with patch.object(loader, "load", wraps=loader.load) as load:
+            results = [
+                service.analyze(csv_bytes, "y", independent_vars, "entity", "period")
+                for independent_vars in (["x0"], ["x1"], ["x0", "x1"])
+            ]
+
+        # Then
+        load.assert_called_once_with(csv_bytes)
+        assert len(list(tmp_path.glob("v*/*"))) == 1
+        for result, independent_vars in zip(results, (["x0"], ["x1"], ["x0", "x1"])):
+            assert_results_agree(result, uncached.analyze(csv_bytes, "y", independent_vars, "entity", "period"))
+
+    def test_analyze_with_parsed_cache_reports_invalid_values_like_a_fresh_parse(self, tmp_path):
+        # Given
+        csv_bytes = make_synthetic_panel(nentity=10, nperiod=5, nvar=1, seed=3).to_csv(index=False).encode("utf-8")
+        csv_bytes += b"e0,2100,abc,1.0\n"
+        service = FertilityAnalysisApplicationService(
+            csv_loader=CsvDataFrameLoader(),
+            parsed_cache=DiskParsedDatasetCache(tmp_path, max_bytes=1024 * 1024),
+        )
+
+        # When / Then
+        for _ in range(2):
+            with pytest.raises(InvalidPanelException) as raised:
+                service.analyze(csv_bytes, "y", ["x0"], "entity", "period")
+            assert [issue.kind for issue in raised.value.issues] == ["non_numeric"]
+
+    def test_strict_request_after_lenient_one_still_raises_invalid_panel(self):
+        # Given
+        mock_dataset_repository = Mock()
+        data = {
+            "prefecture": ["Tokyo"] * 5 + ["Osaka"] * 5 + ["Kyoto"] * 5 + ["Nara"],
+            "year": [2018, 2019, 2020, 2021, 2022] * 3 + [2018],
+            "fertility_rate": [1.2, 1.25, 1.3, 1.35, 1.4, 1.5, 1.55, 1.6, 1.65, 1.7, 1.3, 1.32, 1.35, 1.38, None, 1.4],
+            "work_hours": [40, 39, 38, 37, 36, 42, 41.5, 41, 40.5, 40, 41, 40.5, 40, 39.5, 39, 38]
+        }
+        mock_dataset_repository.get.return_value = pd.DataFrame(data)
+        service = FertilityAnalysisApplicationService(
+            csv_loader=Mock(),
+            dataset_repository=mock_dataset_repository,
+            result_cache=InMemoryAnalysisResultCache(max_entries=10, ttl_seconds=60)
+        )
+        lenient = PanelValidationOptions(drop_missing=True, drop_singletons=True)
+
+        # When
+        result = service.analyze_dataset("abc123", "fertility_rate", ["work_hours"], validation=lenient)
+
+        # Then
+        assert result.nobs == 14
+        with pytest.raises(InvalidPanelException):
+            service.analyze_dataset("abc123", "fertility_rate", ["work_hours"])
+
+    def test_analyze_batch_returns_result_per_specification(self):
+        # Given
+        mock_csv_loader = Mock()
+        data = {
+            "prefecture": ["Tokyo"] * 5 + ["Osaka"] * 5 + ["Kyoto"] * 5,
+            "year": [2018, 2019, 2020, 2021, 2022] * 3,
+            "fertility_rate": [1.2, 1.25, 1.3, 1.35, 1.4, 1.5, 1.55, 1.6, 1.65, 1.7, 1.3, 1.32, 1.35, 1.38, 1.4],
+            "work_hours": [40, 39, 38, 37, 36, 42, 41.5, 41, 40.5, 40, 41, 40.5, 40, 39.5, 39],
+            "income": [500, 510, 505, 520, 530, 480, 470, 490, 485, 500, 450, 455, 470, 460, 475]
+        }
+        mock_csv_loader.load.return_value = pd.DataFrame(data)
+        
+        service = FertilityAnalysisApplicationService(csv_loader=mock_csv_loader)
+        csv_bytes = b"some,csv,data"
+        specifications = [
+            AnalysisSpecification("fertility_rate", ("work_hours",)),
+            AnalysisSpecification("fertility_rate", ("work_hours", "income")),
+        ]
+        
+        # When
+        results = service.analyze_batch(csv_bytes=csv_bytes, specifications=specifications)
+        
+        # Then
+        assert len(results) == 2
+        assert list(results[0].params) == ["work_hours"]
+        assert list(results[1].params) == ["work_hours", "income"]
+        mock_csv_loader.load.assert_called_once_with(
+            csv_bytes,
+            DatasetSchema(variables=("fertility_rate", "work_hours", "income"))
+        )
+        
+    def test_analyze_batch_with_missing_columns_raises_exception(self):
+        # Given
+        mock_csv_loader = Mock()
+        mock_csv_loader.load.return_value = pd.DataFrame({
+            "prefecture": ["Tokyo", "Osaka"],
+            "year": [2020, 2020],
+            "fertility_rate": [1.2, 1.5],
+            "work_hours": [40, 42]
+        })
+        
+        service = FertilityAnalysisApplicationService(csv_loader=mock_csv_loader)
+        specifications = [
+            AnalysisSpecification("fertility_rate", ("work_hours",)),
+            AnalysisSpecification("fertility_rate", ("income",)),
+        ]
+        
+        # When / Then
+        with pytest.raises(MissingColumnsException) as exc_info:
+            service.analyze_batch(csv_bytes=b"some,csv,data", specifications=specifications)
+        assert exc_info.value.missing_columns == ["income"]
+        
+    def test_analyze_dataset_batch_only_fits_uncached_specifications(self):
+        # Given
+        mock_dataset_repository = Mock()
+        data = {
+            "prefecture": ["Tokyo"] * 5 + ["Osaka"] * 5 + ["Kyoto"] * 5,
+            "year": [2018, 2019, 2020, 2021, 2022] * 3,
+            "fertility_rate": [1.2, 1.25, 1.3, 1.35, 1.4, 1.5, 1.55, 1.6, 1.65, 1.7, 1.3, 1.32, 1.35, 1.38, 1.4],
+            "work_hours": [40, 39, 38, 37, 36, 42, 41.5, 41, 40.5, 40, 41, 40.5, 40, 39.5, 39],
+            "income": [500, 510, 505, 520, 530, 480, 470, 490, 485, 500, 450, 455, 470, 460, 475]
+        }
+        mock_dataset_repository.get.return_value = pd.DataFrame(data)
+        result_cache = InMemoryAnalysisResultCache(max_entries=10, ttl_seconds=60)
+        mock_estimator = Mock(wraps=NumpyFixedEffectsEstimator())
+        
+        service = FertilityAnalysisApplicationService(
+            csv_loader=Mock(),
+            estimator=mock_estimator,
+            dataset_repository=mock_dataset_repository,
+            result_cache=result_cache
+        )
+        cached = service.analyze_dataset(dataset_id="abc123", dependent_var="fertility_rate", independent_vars=["work_hours"])
+        specifications = [
+            AnalysisSpecification("fertility_rate", ("work_hours",)),
+            AnalysisSpecification("fertility_rate", ("income",)),
+        ]
+        
+        # When
+        results = service.analyze_dataset_batch(dataset_id="abc123", specifications=specifications)
+        
+        # Then
+        assert results[0] is cached
+        assert list(results[1].params) == ["income"]
+        fitted_specifications = mock_estimator.fit_many.call_args.args[1]
+        assert fitted_specifications == [specifications[1]]
@@ -0,0 +1,124 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.application.exception.invalid_panel_exception import InvalidPanelException
+from app.application.panel_validation import MAX_REPORTED_ROWS, validate_panel
+from app.domain.model.panel_issue import PanelIssue
+from app.domain.model.panel_validation_options import PanelValidationOptions
+
+
+def make_dataframe() -> pd.DataFrame:
+    return pd.DataFrame({
+        "prefecture": ["Tokyo"] * 3 + ["Osaka"] * 3,
+        "year": [2020, 2021, 2022] * 2,
+        "fertility_rate": [1.2, 1.25, 1.3, 1.5, 1.55, 1.6],
+        "work_hours": [40.0, 39.0, 38.0, 42.0, 41.5, 41.0],
+    })
+
+
+def issues_of(dataframe, options=PanelValidationOptions(), **kwargs) -> list[PanelIssue]:
+    with pytest.raises(InvalidPanelException) as raised:
+        validate_panel(dataframe, ["fertility_rate", "work_hours"], "prefecture", "year", options=options, **kwargs)
+    return raised.value.issues
+
+
+class TestValidatePanel:
+    def test_valid_panel_is_returned_unchanged(self):
+        # Given
+        dataframe = make_dataframe()
+
+        # When
+        validated = validate_panel(dataframe, ["fertility_rate", "work_hours"], "prefecture", "year")
+
+        # Then
+        assert validated is dataframe
+
+    def test_reports_every_kind_of_issue_with_offending_rows(self):
+        # Given
+        dataframe = make_dataframe().astype({"work_hours": object})
+        dataframe.loc[0, "work_hours"] = "forty"
+        dataframe.loc[1, "fertility_rate"] = np.inf
+        dataframe.loc[2, "fertility_rate"] = np.nan
+        dataframe.loc[4, "year"] = 2023
+        dataframe.loc[5, "year"] = 2023
+        dataframe = pd.concat([dataframe, pd.DataFrame({
+            "prefecture": ["Kyoto"], "year": [2020], "fertility_rate": [1.3], "work_hours": [41.0]
+        })], ignore_index=True)
+
+        # When
+        issues = issues_of(dataframe)
+
+        # Then
+        assert issues == [
+            PanelIssue("non_numeric", ["work_hours"], 1, [0]),
+            PanelIssue("infinite", ["fertility_rate"], 1, [1]),
+            PanelIssue("missing", ["fertility_rate"], 1, [2]),
+            PanelIssue("duplicate_key", ["prefecture", "year"], 2, [4, 5]),
+            # Tokyo is left with one complete row, Kyoto only has one.
+            PanelIssue("singleton_entity", ["prefecture"], 2, [1, 6]),
+        ]
+
+    def test_reports_a_limited_number_of_rows_with_the_full_count(self):
+        # Given
+        dataframe = pd.concat([make_dataframe()] * 10, ignore_index=True)
+
+        # When
+        issues = issues_of(dataframe)
+
+        # Then
+        assert issues[0].kind == "duplicate_key"
+        assert issues[0].count == 60
+        assert issues[0].rows == list(range(MAX_REPORTED_ROWS))
+
+    def test_drop_missing_drops_rows_without_keys_and_keeps_missing_values(self):
+        # Given
+        dataframe = make_dataframe()
+        dataframe.loc[1, "fertility_rate"] = np.nan
+        dataframe["year"] = dataframe["year"].astype("Int64")
+        dataframe.loc[4, "year"] = pd.NA
+
+        # When
+        validated = validate_panel(
+            dataframe, ["fertility_rate", "work_hours"], "prefecture", "year",
+            options=PanelValidationOptions(drop_missing=True)
+        )
+
+        # Then
+        assert validated.index.tolist() == [0, 1, 2, 3, 5]
+        assert np.isnan(validated.loc[1, "fertility_rate"])
+
+    def test_drop_singletons_drops_entities_with_one_complete_row(self):
+        # Given
+        dataframe = make_dataframe()
+        dataframe.loc[[0, 1], "work_hours"] = np.nan
+
+        # When
+        validated = validate_panel(
+            dataframe, ["fertility_rate", "work_hours"], "prefecture", "year",
+            options=PanelValidationOptions(drop_missing=True, drop_singletons=True)
+        )
+
+        # Then
+        assert validated["prefecture"].unique().tolist() == ["Osaka"]
+
+    def test_converts_text_variables_to_numbers(self):
+        # Given
+        dataframe = make_dataframe().astype({"work_hours": str})
+
+        # When
+        validated = validate_panel(dataframe, ["fertility_rate", "work_hours"], "prefecture", "year")
+
+        # Then
+        assert validated["work_hours"].dtype == np.float64
+
+    def test_row_blocks_report_rows_from_the_offset_and_skip_key_checks(self):
+        # Given
+        dataframe = make_dataframe().head(4)
+        dataframe.loc[3, "fertility_rate"] = np.nan
+
+        # When
+        issues = issues_of(dataframe, row_offset=100, check_keys=False)
+
+        # Then
+        assert issues == [PanelIssue("missing", ["fertility_rate"], 1, [103])]
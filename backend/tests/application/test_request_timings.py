@@ -0,0 +1,54 @@
+from concurrent.futures import ThreadPoolExecutor
+import contextvars
+
+from app.application import request_timings
+
+
+class TestRequestTimings:
+    def test_stage_records_into_current_request(self):
+        # Given
+        timings, token = request_timings.begin()
+
+        # When
+        try:
+            with request_timings.stage("fit"):
+                pass
+            with request_timings.stage("fit"):
+                pass
+            request_timings.record_shape(10, 3)
+            request_timings.record_error(ValueError)
+        finally:
+            request_timings.end(token)
+
+        # Then
+        assert list(timings.stages) == ["fit"]
+        assert timings.stages["fit"] >= 0.0
+        assert (timings.rows, timings.columns) == (10, 3)
+        assert timings.error == "ValueError"
+        assert request_timings.current() is None
+
+    def test_stage_outside_a_request_is_a_no_op(self):
+        # When
+        with request_timings.stage("fit"):
+            request_timings.record_shape(1, 1)
+
+        # Then
+        assert request_timings.current() is None
+
+    def test_stages_in_worker_threads_reach_the_request_context(self):
+        # Given
+        timings, token = request_timings.begin()
+
+        def work():
+            with request_timings.stage("bootstrap"):
+                pass
+
+        # When
+        try:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                executor.submit(contextvars.copy_context().run, work).result()
+        finally:
+            request_timings.end(token)
+
+        # Then
+        assert "bootstrap" in timings.stages
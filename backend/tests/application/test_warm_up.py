@@ -0,0 +1,13 @@
+from app.application.warm_up import warm_up
+from app.domain.service.numpy_fixed_effects_estimator import NumpyFixedEffectsEstimator
+from app.infrastructure.csv_dataframe_loader import CsvDataFrameLoader
+
+
+class TestWarmUp:
+    def test_fits_the_bundled_panel(self):
+        # When
+        result = warm_up(CsvDataFrameLoader(), NumpyFixedEffectsEstimator())
+
+        # Then
+        assert result.nobs == 24
+        assert list(result.params) == ["unmarried", "employment_rate"]
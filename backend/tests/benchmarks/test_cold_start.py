@@ -0,0 +1,14 @@
+from benchmarks.cold_start import measure_in_subprocess
+
+
+class TestColdStart:
+    def test_measures_start_up_in_a_fresh_interpreter_without_heavy_imports(self):
+        # When
+        measurement = measure_in_subprocess()
+
+        # Then
+        stages = measurement["stages"]
+        assert list(stages) == ["import", "startup", "first_response", "time_to_first_response"]
+        assert all(seconds > 0 for seconds in stages.values())
+        assert stages["time_to_first_response"] >= stages["import"]
+        assert measurement["loaded_at_import"] == []
@@ -0,0 +1,60 @@
+from benchmarks.__main__ import main
+from benchmarks.runner import compare, run, save
+from benchmarks.synthetic_panel import Scenario
+
+
+def make_results(**medians: float) -> dict:
+    return {
+        "scenarios": {
+            "prefectures": {
+                "stages": {stage: {"median": median} for stage, median in medians.items()}
+            }
+        }
+    }
+
+
+class TestRun:
+    def test_times_every_pipeline_stage(self):
+        # When
+        results = run([Scenario("tiny", nentity=6, nperiod=4, nvar=2)], repeat=1)
+
+        # Then
+        stages = results["scenarios"]["tiny"]["stages"]
+        assert list(stages) == ["csv_load", "normalize", "fit_numpy", "fit_linearmodels", "serialize", "round_trip"]
+        assert all(len(timing["timings"]) == 1 for timing in stages.values())
+        assert results["scenarios"]["tiny"]["rows"] == 24
+
+
+class TestCompare:
+    def test_flags_stages_slower_than_threshold(self):
+        # Given
+        baseline = make_results(csv_load=0.100, fit_numpy=0.050)
+        current = make_results(csv_load=0.140, fit_numpy=0.055)
+
+        # When
+        rows = compare(current, baseline, threshold=0.25, min_seconds=0.001)
+
+        # Then
+        assert {row["stage"]: row["regressed"] for row in rows} == {"csv_load": True, "fit_numpy": False}
+
+    def test_ignores_small_absolute_differences(self):
+        # Given
+        baseline = make_results(serialize=0.00001)
+        current = make_results(serialize=0.00003)
+
+        # When
+        rows = compare(current, baseline, threshold=0.25, min_seconds=0.001)
+
+        # Then
+        assert rows[0]["regressed"] is False
+
+    def test_cli_exits_non_zero_on_regression(self, tmp_path):
+        # Given
+        save(make_results(csv_load=0.100), tmp_path / "baseline.json")
+        save(make_results(csv_load=0.200), tmp_path / "current.json")
+
+        # When
+        exit_code = main(["compare", str(tmp_path / "current.json"), str(tmp_path / "baseline.json")])
+
+        # Then
+        assert exit_code == 1
@@ -0,0 +1,29 @@
+import pandas as pd
+
+from benchmarks.synthetic_panel import SCENARIOS, make_panel
+
+
+class TestMakePanel:
+    def test_is_deterministic_for_a_seed(self):
+        # When
+        first = make_panel(nentity=5, nperiod=4, nvar=2, seed=3)
+        second = make_panel(nentity=5, nperiod=4, nvar=2, seed=3)
+
+        # Then
+        pd.testing.assert_frame_equal(first, second)
+
+    def test_builds_balanced_panel_with_api_column_names(self):
+        # When
+        dataframe = make_panel(nentity=5, nperiod=4, nvar=2)
+
+        # Then
+        assert list(dataframe.columns) == ["prefecture", "year", "x0", "x1", "TFR"]
+        assert len(dataframe) == 20
+        assert dataframe.groupby("prefecture")["year"].nunique().eq(4).all()
+
+    def test_scenarios_scale_entities_from_prefectures_upwards(self):
+        # When
+        entities = [scenario.nentity for scenario in SCENARIOS.values()]
+
+        # Then
+        assert entities == [47, 1_700, 20_000]
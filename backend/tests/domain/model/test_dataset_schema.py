@@ -0,0 +1,49 @@
+from app.domain.model.absorption_specification import AbsorptionSpecification
+from app.domain.model.analysis_specification import AnalysisSpecification
+from app.domain.model.dataset_schema import DatasetSchema
+
+
+class TestDatasetSchema:
+    def test_from_specifications_collects_columns_once(self):
+        # Given
+        specifications = [
+            AnalysisSpecification("fertility_rate", ("work_hours",)),
+            AnalysisSpecification("fertility_rate", ("work_hours", "income")),
+        ]
+
+        # When
+        schema = DatasetSchema.from_specifications(specifications)
+
+        # Then
+        assert schema.variables == ("fertility_rate", "work_hours", "income")
+        assert schema.entity_vars == ("prefecture",)
+        assert schema.time_vars == ("year",)
+
+    def test_dtypes_map_variables_entity_and_time(self):
+        # Given
+        schema = DatasetSchema(variables=("fertility_rate",))
+
+        # When
+        dtypes = schema.dtypes
+
+        # Then
+        assert dtypes == {"fertility_rate": "float64", "year": "int64", "prefecture": "category"}
+        assert schema.columns == ["fertility_rate", "year", "prefecture"]
+
+    def test_absorbed_effect_columns_are_read_as_categories(self):
+        # Given
+        specifications = [
+            AnalysisSpecification(
+                "fertility_rate",
+                ("work_hours",),
+                absorption=AbsorptionSpecification(effects=(("year",), ("region", "year"))),
+            ),
+        ]
+
+        # When
+        schema = DatasetSchema.from_specifications(specifications)
+
+        # Then
+        assert schema.effect_vars == ("year", "region")
+        assert schema.dtypes["region"] == "category"
+        assert schema.dtypes["year"] == "int64"
@@ -0,0 +1,80 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.domain.model.panel import Panel
+
+
+def make_dataframe():
+    return pd.DataFrame({
+        "prefecture": pd.Categorical(["東京都", "大阪府", "東京都", "大阪府", None]),
+        "year": [2021, 2020, 2020, 2021, 2022],
+        "region": ["関東", "近畿", "関東", "近畿", "関東"],
+        "fertility_rate": [1.1, 1.3, 1.2, np.nan, 1.4],
+        "work_hours": [40.0, 41.0, 39.0, 38.0, 37.0],
+    })
+
+
+class TestPanel:
+    def test_from_dataframe_codes_keys_and_packs_variables_column_major(self):
+        # Given
+        dataframe = make_dataframe()
+
+        # When
+        panel = Panel.from_dataframe(dataframe, "prefecture", "year", ["fertility_rate", "work_hours"], ["region"])
+
+        # Then
+        assert panel.keys == ("prefecture", "year", "region")
+        assert panel.codes.dtype == np.int32
+        assert panel.key_labels("prefecture")[panel.key_codes("prefecture")[:4]].tolist() == ["東京都", "大阪府", "東京都", "大阪府"]
+        assert panel.key_codes("prefecture")[4] == -1
+        # Periods are coded in time order.
+        assert panel.key_labels("year").tolist() == [2020, 2021, 2022]
+        assert panel.key_codes("year").tolist() == [1, 0, 0, 1, 2]
+        assert panel.values.flags.f_contiguous
+        np.testing.assert_array_equal(panel.variable("work_hours"), dataframe["work_hours"])
+        assert np.isnan(panel.variable("fertility_rate")[3])
+        assert panel.missing_keys(["prefecture"]).tolist() == [False, False, False, False, True]
+
+    def test_from_dataframe_can_store_variables_as_float32(self):
+        # Given
+        dataframe = make_dataframe()
+
+        # When
+        panel = Panel.from_dataframe(dataframe, "prefecture", "year", ["work_hours"], dtype=np.float32)
+
+        # Then
+        assert panel.values.dtype == np.float32
+        assert panel.matrix(["work_hours"]).dtype == np.float64
+
+    def test_take_keeps_label_tables_and_to_dataframe_decodes_keys(self):
+        # Given
+        panel = Panel.from_dataframe(make_dataframe(), "prefecture", "year", ["fertility_rate", "work_hours"])
+
+        # When
+        taken = panel.take(np.array([1, 2]))
+        dataframe = taken.to_dataframe()
+
+        # Then
+        assert taken.labels is panel.labels
+        assert dataframe["prefecture"].astype(object).tolist() == ["大阪府", "東京都"]
+        assert dataframe["year"].tolist() == [2020, 2020]
+        assert dataframe["work_hours"].tolist() == [41.0, 39.0]
+
+    def test_of_returns_panels_unchanged(self):
+        # Given
+        panel = Panel.from_dataframe(make_dataframe(), "prefecture", "year", ["work_hours"])
+
+        # When / Then
+        assert Panel.of(panel, "prefecture", "year", ["work_hours"]) is panel
+
+    def test_unknown_columns_raise_key_error(self):
+        # Given
+        panel = Panel.from_dataframe(make_dataframe(), "prefecture", None, ["work_hours"])
+
+        # When / Then
+        assert panel.keys == ("prefecture",)
+        with pytest.raises(KeyError):
+            panel.variable("income")
+        with pytest.raises(KeyError):
+            panel.key_codes("year")
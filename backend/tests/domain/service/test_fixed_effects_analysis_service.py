@@ -1,5 +1,6 @@
 import pytest
 import pandas as pd
+from unittest.mock import Mock
 
 from app.domain.service.fixed_effects_analysis_service import FixedEffectsAnalysisService
 from app.domain.model.fixed_effects_result import FixedEffectsResult
@@ -21,7 +22,7 @@ class TestFixedEffectsAnalysisService:
             "year": [2020, 2021, 2022, 2020, 2021, 2022],
             "fertility_rate": [1.2, 1.3, 1.4, 1.5, 1.6, 1.7],
             "work_hours": [40, 38, 36, 42, 40, 38],
-            "income": [500, 520, 540, 480, 500, 520]
+            "income": [500, 520, 545, 480, 500, 515]
         }
         dataframe = pd.DataFrame(data)
         
@@ -62,3 +63,22 @@ class TestFixedEffectsAnalysisService:
         assert len(result.params) == 1
         assert "work_hours" in result.params
         assert isinstance(result.dropped_vars, list)
+
+    def test_analyze_delegates_to_injected_estimator(self):
+        # Given
+        mock_estimator = Mock()
+        service = FixedEffectsAnalysisService(
+            dependent_var="fertility_rate",
+            independent_vars=["work_hours"],
+            entity_var="prefecture",
+            time_var="year",
+            estimator=mock_estimator
+        )
+        dataframe = pd.DataFrame({"prefecture": ["Tokyo"], "year": [2020], "fertility_rate": [1.2], "work_hours": [40]})
+
+        # When
+        result = service.analyze(dataframe)
+
+        # Then
+        assert result == mock_estimator.fit.return_value
+        mock_estimator.fit.assert_called_once_with(dataframe, "fertility_rate", ["work_hours"], "prefecture", "year", None)
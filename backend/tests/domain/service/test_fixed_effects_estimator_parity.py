@@ -0,0 +1,158 @@
+from pathlib import Path
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.domain.model.absorption_specification import AbsorptionSpecification
+from app.domain.model.fixed_effects_result import FixedEffectsResult
+from app.domain.service.linearmodels_fixed_effects_estimator import LinearmodelsFixedEffectsEstimator
+from app.domain.service.numpy_fixed_effects_estimator import NumpyFixedEffectsEstimator
+
+SAMPLE_PANEL_DATA = Path(__file__).resolve().parents[3] / "sample_panel_data.csv"
+TOLERANCE = 1e-10
+
+
+def make_synthetic_panel(
+    nentity: int,
+    nperiod: int,
+    nvar: int,
+    seed: int,
+    balanced: bool = True,
+    missing: int = 0,
+) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    entity = np.repeat(np.arange(nentity), nperiod)
+    period = np.tile(np.arange(2000, 2000 + nperiod), nentity)
+    dataframe = pd.DataFrame({"entity": [f"e{i}" for i in entity], "period": period})
+
+    effects = rng.normal(scale=2.0, size=nentity)
+    y = effects[entity] + rng.normal(size=entity.size)
+    for j in range(nvar):
+        x = rng.normal(size=entity.size) + rng.normal(size=nentity)[entity]
+        dataframe[f"x{j}"] = x
+        y += (j + 1) * 0.1 * x
+    dataframe["y"] = y
+
+    if not balanced:
+        dataframe = dataframe.sample(frac=0.8, random_state=seed).reset_index(drop=True)
+    if missing:
+        rows = rng.choice(len(dataframe), size=missing, replace=False)
+        dataframe.loc[rows, "x0"] = np.nan
+    return dataframe
+
+
+def assert_results_agree(actual: FixedEffectsResult, expected: FixedEffectsResult):
+    assert actual.nobs == expected.nobs
+    assert actual.dropped_vars == expected.dropped_vars
+    for field in ["params", "std_errors", "tstats", "pvalues"]:
+        actual_values = getattr(actual, field)
+        expected_values = getattr(expected, field)
+        assert list(actual_values) == list(expected_values)
+        for name, value in expected_values.items():
+            assert actual_values[name] == pytest.approx(value, rel=TOLERANCE, abs=TOLERANCE)
+    for field in ["rsquared_within", "rsquared_between", "rsquared_overall"]:
+        assert getattr(actual, field) == pytest.approx(getattr(expected, field), rel=TOLERANCE, abs=TOLERANCE)
+
+
+def fit_both(
+    dataframe: pd.DataFrame,
+    dependent_var: str,
+    independent_vars: list[str],
+    entity_var: str,
+    time_var: str,
+    absorption: AbsorptionSpecification | None = None,
+):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        expected = LinearmodelsFixedEffectsEstimator().fit(
+            dataframe, dependent_var, independent_vars, entity_var, time_var, absorption
+        )
+    actual = NumpyFixedEffectsEstimator().fit(
+        dataframe, dependent_var, independent_vars, entity_var, time_var, absorption
+    )
+    return actual, expected
+
+
+class TestFixedEffectsEstimatorParity:
+    @pytest.mark.parametrize("independent_vars", [
+        ["unmarried"],
+        ["employment_rate"],
+        ["unmarried", "employment_rate"],
+    ])
+    def test_sample_panel_data(self, independent_vars):
+        # Given
+        dataframe = pd.read_csv(SAMPLE_PANEL_DATA)
+
+        # When
+        actual, expected = fit_both(dataframe, "TFR", independent_vars, "prefecture", "year")
+
+        # Then
+        assert_results_agree(actual, expected)
+
+    @pytest.mark.parametrize("nentity,nperiod,nvar,seed", [
+        (47, 4, 1, 0),
+        (47, 20, 3, 1),
+        (300, 5, 8, 2),
+        (5, 50, 2, 3),
+    ])
+    def test_balanced_synthetic_panels(self, nentity, nperiod, nvar, seed):
+        # Given
+        dataframe = make_synthetic_panel(nentity, nperiod, nvar, seed)
+        independent_vars = [f"x{j}" for j in range(nvar)]
+
+        # When
+        actual, expected = fit_both(dataframe, "y", independent_vars, "entity", "period")
+
+        # Then
+        assert_results_agree(actual, expected)
+
+    def test_unbalanced_synthetic_panel_with_missing_values(self):
+        # Given
+        dataframe = make_synthetic_panel(60, 8, 3, seed=4, balanced=False, missing=25)
+
+        # When
+        actual, expected = fit_both(dataframe, "y", ["x0", "x1", "x2"], "entity", "period")
+
+        # Then
+        assert_results_agree(actual, expected)
+
+    def test_rows_without_an_entity_are_left_out_like_missing_values(self):
+        # Given
+        dataframe = make_synthetic_panel(40, 6, 2, seed=14, balanced=False)
+        dataframe.loc[[3, 17, 50], "entity"] = None
+        labelled = dataframe.dropna(subset=["entity"]).reset_index(drop=True)
+
+        # When
+        actual = NumpyFixedEffectsEstimator().fit(dataframe, "y", ["x0", "x1"], "entity", "period")
+        _, expected = fit_both(labelled, "y", ["x0", "x1"], "entity", "period")
+
+        # Then
+        assert actual.nobs == len(dataframe) - 3
+        assert_results_agree(actual, expected)
+
+    def test_absorbed_variable_is_dropped_by_both_backends(self):
+        # Given
+        dataframe = make_synthetic_panel(30, 6, 2, seed=5)
+        dataframe["time_invariant"] = dataframe["entity"].str[1:].astype(float) * 0.5
+
+        # When
+        actual, expected = fit_both(dataframe, "y", ["x0", "time_invariant", "x1"], "entity", "period")
+
+        # Then
+        assert actual.dropped_vars == ["time_invariant"]
+        assert_results_agree(actual, expected)
+
+    @pytest.mark.parametrize("balanced", [True, False])
+    def test_time_effects_match_two_way_panel_ols(self, balanced):
+        # Given
+        dataframe = make_synthetic_panel(40, 8, 3, seed=6, balanced=balanced, missing=10)
+        dataframe["y"] += np.sin(dataframe["period"])
+        absorption = AbsorptionSpecification(effects=(("period",),), tolerance=1e-12)
+
+        # When
+        actual, expected = fit_both(dataframe, "y", ["x0", "x1", "x2"], "entity", "period", absorption)
+
+        # Then
+        assert_results_agree(actual, expected)
@@ -0,0 +1,72 @@
+import pandas as pd
+import pytest
+
+from app.domain.service.linearmodels_fixed_effects_estimator import LinearmodelsFixedEffectsEstimator
+from app.domain.model.absorption_specification import AbsorptionSpecification
+from app.domain.model.analysis_specification import AnalysisSpecification
+from app.domain.model.fixed_effects_result import FixedEffectsResult
+
+
+def make_dataframe() -> pd.DataFrame:
+    return pd.DataFrame({
+        "prefecture": ["Tokyo"] * 5 + ["Osaka"] * 5 + ["Kyoto"] * 5,
+        "year": [2018, 2019, 2020, 2021, 2022] * 3,
+        "fertility_rate": [1.2, 1.25, 1.3, 1.35, 1.4, 1.5, 1.55, 1.6, 1.65, 1.7, 1.3, 1.32, 1.35, 1.38, 1.4],
+        "work_hours": [40, 39, 38, 37, 36, 42, 41.5, 41, 40.5, 40, 41, 40.5, 40, 39.5, 39]
+    })
+
+
+class TestLinearmodelsFixedEffectsEstimator:
+    def test_fit_returns_fixed_effects_result(self):
+        # Given
+        estimator = LinearmodelsFixedEffectsEstimator()
+
+        # When
+        result = estimator.fit(make_dataframe(), "fertility_rate", ["work_hours"], "prefecture", "year")
+
+        # Then
+        assert isinstance(result, FixedEffectsResult)
+        assert result.nobs == 15
+        assert "work_hours" in result.params
+        assert result.dropped_vars == []
+
+    def test_fit_many_fits_each_specification(self):
+        # Given
+        estimator = LinearmodelsFixedEffectsEstimator()
+        specifications = [
+            AnalysisSpecification("fertility_rate", ("work_hours",)),
+            AnalysisSpecification("work_hours", ("fertility_rate",)),
+        ]
+
+        # When
+        results = estimator.fit_many(make_dataframe(), specifications)
+
+        # Then
+        assert len(results) == 2
+        assert list(results[0].params) == ["work_hours"]
+        assert list(results[1].params) == ["fertility_rate"]
+
+    def test_fit_accepts_categorical_entity_with_unobserved_categories(self):
+        # Given
+        estimator = LinearmodelsFixedEffectsEstimator()
+        dataframe = make_dataframe()
+        expected = estimator.fit(dataframe, "fertility_rate", ["work_hours"], "prefecture", "year")
+        dataframe["prefecture"] = pd.Categorical(dataframe["prefecture"], categories=["Tokyo", "Osaka", "Kyoto", "Nara"])
+
+        # When
+        result = estimator.fit(dataframe, "fertility_rate", ["work_hours"], "prefecture", "year")
+
+        # Then
+        assert result.nobs == expected.nobs
+        assert result.params == expected.params
+
+    def test_fit_rejects_more_than_two_effects(self):
+        # Given
+        estimator = LinearmodelsFixedEffectsEstimator()
+        dataframe = make_dataframe()
+        dataframe["region"] = [1] * 5 + [2] * 10
+        absorption = AbsorptionSpecification(effects=(("year",), ("region", "year")))
+
+        # When / Then
+        with pytest.raises(ValueError, match="at most one effect"):
+            estimator.fit(dataframe, "fertility_rate", ["work_hours"], "prefecture", "year", absorption)
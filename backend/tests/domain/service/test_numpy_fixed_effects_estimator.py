@@ -0,0 +1,235 @@
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.domain.service.numpy_fixed_effects_estimator import NumpyFixedEffectsEstimator
+from app.domain.model.absorption_specification import AbsorptionSpecification
+from app.domain.model.analysis_specification import AnalysisSpecification
+from app.domain.model.fixed_effects_result import FixedEffectsResult
+from app.domain.model.panel import Panel
+
+
+def make_dataframe() -> pd.DataFrame:
+    return pd.DataFrame({
+        "prefecture": ["Tokyo"] * 5 + ["Osaka"] * 5 + ["Kyoto"] * 5,
+        "year": [2018, 2019, 2020, 2021, 2022] * 3,
+        "fertility_rate": [1.2, 1.25, 1.3, 1.35, 1.4, 1.5, 1.55, 1.6, 1.65, 1.7, 1.3, 1.32, 1.35, 1.38, 1.4],
+        "work_hours": [40, 39, 38, 37, 36, 42, 41.5, 41, 40.5, 40, 41, 40.5, 40, 39.5, 39],
+        "income": [500, 510, 505, 520, 530, 480, 470, 490, 485, 500, 450, 455, 470, 460, 475],
+        "region": [1] * 5 + [2] * 5 + [2] * 5,
+    })
+
+
+class TestNumpyFixedEffectsEstimator:
+    def test_fit_returns_fixed_effects_result(self):
+        # Given
+        estimator = NumpyFixedEffectsEstimator()
+
+        # When
+        result = estimator.fit(make_dataframe(), "fertility_rate", ["work_hours", "income"], "prefecture", "year")
+
+        # Then
+        assert isinstance(result, FixedEffectsResult)
+        assert result.nobs == 15
+        assert list(result.params) == ["work_hours", "income"]
+        assert list(result.std_errors) == ["work_hours", "income"]
+        assert isinstance(result.rsquared_within, float)
+        assert result.dropped_vars == []
+
+    def test_fit_drops_variables_absorbed_by_entity_effects(self):
+        # Given
+        estimator = NumpyFixedEffectsEstimator()
+
+        # When
+        result = estimator.fit(make_dataframe(), "fertility_rate", ["region", "work_hours"], "prefecture", "year")
+
+        # Then
+        assert list(result.params) == ["work_hours"]
+        assert result.dropped_vars == ["region"]
+
+    def test_fit_drops_variables_collinear_after_demeaning(self):
+        # Given
+        estimator = NumpyFixedEffectsEstimator()
+        dataframe = make_dataframe()
+        dataframe["scaled_hours"] = dataframe["work_hours"] * 2 + dataframe["region"]
+
+        # When
+        result = estimator.fit(dataframe, "fertility_rate", ["work_hours", "scaled_hours"], "prefecture", "year")
+
+        # Then
+        assert len(result.params) == 1
+        assert len(result.dropped_vars) == 1
+
+    def test_fit_excludes_rows_with_missing_values(self):
+        # Given
+        estimator = NumpyFixedEffectsEstimator()
+        dataframe = make_dataframe()
+        dataframe.loc[[0, 7], "income"] = np.nan
+
+        # When
+        result = estimator.fit(dataframe, "fertility_rate", ["work_hours", "income"], "prefecture", "year")
+
+        # Then
+        assert result.nobs == 13
+
+    def test_fit_raises_value_error_when_all_variables_are_absorbed(self):
+        # Given
+        estimator = NumpyFixedEffectsEstimator()
+
+        # When / Then
+        with pytest.raises(ValueError, match="fully absorbed"):
+            estimator.fit(make_dataframe(), "fertility_rate", ["region"], "prefecture", "year")
+
+    def test_fit_returns_nan_standard_errors_without_residual_degrees_of_freedom(self):
+        # Given
+        estimator = NumpyFixedEffectsEstimator()
+        dataframe = make_dataframe().groupby("prefecture").head(2).head(4)
+
+        # When
+        result = estimator.fit(dataframe, "fertility_rate", ["work_hours", "income"], "prefecture", "year")
+
+        # Then
+        assert result.nobs == 4
+        assert math.isnan(result.std_errors["work_hours"])
+
+    def test_fit_many_matches_individual_fits(self):
+        # Given
+        estimator = NumpyFixedEffectsEstimator()
+        dataframe = make_dataframe()
+        specifications = [
+            AnalysisSpecification("fertility_rate", ("work_hours",)),
+            AnalysisSpecification("fertility_rate", ("work_hours", "income")),
+            AnalysisSpecification("fertility_rate", ("income", "region")),
+            AnalysisSpecification("income", ("work_hours",)),
+        ]
+
+        # When
+        results = estimator.fit_many(dataframe, specifications)
+
+        # Then
+        assert len(results) == len(specifications)
+        for specification, result in zip(specifications, results):
+            expected = estimator.fit(
+                dataframe, specification.dependent_var, list(specification.independent_vars), "prefecture", "year"
+            )
+            assert result.nobs == expected.nobs
+            assert result.dropped_vars == expected.dropped_vars
+            assert result.params == pytest.approx(expected.params, rel=1e-12)
+            assert result.std_errors == pytest.approx(expected.std_errors, rel=1e-12)
+            assert result.rsquared_between == pytest.approx(expected.rsquared_between, rel=1e-12)
+
+    def test_fit_many_uses_each_specifications_own_sample_when_values_are_missing(self):
+        # Given
+        estimator = NumpyFixedEffectsEstimator()
+        dataframe = make_dataframe()
+        dataframe.loc[[0, 7], "income"] = np.nan
+        specifications = [
+            AnalysisSpecification("fertility_rate", ("work_hours",)),
+            AnalysisSpecification("fertility_rate", ("work_hours", "income")),
+        ]
+
+        # When
+        results = estimator.fit_many(dataframe, specifications)
+
+        # Then
+        assert results[0].nobs == 15
+        assert results[1].nobs == 13
+        expected = estimator.fit(dataframe, "fertility_rate", ["work_hours"], "prefecture", "year")
+        assert results[0].params == pytest.approx(expected.params, rel=1e-12)
+
+    def test_fit_accepts_categorical_entity_with_unobserved_categories(self):
+        # Given
+        estimator = NumpyFixedEffectsEstimator()
+        dataframe = make_dataframe()
+        expected = estimator.fit(dataframe, "fertility_rate", ["work_hours"], "prefecture", "year")
+        dataframe["prefecture"] = pd.Categorical(dataframe["prefecture"], categories=["Tokyo", "Osaka", "Kyoto", "Nara"])
+
+        # When
+        result = estimator.fit(dataframe, "fertility_rate", ["work_hours"], "prefecture", "year")
+
+        # Then
+        assert result.params == pytest.approx(expected.params, rel=1e-12)
+        assert result.std_errors == pytest.approx(expected.std_errors, rel=1e-12)
+
+    def test_fit_absorbs_additional_effects_and_reports_iterations(self):
+        # Given
+        estimator = NumpyFixedEffectsEstimator()
+        absorption = AbsorptionSpecification(effects=(("year",), ("region", "year")))
+
+        # When
+        result = estimator.fit(make_dataframe(), "fertility_rate", ["income"], "prefecture", "year", absorption)
+
+        # Then
+        assert list(result.params) == ["income"]
+        assert set(result.absorption_iterations) == {"fertility_rate", "income"}
+        assert all(count >= 1 for count in result.absorption_iterations.values())
+
+    def test_fit_drops_variables_absorbed_by_time_effects(self):
+        # Given
+        estimator = NumpyFixedEffectsEstimator()
+        dataframe = make_dataframe()
+        dataframe["trend"] = dataframe["year"] - 2018.0
+        absorption = AbsorptionSpecification(effects=(("year",),))
+
+        # When
+        result = estimator.fit(dataframe, "fertility_rate", ["trend", "income"], "prefecture", "year", absorption)
+
+        # Then
+        assert result.dropped_vars == ["trend"]
+
+    def test_fit_many_shares_absorption_across_specifications(self):
+        # Given
+        estimator = NumpyFixedEffectsEstimator()
+        dataframe = make_dataframe()
+        absorption = AbsorptionSpecification(effects=(("year",),))
+        specifications = [
+            AnalysisSpecification("fertility_rate", ("work_hours",), absorption=absorption),
+            AnalysisSpecification("fertility_rate", ("work_hours", "income"), absorption=absorption),
+            AnalysisSpecification("fertility_rate", ("work_hours",)),
+        ]
+
+        # When
+        results = estimator.fit_many(dataframe, specifications)
+
+        # Then
+        for specification, result in zip(specifications, results):
+            expected = estimator.fit(
+                dataframe,
+                specification.dependent_var,
+                list(specification.independent_vars),
+                "prefecture",
+                "year",
+                specification.absorption,
+            )
+            assert result.params == pytest.approx(expected.params, rel=1e-12)
+            assert result.std_errors == pytest.approx(expected.std_errors, rel=1e-12)
+            assert result.absorption_iterations == expected.absorption_iterations
+        assert results[2].absorption_iterations is None
+
+    def test_fit_many_on_a_panel_matches_the_data_frame_it_was_built_from(self):
+        # Given
+        estimator = NumpyFixedEffectsEstimator()
+        dataframe = make_dataframe()
+        absorption = AbsorptionSpecification(effects=(("region", "year"),))
+        specifications = [
+            AnalysisSpecification("fertility_rate", ("work_hours", "income"), absorption=absorption),
+            AnalysisSpecification("fertility_rate", ("income",)),
+        ]
+        panel = Panel.from_dataframe(
+            dataframe, "prefecture", "year", ["fertility_rate", "work_hours", "income"], absorption.columns
+        )
+
+        # When
+        results = estimator.fit_many(panel, specifications)
+
+        # Then
+        assert results == estimator.fit_many(dataframe, specifications)
+
+    def test_absorption_specification_requires_columns_and_positive_tolerance(self):
+        # When / Then
+        with pytest.raises(ValueError, match="at least one column"):
+            AbsorptionSpecification(effects=((),))
+        with pytest.raises(ValueError, match="tolerance must be positive"):
+            AbsorptionSpecification(effects=(("year",),), tolerance=0.0)
@@ -0,0 +1,119 @@
+import numpy as np
+import pytest
+
+from app.domain.model.panel import Panel
+from app.domain.service.panel_sufficient_statistics import PanelSufficientStatistics
+from tests.domain.service.test_fixed_effects_estimator_parity import make_synthetic_panel
+
+COLUMNS = ("y", "x0", "x1")
+
+
+class TestPanelSufficientStatistics:
+    def test_from_dataframe_counts_complete_rows_per_entity(self):
+        # Given
+        dataframe = make_synthetic_panel(nentity=5, nperiod=4, nvar=2, seed=1, missing=3)
+
+        # When
+        statistics = PanelSufficientStatistics.from_dataframe(dataframe, "entity", COLUMNS)
+
+        # Then
+        assert statistics.nobs == 17
+        assert statistics.means.shape == (5, 3)
+        assert statistics.within_cross_products.shape == (3, 3)
+
+    def test_from_panel_matches_statistics_of_the_data_frame(self):
+        # Given
+        dataframe = make_synthetic_panel(nentity=8, nperiod=5, nvar=2, seed=1, balanced=False, missing=4)
+        expected = PanelSufficientStatistics.from_dataframe(dataframe, "entity", COLUMNS)
+
+        # When
+        statistics = PanelSufficientStatistics.from_panel(
+            Panel.from_dataframe(dataframe, "entity", "period", COLUMNS), COLUMNS
+        )
+
+        # Then
+        assert statistics.entities.tolist() == expected.entities.tolist()
+        np.testing.assert_array_equal(statistics.counts, expected.counts)
+        np.testing.assert_array_equal(statistics.means, expected.means)
+        np.testing.assert_array_equal(statistics.within_cross_products, expected.within_cross_products)
+
+    def test_merge_of_time_slices_matches_statistics_of_the_whole_panel(self):
+        # Given
+        dataframe = make_synthetic_panel(nentity=20, nperiod=8, nvar=2, seed=2, balanced=False, missing=5)
+        # The late slice introduces an entity that is absent from the early one.
+        dataframe = dataframe[~((dataframe["entity"] == "e0") & (dataframe["period"] < 2005))]
+        early = dataframe[dataframe["period"] < 2005]
+        late = dataframe[dataframe["period"] >= 2005]
+        expected = PanelSufficientStatistics.from_dataframe(dataframe, "entity", COLUMNS)
+
+        # When
+        merged = PanelSufficientStatistics.from_dataframe(early, "entity", COLUMNS).merge(
+            PanelSufficientStatistics.from_dataframe(late, "entity", COLUMNS)
+        )
+
+        # Then
+        order = [list(merged.entities).index(entity) for entity in expected.entities]
+        assert sorted(merged.entities) == sorted(expected.entities)
+        np.testing.assert_array_equal(merged.counts[order], expected.counts)
+        np.testing.assert_allclose(merged.means[order], expected.means, rtol=1e-12)
+        np.testing.assert_allclose(merged.within_cross_products, expected.within_cross_products, rtol=1e-12)
+
+    def test_merge_rejects_statistics_over_different_columns(self):
+        # Given
+        dataframe = make_synthetic_panel(nentity=3, nperiod=3, nvar=2, seed=3)
+        statistics = PanelSufficientStatistics.from_dataframe(dataframe, "entity", COLUMNS)
+        other = PanelSufficientStatistics.from_dataframe(dataframe, "entity", ("y", "x0"))
+
+        # When / Then
+        with pytest.raises(ValueError, match="same entity and columns"):
+            statistics.merge(other)
+
+    def test_accumulate_over_row_blocks_matches_whole_panel(self):
+        # Given
+        dataframe = make_synthetic_panel(nentity=15, nperiod=6, nvar=2, seed=6, balanced=False, missing=4)
+        chunks = [dataframe.iloc[start:start + 7] for start in range(0, len(dataframe), 7)]
+        expected = PanelSufficientStatistics.from_dataframe(dataframe, "entity", COLUMNS)
+
+        # When
+        statistics = PanelSufficientStatistics.accumulate(chunks, "entity", COLUMNS)
+
+        # Then
+        assert statistics.nobs == expected.nobs
+        np.testing.assert_allclose(statistics.within_cross_products, expected.within_cross_products, rtol=1e-12)
+
+    def test_accumulate_without_chunks_raises_value_error(self):
+        # Given / When / Then
+        with pytest.raises(ValueError, match="No complete observations"):
+            PanelSufficientStatistics.accumulate([], "entity", COLUMNS)
+
+    def test_subtract_of_a_time_slice_matches_statistics_of_the_remaining_rows(self):
+        # Given
+        dataframe = make_synthetic_panel(nentity=20, nperiod=8, nvar=2, seed=7, balanced=False, missing=5)
+        # Only the early slice has rows for e0, which must then disappear.
+        dataframe = dataframe[~((dataframe["entity"] == "e0") & (dataframe["period"] >= 2003))]
+        early = dataframe[dataframe["period"] < 2003]
+        late = dataframe[dataframe["period"] >= 2003]
+        expected = PanelSufficientStatistics.from_dataframe(late, "entity", COLUMNS)
+
+        # When
+        remaining = PanelSufficientStatistics.from_dataframe(dataframe, "entity", COLUMNS).subtract(
+            PanelSufficientStatistics.from_dataframe(early, "entity", COLUMNS)
+        )
+
+        # Then
+        order = [list(remaining.entities).index(entity) for entity in expected.entities]
+        assert sorted(remaining.entities) == sorted(expected.entities)
+        np.testing.assert_array_equal(remaining.counts[order], expected.counts)
+        np.testing.assert_allclose(remaining.means[order], expected.means, rtol=1e-10)
+        np.testing.assert_allclose(remaining.within_cross_products, expected.within_cross_products, rtol=1e-10)
+
+    def test_subtract_rejects_rows_that_are_not_present(self):
+        # Given
+        dataframe = make_synthetic_panel(nentity=4, nperiod=3, nvar=2, seed=8)
+        statistics = PanelSufficientStatistics.from_dataframe(dataframe[dataframe["entity"] != "e3"], "entity", COLUMNS)
+
+        # When / Then
+        with pytest.raises(ValueError, match="entities that are not present"):
+            statistics.subtract(PanelSufficientStatistics.from_dataframe(dataframe, "entity", COLUMNS))
+        with pytest.raises(ValueError, match="more observations than are present"):
+            statistics.subtract(statistics.merge(statistics))
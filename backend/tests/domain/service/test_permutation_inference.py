@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+
+from app.domain.model.absorption_specification import AbsorptionSpecification
+from app.domain.model.permutation_specification import PermutationSpecification
+from app.domain.service.numpy_fixed_effects_estimator import NumpyFixedEffectsEstimator
+from app.domain.service.permutation_inference import PermutationInference
+from app.domain.service.within_transformation import encode_groups
+from tests.domain.service.test_fixed_effects_estimator_parity import make_synthetic_panel
+
+INDEPENDENT_VARS = ["x0", "x1", "x2"]
+
+
+def fit(dataframe, absorption=None):
+    return NumpyFixedEffectsEstimator().fit(dataframe, "y", INDEPENDENT_VARS, "entity", "period", absorption)
+
+
+class TestPermutationInference:
+    def test_run_adds_pvalue_and_null_summary(self):
+        # Given
+        dataframe = make_synthetic_panel(nentity=47, nperiod=8, nvar=3, seed=14)
+        result = fit(dataframe)
+
+        # When
+        permuted = PermutationInference().run(
+            dataframe, result, "y", "entity", "period", PermutationSpecification("x2", draws=999)
+        )
+
+        # Then
+        assert permuted.params == result.params
+        assert permuted.permutation_pvalue == pytest.approx(1 / 1000)
+        summary = permuted.permutation_null
+        assert summary["min"] <= summary["q025"] <= summary["q50"] <= summary["q975"] <= summary["max"]
+        assert abs(summary["mean"]) < result.params["x2"]
+
+    @pytest.mark.parametrize("scheme", ["within_entity", "across_entity", "time_block"])
+    @pytest.mark.parametrize("absorption", [None, AbsorptionSpecification(effects=(("period",),), tolerance=1e-13)])
+    def test_null_coefficients_match_explicit_refits(self, scheme, absorption):
+        # Given
+        dataframe = make_synthetic_panel(nentity=12, nperiod=7, nvar=3, seed=15)
+        specification = PermutationSpecification("x1", draws=4, scheme=scheme, block_length=3, seed=5)
+        inference = PermutationInference()
+        codes, nentity = encode_groups(dataframe["entity"])
+        rng = np.random.default_rng(np.random.SeedSequence(5).spawn(1)[0])
+        index = inference._index_sampler(specification, codes, nentity, dataframe["period"])(rng, 4)
+        expected = []
+        for rows in index:
+            refit = dataframe.assign(x1=dataframe["x1"].to_numpy()[rows])
+            expected.append(fit(refit, absorption).params["x1"])
+
+        # When
+        permuted = inference.run(dataframe, fit(dataframe, absorption), "y", "entity", "period", specification, absorption)
+
+        # Then
+        assert permuted.permutation_null["min"] == pytest.approx(min(expected), abs=1e-12)
+        assert permuted.permutation_null["max"] == pytest.approx(max(expected), abs=1e-12)
+        assert permuted.permutation_null["mean"] == pytest.approx(np.mean(expected), abs=1e-12)
+
+    def test_run_is_reproducible_regardless_of_worker_count(self):
+        # Given
+        dataframe = make_synthetic_panel(nentity=20, nperiod=6, nvar=3, seed=16)
+        result = fit(dataframe)
+        specification = PermutationSpecification("x0", draws=1500, scheme="across_entity", seed=42)
+
+        # When
+        serial = PermutationInference(workers=1).run(dataframe, result, "y", "entity", "period", specification)
+        parallel = PermutationInference(workers=4).run(dataframe, result, "y", "entity", "period", specification)
+
+        # Then
+        assert serial.permutation_pvalue == parallel.permutation_pvalue
+        assert serial.permutation_null == parallel.permutation_null
+
+    def test_schemes_moving_whole_paths_require_a_balanced_panel(self):
+        # Given
+        dataframe = make_synthetic_panel(nentity=20, nperiod=6, nvar=3, seed=17, balanced=False)
+        specification = PermutationSpecification("x0", draws=9, scheme="time_block")
+
+        # When / Then
+        with pytest.raises(ValueError, match="requires a balanced panel"):
+            PermutationInference().run(dataframe, fit(dataframe), "y", "entity", "period", specification)
+
+    def test_run_rejects_variable_without_estimated_coefficient(self):
+        # Given
+        dataframe = make_synthetic_panel(nentity=10, nperiod=5, nvar=3, seed=18)
+
+        # When / Then
+        with pytest.raises(ValueError, match="not among the estimated coefficients"):
+            PermutationInference().run(
+                dataframe, fit(dataframe), "y", "entity", "period", PermutationSpecification("x9", draws=9)
+            )
+
+    def test_specification_requires_positive_draws_and_block_length(self):
+        # When / Then
+        with pytest.raises(ValueError, match="draws must be a positive integer"):
+            PermutationSpecification("x0", draws=0)
+        with pytest.raises(ValueError, match="block length must be a positive integer"):
+            PermutationSpecification("x0", draws=9, block_length=0)
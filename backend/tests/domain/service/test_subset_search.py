@@ -0,0 +1,110 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from app.domain.model.subset_search_specification import SubsetSearchSpecification
+from app.domain.service.numpy_fixed_effects_estimator import NumpyFixedEffectsEstimator
+from app.domain.service.panel_sufficient_statistics import PanelSufficientStatistics
+from app.domain.service.subset_search import SubsetSearch
+from tests.domain.service.test_fixed_effects_estimator_parity import make_synthetic_panel
+
+
+def make_candidate_panel(nnoise: int, seed: int):
+    dataframe = make_synthetic_panel(nentity=20, nperiod=6, nvar=3, seed=seed)
+    rng = np.random.default_rng(seed)
+    for j in range(nnoise):
+        dataframe[f"n{j}"] = rng.normal(size=len(dataframe))
+    candidates = ("x0", "x1", "x2", *(f"n{j}" for j in range(nnoise)))
+    return dataframe, candidates
+
+
+def search(dataframe, candidates, **kwargs):
+    statistics = PanelSufficientStatistics.from_dataframe(dataframe, "entity", ("y", *candidates))
+    return SubsetSearch().run(statistics, SubsetSearchSpecification("y", candidates, entity_var="entity", time_var="period", **kwargs))
+
+
+def exhaustive_ranking(dataframe, candidates, criterion, top, max_vars=None):
+    # Within R-squared shares the total sum of squares across subsets, so
+    # the criteria order subsets like n log(1 - R^2) plus the penalty.
+    nobs = len(dataframe)
+    penalty = {"rsquared_within": 0.0, "aic": 2.0, "bic": np.log(nobs)}[criterion]
+    scored = []
+    for size in range(1, (max_vars or len(candidates)) + 1):
+        for subset in itertools.combinations(candidates, size):
+            result = NumpyFixedEffectsEstimator().fit(dataframe, "y", list(subset), "entity", "period")
+            scored.append((nobs * np.log(1.0 - result.rsquared_within) + penalty * size, subset))
+    return [subset for _, subset in sorted(scored)[:top]]
+
+
+class TestSubsetSearch:
+    @pytest.mark.parametrize("criterion, max_vars", [("aic", None), ("bic", None), ("rsquared_within", 3)])
+    def test_run_returns_the_same_top_subsets_as_exhaustive_refits(self, criterion, max_vars):
+        # Given
+        dataframe, candidates = make_candidate_panel(nnoise=5, seed=21)
+
+        # When
+        result = search(dataframe, candidates, criterion=criterion, top=5, max_vars=max_vars)
+
+        # Then
+        assert [model.independent_vars for model in result.models] == exhaustive_ranking(
+            dataframe, candidates, criterion, 5, max_vars
+        )
+        assert result.evaluated_subsets < result.total_subsets
+
+    def test_run_reports_criterion_and_refitted_results(self):
+        # Given
+        dataframe, candidates = make_candidate_panel(nnoise=3, seed=22)
+
+        # When
+        result = search(dataframe, candidates, criterion="rsquared_within", top=3, max_vars=2)
+
+        # Then
+        assert result.nobs == len(dataframe)
+        assert result.total_subsets == 6 + 15
+        values = [model.criterion_value for model in result.models]
+        assert values == sorted(values, reverse=True)
+        for model in result.models:
+            expected = NumpyFixedEffectsEstimator().fit(dataframe, "y", list(model.independent_vars), "entity", "period")
+            assert list(model.result.params) == list(model.independent_vars)
+            assert model.result.params == pytest.approx(expected.params, rel=1e-10)
+            assert model.criterion_value == pytest.approx(expected.rsquared_within, rel=1e-10)
+
+    def test_run_skips_subsets_with_collinear_or_absorbed_candidates(self):
+        # Given
+        dataframe, candidates = make_candidate_panel(nnoise=2, seed=23)
+        dataframe["x_sum"] = dataframe["x0"] + dataframe["x1"]
+        dataframe["entity_level"] = dataframe.groupby("entity")["x2"].transform("mean")
+        candidates = (*candidates, "x_sum", "entity_level")
+
+        # When
+        result = search(dataframe, candidates, criterion="aic", top=50)
+
+        # Then
+        for model in result.models:
+            assert "entity_level" not in model.independent_vars
+            assert not {"x0", "x1", "x_sum"} <= set(model.independent_vars)
+            assert model.result.dropped_vars == []
+        assert len({model.independent_vars for model in result.models}) == len(result.models)
+
+    def test_run_raises_value_error_when_every_candidate_is_absorbed(self):
+        # Given
+        dataframe, _ = make_candidate_panel(nnoise=0, seed=24)
+        dataframe["entity_level"] = dataframe.groupby("entity")["x0"].transform("mean")
+
+        # When / Then
+        with pytest.raises(ValueError, match="fully absorbed"):
+            search(dataframe, ("entity_level",))
+
+    def test_specification_rejects_invalid_arguments(self):
+        # When / Then
+        with pytest.raises(ValueError, match="At least one candidate"):
+            SubsetSearchSpecification("y", ())
+        with pytest.raises(ValueError, match="must be distinct"):
+            SubsetSearchSpecification("y", ("x0", "x0"))
+        with pytest.raises(ValueError, match="cannot be a candidate"):
+            SubsetSearchSpecification("y", ("y", "x0"))
+        with pytest.raises(ValueError, match="returned subsets must be a positive integer"):
+            SubsetSearchSpecification("y", ("x0",), top=0)
+        with pytest.raises(ValueError, match="maximum subset size must be a positive integer"):
+            SubsetSearchSpecification("y", ("x0",), max_vars=0)
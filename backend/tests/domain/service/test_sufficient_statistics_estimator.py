@@ -0,0 +1,64 @@
+import pytest
+
+from app.domain.service.numpy_fixed_effects_estimator import NumpyFixedEffectsEstimator
+from app.domain.service.panel_sufficient_statistics import PanelSufficientStatistics
+from app.domain.service.sufficient_statistics_estimator import SufficientStatisticsEstimator
+from tests.domain.service.test_fixed_effects_estimator_parity import assert_results_agree, make_synthetic_panel
+from tests.domain.service.test_numpy_fixed_effects_estimator import make_dataframe
+
+
+class TestSufficientStatisticsEstimator:
+    @pytest.mark.parametrize("balanced, missing", [(True, 0), (False, 12)])
+    def test_fit_matches_fit_on_raw_rows(self, balanced, missing):
+        # Given
+        dataframe = make_synthetic_panel(nentity=40, nperiod=10, nvar=3, seed=4, balanced=balanced, missing=missing)
+        independent_vars = ["x0", "x1", "x2"]
+        statistics = PanelSufficientStatistics.from_dataframe(dataframe, "entity", ("y", *independent_vars))
+
+        # When
+        result = SufficientStatisticsEstimator().fit(statistics, "y", independent_vars)
+
+        # Then
+        expected = NumpyFixedEffectsEstimator().fit(dataframe, "y", independent_vars, "entity", "period")
+        assert_results_agree(result, expected)
+
+    def test_fit_after_merging_time_slices_matches_full_refit(self):
+        # Given
+        dataframe = make_synthetic_panel(nentity=30, nperiod=12, nvar=2, seed=5, balanced=False, missing=6)
+        columns = ("y", "x0", "x1")
+        statistics = PanelSufficientStatistics.from_dataframe(dataframe[dataframe["period"] < 2004], "entity", columns)
+        for period in range(2004, 2012):
+            statistics = statistics.merge(
+                PanelSufficientStatistics.from_dataframe(dataframe[dataframe["period"] == period], "entity", columns)
+            )
+
+        # When
+        result = SufficientStatisticsEstimator().fit(statistics, "y", ["x0", "x1"])
+
+        # Then
+        expected = NumpyFixedEffectsEstimator().fit(dataframe, "y", ["x0", "x1"], "entity", "period")
+        assert_results_agree(result, expected)
+
+    @pytest.mark.parametrize("independent_vars", [["region", "work_hours"], ["work_hours", "scaled_hours"]])
+    def test_fit_drops_absorbed_and_collinear_variables_like_raw_fit(self, independent_vars):
+        # Given
+        dataframe = make_dataframe()
+        dataframe["scaled_hours"] = dataframe["work_hours"] * 2 + dataframe["region"]
+        statistics = PanelSufficientStatistics.from_dataframe(
+            dataframe, "prefecture", ("fertility_rate", *independent_vars)
+        )
+
+        # When
+        result = SufficientStatisticsEstimator().fit(statistics, "fertility_rate", independent_vars)
+
+        # Then
+        expected = NumpyFixedEffectsEstimator().fit(dataframe, "fertility_rate", independent_vars, "prefecture", "year")
+        assert_results_agree(result, expected)
+
+    def test_fit_raises_value_error_when_all_variables_are_absorbed(self):
+        # Given
+        statistics = PanelSufficientStatistics.from_dataframe(make_dataframe(), "prefecture", ("fertility_rate", "region"))
+
+        # When / Then
+        with pytest.raises(ValueError, match="fully absorbed"):
+            SufficientStatisticsEstimator().fit(statistics, "fertility_rate", ["region"])
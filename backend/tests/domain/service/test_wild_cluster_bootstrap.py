@@ -0,0 +1,115 @@
+import numpy as np
+import pytest
+
+from app.domain.model.bootstrap_specification import BootstrapSpecification
+from app.domain.model.panel import Panel
+from app.domain.service.numpy_fixed_effects_estimator import NumpyFixedEffectsEstimator
+from app.domain.service.wild_cluster_bootstrap import WildClusterBootstrap
+from app.domain.service.within_transformation import demean, encode_groups
+from tests.domain.service.test_fixed_effects_estimator_parity import make_synthetic_panel
+
+INDEPENDENT_VARS = ["x0", "x1"]
+
+
+def fit(dataframe):
+    return NumpyFixedEffectsEstimator().fit(dataframe, "y", INDEPENDENT_VARS, "entity", "period")
+
+
+class TestWildClusterBootstrap:
+    def test_run_adds_bootstrap_pvalues_and_confidence_intervals(self):
+        # Given
+        dataframe = make_synthetic_panel(nentity=47, nperiod=10, nvar=2, seed=8)
+        result = fit(dataframe)
+
+        # When
+        bootstrapped = WildClusterBootstrap().run(
+            dataframe, result, "y", "entity", BootstrapSpecification(draws=999)
+        )
+
+        # Then
+        assert bootstrapped.params == result.params
+        assert set(bootstrapped.bootstrap_pvalues) == set(INDEPENDENT_VARS)
+        for name, (lower, upper) in bootstrapped.bootstrap_conf_int.items():
+            assert lower < result.params[name] < upper
+            assert 0.0 <= bootstrapped.bootstrap_pvalues[name] <= 1.0
+
+    def test_run_is_reproducible_regardless_of_worker_count(self):
+        # Given
+        dataframe = make_synthetic_panel(nentity=20, nperiod=6, nvar=2, seed=9)
+        result = fit(dataframe)
+        specification = BootstrapSpecification(draws=1500, weights="webb", seed=42)
+
+        # When
+        serial = WildClusterBootstrap(workers=1).run(dataframe, result, "y", "entity", specification)
+        parallel = WildClusterBootstrap(workers=4).run(dataframe, result, "y", "entity", specification)
+
+        # Then
+        assert serial.bootstrap_pvalues == parallel.bootstrap_pvalues
+        assert serial.bootstrap_conf_int == parallel.bootstrap_conf_int
+
+    def test_run_uses_the_estimation_sample_of_dropped_regressors(self):
+        # Given
+        dataframe = make_synthetic_panel(nentity=20, nperiod=6, nvar=2, seed=11)
+        dataframe["x2"] = 2.0 * dataframe["x0"]
+        dataframe.loc[[4, 30, 77], "x2"] = np.nan
+        panel = Panel.from_dataframe(dataframe, "entity", "period", ["y", "x0", "x1", "x2"])
+        estimator = NumpyFixedEffectsEstimator()
+        result = estimator.fit(panel, "y", ["x0", "x1", "x2"], "entity", "period")
+        observed = dataframe.dropna().reset_index(drop=True)
+        specification = BootstrapSpecification(draws=499, seed=3)
+
+        # When
+        passed = WildClusterBootstrap().run(
+            panel, result, "y", "entity", specification,
+            sample=estimator.sample(panel, "y", ["x0", "x1", "x2"], "entity")
+        )
+        inferred = WildClusterBootstrap().run(panel, result, "y", "entity", specification)
+        expected = WildClusterBootstrap().run(
+            observed, estimator.fit(observed, "y", ["x0", "x1", "x2"], "entity", "period"), "y", "entity", specification
+        )
+
+        # Then
+        assert result.dropped_vars
+        assert passed.bootstrap_pvalues == inferred.bootstrap_pvalues == expected.bootstrap_pvalues
+        assert passed.bootstrap_conf_int == pytest.approx(expected.bootstrap_conf_int, rel=1e-10)
+
+    def test_batched_t_statistics_match_explicit_refits(self):
+        # Given
+        dataframe = make_synthetic_panel(nentity=12, nperiod=5, nvar=2, seed=10)
+        codes, ncluster = encode_groups(dataframe["entity"])
+        y = demean(codes, dataframe[["y"]].to_numpy(), ncluster)[0][:, 0]
+        x = demean(codes, dataframe[INDEPENDENT_VARS].to_numpy(), ncluster)[0]
+        inverse = np.linalg.inv(x.T @ x)
+        params = inverse @ x.T @ y
+        residuals = y - x @ params
+        weights = np.random.default_rng(0).choice([-1.0, 1.0], size=(ncluster, 3))
+        bootstrap = WildClusterBootstrap()
+        kernels = [bootstrap._score_kernel(x, codes, ncluster, inverse, j, residuals) for j in range(2)]
+
+        # When
+        tstats = bootstrap._studentize(kernels, weights)
+
+        # Then
+        for draw in range(weights.shape[1]):
+            y_star = x @ params + residuals * weights[codes, draw]
+            params_star = inverse @ x.T @ y_star
+            residuals_star = y_star - x @ params_star
+            scores = np.array([x[codes == g].T @ residuals_star[codes == g] for g in range(ncluster)])
+            std_errors = np.sqrt(np.diag(inverse @ scores.T @ scores @ inverse))
+            np.testing.assert_allclose(tstats[:, draw], (params_star - params) / std_errors, rtol=1e-10)
+
+    def test_run_requires_at_least_two_clusters(self):
+        # Given
+        dataframe = make_synthetic_panel(nentity=1, nperiod=10, nvar=2, seed=11)
+        dataframe["x1"] = np.arange(10.0) ** 2
+
+        # When / Then
+        with pytest.raises(ValueError, match="at least two clusters"):
+            WildClusterBootstrap().run(dataframe, fit(dataframe), "y", "entity", BootstrapSpecification(draws=9))
+
+    def test_specification_rejects_invalid_settings(self):
+        # Given / When / Then
+        with pytest.raises(ValueError, match="positive integer"):
+            BootstrapSpecification(draws=0)
+        with pytest.raises(ValueError, match="between 0 and 1"):
+            BootstrapSpecification(draws=99, confidence_level=1.0)
@@ -0,0 +1,76 @@
+from unittest.mock import patch
+
+import pytest
+
+from app.domain.model.window_specification import WindowSpecification
+from app.domain.service.numpy_fixed_effects_estimator import NumpyFixedEffectsEstimator
+from app.domain.service.panel_sufficient_statistics import PanelSufficientStatistics
+from app.domain.service.windowed_estimation import WindowedEstimation
+from tests.domain.service.test_fixed_effects_estimator_parity import assert_results_agree, make_synthetic_panel
+
+
+def run(dataframe, window):
+    return WindowedEstimation().run(dataframe, "y", ["x0", "x1"], "entity", "period", window)
+
+
+class TestWindowedEstimation:
+    @pytest.mark.parametrize("window", [
+        WindowSpecification(5),
+        WindowSpecification(3, "rolling", step=4),
+        WindowSpecification(4, "expanding", step=2),
+    ])
+    def test_each_window_matches_a_refit_on_its_rows(self, window):
+        # Given
+        dataframe = make_synthetic_panel(nentity=25, nperiod=12, nvar=2, seed=31, balanced=False, missing=10)
+
+        # When
+        estimates = run(dataframe, window)
+
+        # Then
+        assert estimates
+        for estimate in estimates:
+            rows = dataframe[dataframe["period"].between(estimate.start, estimate.end)]
+            expected = NumpyFixedEffectsEstimator().fit(rows, "y", ["x0", "x1"], "entity", "period")
+            assert_results_agree(estimate.result, expected)
+
+    def test_windows_cover_consecutive_periods(self):
+        # Given
+        dataframe = make_synthetic_panel(nentity=5, nperiod=6, nvar=2, seed=32)
+
+        # When
+        rolling = run(dataframe, WindowSpecification(3, step=2))
+        expanding = run(dataframe, WindowSpecification(4, "expanding"))
+
+        # Then
+        assert [(estimate.start, estimate.end) for estimate in rolling] == [(2000, 2002), (2002, 2004)]
+        assert [(estimate.start, estimate.end) for estimate in expanding] == [(2000, 2003), (2000, 2004), (2000, 2005)]
+
+    def test_each_time_slice_is_summarized_once(self):
+        # Given
+        dataframe = make_synthetic_panel(nentity=5, nperiod=10, nvar=2, seed=33)
+
+        # When
+        with patch.object(
+            PanelSufficientStatistics, "from_panel", wraps=PanelSufficientStatistics.from_panel
+        ) as from_panel:
+            estimates = run(dataframe, WindowSpecification(4))
+
+        # Then
+        assert len(estimates) == 7
+        assert from_panel.call_count == 10
+        assert all(call.args[0].nobs == 5 for call in from_panel.call_args_list)
+
+    def test_run_raises_value_error_when_window_is_longer_than_the_panel(self):
+        # Given
+        dataframe = make_synthetic_panel(nentity=5, nperiod=3, nvar=2, seed=34)
+
+        # When / Then
+        with pytest.raises(ValueError, match="needs at least that many"):
+            run(dataframe, WindowSpecification(4))
+
+    def test_specification_requires_positive_length_and_step(self):
+        # When / Then
+        with pytest.raises(ValueError, match="length must be a positive integer"):
+            WindowSpecification(0)
+        with pytest.raises(ValueError, match="step must be a positive integer"):
+            WindowSpecification(3, step=0)
@@ -0,0 +1,125 @@
+import numpy as np
+import pytest
+
+from app.domain.service.within_transformation import (
+    count_absorbed_levels,
+    demean,
+    demean_alternating,
+    encode_groups,
+    encode_interaction,
+    group_means,
+    group_sums,
+)
+
+
+class TestEncodeGroups:
+    def test_encodes_labels_in_order_of_appearance(self):
+        # Given
+        labels = np.array(["東京都", "大阪府", "東京都", "京都府"], dtype=object)
+
+        # When
+        codes, ngroups = encode_groups(labels)
+
+        # Then
+        assert codes.tolist() == [0, 1, 0, 2]
+        assert ngroups == 3
+
+
+class TestGroupSums:
+    def test_sums_each_column_by_group(self):
+        # Given
+        codes = np.array([0, 1, 0, 1])
+        values = np.array([[1.0, 10.0], [2.0, 20.0], [3.0, 30.0], [4.0, 40.0]])
+
+        # When
+        sums = group_sums(codes, values, 2)
+
+        # Then
+        assert sums.tolist() == [[4.0, 40.0], [6.0, 60.0]]
+
+
+class TestGroupMeans:
+    def test_averages_each_column_by_group(self):
+        # Given
+        codes = np.array([0, 0, 1])
+        values = np.array([[1.0], [3.0], [5.0]])
+
+        # When
+        means = group_means(codes, values, 2)
+
+        # Then
+        assert means.tolist() == [[2.0], [5.0]]
+
+
+class TestDemean:
+    def test_subtracts_group_means(self):
+        # Given
+        codes = np.array([0, 0, 1, 1])
+        values = np.array([[1.0], [3.0], [10.0], [20.0]])
+
+        # When
+        demeaned, means = demean(codes, values, 2)
+
+        # Then
+        assert demeaned[:, 0].tolist() == [-1.0, 1.0, -5.0, 5.0]
+        assert means[:, 0].tolist() == [2.0, 15.0]
+
+
+class TestEncodeInteraction:
+    def test_encodes_each_observed_combination(self):
+        # Given
+        regions = np.array(["関東", "関東", "近畿", "関東"], dtype=object)
+        years = np.array([2020, 2021, 2020, 2020])
+
+        # When
+        codes, ngroups = encode_interaction([regions, years])
+
+        # Then
+        assert codes.tolist() == [0, 1, 2, 0]
+        assert ngroups == 3
+
+
+class TestDemeanAlternating:
+    def test_matches_two_way_demeaning_on_balanced_panel(self):
+        # Given
+        rng = np.random.default_rng(0)
+        values = rng.normal(size=(6, 4))
+        entity, period = np.divmod(np.arange(24), 4)
+        expected = values - values.mean(axis=1, keepdims=True) - values.mean(axis=0) + values.mean()
+
+        # When
+        within, iterations = demean_alternating(
+            [(entity, 6), (period, 4)], values.reshape(-1, 1), tolerance=1e-12, max_iterations=100
+        )
+
+        # Then
+        assert np.allclose(within[:, 0], expected.ravel(), atol=1e-12)
+        assert iterations.tolist() == [2]
+
+    def test_raises_when_not_converged(self):
+        # Given
+        codes = np.array([0, 0, 1, 1, 2])
+        other = np.array([0, 1, 1, 2, 2])
+        values = np.array([[1.0], [4.0], [2.0], [8.0], [3.0]])
+
+        # When / Then
+        with pytest.raises(ValueError, match="did not converge within 1 iterations"):
+            demean_alternating([(codes, 3), (other, 3)], values, tolerance=1e-12, max_iterations=1)
+
+
+class TestCountAbsorbedLevels:
+    def test_subtracts_one_level_per_connected_component(self):
+        # Given
+        entity = np.array([0, 0, 1, 1, 2, 2])
+        period = np.array([0, 1, 0, 1, 2, 3])
+
+        # When / Then
+        assert count_absorbed_levels([(entity, 3), (period, 4)]) == 3 + 4 - 2
+
+    def test_nested_grouping_adds_no_levels(self):
+        # Given
+        entity = np.array([0, 1, 2, 3])
+        region = np.array([0, 0, 1, 1])
+
+        # When / Then
+        assert count_absorbed_levels([(entity, 4), (region, 2)]) == 4
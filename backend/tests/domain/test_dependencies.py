@@ -0,0 +1,27 @@
+from unittest.mock import patch
+
+from app.dependencies import get_fixed_effects_estimator
+from app.domain.service.linearmodels_fixed_effects_estimator import LinearmodelsFixedEffectsEstimator
+from app.domain.service.numpy_fixed_effects_estimator import NumpyFixedEffectsEstimator
+
+
+class TestGetFixedEffectsEstimator:
+    def test_returns_numpy_estimator_by_default(self):
+        # Given / When
+        result = get_fixed_effects_estimator()
+
+        # Then
+        assert isinstance(result, NumpyFixedEffectsEstimator)
+
+    def test_returns_linearmodels_estimator_when_configured(self):
+        # Given
+        get_fixed_effects_estimator.cache_clear()
+        with patch("app.dependencies.web_config") as mock_web_config:
+            mock_web_config.FIXED_EFFECTS_ESTIMATOR = "linearmodels"
+
+            # When
+            result = get_fixed_effects_estimator()
+        get_fixed_effects_estimator.cache_clear()
+
+        # Then
+        assert isinstance(result, LinearmodelsFixedEffectsEstimator)
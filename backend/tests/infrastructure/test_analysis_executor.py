@@ -0,0 +1,82 @@
+import asyncio
+import threading
+
+import pytest
+
+from app.application.exception.analysis_queue_full_exception import AnalysisQueueFullException
+from app.application.exception.analysis_timeout_exception import AnalysisTimeoutException
+from app.infrastructure.analysis_executor import AnalysisExecutor
+
+
+class TestAnalysisExecutor:
+    async def test_run_returns_function_result(self):
+        # Given
+        executor = AnalysisExecutor(max_workers=1, max_queue_depth=0, timeout_seconds=5, retry_after_seconds=1)
+
+        # When
+        result = await executor.run(lambda a, b: a + b, 1, 2)
+
+        # Then
+        assert result == 3
+        assert executor.in_flight == 0
+        executor.shutdown()
+
+    async def test_run_executes_outside_event_loop_thread(self):
+        # Given
+        executor = AnalysisExecutor(max_workers=1, max_queue_depth=0, timeout_seconds=5, retry_after_seconds=1)
+
+        # When
+        thread_name = await executor.run(lambda: threading.current_thread().name)
+
+        # Then
+        assert thread_name.startswith("analysis")
+        executor.shutdown()
+
+    async def test_run_propagates_function_exception(self):
+        # Given
+        executor = AnalysisExecutor(max_workers=1, max_queue_depth=0, timeout_seconds=5, retry_after_seconds=1)
+
+        def fail():
+            raise ValueError("Invalid CSV format")
+
+        # When / Then
+        with pytest.raises(ValueError, match="Invalid CSV format"):
+            await executor.run(fail)
+        assert executor.in_flight == 0
+        executor.shutdown()
+
+    async def test_run_rejects_work_when_queue_is_full(self):
+        # Given
+        executor = AnalysisExecutor(max_workers=1, max_queue_depth=1, timeout_seconds=5, retry_after_seconds=7)
+        release = threading.Event()
+        running = [asyncio.create_task(executor.run(release.wait)) for _ in range(2)]
+        await asyncio.sleep(0)
+
+        # When / Then
+        with pytest.raises(AnalysisQueueFullException) as exc_info:
+            await executor.run(lambda: None)
+        assert exc_info.value.retry_after_seconds == 7
+
+        release.set()
+        await asyncio.gather(*running)
+        assert executor.in_flight == 0
+        executor.shutdown()
+
+    async def test_run_raises_timeout_and_keeps_slot_until_work_finishes(self):
+        # Given
+        executor = AnalysisExecutor(max_workers=1, max_queue_depth=0, timeout_seconds=0.05, retry_after_seconds=1)
+        release = threading.Event()
+
+        # When
+        with pytest.raises(AnalysisTimeoutException):
+            await executor.run(release.wait)
+
+        # Then
+        assert executor.in_flight == 1
+        release.set()
+        for _ in range(100):
+            if executor.in_flight == 0:
+                break
+            await asyncio.sleep(0.01)
+        assert executor.in_flight == 0
+        executor.shutdown()
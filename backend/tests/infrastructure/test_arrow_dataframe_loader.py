@@ -0,0 +1,112 @@
+import io
+
+import pandas as pd
+import pytest
+
+from app.application.exception.missing_columns_exception import MissingColumnsException
+from app.domain.model.dataset_schema import DatasetSchema
+from app.infrastructure.arrow_dataframe_loader import ArrowDataFrameLoader, detect_arrow_format
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+def make_dataframe() -> pd.DataFrame:
+    return pd.DataFrame({
+        "prefecture": ["Tokyo", "Tokyo", "Osaka"],
+        "year": [2018, 2019, 2018],
+        "fertility_rate": [1.2, 1.25, 1.5],
+        "work_hours": [40, 39, 42],
+        "unused": ["a", "b", "c"],
+    })
+
+
+def to_bytes(dataframe: pd.DataFrame, arrow_format: str) -> bytes:
+    sink = io.BytesIO()
+    table = pa.Table.from_pandas(dataframe, preserve_index=False)
+    if arrow_format == "parquet":
+        pq.write_table(table, sink)
+    elif arrow_format == "arrow_file":
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    else:
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+    return sink.getvalue()
+
+
+class TestArrowDataFrameLoader:
+    @pytest.mark.parametrize("arrow_format", ["parquet", "arrow_file", "arrow_stream"])
+    def test_load_detects_format_and_projects_columns(self, arrow_format):
+        # Given
+        loader = ArrowDataFrameLoader()
+        data = to_bytes(make_dataframe(), arrow_format)
+        schema = DatasetSchema(variables=("fertility_rate", "work_hours"))
+
+        # When
+        result = loader.load(data, schema)
+
+        # Then
+        assert detect_arrow_format(data) == arrow_format
+        assert sorted(result.columns) == ["fertility_rate", "prefecture", "work_hours", "year"]
+        assert result["work_hours"].dtype == "float64"
+        assert isinstance(result["prefecture"].dtype, pd.CategoricalDtype)
+        assert result["fertility_rate"].tolist() == [1.2, 1.25, 1.5]
+
+    def test_load_without_schema_returns_all_columns(self):
+        # Given
+        loader = ArrowDataFrameLoader()
+
+        # When
+        result = loader.load(to_bytes(make_dataframe(), "parquet"))
+
+        # Then
+        pd.testing.assert_frame_equal(result, make_dataframe())
+
+    def test_load_rejects_missing_columns_from_metadata(self):
+        # Given
+        loader = ArrowDataFrameLoader()
+        schema = DatasetSchema(variables=("fertility_rate", "income"))
+
+        # When / Then
+        with pytest.raises(MissingColumnsException) as exc_info:
+            loader.load(to_bytes(make_dataframe(), "arrow_file"), schema)
+        assert exc_info.value.missing_columns == ["income"]
+
+    def test_load_rejects_corrupt_input(self):
+        # Given
+        loader = ArrowDataFrameLoader()
+
+        # When / Then
+        with pytest.raises(ValueError, match="Invalid Arrow format"):
+            loader.load(b"PAR1 truncated")
+
+    def test_load_file_reads_arrow_file_through_memory_map(self, tmp_path):
+        # Given
+        loader = ArrowDataFrameLoader()
+        path = tmp_path / "panel.arrow"
+        path.write_bytes(to_bytes(make_dataframe(), "arrow_file"))
+        schema = DatasetSchema(variables=("fertility_rate", "work_hours"))
+
+        # When
+        result = loader.load_file(path, schema)
+
+        # Then
+        assert len(result) == 3
+        # Float columns without nulls are views over the mapped buffers.
+        assert not result["fertility_rate"].to_numpy().flags.owndata
+        assert result["fertility_rate"].tolist() == [1.2, 1.25, 1.5]
+
+    @pytest.mark.parametrize("arrow_format", ["parquet", "arrow_file", "arrow_stream"])
+    def test_load_chunks_yields_bounded_row_blocks(self, arrow_format):
+        # Given
+        loader = ArrowDataFrameLoader()
+        schema = DatasetSchema(variables=("fertility_rate", "work_hours"))
+
+        # When
+        chunks = list(loader.load_chunks(to_bytes(make_dataframe(), arrow_format), schema, chunk_rows=2))
+
+        # Then
+        assert [len(chunk) for chunk in chunks] == [2, 1]
+        assert pd.concat(chunks)["fertility_rate"].tolist() == [1.2, 1.25, 1.5]
+        assert chunks[0]["work_hours"].dtype == "float64"
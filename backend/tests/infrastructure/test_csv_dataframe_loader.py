@@ -2,9 +2,20 @@ import pytest
 import pandas as pd
 import io
 
+from app.application.exception.missing_columns_exception import MissingColumnsException
+from app.domain.model.dataset_schema import DatasetSchema
 from app.infrastructure.csv_dataframe_loader import CsvDataFrameLoader
 
 
+def make_wide_csv_bytes() -> bytes:
+    header = "prefecture,year,fertility_rate,work_hours," + ",".join(f"unused_{i}" for i in range(50))
+    rows = [
+        f"{prefecture},{year},{1.2 + i * 0.01},{40 - i}," + ",".join("x" for _ in range(50))
+        for i, (prefecture, year) in enumerate([("Tokyo", 2018), ("Tokyo", 2019), ("Osaka", 2018)])
+    ]
+    return "\n".join([header, *rows]).encode("utf-8")
+
+
 class TestCsvDataFrameLoader:
     def test_load_valid_csv(self):
         # Given
@@ -45,3 +56,105 @@ class TestCsvDataFrameLoader:
         # When / Then
         with pytest.raises(ValueError, match="Invalid CSV format"):
             loader.load(invalid_bytes)
+
+    def test_load_reads_from_file_object(self):
+        # Given
+        loader = CsvDataFrameLoader()
+        csv_file = io.BytesIO(b"name,age\nAlice,30\nBob,25")
+
+        # When
+        result = loader.load(csv_file)
+
+        # Then
+        assert len(result) == 2
+        assert list(result.columns) == ["name", "age"]
+
+    @pytest.mark.parametrize("engine", ["c", "pyarrow"])
+    def test_load_with_schema_projects_columns_and_applies_dtypes(self, engine):
+        # Given
+        if engine == "pyarrow":
+            pytest.importorskip("pyarrow")
+        loader = CsvDataFrameLoader(engine=engine)
+        schema = DatasetSchema(variables=("fertility_rate", "work_hours"))
+
+        # When
+        result = loader.load(make_wide_csv_bytes(), schema)
+
+        # Then
+        assert sorted(result.columns) == ["fertility_rate", "prefecture", "work_hours", "year"]
+        assert result["fertility_rate"].dtype == "float64"
+        assert result["work_hours"].dtype == "float64"
+        assert isinstance(result["prefecture"].dtype, pd.CategoricalDtype)
+        assert result["year"].dtype == "int64"
+
+    def test_load_with_schema_rejects_missing_columns_from_header(self):
+        # Given
+        loader = CsvDataFrameLoader()
+        schema = DatasetSchema(variables=("fertility_rate", "income"))
+        csv_bytes = b"prefecture,year,fertility_rate\nTokyo,2018,1.2\nOsaka,not-a-year,1.5,extra,fields"
+
+        # When / Then
+        with pytest.raises(MissingColumnsException) as exc_info:
+            loader.load(csv_bytes, schema)
+        assert exc_info.value.missing_columns == ["income"]
+
+    def test_load_with_schema_reads_values_that_do_not_match_dtypes_as_text(self):
+        # Given
+        loader = CsvDataFrameLoader()
+        schema = DatasetSchema(variables=("fertility_rate",))
+        csv_bytes = b"prefecture,year,fertility_rate\nTokyo,2018,high\nTokyo,,1.2"
+
+        # When
+        dataframe = loader.load(csv_bytes, schema)
+
+        # Then
+        assert dataframe["fertility_rate"].tolist() == ["high", "1.2"]
+        assert str(dataframe["year"].dtype) == "Int64"
+        assert dataframe["year"].isna().tolist() == [False, True]
+
+    def test_load_with_schema_rejects_time_values_that_are_not_integers(self):
+        # Given
+        loader = CsvDataFrameLoader()
+        schema = DatasetSchema(variables=("fertility_rate",))
+        csv_bytes = b"prefecture,year,fertility_rate\nTokyo,FY2018,1.2"
+
+        # When / Then
+        with pytest.raises(ValueError, match="Invalid CSV format"):
+            loader.load(csv_bytes, schema)
+
+    def test_load_chunks_yields_row_blocks_with_schema_dtypes(self):
+        # Given
+        loader = CsvDataFrameLoader()
+        schema = DatasetSchema(variables=("fertility_rate", "work_hours"))
+
+        # When
+        chunks = list(loader.load_chunks(make_wide_csv_bytes(), schema, chunk_rows=2))
+
+        # Then
+        assert [len(chunk) for chunk in chunks] == [2, 1]
+        assert all(chunk["work_hours"].dtype == "float64" for chunk in chunks)
+        assert sorted(chunks[0].columns) == ["fertility_rate", "prefecture", "work_hours", "year"]
+
+    def test_load_chunks_reads_blocks_from_the_first_unparsable_value_on_as_text(self):
+        # Given
+        loader = CsvDataFrameLoader()
+        schema = DatasetSchema(variables=("fertility_rate",))
+        csv_bytes = b"prefecture,year,fertility_rate\nTokyo,2018,1.1\nTokyo,2019,1.2\nOsaka,2018,high\nOsaka,2019,1.3"
+
+        # When
+        chunks = list(loader.load_chunks(csv_bytes, schema, chunk_rows=2))
+
+        # Then
+        assert [len(chunk) for chunk in chunks] == [2, 2]
+        assert chunks[0]["fertility_rate"].dtype == "float64"
+        assert chunks[1]["fertility_rate"].tolist() == ["high", "1.3"]
+        assert chunks[1]["year"].tolist() == [2018, 2019]
+
+    def test_load_chunks_rejects_missing_columns_before_reading_rows(self):
+        # Given
+        loader = CsvDataFrameLoader()
+        schema = DatasetSchema(variables=("income",))
+
+        # When / Then
+        with pytest.raises(MissingColumnsException):
+            next(loader.load_chunks(make_wide_csv_bytes(), schema, chunk_rows=2))
@@ -1,11 +1,150 @@
-from app.dependencies import get_dataframe_loader
+from unittest.mock import patch
+
+from app.dependencies import (
+    get_analysis_executor,
+    get_analysis_result_cache,
+    get_dataframe_loader,
+    get_dataset_repository,
+    get_parsed_dataset_cache,
+    get_sufficient_statistics_repository,
+)
+from app.infrastructure.analysis_executor import AnalysisExecutor
+from app.infrastructure.arrow_dataframe_loader import ArrowDataFrameLoader
 from app.infrastructure.csv_dataframe_loader import CsvDataFrameLoader
+from app.infrastructure.disk_backed_dataset_repository import DiskBackedDatasetRepository
+from app.infrastructure.disk_parsed_dataset_cache import DiskParsedDatasetCache
+from app.infrastructure.format_detecting_dataframe_loader import FormatDetectingDataFrameLoader
+from app.infrastructure.in_memory_analysis_result_cache import InMemoryAnalysisResultCache
+from app.infrastructure.in_memory_dataset_repository import InMemoryDatasetRepository
+from app.infrastructure.in_memory_sufficient_statistics_repository import InMemorySufficientStatisticsRepository
+from app.infrastructure.memory_mapped_dataset_repository import MemoryMappedDatasetRepository
 
 
 class TestGetDataFrameLoader:
-    def test_returns_csv_dataframe_loader_instance(self):
+    def test_returns_format_detecting_loader_for_csv_and_arrow(self):
         # Given / When
         result = get_dataframe_loader()
         
         # Then
-        assert isinstance(result, CsvDataFrameLoader)
+        assert isinstance(result, FormatDetectingDataFrameLoader)
+        assert isinstance(result.csv_loader, CsvDataFrameLoader)
+        assert isinstance(result.arrow_loader, ArrowDataFrameLoader)
+
+
+class TestGetDatasetRepository:
+    def test_returns_shared_in_memory_dataset_repository(self):
+        # Given / When
+        first = get_dataset_repository()
+        second = get_dataset_repository()
+        
+        # Then
+        assert isinstance(first, InMemoryDatasetRepository)
+        assert first is second
+
+    def test_returns_memory_mapped_repository_when_store_directory_is_set(self, tmp_path):
+        # Given
+        with patch("app.dependencies.web_config") as mock_web_config:
+            mock_web_config.DATASET_STORE_DIRECTORY = tmp_path
+            mock_web_config.DATASET_REGISTRY_MAX_BYTES = 1024
+
+            # When
+            result = get_dataset_repository.__wrapped__()
+
+        # Then
+        assert isinstance(result, MemoryMappedDatasetRepository)
+        assert result.directory == tmp_path
+        assert result.max_bytes == 1024
+
+    def test_writes_through_to_parsed_dataset_cache_when_cache_directory_is_set(self, tmp_path):
+        # Given
+        with patch("app.dependencies.web_config") as mock_web_config, \
+                patch("app.dependencies.get_parsed_dataset_cache") as mock_get_parsed_dataset_cache:
+            mock_web_config.DATASET_STORE_DIRECTORY = None
+            mock_web_config.DATASET_REGISTRY_MAX_BYTES = 1024
+            mock_get_parsed_dataset_cache.return_value = DiskParsedDatasetCache(tmp_path, max_bytes=1024)
+
+            # When
+            result = get_dataset_repository.__wrapped__()
+
+        # Then
+        assert isinstance(result, DiskBackedDatasetRepository)
+        assert isinstance(result.repository, InMemoryDatasetRepository)
+        assert result.parsed_cache is mock_get_parsed_dataset_cache.return_value
+
+
+class TestGetParsedDatasetCache:
+    def test_returns_none_by_default(self):
+        # Given / When
+        result = get_parsed_dataset_cache()
+
+        # Then
+        assert result is None
+
+    def test_returns_disk_cache_when_cache_directory_is_set(self, tmp_path):
+        # Given
+        with patch("app.dependencies.web_config") as mock_web_config:
+            mock_web_config.PARSED_DATASET_CACHE_DIRECTORY = tmp_path
+            mock_web_config.PARSED_DATASET_CACHE_MAX_BYTES = 1024
+
+            # When
+            result = get_parsed_dataset_cache.__wrapped__()
+
+        # Then
+        assert isinstance(result, DiskParsedDatasetCache)
+        assert result.directory.parent == tmp_path
+        assert result.max_bytes == 1024
+
+
+class TestGetSufficientStatisticsRepository:
+    def test_returns_shared_in_memory_repository(self):
+        # Given / When
+        first = get_sufficient_statistics_repository()
+        second = get_sufficient_statistics_repository()
+
+        # Then
+        assert isinstance(first, InMemorySufficientStatisticsRepository)
+        assert first is second
+
+    def test_returns_none_for_linearmodels_estimator(self):
+        # Given
+        with patch("app.dependencies.web_config") as mock_web_config:
+            mock_web_config.FIXED_EFFECTS_ESTIMATOR = "linearmodels"
+
+            # When
+            result = get_sufficient_statistics_repository.__wrapped__()
+
+        # Then
+        assert result is None
+
+
+class TestGetAnalysisResultCache:
+    def test_returns_shared_in_memory_analysis_result_cache(self):
+        # Given / When
+        first = get_analysis_result_cache()
+        second = get_analysis_result_cache()
+        
+        # Then
+        assert isinstance(first, InMemoryAnalysisResultCache)
+        assert first is second
+        
+    def test_returns_none_when_disabled(self):
+        # Given
+        with patch("app.dependencies.web_config") as mock_web_config:
+            mock_web_config.ANALYSIS_RESULT_CACHE_ENABLED = False
+            
+            # When
+            result = get_analysis_result_cache.__wrapped__()
+        
+        # Then
+        assert result is None
+
+
+class TestGetAnalysisExecutor:
+    def test_returns_shared_analysis_executor(self):
+        # Given / When
+        first = get_analysis_executor()
+        second = get_analysis_executor()
+        
+        # Then
+        assert isinstance(first, AnalysisExecutor)
+        assert first is second
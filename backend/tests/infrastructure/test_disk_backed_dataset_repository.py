@@ -0,0 +1,42 @@
+import pandas as pd
+
+from app.infrastructure.disk_backed_dataset_repository import DiskBackedDatasetRepository
+from app.infrastructure.disk_parsed_dataset_cache import DiskParsedDatasetCache
+from app.infrastructure.in_memory_dataset_repository import InMemoryDatasetRepository
+
+DATASET_ID = "a" * 64
+
+
+def make_dataframe(rows: int) -> pd.DataFrame:
+    return pd.DataFrame({"value": [float(i) for i in range(rows)]})
+
+
+class TestDiskBackedDatasetRepository:
+    def test_registered_datasets_are_reloaded_after_a_restart(self, tmp_path):
+        # Given
+        dataframe = make_dataframe(10)
+        DiskBackedDatasetRepository(
+            InMemoryDatasetRepository(max_bytes=1024 * 1024),
+            DiskParsedDatasetCache(tmp_path, max_bytes=1024 * 1024),
+        ).put(DATASET_ID, dataframe)
+        restarted = InMemoryDatasetRepository(max_bytes=1024 * 1024)
+
+        # When
+        result = DiskBackedDatasetRepository(
+            restarted,
+            DiskParsedDatasetCache(tmp_path, max_bytes=1024 * 1024),
+        ).get(DATASET_ID)
+
+        # Then
+        pd.testing.assert_frame_equal(result, dataframe)
+        assert restarted.get(DATASET_ID) is result
+
+    def test_get_returns_none_for_unknown_dataset(self, tmp_path):
+        # Given
+        repository = DiskBackedDatasetRepository(
+            InMemoryDatasetRepository(max_bytes=1024 * 1024),
+            DiskParsedDatasetCache(tmp_path, max_bytes=1024 * 1024),
+        )
+
+        # When / Then
+        assert repository.get(DATASET_ID) is None
@@ -0,0 +1,100 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from app.infrastructure.disk_parsed_dataset_cache import FORMAT_VERSION, DiskParsedDatasetCache
+
+DATASET_ID = "a" * 64
+OTHER_DATASET_ID = "b" * 64
+
+
+def make_dataframe(rows: int) -> pd.DataFrame:
+    return pd.DataFrame({
+        "prefecture": pd.Categorical([f"県{i % 3}" for i in range(rows)]),
+        "year": np.arange(rows, dtype=np.int64),
+        "value": [float(i) for i in range(rows)],
+    })
+
+
+class TestDiskParsedDatasetCache:
+    def test_entries_survive_a_restart(self, tmp_path):
+        # Given
+        dataframe = make_dataframe(10)
+        DiskParsedDatasetCache(tmp_path, max_bytes=1024 * 1024).put(DATASET_ID, dataframe)
+
+        # When
+        restarted = DiskParsedDatasetCache(tmp_path, max_bytes=1024 * 1024)
+        stored = restarted.get(DATASET_ID)
+
+        # Then
+        pd.testing.assert_frame_equal(stored, dataframe)
+        assert not stored["value"].to_numpy().flags.writeable
+        assert restarted.directory == tmp_path / f"v{FORMAT_VERSION}"
+
+    def test_entries_are_keyed_by_content_hash(self, tmp_path):
+        # Given
+        cache = DiskParsedDatasetCache(tmp_path, max_bytes=1024 * 1024)
+        cache.put(DATASET_ID, make_dataframe(10))
+
+        # When / Then
+        assert cache.get(OTHER_DATASET_ID) is None
+        assert [entry.name for entry in cache.directory.iterdir()] == [DATASET_ID]
+
+    def test_get_ignores_ids_that_are_not_content_hashes(self, tmp_path):
+        # Given
+        cache = DiskParsedDatasetCache(tmp_path, max_bytes=1024 * 1024)
+
+        # When
+        cache.put("../dataset", make_dataframe(10))
+
+        # Then
+        assert cache.get("../dataset") is None
+        assert list(cache.directory.iterdir()) == []
+
+    def test_corrupt_entry_is_deleted_and_reported_as_miss(self, tmp_path):
+        # Given
+        cache = DiskParsedDatasetCache(tmp_path, max_bytes=1024 * 1024)
+        cache.put(DATASET_ID, make_dataframe(10))
+        [entry] = cache.directory.iterdir()
+        (entry / "2.npy").write_bytes(b"truncated")
+
+        # When
+        result = cache.get(DATASET_ID)
+
+        # Then
+        assert result is None
+        assert not entry.exists()
+        cache.put(DATASET_ID, make_dataframe(10))
+        pd.testing.assert_frame_equal(cache.get(DATASET_ID), make_dataframe(10))
+
+    def test_put_evicts_least_recently_used_entries_over_budget(self, tmp_path):
+        # Given
+        cache = DiskParsedDatasetCache(tmp_path, max_bytes=1024 * 1024)
+        cache.put(DATASET_ID, make_dataframe(100))
+        # The budget counts whole files, headers and metadata included.
+        cache.max_bytes = cache.total_bytes * 2
+        cache.put(OTHER_DATASET_ID, make_dataframe(100))
+        for age, entry in enumerate(sorted(cache.directory.iterdir(), reverse=True)):
+            os.utime(entry, (1_000_000 - age, 1_000_000 - age))
+        cache.get(DATASET_ID)
+
+        # When
+        cache.put("c" * 64, make_dataframe(100))
+
+        # Then
+        assert cache.get(DATASET_ID) is not None
+        assert cache.get(OTHER_DATASET_ID) is None
+        assert cache.get("c" * 64) is not None
+        assert cache.total_bytes <= cache.max_bytes
+
+    def test_put_skips_dataset_larger_than_budget(self, tmp_path):
+        # Given
+        cache = DiskParsedDatasetCache(tmp_path, max_bytes=10)
+
+        # When
+        cache.put(DATASET_ID, make_dataframe(100))
+
+        # Then
+        assert cache.get(DATASET_ID) is None
+        assert list(cache.directory.iterdir()) == []
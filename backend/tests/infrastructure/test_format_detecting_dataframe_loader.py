@@ -0,0 +1,46 @@
+from unittest.mock import Mock
+
+from app.domain.model.dataset_schema import DatasetSchema
+from app.infrastructure.format_detecting_dataframe_loader import FormatDetectingDataFrameLoader
+
+
+class TestFormatDetectingDataFrameLoader:
+    def test_load_dispatches_csv_by_default(self):
+        # Given
+        csv_loader, arrow_loader = Mock(), Mock()
+        loader = FormatDetectingDataFrameLoader(csv_loader=csv_loader, arrow_loader=arrow_loader)
+        schema = DatasetSchema(variables=("fertility_rate",))
+
+        # When
+        result = loader.load(b"prefecture,year\nTokyo,2020\n", schema)
+
+        # Then
+        assert result is csv_loader.load.return_value
+        arrow_loader.load.assert_not_called()
+
+    def test_load_dispatches_arrow_formats_by_magic_bytes(self):
+        # Given
+        csv_loader, arrow_loader = Mock(), Mock()
+        loader = FormatDetectingDataFrameLoader(csv_loader=csv_loader, arrow_loader=arrow_loader)
+
+        # When
+        results = [loader.load(header + b"...") for header in (b"PAR1", b"ARROW1", b"\xff\xff\xff\xff")]
+
+        # Then
+        assert results == [arrow_loader.load.return_value] * 3
+        csv_loader.load.assert_not_called()
+        assert arrow_loader.load.call_args.args[0].tell() == 0
+
+    def test_load_file_delegates_path_to_selected_loader(self, tmp_path):
+        # Given
+        csv_loader, arrow_loader = Mock(), Mock()
+        loader = FormatDetectingDataFrameLoader(csv_loader=csv_loader, arrow_loader=arrow_loader)
+        path = tmp_path / "panel.arrow"
+        path.write_bytes(b"ARROW1...")
+
+        # When
+        result = loader.load_file(path)
+
+        # Then
+        assert result is arrow_loader.load_file.return_value
+        arrow_loader.load_file.assert_called_once_with(path, None)
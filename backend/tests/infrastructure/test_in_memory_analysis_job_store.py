@@ -0,0 +1,72 @@
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+
+from app.domain.model.analysis_job import AnalysisJob
+from app.infrastructure.in_memory_analysis_job_store import InMemoryAnalysisJobStore
+
+START = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = START
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+def make_job(job_id: str, status: str = "queued", expires_in: float | None = None) -> AnalysisJob:
+    return AnalysisJob(
+        job_id=job_id,
+        status=status,
+        created_at=START,
+        expires_at=START + timedelta(seconds=expires_in) if expires_in is not None else None,
+    )
+
+
+class TestInMemoryAnalysisJobStore:
+    def test_update_applies_change_to_stored_job(self):
+        # Given
+        store = InMemoryAnalysisJobStore(max_jobs=10)
+        store.put(make_job("a"))
+
+        # When
+        updated = store.update("a", lambda job: replace(job, status="running"))
+
+        # Then
+        assert updated.status == "running"
+        assert store.get("a").status == "running"
+        assert store.update("missing", lambda job: job) is None
+
+    def test_get_drops_finished_jobs_once_they_expire(self):
+        # Given
+        clock = FakeClock()
+        store = InMemoryAnalysisJobStore(max_jobs=10, clock=clock)
+        store.put(make_job("a", "succeeded", expires_in=60))
+
+        # When
+        clock.now = START + timedelta(seconds=59)
+        before = store.get("a")
+        clock.now = START + timedelta(seconds=60)
+        after = store.get("a")
+
+        # Then
+        assert before is not None
+        assert after is None
+
+    def test_put_evicts_oldest_finished_jobs_but_keeps_active_ones(self):
+        # Given
+        store = InMemoryAnalysisJobStore(max_jobs=2)
+        store.put(make_job("queued"))
+        store.put(make_job("old", "succeeded", expires_in=60))
+        store.put(make_job("new", "failed", expires_in=60))
+
+        # When
+        store.put(make_job("running", "running"))
+
+        # Then
+        assert store.get("queued") is not None
+        assert store.get("running") is not None
+        assert store.get("old") is None
+        assert store.get("new") is None
+        assert len(store) == 2
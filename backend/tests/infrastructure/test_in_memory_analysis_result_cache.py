@@ -0,0 +1,126 @@
+from app.domain.model.absorption_specification import AbsorptionSpecification
+from app.domain.model.analysis_specification import AnalysisSpecification
+from app.domain.model.bootstrap_specification import BootstrapSpecification
+from app.domain.model.panel_validation_options import PanelValidationOptions
+from app.domain.model.permutation_specification import PermutationSpecification
+from app.domain.model.fixed_effects_result import FixedEffectsResult
+from app.infrastructure.in_memory_analysis_result_cache import InMemoryAnalysisResultCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_result(nobs: int = 100) -> FixedEffectsResult:
+    return FixedEffectsResult(
+        nobs=nobs,
+        params={"var1": 1.5},
+        std_errors={"var1": 0.2},
+        tstats={"var1": 7.5},
+        pvalues={"var1": 0.001},
+        rsquared_within=0.75,
+        rsquared_between=0.65,
+        rsquared_overall=0.70,
+        dropped_vars=[]
+    )
+
+
+class TestInMemoryAnalysisResultCache:
+    def test_get_returns_cached_result_and_counts_hit(self):
+        # Given
+        cache = InMemoryAnalysisResultCache(max_entries=10, ttl_seconds=60)
+        specification = AnalysisSpecification("TFR", ("unmarried",))
+        result = make_result()
+        cache.put("dataset", specification, result)
+
+        # When
+        cached = cache.get("dataset", specification)
+
+        # Then
+        assert cached is result
+        assert cache.hits == 1
+        assert cache.misses == 0
+
+    def test_get_counts_miss_for_unknown_key(self):
+        # Given
+        cache = InMemoryAnalysisResultCache(max_entries=10, ttl_seconds=60)
+
+        # When
+        cached = cache.get("dataset", AnalysisSpecification("TFR", ("unmarried",)))
+
+        # Then
+        assert cached is None
+        assert cache.hits == 0
+        assert cache.misses == 1
+
+    def test_key_ignores_order_of_independent_variables(self):
+        # Given
+        cache = InMemoryAnalysisResultCache(max_entries=10, ttl_seconds=60)
+        result = make_result()
+        cache.put("dataset", AnalysisSpecification("TFR", ("unmarried", "employment_rate")), result)
+
+        # When
+        cached = cache.get("dataset", AnalysisSpecification("TFR", ("employment_rate", "unmarried")))
+
+        # Then
+        assert cached is result
+
+    def test_key_distinguishes_dataset_and_specification(self):
+        # Given
+        cache = InMemoryAnalysisResultCache(max_entries=10, ttl_seconds=60)
+        cache.put("dataset", AnalysisSpecification("TFR", ("unmarried",)), make_result())
+
+        # When / Then
+        assert cache.get("other", AnalysisSpecification("TFR", ("unmarried",))) is None
+        assert cache.get("dataset", AnalysisSpecification("TFR", ("employment_rate",))) is None
+        assert cache.get("dataset", AnalysisSpecification("TFR", ("unmarried",), entity_var="region")) is None
+        assert cache.get(
+            "dataset", AnalysisSpecification("TFR", ("unmarried",), bootstrap=BootstrapSpecification(draws=999))
+        ) is None
+        assert cache.get(
+            "dataset", AnalysisSpecification("TFR", ("unmarried",), absorption=AbsorptionSpecification((("year",),)))
+        ) is None
+        assert cache.get(
+            "dataset", AnalysisSpecification("TFR", ("unmarried",), permutation=PermutationSpecification("unmarried", 999))
+        ) is None
+        assert cache.get(
+            "dataset", AnalysisSpecification("TFR", ("unmarried",), validation=PanelValidationOptions(drop_missing=True))
+        ) is None
+
+    def test_get_expires_entries_after_ttl(self):
+        # Given
+        clock = FakeClock()
+        cache = InMemoryAnalysisResultCache(max_entries=10, ttl_seconds=60, clock=clock)
+        specification = AnalysisSpecification("TFR", ("unmarried",))
+        cache.put("dataset", specification, make_result())
+
+        # When
+        clock.now = 61.0
+        cached = cache.get("dataset", specification)
+
+        # Then
+        assert cached is None
+        assert len(cache) == 0
+
+    def test_put_evicts_least_recently_used_entry(self):
+        # Given
+        cache = InMemoryAnalysisResultCache(max_entries=2, ttl_seconds=60)
+        first = AnalysisSpecification("TFR", ("a",))
+        second = AnalysisSpecification("TFR", ("b",))
+        third = AnalysisSpecification("TFR", ("c",))
+        cache.put("dataset", first, make_result(1))
+        cache.put("dataset", second, make_result(2))
+        cache.get("dataset", first)
+
+        # When
+        cache.put("dataset", third, make_result(3))
+
+        # Then
+        assert len(cache) == 2
+        assert cache.get("dataset", first) is not None
+        assert cache.get("dataset", second) is None
+        assert cache.get("dataset", third) is not None
@@ -0,0 +1,70 @@
+import pandas as pd
+import pytest
+
+from app.infrastructure.in_memory_dataset_repository import InMemoryDatasetRepository
+
+
+def make_dataframe(rows: int) -> pd.DataFrame:
+    return pd.DataFrame({"value": [float(i) for i in range(rows)]})
+
+
+def nbytes(dataframe: pd.DataFrame) -> int:
+    return int(dataframe.memory_usage(index=True, deep=True).sum())
+
+
+class TestInMemoryDatasetRepository:
+    def test_get_returns_stored_dataframe(self):
+        # Given
+        repository = InMemoryDatasetRepository(max_bytes=1024 * 1024)
+        dataframe = make_dataframe(10)
+
+        # When
+        repository.put("dataset", dataframe)
+
+        # Then
+        assert repository.get("dataset") is dataframe
+
+    def test_get_returns_none_for_unknown_dataset(self):
+        # Given
+        repository = InMemoryDatasetRepository(max_bytes=1024 * 1024)
+
+        # When / Then
+        assert repository.get("unknown") is None
+
+    def test_put_evicts_least_recently_used_dataset_when_over_budget(self):
+        # Given
+        dataframe = make_dataframe(100)
+        repository = InMemoryDatasetRepository(max_bytes=nbytes(dataframe) * 2)
+        repository.put("first", dataframe)
+        repository.put("second", make_dataframe(100))
+        repository.get("first")
+
+        # When
+        repository.put("third", make_dataframe(100))
+
+        # Then
+        assert "first" in repository
+        assert "second" not in repository
+        assert "third" in repository
+        assert repository.total_bytes <= repository.max_bytes
+
+    def test_put_same_dataset_twice_does_not_double_count_bytes(self):
+        # Given
+        dataframe = make_dataframe(100)
+        repository = InMemoryDatasetRepository(max_bytes=1024 * 1024)
+
+        # When
+        repository.put("dataset", dataframe)
+        repository.put("dataset", dataframe)
+
+        # Then
+        assert len(repository) == 1
+        assert repository.total_bytes == nbytes(dataframe)
+
+    def test_put_rejects_dataset_larger_than_budget(self):
+        # Given
+        repository = InMemoryDatasetRepository(max_bytes=10)
+
+        # When / Then
+        with pytest.raises(ValueError, match="exceeds the registry budget"):
+            repository.put("dataset", make_dataframe(100))
@@ -0,0 +1,83 @@
+from app.domain.model.panel_issue import PanelIssue
+from app.domain.model.panel_validation_options import PanelValidationOptions
+from app.domain.model.panel_validation_outcome import PanelValidationOutcome
+from app.domain.service.panel_sufficient_statistics import PanelSufficientStatistics
+from app.infrastructure.in_memory_sufficient_statistics_repository import InMemorySufficientStatisticsRepository
+from tests.domain.service.test_numpy_fixed_effects_estimator import make_dataframe
+
+
+def make_statistics(columns: tuple[str, ...]) -> PanelSufficientStatistics:
+    return PanelSufficientStatistics.from_dataframe(make_dataframe(), "prefecture", columns)
+
+
+class TestInMemorySufficientStatisticsRepository:
+    def test_put_and_get_by_entity_and_columns(self):
+        # Given
+        repository = InMemorySufficientStatisticsRepository(max_datasets=2)
+        statistics = make_statistics(("fertility_rate", "work_hours"))
+
+        # When
+        repository.put("a", statistics)
+
+        # Then
+        assert repository.get("a", "prefecture", ("fertility_rate", "work_hours")) is statistics
+        assert repository.get("a", "prefecture", ("fertility_rate", "income")) is None
+        assert repository.get("b", "prefecture", ("fertility_rate", "work_hours")) is None
+
+    def test_list_returns_all_statistics_of_a_dataset(self):
+        # Given
+        repository = InMemorySufficientStatisticsRepository(max_datasets=2)
+        repository.put("a", make_statistics(("fertility_rate", "work_hours")))
+        repository.put("a", make_statistics(("fertility_rate", "income")))
+
+        # When
+        statistics = repository.list("a")
+
+        # Then
+        assert [entry.columns for entry in statistics] == [("fertility_rate", "work_hours"), ("fertility_rate", "income")]
+
+    def test_evicts_least_recently_used_dataset(self):
+        # Given
+        repository = InMemorySufficientStatisticsRepository(max_datasets=2)
+        columns = ("fertility_rate", "work_hours")
+        repository.put("a", make_statistics(columns))
+        repository.put("b", make_statistics(columns))
+        repository.get("a", "prefecture", columns)
+
+        # When
+        repository.put("c", make_statistics(columns))
+
+        # Then
+        assert len(repository) == 2
+        assert repository.list("b") == []
+        assert repository.get("a", "prefecture", columns) is not None
+
+    def test_put_and_get_validation_by_columns_and_options(self):
+        # Given
+        repository = InMemorySufficientStatisticsRepository(max_datasets=2)
+        columns = ("fertility_rate", "work_hours")
+        outcome = PanelValidationOutcome(
+            "prefecture", "year", columns, PanelValidationOptions(), (PanelIssue("missing", ["work_hours"], 1, [3]),)
+        )
+
+        # When
+        repository.put_validation("a", outcome)
+
+        # Then
+        assert repository.get_validation("a", "prefecture", "year", columns, PanelValidationOptions()) is outcome
+        assert repository.get_validation("a", "prefecture", "year", columns, PanelValidationOptions(drop_missing=True)) is None
+        assert repository.get_validation("b", "prefecture", "year", columns, PanelValidationOptions()) is None
+        assert repository.list_validations("a") == [outcome]
+
+    def test_evicts_validations_with_their_dataset(self):
+        # Given
+        repository = InMemorySufficientStatisticsRepository(max_datasets=1)
+        columns = ("fertility_rate", "work_hours")
+        repository.put_validation("a", PanelValidationOutcome("prefecture", "year", columns, PanelValidationOptions()))
+
+        # When
+        repository.put("b", make_statistics(columns))
+
+        # Then
+        assert repository.get_validation("a", "prefecture", "year", columns, PanelValidationOptions()) is None
+        assert repository.list_validations("a") == []
@@ -0,0 +1,135 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.infrastructure.memory_mapped_dataset_repository import (
+    INDEX_FILE,
+    RECENCY_RESOLUTION_SECONDS,
+    MemoryMappedDatasetRepository,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_dataframe(rows: int) -> pd.DataFrame:
+    return pd.DataFrame({
+        "prefecture": pd.Categorical([f"県{i % 3}" for i in range(rows)]),
+        "year": np.arange(rows, dtype=np.int64),
+        "value": [float(i) for i in range(rows)],
+    })
+
+
+def nbytes(rows: int) -> int:
+    # int8 codes, int64 years and float64 values.
+    return rows * (1 + 8 + 8)
+
+
+class TestMemoryMappedDatasetRepository:
+    def test_get_returns_read_only_view_of_stored_columns(self, tmp_path):
+        # Given
+        repository = MemoryMappedDatasetRepository(tmp_path, max_bytes=1024 * 1024)
+        dataframe = make_dataframe(10).assign(region=["関東"] * 10)
+
+        # When
+        repository.put("dataset", dataframe)
+        stored = repository.get("dataset")
+
+        # Then
+        pd.testing.assert_frame_equal(stored, dataframe.astype({"region": "category"}))
+        assert not stored["value"].to_numpy().flags.owndata
+        assert not stored["value"].to_numpy().flags.writeable
+        assert repository.get("dataset") is stored
+
+    def test_datasets_put_by_one_worker_are_attached_by_another(self, tmp_path):
+        # Given
+        writer = MemoryMappedDatasetRepository(tmp_path, max_bytes=1024 * 1024)
+        reader = MemoryMappedDatasetRepository(tmp_path, max_bytes=1024 * 1024)
+        dataframe = make_dataframe(10)
+
+        # When
+        writer.put("dataset", dataframe)
+
+        # Then
+        assert "dataset" in reader
+        pd.testing.assert_frame_equal(reader.get("dataset"), dataframe)
+
+    def test_get_returns_none_for_unknown_dataset(self, tmp_path):
+        # Given
+        repository = MemoryMappedDatasetRepository(tmp_path, max_bytes=1024 * 1024)
+
+        # When / Then
+        assert repository.get("unknown") is None
+        assert repository.get("../unknown") is None
+
+    def test_put_evicts_least_recently_used_dataset_across_workers(self, tmp_path):
+        # Given
+        clock = FakeClock()
+        first_worker = MemoryMappedDatasetRepository(tmp_path, max_bytes=nbytes(100) * 2, clock=clock)
+        second_worker = MemoryMappedDatasetRepository(tmp_path, max_bytes=nbytes(100) * 2, clock=clock)
+        first_worker.put("first", make_dataframe(100))
+        clock.now += 1
+        second_worker.put("second", make_dataframe(100))
+        attached = second_worker.get("second")
+        clock.now += RECENCY_RESOLUTION_SECONDS
+        first_worker.get("first")
+
+        # When
+        first_worker.put("third", make_dataframe(100))
+
+        # Then
+        assert "first" in second_worker
+        assert "second" not in second_worker
+        assert "third" in second_worker
+        assert not (tmp_path / "second").exists()
+        assert second_worker.get("second") is None
+        assert first_worker.total_bytes <= first_worker.max_bytes
+        # Evicted files stay readable through mappings made before eviction.
+        assert attached["value"].sum() == sum(range(100))
+
+    def test_get_rewrites_index_only_when_last_use_is_older_than_resolution(self, tmp_path):
+        # Given
+        clock = FakeClock()
+        repository = MemoryMappedDatasetRepository(tmp_path, max_bytes=1024 * 1024, clock=clock)
+        repository.put("dataset", make_dataframe(10))
+        written = (tmp_path / INDEX_FILE).read_text()
+
+        # When
+        clock.now += RECENCY_RESOLUTION_SECONDS / 2
+        repository.get("dataset")
+        repository.get("dataset")
+        unchanged = (tmp_path / INDEX_FILE).read_text()
+        clock.now += RECENCY_RESOLUTION_SECONDS
+        repository.get("dataset")
+
+        # Then
+        assert unchanged == written
+        assert (tmp_path / INDEX_FILE).read_text() != written
+
+    def test_put_same_dataset_twice_does_not_double_count_bytes(self, tmp_path):
+        # Given
+        repository = MemoryMappedDatasetRepository(tmp_path, max_bytes=1024 * 1024)
+
+        # When
+        repository.put("dataset", make_dataframe(100))
+        MemoryMappedDatasetRepository(tmp_path, max_bytes=1024 * 1024).put("dataset", make_dataframe(100))
+
+        # Then
+        assert len(repository) == 1
+        assert repository.total_bytes == nbytes(100)
+        assert [path.name for path in tmp_path.iterdir() if path.is_dir()] == ["dataset"]
+
+    def test_put_rejects_dataset_larger_than_budget(self, tmp_path):
+        # Given
+        repository = MemoryMappedDatasetRepository(tmp_path, max_bytes=10)
+
+        # When / Then
+        with pytest.raises(ValueError, match="exceeds the registry budget"):
+            repository.put("dataset", make_dataframe(100))
+        assert len(repository) == 0
+        assert not any(path.is_dir() for path in tmp_path.iterdir())
@@ -0,0 +1,78 @@
+import pytest
+
+from app.infrastructure.metrics_registry import Metric, MetricsRegistry
+
+
+class TestMetricsRegistry:
+    def test_render_writes_counters_and_gauges_in_text_format(self):
+        # Given
+        registry = MetricsRegistry()
+        counter = registry.counter("jobs_total", "Jobs run.", ["status"])
+        gauge = registry.gauge("queue_depth", "Queued jobs.")
+        counter.inc(status="200")
+        counter.inc(2, status="200")
+        gauge.set(3)
+
+        # When
+        text = registry.render()
+
+        # Then
+        assert "# HELP jobs_total Jobs run.\n# TYPE jobs_total counter\n" in text
+        assert 'jobs_total{status="200"} 3.0' in text
+        assert "# TYPE queue_depth gauge\nqueue_depth 3.0" in text
+        assert text.endswith("\n")
+
+    def test_histogram_buckets_are_cumulative(self):
+        # Given
+        registry = MetricsRegistry()
+        histogram = registry.histogram("latency_seconds", "Latency.", (0.1, 1.0), ["path"])
+
+        # When
+        for value in (0.05, 0.5, 5.0):
+            histogram.observe(value, path="/analysis")
+        text = registry.render()
+
+        # Then
+        assert 'latency_seconds_bucket{path="/analysis",le="0.1"} 1' in text
+        assert 'latency_seconds_bucket{path="/analysis",le="1.0"} 2' in text
+        assert 'latency_seconds_bucket{path="/analysis",le="+Inf"} 3' in text
+        assert 'latency_seconds_sum{path="/analysis"} 5.55' in text
+        assert 'latency_seconds_count{path="/analysis"} 3' in text
+
+    def test_gauge_function_is_read_at_render_time(self):
+        # Given
+        registry = MetricsRegistry()
+        values = iter([1, 4])
+        registry.gauge("in_flight", "In flight.", function=lambda: next(values))
+
+        # When / Then
+        assert "in_flight 1.0" in registry.render()
+        assert "in_flight 4.0" in registry.render()
+
+    def test_label_values_are_escaped(self):
+        # Given
+        registry = MetricsRegistry()
+        registry.counter("errors_total", "Errors.", ["error"]).inc(error='bad "value"\n')
+
+        # When / Then
+        assert 'errors_total{error="bad \\"value\\"\\n"} 1.0' in registry.render()
+
+    def test_rejects_duplicate_names_and_unknown_labels(self):
+        # Given
+        registry = MetricsRegistry()
+        counter = registry.counter("jobs_total", "Jobs run.", ["status"])
+
+        # When / Then
+        with pytest.raises(ValueError):
+            registry.counter("jobs_total", "Jobs run.")
+        with pytest.raises(ValueError):
+            counter.inc(path="/analysis")
+
+    def test_metric_without_samples_cannot_be_created(self):
+        # Given
+        class Untyped(Metric):
+            pass
+
+        # When / Then
+        with pytest.raises(TypeError):
+            Untyped("untyped", "No samples.", [])
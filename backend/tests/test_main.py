@@ -2,7 +2,11 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.testclient import TestClient
 import pytest
+from unittest.mock import patch
 
+from app.application.warm_up import warm_up as fit_bundled_panel
+from app.config.web_config import web_config
+from app.dependencies import get_dataframe_loader, get_fixed_effects_estimator
 from app.main import app
 
 
@@ -18,6 +22,42 @@ class TestAppMain:
         assert response.status_code == 200
         assert response.json() == {"status": "ok"}
         
+    def test_metrics_endpoint_exposes_request_and_stage_metrics(self):
+        # Given
+        client = TestClient(app)
+        client.get("/health")
+
+        # When
+        response = client.get("/metrics")
+
+        # Then
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert 'http_requests_total{method="GET",path="/health",status="200"}' in response.text
+        assert "# TYPE analysis_stage_duration_seconds histogram" in response.text
+        assert "server-timing" in response.headers
+
+    def test_lifespan_warms_up_the_shared_loader_and_estimator(self):
+        # Given
+        with patch("app.main.warm_up", wraps=fit_bundled_panel) as warm_up:
+            # When
+            with TestClient(app) as client:
+                response = client.get("/health")
+
+        # Then
+        assert response.status_code == 200
+        warm_up.assert_called_once_with(get_dataframe_loader(), get_fixed_effects_estimator())
+
+    def test_lifespan_skips_warm_up_when_disabled(self):
+        # Given
+        with patch.object(web_config, "WARM_UP_ENABLED", False), patch("app.main.warm_up") as warm_up:
+            # When
+            with TestClient(app):
+                pass
+
+        # Then
+        warm_up.assert_not_called()
+
     def test_app_has_title(self):
         # Given / When / Then
         assert app.title == "Japan Fertility Workstyle Analysis API"